@@ -281,8 +281,7 @@ class CharacterDialog(QDialog):
         elif current_tab == 2:
             template = self.template_combo.currentData()
             if template:
-                import copy
-                return copy.deepcopy(template)
+                return template.clone()
         
         return None
     
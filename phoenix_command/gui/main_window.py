@@ -739,7 +739,6 @@ class MainWindow(QMainWindow):
         from phoenix_command.models.gear import AmmoType, Weapon
         from phoenix_command.models.hit_result_advanced import ShotParameters
         from phoenix_command.simulations.combat_simulator import CombatSimulator
-        from phoenix_command.simulations.map_los import check_los
 
         tokens = self.hex_map_view.get_token_state()
         shooter_tok = tokens.placements.get(preview.shooter_token_id)
@@ -853,8 +852,7 @@ class MainWindow(QMainWindow):
             return True, "scheduled"
 
         # Immediate resolve — check LOS again
-        los = check_los(
-            self.hex_map_view.get_map_state(),
+        los = self.hex_map_view.get_los_cache().get(
             shooter_tok,
             target_tok,
             ic.token_runtime.get(preview.target_token_id),
@@ -891,7 +889,6 @@ class MainWindow(QMainWindow):
         from phoenix_command.models.gear import AmmoType, Weapon
         from phoenix_command.models.hit_result_advanced import ShotParameters
         from phoenix_command.simulations.combat_simulator import CombatSimulator
-        from phoenix_command.simulations.map_los import check_los
 
         snap = proj.shot_snapshot
         tokens = self.hex_map_view.get_token_state()
@@ -901,8 +898,7 @@ class MainWindow(QMainWindow):
             self.combat_log.append_system("In-flight shot: token gone — miss")
             return
         ic = self.hex_map_view.get_impulse_combat_state()
-        los = check_los(
-            self.hex_map_view.get_map_state(),
+        los = self.hex_map_view.get_los_cache().get(
             shooter_tok,
             target_tok,
             ic.token_runtime.get(proj.target_token_id),
@@ -1096,6 +1092,7 @@ class MainWindow(QMainWindow):
             target_tok,
             target_rt,
             map_state,
+            self.hex_map_view.get_los_cache(),
         )
         return ctx, shooter_tok.character_name, target_tok.character_name
 
@@ -35,7 +35,7 @@ from phoenix_command.gui.widgets.hex_map_modes import (
 )
 from phoenix_command.gui.widgets.token_graphics import TokenGraphicsItem
 from phoenix_command.gui.widgets.transform_gizmo import TransformState
-from phoenix_command.session.domains.map_state import MapState, is_hex_wall_key
+from phoenix_command.session.domains.map_state import HEX_WALL_EDGE, MapState
 from phoenix_command.session.domains.token_state import TokenState
 
 
@@ -261,8 +261,7 @@ class HexMapScene(QGraphicsScene):
             self._add_background(layer, grid)
             self._add_annotations(layer, grid)
 
-            for key, tile in layer.terrain.items():
-                q, r = map(int, key.split(","))
+            for q, r, tile in layer.terrain.cell_items():
                 if not is_in_bounds(q, r, grid):
                     continue
                 corners = hex_corners(q, r, grid)
@@ -282,8 +281,7 @@ class HexMapScene(QGraphicsScene):
                     text.setZValue(layer.elevation + 1)
                     self.addItem(text)
 
-            for key, cond in layer.conditions.items():
-                q, r = map(int, key.split(","))
+            for q, r, cond in layer.conditions.cell_items():
                 if not is_in_bounds(q, r, grid):
                     continue
                 corners = hex_corners(q, r, grid)
@@ -297,8 +295,7 @@ class HexMapScene(QGraphicsScene):
                 item.setToolTip(f"Conditions: {vis}")
                 self.addItem(item)
 
-            for key, obstacle in layer.obstacles.items():
-                q, r = map(int, key.split(","))
+            for q, r, obstacle in layer.obstacles.cell_items():
                 if not is_in_bounds(q, r, grid):
                     continue
                 corners = hex_corners(q, r, grid)
@@ -316,10 +313,8 @@ class HexMapScene(QGraphicsScene):
                 label.setZValue(layer.elevation + 3)
                 self.addItem(label)
 
-            for key, wall in layer.walls.items():
-                if is_hex_wall_key(key):
-                    coords = key.rsplit(":", 1)[0]
-                    q, r = map(int, coords.split(","))
+            for q, r, edge, wall in layer.walls.cell_items():
+                if edge == HEX_WALL_EDGE:
                     if not is_in_bounds(q, r, grid):
                         continue
                     corners = hex_corners(q, r, grid)
@@ -332,11 +327,8 @@ class HexMapScene(QGraphicsScene):
                     item.setZValue(layer.elevation + 2.5)
                     self.addItem(item)
                     continue
-                coords, edge_s = key.rsplit(":", 1)
-                q, r = map(int, coords.split(","))
                 if not is_in_bounds(q, r, grid):
                     continue
-                edge = int(edge_s)
                 start, end = edge_endpoints(q, r, edge, grid)
                 line = QGraphicsLineItem(start[0], start[1], end[0], end[1])
                 pen = QPen(QColor(40, 40, 40, layer_alpha), 4)
@@ -366,8 +358,7 @@ class HexMapScene(QGraphicsScene):
                     marker.setZValue(layer.elevation + 5)
                     self.addItem(marker)
 
-            for key, stair in layer.stairs.items():
-                q, r = map(int, key.split(","))
+            for q, r, stair in layer.stairs.cell_items():
                 if not is_in_bounds(q, r, grid):
                     continue
                 cx, cy = axial_to_pixel(q, r, grid)
@@ -78,6 +78,7 @@ from phoenix_command.session.domains.map_state import (
 )
 from phoenix_command.session.domains.player_info import PlayerInfo
 from phoenix_command.session.domains.token_state import TokenPlacement, TokenState
+from phoenix_command.simulations.map_los import LosCache
 from phoenix_command.tables.catalogs.movement_catalog import TERRAIN_PRESETS
 
 __all__ = [
@@ -146,6 +147,7 @@ class HexMapView(QWidget):
         self._combat_callbacks = None  # set by main window
 
         self._scene = HexMapScene()
+        self._los_cache = LosCache(self._scene.map_state)
         self._annotations = AnnotationOverlayController(self._scene)
         self._ruler = RulerOverlayController(self._scene)
         self._scene.on_token_moved_callback = self._emit_map_changed
@@ -680,6 +682,7 @@ class HexMapView(QWidget):
                     protection_factor=self._wall_template.protection_factor,
                 )
                 self._last_cell = (q, r)
+                self._los_cache.invalidate_hexes(layer.id, [(q, r)])
                 self._dirty = True
                 self._rebuild_scene()
                 return
@@ -695,6 +698,7 @@ class HexMapView(QWidget):
                 protection_factor=self._wall_template.protection_factor,
             )
             self._last_edge = edge_key
+            self._los_cache.invalidate_keys(layer.id, [wall_key])
             self._dirty = True
             self._rebuild_scene()
 
@@ -716,6 +720,7 @@ class HexMapView(QWidget):
                 existing.head_height = opening.head_height
             layer.walls[wall_key] = wall
             self._last_edge = edge_key
+            self._los_cache.invalidate_keys(layer.id, [wall_key])
             self._dirty = True
             self._rebuild_scene()
 
@@ -735,6 +740,7 @@ class HexMapView(QWidget):
                 door.state = states[(idx + 1) % len(states)]
             layer.walls[wall_key] = wall
             self._last_edge = edge_key
+            self._los_cache.invalidate_keys(layer.id, [wall_key])
             self._dirty = True
             self._rebuild_scene()
 
@@ -763,6 +769,7 @@ class HexMapView(QWidget):
                 blocks_movement=tpl.blocks_movement,
                 blocks_los=tpl.blocks_los,
             )
+        self._los_cache.invalidate_hexes(layer.id, iter_offset_rect(c0, r0, c1, r1, grid))
 
     def _fill_wall_hex_rect(self, c0: int, r0: int, c1: int, r1: int) -> None:
         grid = self._scene.map_state.grid
@@ -775,6 +782,7 @@ class HexMapView(QWidget):
                 height=tpl.height,
                 protection_factor=tpl.protection_factor,
             )
+        self._los_cache.invalidate_hexes(layer.id, iter_offset_rect(c0, r0, c1, r1, grid))
 
     def _fill_condition_rect(self, c0: int, r0: int, c1: int, r1: int) -> None:
         grid = self._scene.map_state.grid
@@ -805,6 +813,7 @@ class HexMapView(QWidget):
             layer.walls.pop(hex_wall_key(q, r), None)
             for edge in range(6):
                 layer.walls.pop(f"{q},{r}:{edge}", None)
+        self._los_cache.invalidate_hexes(layer.id, iter_offset_rect(c0, r0, c1, r1, grid))
 
     def _select_token_at(self, q: int, r: int) -> None:
         active = self._scene.map_state.get_active_layer()
@@ -1429,6 +1438,12 @@ class HexMapView(QWidget):
     def get_token_state(self) -> TokenState:
         return self._scene.token_state
 
+    def get_los_cache(self) -> LosCache:
+        """LOS cache for the current map; token moves are picked up on lookup."""
+        if self._los_cache.map_state is not self._scene.map_state:
+            self._los_cache = LosCache(self._scene.map_state)
+        return self._los_cache
+
     def set_map_state(self, map_state: MapState | None) -> None:
         if map_state is None:
             map_state = MapState()
@@ -1489,7 +1504,7 @@ class HexMapView(QWidget):
 
     def _window_opening_for_hex(self, q: int, r: int) -> Opening:
         layer = self._scene.map_state.get_active_layer()
-        hex_wall = layer.walls.get(hex_wall_key(q, r))
+        hex_wall = layer.walls.hex_wall_at(q, r)
         if hex_wall is None:
             return Opening(kind="window", state="closed", position=0.5)
         head_height = min(max(1.2, hex_wall.height - 0.3), hex_wall.height)
@@ -2,8 +2,8 @@
 
 import copy
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
-from phoenix_command.models.gear import Gear, Armor
+from typing import TYPE_CHECKING, ClassVar, Iterable
+from phoenix_command.models.gear import Gear, ArmorStack, build_armor_index
 from phoenix_command.models.enums import AdvancedHitLocation
 from phoenix_command.tables.core.table1_character_generation import Table1CharacterGeneration
 
@@ -26,11 +26,88 @@ class Character:
     equipment: list[Gear] = field(default_factory=list)
     name: str = "Unnamed"
     hit_history: list['DamageResult'] = field(default_factory=list)
+    # Derived stats, computed on first access and dropped when an input changes
+    _stats: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _armor_index: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    # Fields the Table 1 stat chain depends on; assigning any of them invalidates the cache
+    STAT_INPUTS: ClassVar[frozenset[str]] = frozenset({
+        "strength", "intelligence", "will", "agility", "gun_combat_skill_level", "equipment",
+    })
+
+    def __setattr__(self, name, value) -> None:
+        object.__setattr__(self, name, value)
+        if name in self.STAT_INPUTS:
+            self.invalidate_stats()
+
+    def invalidate_stats(self) -> None:
+        """Drop cached derived stats; call after changing equipment or armor layers in place."""
+        self.__dict__["_stats"] = {}
+        armor_index = self.__dict__.get("_armor_index")
+        if armor_index:
+            for stack in armor_index.values():
+                stack.detach()
+        self.__dict__["_armor_index"] = None
+
+    def _compute_stats(self) -> dict:
+        """Run the Table 1 chain once and return every derived stat."""
+        encumbrance = sum(item.weight for item in self.equipment)
+        base_speed = Table1CharacterGeneration.get_base_speed_1a(self.strength, encumbrance)
+        max_speed = int(Table1CharacterGeneration.get_max_speed_1b(self.agility, base_speed))
+        skill_accuracy_level = Table1CharacterGeneration.get_skill_accuracy_level_1c(self.gun_combat_skill_level)
+        intelligence_skill_factor = self.intelligence + skill_accuracy_level
+        combat_actions = Table1CharacterGeneration.get_combat_actions_1d(max_speed, intelligence_skill_factor)
+        return {
+            "encumbrance": encumbrance,
+            "base_speed": base_speed,
+            "max_speed": max_speed,
+            "skill_accuracy_level": skill_accuracy_level,
+            "intelligence_skill_factor": intelligence_skill_factor,
+            "combat_actions": combat_actions,
+            "impulses": Table1CharacterGeneration.get_impulses_1e(combat_actions),
+            "knockout_value": int(0.5 * self.will * self.gun_combat_skill_level),
+            "defensive_alm": Table1CharacterGeneration.get_defensive_alm(intelligence_skill_factor),
+        }
+
+    def _stat(self, name: str):
+        stats = self._stats
+        if not stats:
+            stats = self.__dict__["_stats"] = self._compute_stats()
+        return stats[name]
+
+    @classmethod
+    def recompute_roster_stats(cls, characters: Iterable['Character']) -> None:
+        """Refresh the derived stats of many characters at once.
+
+        Characters sharing the same attributes, skill and carried weight (e.g. a squad of
+        identically kitted NPCs) share one run of the Table 1 chain; each character still gets
+        its own stats dict and impulse list.
+        """
+        computed: dict[tuple, dict] = {}
+        for character in characters:
+            character.invalidate_stats()
+            key = (
+                character.strength, character.intelligence, character.will, character.agility,
+                character.gun_combat_skill_level, sum(item.weight for item in character.equipment),
+            )
+            stats = computed.get(key)
+            if stats is None:
+                stats = computed[key] = character._compute_stats()
+            character.__dict__["_stats"] = dict(stats, impulses=list(stats["impulses"]))
+
     @property
     def encumbrance(self) -> float:
         """Total weight of all carried equipment."""
-        return sum(item.weight for item in self.equipment)
+        return self._stat("encumbrance")
     
+    @property
+    def armor_index(self) -> dict[tuple[AdvancedHitLocation, bool], ArmorStack]:
+        """Worn armor by (location, is_front); stack totals follow armor degradation."""
+        armor_index = self._armor_index
+        if armor_index is None:
+            armor_index = self.__dict__["_armor_index"] = build_armor_index(self.equipment)
+        return armor_index
+
     @property
     def armor_protection(self) -> dict[tuple[AdvancedHitLocation, bool], tuple[int, int]]:
         """Combined armor protection from all worn armor pieces.
@@ -38,66 +115,79 @@ class Character:
         Returns:
             dict mapping (location, is_front) -> (protection_factor, blunt_protection_factor)
         """
-        combined = {}
-        for item in self.equipment:
-            if isinstance(item, Armor):
-                for key, protection_data in item.protection.items():
-                    if key not in combined:
-                        combined[key] = (0, 0)
-                    pf, bpf = combined[key]
-                    combined[key] = (
-                        pf + protection_data.get_total_protection(),
-                        bpf + protection_data.get_total_blunt_protection()
-                    )
-        return combined
+        return {
+            key: (stack.total_protection, stack.total_blunt_protection)
+            for key, stack in self.armor_index.items()
+        }
     
     @property
     def base_speed(self) -> float:
         """Base speed from Table 1A."""
-        return Table1CharacterGeneration.get_base_speed_1a(self.strength, self.encumbrance)
+        return self._stat("base_speed")
     
     @property
     def max_speed(self) -> int:
         """Maximum speed from Table 1B."""
-        return int(Table1CharacterGeneration.get_max_speed_1b(self.agility, self.base_speed))
+        return self._stat("max_speed")
     
     @property
     def skill_accuracy_level(self) -> int:
         """Skill accuracy level from Table 1C."""
-        return Table1CharacterGeneration.get_skill_accuracy_level_1c(self.gun_combat_skill_level)
+        return self._stat("skill_accuracy_level")
     
     @property
     def intelligence_skill_factor(self) -> int:
         """Intelligence + Skill Accuracy Level."""
-        return self.intelligence + self.skill_accuracy_level
+        return self._stat("intelligence_skill_factor")
     
     @property
     def combat_actions(self) -> int:
         """Combat actions from Table 1D."""
-        return Table1CharacterGeneration.get_combat_actions_1d(self.max_speed, self.intelligence_skill_factor)
+        return self._stat("combat_actions")
     
     @property
     def impulses(self) -> list[int]:
         """Combat actions per impulse from Table 1E."""
-        return Table1CharacterGeneration.get_impulses_1e(self.combat_actions)
+        return self._stat("impulses")
     
     @property
     def knockout_value(self) -> int:
         """Knockout value = 0.5 × Will × Skill Level."""
-        return int(0.5 * self.will * self.gun_combat_skill_level)
+        return self._stat("knockout_value")
     
     @property
     def defensive_alm(self) -> int:
         """Defensive Accuracy Level Modifier based on ISF."""
-        return Table1CharacterGeneration.get_defensive_alm(self.intelligence_skill_factor)
+        return self._stat("defensive_alm")
     
     def add_gear(self, gear: Gear) -> None:
-        """Add equipment to character (deep copy to avoid mutating database templates)."""
-        self.equipment.append(copy.deepcopy(gear))
+        """Add equipment to character; templates are shared, only per-instance state is copied."""
+        self.equipment.append(gear.instantiate())
+        self.invalidate_stats()
     
+    def clone(self) -> 'Character':
+        """Return an independent copy, e.g. of a roster template.
+
+        Unlike deepcopy, carried gear is re-instantiated, so weapons, ammo and ballistic tables
+        stay shared with their templates and only armor layer conditions are copied.
+        """
+        return Character(
+            strength=self.strength,
+            intelligence=self.intelligence,
+            will=self.will,
+            health=self.health,
+            agility=self.agility,
+            gun_combat_skill_level=self.gun_combat_skill_level,
+            physical_damage_total=self.physical_damage_total,
+            equipment=[item.instantiate() for item in self.equipment],
+            name=self.name,
+            hit_history=copy.deepcopy(self.hit_history),
+        )
+
     def remove_gear(self, gear: Gear) -> None:
         """Remove equipment from character."""
         self.equipment.remove(gear)
+        self.invalidate_stats()
     
     def apply_damage(self, damage: int, damage_result: 'DamageResult | None' = None) -> None:
         """Apply physical damage to character and optionally record the hit."""
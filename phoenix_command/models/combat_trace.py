@@ -0,0 +1,117 @@
+"""Structured, lazily rendered combat trace events.
+
+Simulation code records events as (kind, template, args) in the style of the logging module:
+the %-template is only applied when a trace is rendered, so building a trace costs one tuple per
+event and passing NULL_TRACE costs nothing. Event kinds group lines for display:
+
+    header          section banners and shot summaries
+    eal             accuracy level components (Tables 4A-4H)
+    roll            dice rolls and hit checks
+    hits            hit counts from Tables 5A and 9B, pellet and burst distribution
+    location        hit locations (Table 1)
+    armor           armor layers and penetration
+    damage          damage, shock and organ results
+    incapacitation  incapacitation checks and times (Table 8)
+    scatter         explosive scatter
+"""
+
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class TraceEvent:
+    kind: str
+    template: str
+    args: tuple = ()
+
+    def render(self) -> str:
+        return self.template % self.args
+
+
+_BLANK_LINE = TraceEvent("header", "")
+
+
+class CombatTrace:
+    """Collects trace events in order and renders them to Detailed Log text on demand."""
+
+    __slots__ = ("events",)
+    enabled = True
+
+    def __init__(self):
+        self.events: List[TraceEvent] = []
+
+    def add(self, kind: str, template: str, *args) -> None:
+        """Record an event; template is %-formatted with args only when rendered."""
+        self.events.append(TraceEvent(kind, template, args))
+
+    def extend(self, other: "CombatTrace") -> None:
+        """Append all events of another trace, e.g. a per-hit branch."""
+        self.events.extend(other.events)
+
+    def branch(self) -> "CombatTrace":
+        """Return an empty trace of the same kind for a nested sub-log."""
+        return CombatTrace()
+
+    def snapshot(self, *tails: Optional["CombatTrace"]) -> "CombatTrace":
+        """Return a copy of this trace followed by each tail's events, for attaching to a result.
+
+        Nothing is formatted. The copy renders exactly as render() with each tail's rendered
+        text would, so a missing or empty tail still adds an empty line.
+        """
+        copy = CombatTrace()
+        copy.events = self.events.copy()
+        for tail in tails:
+            if tail:
+                copy.events.extend(tail.events)
+            else:
+                copy.events.append(_BLANK_LINE)
+        return copy
+
+    def of_kind(self, *kinds: str) -> List[TraceEvent]:
+        return [event for event in self.events if event.kind in kinds]
+
+    def lines(self) -> List[str]:
+        return [event.render() for event in self.events]
+
+    def render(self, *tails: Optional[str]) -> Optional[str]:
+        """Render the trace as newline-joined text, followed by each tail on its own line.
+
+        Args:
+            tails: Already rendered logs to append, e.g. a sub-result's log; None renders as "".
+
+        Returns:
+            The log text, or None for a disabled trace.
+        """
+        return "\n".join([*self.lines(), *(tail or "" for tail in tails)])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.lines())
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+
+class NullTrace(CombatTrace):
+    """A trace that records nothing; headless and batch runs pass NULL_TRACE."""
+
+    __slots__ = ()
+    enabled = False
+
+    def add(self, kind: str, template: str, *args) -> None:
+        pass
+
+    def extend(self, other: CombatTrace) -> None:
+        pass
+
+    def branch(self) -> CombatTrace:
+        return self
+
+    def snapshot(self, *tails: Optional[CombatTrace]) -> CombatTrace:
+        return self
+
+    def render(self, *tails: Optional[str]) -> Optional[str]:
+        return None
+
+
+NULL_TRACE = NullTrace()
@@ -1,13 +1,15 @@
+import bisect
 import random
+import dataclasses
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import ClassVar, Iterable, Optional, Sequence
 
 from phoenix_command.models.enums import AmmoFeedDevice, AdvancedHitLocation, ArmorMaterial, Caliber, WeaponType, \
     Country, GrenadeType
 from phoenix_command.tables.core.table3_hit_location_and_damage import Table3HitLocationAndDamage
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BallisticData:
     """Ballistic characteristics at specific range."""
     range_hexes: int
@@ -18,7 +20,7 @@ class BallisticData:
     base_pellet_hit_chance: Optional[str] = None
     pattern_radius: Optional[float] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExplosiveData:
     """Explosive characteristics at specific burst ranges."""
     range_hexes: Optional[int] #can be None if explosion is in contact with target
@@ -28,13 +30,109 @@ class ExplosiveData:
     base_concussion: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RangeData:
     """Data for a specific range."""
     range_hexes: int
     value: float
 
 
+def _scan_by_range(entries: list, range_hexes: float):
+    """Select the entry of a per-range table that applies at range_hexes.
+
+    Walks the table in order and returns the first entry whose range reaches range_hexes or whose
+    successor's range lies beyond it, falling back to the last entry. Entries without a range
+    (contact bursts) are skipped. Returns None for an empty table.
+    """
+    for i, data in enumerate(entries):
+        if data.range_hexes is None:
+            continue
+        if range_hexes <= data.range_hexes:
+            return data
+        if i < len(entries) - 1:
+            if range_hexes < entries[i + 1].range_hexes:
+                return data
+    return entries[-1] if entries else None
+
+
+@dataclass(frozen=True, slots=True)
+class RangeIndex:
+    """Per-range table compiled for bisect lookups.
+
+    breakpoints are the distinct listed ranges in ascending order. at_breakpoint[k] is the entry
+    selected at exactly breakpoints[k]; between_breakpoints[k] is the entry selected strictly below
+    breakpoints[k] and above breakpoints[k - 1], with a final slot past the last breakpoint. The
+    slots are filled from _scan_by_range, so lookups match the table walk even for unsorted tables.
+    The entries are frozen records, so the index goes stale only when the list itself is edited;
+    snapshot holds the entries it was built from to detect that.
+    """
+    snapshot: tuple
+    breakpoints: list
+    at_breakpoint: list
+    between_breakpoints: list
+
+    @classmethod
+    def build(cls, entries: list) -> "RangeIndex":
+        breakpoints = sorted({data.range_hexes for data in entries if data.range_hexes is not None})
+        if breakpoints:
+            probes = (
+                [breakpoints[0] - 1]
+                + [(low + high) / 2 for low, high in zip(breakpoints, breakpoints[1:])]
+                + [breakpoints[-1] + 1]
+            )
+        else:
+            probes = [0]
+        return cls(
+            snapshot=tuple(entries),
+            breakpoints=breakpoints,
+            at_breakpoint=[_scan_by_range(entries, r) for r in breakpoints],
+            between_breakpoints=[_scan_by_range(entries, r) for r in probes],
+        )
+
+    def is_current(self, entries: list) -> bool:
+        """Whether entries still hold the records the index was built from, in the same order."""
+        return self.snapshot == tuple(entries)
+
+    def lookup(self, range_hexes: float):
+        """Return the entry selected at range_hexes, or None for an empty table."""
+        k = bisect.bisect_left(self.breakpoints, range_hexes)
+        if k < len(self.breakpoints) and self.breakpoints[k] == range_hexes:
+            return self.at_breakpoint[k]
+        return self.between_breakpoints[k]
+
+    def lookup_batch(self, ranges: Iterable[float]) -> list:
+        """Vectorised form of lookup."""
+        breakpoints = self.breakpoints
+        at_breakpoint = self.at_breakpoint
+        between_breakpoints = self.between_breakpoints
+        count = len(breakpoints)
+        entries = []
+        for range_hexes in ranges:
+            k = bisect.bisect_left(breakpoints, range_hexes)
+            if k < count and breakpoints[k] == range_hexes:
+                entries.append(at_breakpoint[k])
+            else:
+                entries.append(between_breakpoints[k])
+        return entries
+
+
+def _range_index(indexes: dict[str, RangeIndex], name: str, entries: list) -> RangeIndex:
+    """Return the cached index of a per-range table, rebuilding it if the list's entries changed."""
+    index = indexes.get(name)
+    if index is None or not index.is_current(entries):
+        index = indexes[name] = RangeIndex.build(entries)
+    return index
+
+
+def _explosive_entry(indexes: dict[str, RangeIndex], explosive_data: list, range_hexes: int | None):
+    """Return the explosive data entry for a burst range; None selects the first (contact) entry."""
+    if not explosive_data:
+        return None
+    if range_hexes is None:
+        return explosive_data[0]
+    return _range_index(indexes, "explosive_data", explosive_data).lookup(range_hexes)
+
+
 @dataclass
 class WeaponBallisticData:
     """Complete ballistic data for a weapon at various ranges."""
@@ -44,53 +142,66 @@ class WeaponBallisticData:
     ballistic_accuracy: list[RangeData] = field(default_factory=list)  # BA - required
     time_of_flight: list[RangeData] = field(default_factory=list)  # TOF - required
 
+    _range_indexes: dict[str, RangeIndex] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     def _get_value_by_range(
             self,
-            data_list: Optional[list[RangeData]],
+            name: str,
             range_hexes: int,
             default: float | None,
     ) -> float | None:
+        data_list = getattr(self, name)
         if not data_list:
             return default
+        return _range_index(self._range_indexes, name, data_list).lookup(range_hexes).value
 
-        for i, data in enumerate(data_list):
-            if range_hexes <= data.range_hexes:
-                return data.value
-
-            if i < len(data_list) - 1:
-                if range_hexes < data_list[i + 1].range_hexes:
-                    return data.value
-
-        return data_list[-1].value
+    def _get_values_by_range(
+            self,
+            name: str,
+            ranges: Iterable[int],
+            default: float | None,
+    ) -> list[float | None]:
+        data_list = getattr(self, name)
+        if not data_list:
+            return [default for _ in ranges]
+        return [data.value for data in _range_index(self._range_indexes, name, data_list).lookup_batch(ranges)]
 
     def get_three_round_burst(self, range_hexes: int) -> Optional[float]:
         return self._get_value_by_range(
-            self.three_round_burst,
+            "three_round_burst",
             range_hexes,
             None,
         )
 
     def get_minimum_arc(self, range_hexes: int) -> Optional[float]:
         return self._get_value_by_range(
-            self.minimum_arc,
+            "minimum_arc",
             range_hexes,
             None,
         )
 
     def get_ballistic_accuracy(self, range_hexes: int) -> int:
         return self._get_value_by_range(
-            self.ballistic_accuracy,
+            "ballistic_accuracy",
             range_hexes,
             0,
         ) or 0
 
     def get_time_of_flight(self, range_hexes: int) -> float:
         return self._get_value_by_range(
-            self.time_of_flight,
+            "time_of_flight",
             range_hexes,
             0.0,
         ) or 0.0
 
+    def get_ballistic_accuracy_batch(self, ranges: Iterable[int]) -> list[int]:
+        """Vectorised form of get_ballistic_accuracy."""
+        return [value or 0 for value in self._get_values_by_range("ballistic_accuracy", ranges, 0)]
+
+    def get_time_of_flight_batch(self, ranges: Iterable[int]) -> list[float]:
+        """Vectorised form of get_time_of_flight."""
+        return [value or 0.0 for value in self._get_values_by_range("time_of_flight", ranges, 0.0)]
+
 @dataclass
 class Gear:
     """Base class for all equipment items."""
@@ -98,6 +209,14 @@ class Gear:
     weight: float  # in pounds
     description: str = field(default="", kw_only=True)
 
+    def instantiate(self) -> "Gear":
+        """Return the instance a character carries.
+
+        Gear without per-instance state is never modified at runtime, so the template itself is
+        shared; subclasses with mutable state return a copy of just that state.
+        """
+        return self
+
 
 @dataclass
 class AmmoType(Gear):
@@ -106,93 +225,85 @@ class AmmoType(Gear):
     explosive_data: list[ExplosiveData] = field(default_factory=list)
     pellet_count: Optional[int] = None
 
+    _range_indexes: dict[str, RangeIndex] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _ballistic_index(self) -> Optional[RangeIndex]:
+        if not self.ballistic_data:
+            return None
+        return _range_index(self._range_indexes, "ballistic_data", self.ballistic_data)
+
     def get_pen(self, range_hexes: int) -> float:
         """Get penetration value for a given range."""
-        for i, data in enumerate(self.ballistic_data):
-            if range_hexes <= data.range_hexes:
-                return data.penetration
-            if i < len(self.ballistic_data) - 1:
-                if range_hexes < self.ballistic_data[i + 1].range_hexes:
-                    return data.penetration
-        return self.ballistic_data[-1].penetration if self.ballistic_data else 0.0
+        index = self._ballistic_index()
+        return index.lookup(range_hexes).penetration if index is not None else 0.0
 
     def get_dc(self, range_hexes: int) -> int:
         """Get damage class for a given range."""
-        for i, data in enumerate(self.ballistic_data):
-            if range_hexes <= data.range_hexes:
-                return data.damage_class
-            if i < len(self.ballistic_data) - 1:
-                if range_hexes < self.ballistic_data[i + 1].range_hexes:
-                    return data.damage_class
-        return self.ballistic_data[-1].damage_class if self.ballistic_data else 0
+        index = self._ballistic_index()
+        return index.lookup(range_hexes).damage_class if index is not None else 0
+
+    def get_pen_batch(self, ranges: Iterable[int]) -> list[float]:
+        """Vectorised form of get_pen."""
+        index = self._ballistic_index()
+        if index is None:
+            return [0.0 for _ in ranges]
+        return [data.penetration for data in index.lookup_batch(ranges)]
+
+    def get_dc_batch(self, ranges: Iterable[int]) -> list[int]:
+        """Vectorised form of get_dc."""
+        index = self._ballistic_index()
+        if index is None:
+            return [0 for _ in ranges]
+        return [data.damage_class for data in index.lookup_batch(ranges)]
 
     def get_base_shrapnel_hit_chance(self, range_hexes: int | None) -> Optional[str]:
         """Get base shrapnel hit chance for a given range from burst."""
-        if range_hexes is None:
-            return self.explosive_data[0].base_shrapnel_hit_chance if self.explosive_data else None
-
-        for i, data in enumerate(self.explosive_data):
-            if data.range_hexes is None:
-                continue
-            if range_hexes <= data.range_hexes:
-                return data.base_shrapnel_hit_chance
-            if i < len(self.explosive_data) - 1:
-                if range_hexes < self.explosive_data[i + 1].range_hexes:
-                    return data.base_shrapnel_hit_chance
-        return self.explosive_data[-1].base_shrapnel_hit_chance if self.explosive_data else None
+        data = _explosive_entry(self._range_indexes, self.explosive_data, range_hexes)
+        return data.base_shrapnel_hit_chance if data is not None else None
 
     def get_explosion_pen(self, range_hexes: int | None) -> float:
         """Get shrapnel penetration for a given range from burst."""
-        if range_hexes is None:
-            return self.explosive_data[0].shrapnel_penetration if self.explosive_data else 0.0
-
-        for i, data in enumerate(self.explosive_data):
-            if data.range_hexes is None:
-                continue
-            if range_hexes <= data.range_hexes:
-                return data.shrapnel_penetration
-            if i < len(self.explosive_data) - 1:
-                if range_hexes < self.explosive_data[i + 1].range_hexes:
-                    return data.shrapnel_penetration
-        return self.explosive_data[-1].shrapnel_penetration if self.explosive_data else 0.0
+        data = _explosive_entry(self._range_indexes, self.explosive_data, range_hexes)
+        return data.shrapnel_penetration if data is not None else 0.0
 
     def get_explosion_dc(self, range_hexes: int | None) -> int:
         """Get shrapnel damage class for a given range from burst."""
-        if range_hexes is None:
-            return self.explosive_data[0].shrapnel_damage_class if self.explosive_data else 0
-
-        for i, data in enumerate(self.explosive_data):
-            if data.range_hexes is None:
-                continue
-            if range_hexes <= data.range_hexes:
-                return data.shrapnel_damage_class
-            if i < len(self.explosive_data) - 1:
-                if range_hexes < self.explosive_data[i + 1].range_hexes:
-                    return data.shrapnel_damage_class
-        return self.explosive_data[-1].shrapnel_damage_class if self.explosive_data else 0
+        data = _explosive_entry(self._range_indexes, self.explosive_data, range_hexes)
+        return data.shrapnel_damage_class if data is not None else 0
 
     def get_base_concussion(self, range_hexes: int | None) -> Optional[int]:
         """Get base concussion damage for a given range from burst."""
-        if range_hexes is None:
-            return self.explosive_data[0].base_concussion if self.explosive_data else None
-
-        for i, data in enumerate(self.explosive_data):
-            if data.range_hexes is None:
-                continue
-            if range_hexes <= data.range_hexes:
-                return data.base_concussion
-            if i < len(self.explosive_data) - 1:
-                if range_hexes < self.explosive_data[i + 1].range_hexes:
-                    return data.base_concussion
-        return self.explosive_data[-1].base_concussion if self.explosive_data else None
+        data = _explosive_entry(self._range_indexes, self.explosive_data, range_hexes)
+        return data.base_concussion if data is not None else None
 
-@dataclass
+@dataclass(slots=True)
 class ArmorLayer:
     """Single layer of armor protection."""
     material: ArmorMaterial
     protection_factor: int  # Ballistic protection value
     blunt_protection_factor: int  # Protection against blunt trauma when armor stops penetration
     current_condition: float = 1.0  # 1.0 = pristine, 0.0 = destroyed
+    # (stack, piece index) of every ArmorStack this layer belongs to, kept current on degradation
+    _stacks: list[tuple['ArmorStack', int]] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    # Fields effective protection depends on; assigning any of them adjusts the registered stacks
+    PROTECTION_INPUTS: ClassVar[frozenset[str]] = frozenset({
+        "protection_factor", "blunt_protection_factor", "current_condition",
+    })
+
+    def __setattr__(self, name, value) -> None:
+        stacks = getattr(self, "_stacks", None) if name in self.PROTECTION_INPUTS else None
+        if not stacks:
+            object.__setattr__(self, name, value)
+            return
+        protection, blunt_protection = self.effective_protection, self.effective_blunt_protection
+        object.__setattr__(self, name, value)
+        for stack, piece in stacks:
+            stack.adjust(
+                piece,
+                self.effective_protection - protection,
+                self.effective_blunt_protection - blunt_protection,
+            )
 
     @property
     def effective_protection(self) -> int:
@@ -205,11 +316,13 @@ class ArmorLayer:
         return int(self.blunt_protection_factor * self.current_condition)
 
     def apply_hit_damage(self) -> None:
-        degradation_percent = self.material.degradation_on_hit / 100.0
-        self.current_condition = max(0.0, self.current_condition * (1.0 - degradation_percent))
+        self._degrade(self.material.degradation_on_hit)
 
     def apply_penetration_damage(self) -> None:
-        degradation_percent = self.material.degradation_on_penetration / 100.0
+        self._degrade(self.material.degradation_on_penetration)
+
+    def _degrade(self, degradation: float) -> None:
+        degradation_percent = degradation / 100.0
         self.current_condition = max(0.0, self.current_condition * (1.0 - degradation_percent))
 
 
@@ -226,27 +339,55 @@ class ArmorProtectionData:
         """Get total blunt protection factor from all layers."""
         return sum(layer.effective_blunt_protection for layer in self.layers)
 
-    def process_hit(self, penetration: float) -> tuple[bool, int]:
-        roll = random.randint(0, 9)
+    def resolve_hit(self, penetration: float, roll: int) -> tuple[bool, int, int]:
+        """Resolve a hit without degrading the layers.
+
+        Returns:
+            Tuple of (penetrated, remaining_pen, layers_penetrated). When not penetrated,
+            the layer at index layers_penetrated is the one that stopped the round.
+        """
+        return self.resolve_layers([layer.effective_protection for layer in self.layers], penetration, roll)
+
+    @staticmethod
+    def resolve_layers(layer_protections: Sequence[int], penetration: float, roll: int) -> tuple[bool, int, int]:
+        """Resolve a hit against layers given by their effective protection, outermost first.
+
+        Same result as resolve_hit; lets exact probability code work from hashable armor
+        signatures instead of live armor objects.
+        """
         remaining_pen = penetration
-        
-        for layer in self.layers:
+        layers_penetrated = 0
+
+        for base_protection in layer_protections:
             if remaining_pen <= 0:
                 break
-            
-            base_protection = layer.effective_protection
+
             effective_protection = Table3HitLocationAndDamage.get_effective_pf(base_protection, roll)
-            
+
             if remaining_pen > effective_protection:
-                layer.apply_penetration_damage()
+                layers_penetrated += 1
                 remaining_pen -= effective_protection
             else:
-                layer.apply_hit_damage()
                 remaining_pen = 0
                 break
 
         penetrated = remaining_pen > 0
-        return penetrated, int(remaining_pen)
+        return penetrated, int(remaining_pen), layers_penetrated
+
+    def process_hit(self, penetration: float, rng: Optional[random.Random] = None) -> tuple[bool, int]:
+        roll = (rng or random).randint(0, 9)
+        penetrated, remaining_pen, layers_penetrated = self.resolve_hit(penetration, roll)
+
+        for layer in self.layers[:layers_penetrated]:
+            layer.apply_penetration_damage()
+        if not penetrated and layers_penetrated < len(self.layers) and penetration > 0:
+            self.layers[layers_penetrated].apply_hit_damage()
+
+        return penetrated, remaining_pen
+
+    def instantiate(self) -> "ArmorProtectionData":
+        """Copy the layers, whose condition degrades per instance."""
+        return ArmorProtectionData(layers=[dataclasses.replace(layer) for layer in self.layers])
 
     def add_layer(
             self,
@@ -305,6 +446,12 @@ class Armor(Gear):
         self.protection.setdefault(key, ArmorProtectionData()) \
             .add_layer(material, protection_factor, blunt_protection_factor)
 
+    def instantiate(self) -> "Armor":
+        """Share the template's descriptive fields; give the instance its own layer conditions."""
+        return dataclasses.replace(
+            self, protection={key: data.instantiate() for key, data in self.protection.items()}
+        )
+
     def get_protection(self, location: AdvancedHitLocation, is_front: bool) -> ArmorProtectionData | None:
         """Get armor protection data for a specific location and side."""
         return self.protection.get((location, is_front))
@@ -324,14 +471,15 @@ class Armor(Gear):
         self,
         location: AdvancedHitLocation,
         is_front: bool,
-        penetration: float
+        penetration: float,
+        rng: Optional[random.Random] = None
     ) -> tuple[bool, int]:
         """Process a hit against this armor at a specific location."""
         protection_data = self.get_protection(location, is_front)
         if protection_data is None:
             return True, int(penetration)
 
-        penetrated, remaining_pen = protection_data.process_hit(penetration)
+        penetrated, remaining_pen = protection_data.process_hit(penetration, rng)
 
         for layer in protection_data.layers:
             if layer.material.global_degradation:
@@ -341,6 +489,58 @@ class Armor(Gear):
         return penetrated, remaining_pen
 
 
+@dataclass(eq=False)
+class ArmorStack:
+    """Armor pieces covering one (location, is_front), outermost first, with running PF totals.
+
+    Every layer of an added piece registers the stack, and any change to a layer's condition or
+    protection factors adjusts the totals by the change in effective protection, so they never
+    need re-summing.
+    """
+    pieces: list[tuple[Armor, ArmorProtectionData]] = field(default_factory=list)
+    piece_protection: list[int] = field(default_factory=list)
+    piece_blunt_protection: list[int] = field(default_factory=list)
+    total_protection: int = 0
+    total_blunt_protection: int = 0
+
+    def add(self, armor: Armor, protection_data: ArmorProtectionData) -> None:
+        piece = len(self.pieces)
+        self.pieces.append((armor, protection_data))
+        self.piece_protection.append(protection_data.get_total_protection())
+        self.piece_blunt_protection.append(protection_data.get_total_blunt_protection())
+        self.total_protection += self.piece_protection[piece]
+        self.total_blunt_protection += self.piece_blunt_protection[piece]
+        for layer in protection_data.layers:
+            layer._stacks.append((self, piece))
+
+    def adjust(self, piece: int, protection_delta: int, blunt_protection_delta: int) -> None:
+        """Apply a change in one piece's effective protection."""
+        self.piece_protection[piece] += protection_delta
+        self.piece_blunt_protection[piece] += blunt_protection_delta
+        self.total_protection += protection_delta
+        self.total_blunt_protection += blunt_protection_delta
+
+    def active_pieces(self) -> list[tuple[Armor, ArmorProtectionData]]:
+        """Pieces that still have protection left, outermost first."""
+        return [entry for entry, protection in zip(self.pieces, self.piece_protection) if protection > 0]
+
+    def detach(self) -> None:
+        """Stop receiving degradation updates, e.g. when the owning index is rebuilt."""
+        for _, protection_data in self.pieces:
+            for layer in protection_data.layers:
+                layer._stacks = [entry for entry in layer._stacks if entry[0] is not self]
+
+
+def build_armor_index(equipment: list[Gear]) -> dict[tuple[AdvancedHitLocation, bool], ArmorStack]:
+    """Index worn armor by (location, is_front), keeping equipment order within each stack."""
+    index: dict[tuple[AdvancedHitLocation, bool], ArmorStack] = {}
+    for item in equipment:
+        if isinstance(item, Armor):
+            for key, protection_data in item.protection.items():
+                index.setdefault(key, ArmorStack()).add(item, protection_data)
+    return index
+
+
 @dataclass
 class Weapon(Gear):
     """Weapon with ballistic and operational characteristics."""
@@ -383,62 +583,24 @@ class Grenade(Gear):
     range: range
     explosive_data: list[ExplosiveData] = field(default_factory=list)
 
+    _range_indexes: dict[str, RangeIndex] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     def get_base_shrapnel_hit_chance(self, range_hexes: int | None) -> Optional[str]:
         """Get base shrapnel hit chance for a given range from burst."""
-        if range_hexes is None:
-            return self.explosive_data[0].base_shrapnel_hit_chance if self.explosive_data else None
-
-        for i, data in enumerate(self.explosive_data):
-            if data.range_hexes is None:
-                continue
-            if range_hexes <= data.range_hexes:
-                return data.base_shrapnel_hit_chance
-            if i < len(self.explosive_data) - 1:
-                if range_hexes < self.explosive_data[i + 1].range_hexes:
-                    return data.base_shrapnel_hit_chance
-        return self.explosive_data[-1].base_shrapnel_hit_chance if self.explosive_data else None
+        data = _explosive_entry(self._range_indexes, self.explosive_data, range_hexes)
+        return data.base_shrapnel_hit_chance if data is not None else None
 
     def get_explosion_pen(self, range_hexes: int | None) -> float:
         """Get shrapnel penetration for a given range from burst."""
-        if range_hexes is None:
-            return self.explosive_data[0].shrapnel_penetration if self.explosive_data else 0.0
-
-        for i, data in enumerate(self.explosive_data):
-            if data.range_hexes is None:
-                continue
-            if range_hexes <= data.range_hexes:
-                return data.shrapnel_penetration
-            if i < len(self.explosive_data) - 1:
-                if range_hexes < self.explosive_data[i + 1].range_hexes:
-                    return data.shrapnel_penetration
-        return self.explosive_data[-1].shrapnel_penetration if self.explosive_data else 0.0
+        data = _explosive_entry(self._range_indexes, self.explosive_data, range_hexes)
+        return data.shrapnel_penetration if data is not None else 0.0
 
     def get_explosion_dc(self, range_hexes: int | None) -> int:
         """Get shrapnel damage class for a given range from burst."""
-        if range_hexes is None:
-            return self.explosive_data[0].shrapnel_damage_class if self.explosive_data else 0
-
-        for i, data in enumerate(self.explosive_data):
-            if data.range_hexes is None:
-                continue
-            if range_hexes <= data.range_hexes:
-                return data.shrapnel_damage_class
-            if i < len(self.explosive_data) - 1:
-                if range_hexes < self.explosive_data[i + 1].range_hexes:
-                    return data.shrapnel_damage_class
-        return self.explosive_data[-1].shrapnel_damage_class if self.explosive_data else 0
+        data = _explosive_entry(self._range_indexes, self.explosive_data, range_hexes)
+        return data.shrapnel_damage_class if data is not None else 0
 
     def get_base_concussion(self, range_hexes: int | None) -> Optional[int]:
         """Get base concussion damage for a given range from burst."""
-        if range_hexes is None:
-            return self.explosive_data[0].base_concussion if self.explosive_data else None
-
-        for i, data in enumerate(self.explosive_data):
-            if data.range_hexes is None:
-                continue
-            if range_hexes <= data.range_hexes:
-                return data.base_concussion
-            if i < len(self.explosive_data) - 1:
-                if range_hexes < self.explosive_data[i + 1].range_hexes:
-                    return data.base_concussion
-        return self.explosive_data[-1].base_concussion if self.explosive_data else None
+        data = _explosive_entry(self._range_indexes, self.explosive_data, range_hexes)
+        return data.base_concussion if data is not None else None
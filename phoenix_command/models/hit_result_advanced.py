@@ -1,14 +1,18 @@
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
+from phoenix_command.models.combat_trace import CombatTrace
 from phoenix_command.models.enums import AdvancedHitLocation, SituationStanceModifier4B, VisibilityModifier4C, TargetOrientation, IncapacitationEffect, TargetExposure
 from phoenix_command.models.recovery import Recovery
+from phoenix_command.tables.core.table8_healing_and_recovery import Table8HealingAndRecovery
 
 if TYPE_CHECKING:
     from phoenix_command.models.character import Character
+    from phoenix_command.models.gear import AmmoType, Weapon
 
 
-@dataclass
+@dataclass(slots=True)
 class DamageResult:
     location: AdvancedHitLocation
     damage: int = 0
@@ -19,7 +23,43 @@ class DamageResult:
     pierced_organs: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True)
+class DamageRecord:
+    """Immutable damage outcome, shared between hits with identical inputs."""
+    location: AdvancedHitLocation
+    damage: int = 0
+    shock: int = 0
+    excess_epen: float = 0.0
+    is_disabled: bool = False
+    weapon_damaged: bool = False
+    pierced_organs: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_damage_result(cls, result: DamageResult) -> 'DamageRecord':
+        return cls(
+            location=result.location,
+            damage=result.damage,
+            shock=result.shock,
+            excess_epen=result.excess_epen,
+            is_disabled=result.is_disabled,
+            weapon_damaged=result.weapon_damaged,
+            pierced_organs=tuple(result.pierced_organs),
+        )
+
+    def to_damage_result(self) -> DamageResult:
+        """Mutable copy for callers that adjust or store the result."""
+        return DamageResult(
+            location=self.location,
+            damage=self.damage,
+            shock=self.shock,
+            excess_epen=self.excess_epen,
+            is_disabled=self.is_disabled,
+            weapon_damaged=self.weapon_damaged,
+            pierced_organs=list(self.pierced_organs),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class ShotParameters:
     """Parameters for a single shot."""
     aim_time_ac: int
@@ -33,7 +73,7 @@ class ShotParameters:
     custom_eal_modifiers: List[tuple] = field(default_factory=list)  # (label, alm)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ShotResult:
     """Result of a shot."""
     hit: bool
@@ -45,7 +85,270 @@ class ShotResult:
     incapacitation_effect: Optional[IncapacitationEffect] = None
     recovery: Optional[Recovery] = None
     incapacitation_time_phases: Optional[int] = None
-    log: Optional[str] = None
+    trace: Optional[CombatTrace] = None
+
+    @property
+    def log(self) -> Optional[str]:
+        """Detailed Log text, rendered from the trace on access; None when the shot was not traced."""
+        return self.trace.render() if self.trace is not None else None
+
+
+@dataclass
+class ShotResultBatch:
+    """Struct-of-arrays store for many shots at one target.
+
+    Each outcome field is a typed array column (one byte per hit flag, four per integer) instead of
+    one ShotResult object per shot; columns expose the buffer protocol, so numpy can wrap them
+    without copying. row() rebuilds a ShotResult on demand.
+    """
+    target: Optional['Character'] = None
+    hits: array = field(default_factory=lambda: array('b'))
+    eals: array = field(default_factory=lambda: array('i'))
+    odds: array = field(default_factory=lambda: array('i'))
+    rolls: array = field(default_factory=lambda: array('i'))
+    damages: array = field(default_factory=lambda: array('i'))
+    shocks: array = field(default_factory=lambda: array('i'))
+    locations: List[Optional[AdvancedHitLocation]] = field(default_factory=list)
+    incapacitation_effects: List[Optional[IncapacitationEffect]] = field(default_factory=list)
+
+    def append(
+        self,
+        hit: bool,
+        eal: int,
+        odds: int,
+        roll: int,
+        damage: int = 0,
+        shock: int = 0,
+        location: Optional[AdvancedHitLocation] = None,
+        incapacitation_effect: Optional[IncapacitationEffect] = None,
+    ) -> None:
+        self.hits.append(hit)
+        self.eals.append(eal)
+        self.odds.append(odds)
+        self.rolls.append(roll)
+        self.damages.append(damage)
+        self.shocks.append(shock)
+        self.locations.append(location)
+        self.incapacitation_effects.append(incapacitation_effect)
+
+    def append_result(self, result: ShotResult) -> None:
+        damage_result = result.damage_result
+        self.append(
+            result.hit, result.eal, result.odds, result.roll,
+            damage_result.damage if damage_result else 0,
+            damage_result.shock if damage_result else 0,
+            damage_result.location if damage_result else None,
+            result.incapacitation_effect,
+        )
+
+    @classmethod
+    def from_results(cls, results: Sequence[ShotResult]) -> 'ShotResultBatch':
+        """Pack shot results; the target of the first result is kept."""
+        batch = cls(target=results[0].target if results else None)
+        for result in results:
+            batch.append_result(result)
+        return batch
+
+    def row(self, index: int) -> ShotResult:
+        """Rebuild one shot as a ShotResult, without log, recovery or incapacitation time."""
+        location = self.locations[index]
+        return ShotResult(
+            hit=bool(self.hits[index]),
+            eal=self.eals[index],
+            odds=self.odds[index],
+            roll=self.rolls[index],
+            target=self.target,
+            damage_result=DamageResult(location, self.damages[index], self.shocks[index]) if location else None,
+            incapacitation_effect=self.incapacitation_effects[index],
+        )
+
+    def __len__(self) -> int:
+        return len(self.hits)
+
+    @property
+    def hit_rate(self) -> float:
+        return sum(self.hits) / len(self.hits) if self.hits else 0.0
+
+    @property
+    def mean_damage(self) -> float:
+        return sum(self.damages) / len(self.damages) if self.damages else 0.0
+
+    @property
+    def incapacitation_probability(self) -> float:
+        if not self.hits:
+            return 0.0
+        return sum(effect is not None for effect in self.incapacitation_effects) / len(self.hits)
+
+
+@dataclass
+class PatternHits:
+    """Pellet or fragment hits on one target, resolved without per-hit logs or results.
+
+    location_counts holds the multinomial draw of hit locations; the per-hit columns are in
+    resolution order, with physical_damage_totals the target's running total after each hit.
+    to_shot_results() builds the per-hit ShotResults the GUI lists, only when asked.
+    """
+    target: 'Character'
+    odds: int = 0
+    location_counts: Dict[AdvancedHitLocation, int] = field(default_factory=dict)
+    damage_results: List[DamageResult] = field(default_factory=list)
+    incapacitation_effects: List[Optional[IncapacitationEffect]] = field(default_factory=list)
+    incapacitation_times: List[Optional[int]] = field(default_factory=list)
+    physical_damage_totals: List[int] = field(default_factory=list)
+
+    def append(
+        self,
+        damage_result: DamageResult,
+        incapacitation_effect: Optional[IncapacitationEffect],
+        incapacitation_time: Optional[int],
+        physical_damage_total: int,
+    ) -> None:
+        self.damage_results.append(damage_result)
+        self.incapacitation_effects.append(incapacitation_effect)
+        self.incapacitation_times.append(incapacitation_time)
+        self.physical_damage_totals.append(physical_damage_total)
+
+    def __len__(self) -> int:
+        return len(self.damage_results)
+
+    @property
+    def total_damage(self) -> int:
+        return sum(damage_result.damage for damage_result in self.damage_results)
+
+    @property
+    def incapacitation_effect(self) -> Optional[IncapacitationEffect]:
+        """First incapacitation effect any hit caused, if any."""
+        return next((effect for effect in self.incapacitation_effects if effect is not None), None)
+
+    def to_shot_results(self, eal: int = 0, roll: int = 0) -> List[ShotResult]:
+        """One ShotResult per hit, as the per-hit paths return them (without per-hit logs)."""
+        recoveries = Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a_batch(
+            self.physical_damage_totals, [self.target.health] * len(self)
+        )
+        return [
+            ShotResult(
+                hit=True,
+                eal=eal,
+                odds=self.odds,
+                roll=roll,
+                target=self.target,
+                damage_result=damage_result,
+                incapacitation_effect=effect,
+                recovery=recovery,
+                incapacitation_time_phases=incapacitation_time,
+            )
+            for damage_result, effect, incapacitation_time, recovery in zip(
+                self.damage_results, self.incapacitation_effects, self.incapacitation_times, recoveries
+            )
+        ]
+
+
+@dataclass
+class MonteCarloShotSummary:
+    """Aggregate outcome of many independent single-shot trials against the same target state."""
+    trials: int
+    eal: int
+    odds: int
+    hits: int = 0
+    damage_histogram: Dict[int, int] = field(default_factory=dict)  # Damage -> trials, misses count as 0
+    location_counts: Dict[AdvancedHitLocation, int] = field(default_factory=dict)
+    incapacitation_counts: Dict[IncapacitationEffect, int] = field(default_factory=dict)
+    expected_deaths: float = 0.0  # Sum over damaging hits of the Table 8A chance of not recovering
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.trials if self.trials else 0.0
+
+    @property
+    def mean_damage(self) -> float:
+        if not self.trials:
+            return 0.0
+        return sum(damage * count for damage, count in self.damage_histogram.items()) / self.trials
+
+    @property
+    def incapacitation_probability(self) -> float:
+        return sum(self.incapacitation_counts.values()) / self.trials if self.trials else 0.0
+
+    @property
+    def death_probability(self) -> float:
+        return self.expected_deaths / self.trials if self.trials else 0.0
+
+    @property
+    def location_frequencies(self) -> Dict[AdvancedHitLocation, float]:
+        """Share of hits landing on each location."""
+        return {location: count / self.hits for location, count in self.location_counts.items()} if self.hits else {}
+
+    def damage_percentile(self, percentile: float) -> int:
+        """Nearest-rank damage percentile over all trials."""
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {percentile}")
+        if not self.trials:
+            return 0
+        rank = max(1, -(-percentile * self.trials // 100))
+        seen = 0
+        for damage in sorted(self.damage_histogram):
+            seen += self.damage_histogram[damage]
+            if seen >= rank:
+                return damage
+        return max(self.damage_histogram)
+
+    def damage_percentiles(self, percentiles: Sequence[float] = (5, 25, 50, 75, 95)) -> Dict[float, int]:
+        return {p: self.damage_percentile(p) for p in percentiles}
+
+
+@dataclass
+class ShotOutcomeDistribution:
+    """Exact outcome distribution of one single shot against a fixed target state.
+
+    The analytic counterpart of MonteCarloShotSummary: probabilities replace trial counts.
+    """
+    eal: int
+    odds: int
+    hit_probability: float
+    outcomes: Dict[Tuple[int, Optional[IncapacitationEffect]], float] = field(default_factory=dict)  # (damage, effect) -> probability, misses are (0, None)
+    location_probabilities: Dict[AdvancedHitLocation, float] = field(default_factory=dict)  # Given a hit
+    death_probability: float = 0.0  # Chance that a damaging hit is not recovered from (Table 8A)
+
+    @property
+    def damage_pmf(self) -> Dict[int, float]:
+        """Probability of each damage value, misses included as 0."""
+        pmf: Dict[int, float] = {}
+        for (damage, _), probability in self.outcomes.items():
+            pmf[damage] = pmf.get(damage, 0.0) + probability
+        return dict(sorted(pmf.items()))
+
+    @property
+    def effect_probabilities(self) -> Dict[IncapacitationEffect, float]:
+        result: Dict[IncapacitationEffect, float] = {}
+        for (_, effect), probability in self.outcomes.items():
+            if effect is not None:
+                result[effect] = result.get(effect, 0.0) + probability
+        return result
+
+    @property
+    def mean_damage(self) -> float:
+        return sum(damage * probability for (damage, _), probability in self.outcomes.items())
+
+    @property
+    def incapacitation_probability(self) -> float:
+        return sum(self.effect_probabilities.values())
+
+    def damage_percentile(self, percentile: float) -> int:
+        """Smallest damage whose cumulative probability reaches the percentile."""
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {percentile}")
+        pmf = self.damage_pmf
+        if not pmf:
+            return 0
+        cumulative = 0.0
+        for damage, probability in pmf.items():
+            cumulative += probability
+            if cumulative >= percentile / 100 - 1e-12:
+                return damage
+        return max(pmf)
+
+    def damage_percentiles(self, percentiles: Sequence[float] = (5, 25, 50, 75, 95)) -> Dict[float, int]:
+        return {p: self.damage_percentile(p) for p in percentiles}
 
 
 @dataclass
@@ -68,6 +371,83 @@ class TargetGroup:
     is_front_shots: List[bool]
 
 
+@dataclass
+class BurstScenario:
+    """One burst or shotgun-burst fire setup to be resolved over many trials.
+
+    When pattern_target_groups is set the scenario is fired with shotgun_burst_fire,
+    otherwise with burst_fire.
+    """
+    shooter: 'Character'
+    weapon: 'Weapon'
+    ammo: 'AmmoType'
+    target_group: TargetGroup
+    arc_of_fire: Optional[float] = None
+    continuous_burst_impulses: int = 0
+    pattern_target_groups: Optional[List[TargetGroup]] = None
+    label: str = ""
+
+    @property
+    def all_targets(self) -> List['Character']:
+        """Primary targets followed by every pattern group's targets, in aggregate order.
+
+        A character placed in several slots (as a primary and a pattern target, or in two pattern
+        groups) takes every hit on the same object, so it is listed once, at its first slot.
+        """
+        targets = {}
+        for group in [self.target_group, *(self.pattern_target_groups or [])]:
+            for target in group.targets:
+                targets.setdefault(id(target), target)
+        return list(targets.values())
+
+
+@dataclass
+class BurstScenarioSummary:
+    """Per-target aggregate outcome of many burst trials; lists follow BurstScenario.all_targets."""
+    label: str
+    target_names: List[str]
+    trials: int = 0
+    volleys_hit: int = 0  # Trials in which at least one target was hit
+    hits: List[int] = field(default_factory=list)
+    damage: List[int] = field(default_factory=list)
+    incapacitated: List[int] = field(default_factory=list)  # Trials in which the target was incapacitated
+
+    def __post_init__(self):
+        size = len(self.target_names)
+        for counts in (self.hits, self.damage, self.incapacitated):
+            if not counts:
+                counts.extend([0] * size)
+            elif len(counts) != size:
+                raise ValueError(f"Expected {size} per-target counts, got {len(counts)}")
+
+    def merge(self, other: 'BurstScenarioSummary') -> None:
+        """Add the counts of another summary of the same scenario."""
+        if other.target_names != self.target_names:
+            raise ValueError("Cannot merge summaries of different target layouts")
+        self.trials += other.trials
+        self.volleys_hit += other.volleys_hit
+        for mine, theirs in ((self.hits, other.hits), (self.damage, other.damage),
+                             (self.incapacitated, other.incapacitated)):
+            for i, value in enumerate(theirs):
+                mine[i] += value
+
+    @property
+    def hit_rate(self) -> float:
+        return self.volleys_hit / self.trials if self.trials else 0.0
+
+    @property
+    def mean_hits(self) -> List[float]:
+        return [count / self.trials if self.trials else 0.0 for count in self.hits]
+
+    @property
+    def mean_damage(self) -> List[float]:
+        return [total / self.trials if self.trials else 0.0 for total in self.damage]
+
+    @property
+    def incapacitation_probability(self) -> List[float]:
+        return [count / self.trials if self.trials else 0.0 for count in self.incapacitated]
+
+
 @dataclass
 class ExplosiveShotResult:
     """Result of explosive weapon or grenade shot."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import uuid
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Generic, Iterable, Iterator, TypeVar
 
 
 def _hex_key(q: int, r: int) -> str:
@@ -36,6 +36,11 @@ def _parse_wall_key(key: str) -> tuple[int, int, int | str]:
     return int(q), int(r), int(edge)
 
 
+def key_hexes(keys: Iterable[str]) -> list[tuple[int, int]]:
+    """Hexes owning MapLayer obstacle or wall keys ("q,r" or "q,r:edge")."""
+    return [_parse_hex_key(key.split(":", 1)[0]) for key in keys]
+
+
 def is_hex_wall_key(key: str) -> bool:
     return key.endswith(f":{HEX_WALL_EDGE}")
 
@@ -43,7 +48,165 @@ def is_hex_wall_key(key: str) -> bool:
 def layer_has_hex_wall(layer: "MapLayer | None", q: int, r: int) -> bool:
     if not layer:
         return False
-    return hex_wall_key(q, r) in layer.walls
+    return layer.walls.hex_wall_at(q, r) is not None
+
+
+# Packed cell ids: q in the high bits, r as a 20-bit two's complement field.
+# Wall cells append 3 bits for the edge, with slot 6 for a full-hex wall.
+_COORD_BITS = 20
+_COORD_MASK = (1 << _COORD_BITS) - 1
+_COORD_SIGN = 1 << (_COORD_BITS - 1)
+_EDGE_BITS = 3
+_EDGE_MASK = (1 << _EDGE_BITS) - 1
+_HEX_WALL_SLOT = 6
+
+
+def hex_cell(q: int, r: int) -> int:
+    """Packed integer id of hex (q, r); r must lie in [-2**19, 2**19)."""
+    return q << _COORD_BITS | r & _COORD_MASK
+
+
+def cell_hex(cell: int) -> tuple[int, int]:
+    """(q, r) of a packed hex id."""
+    r = cell & _COORD_MASK
+    return cell >> _COORD_BITS, r - ((r & _COORD_SIGN) << 1)
+
+
+def wall_cell(q: int, r: int, edge: int | str) -> int:
+    """Packed integer id of the wall on edge (0-5 or HEX_WALL_EDGE) of hex (q, r)."""
+    slot = _HEX_WALL_SLOT if edge == HEX_WALL_EDGE else edge
+    return (q << _COORD_BITS | r & _COORD_MASK) << _EDGE_BITS | slot
+
+
+_V = TypeVar("_V")
+
+
+class HexKeyedDict(dict[str, _V], Generic[_V]):
+    """
+    Layer data keyed by "q,r" strings, with a packed-integer index for lookups.
+
+    The string keys stay the serialization and editing view. Hot paths use
+    ``at`` and ``cell_items``, which read an index keyed by hex_cell ids
+    instead of formatting or splitting strings. The index is built on first
+    use and then kept in step with every mutation; keys that do not parse
+    are stored but not indexed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._cells: dict[int, _V] | None = None
+
+    @staticmethod
+    def _cell_of(key: str) -> int | None:
+        try:
+            q, r = key.split(",")
+            return hex_cell(int(q), int(r))
+        except (AttributeError, ValueError):
+            return None
+
+    def _index(self) -> dict[int, _V]:
+        cells = {}
+        for key, value in self.items():
+            cell = self._cell_of(key)
+            if cell is not None:
+                cells[cell] = value
+        self._cells = cells
+        return cells
+
+    def at(self, q: int, r: int) -> _V | None:
+        """Value at hex (q, r), or None."""
+        cells = self._cells
+        if cells is None:
+            cells = self._index()
+        return cells.get(q << _COORD_BITS | r & _COORD_MASK)
+
+    def cell_items(self) -> Iterator[tuple[int, int, _V]]:
+        """(q, r, value) for every indexed key."""
+        cells = self._cells
+        if cells is None:
+            cells = self._index()
+        for cell, value in cells.items():
+            yield (*cell_hex(cell), value)
+
+    def __setitem__(self, key: str, value: _V) -> None:
+        super().__setitem__(key, value)
+        if self._cells is not None:
+            cell = self._cell_of(key)
+            if cell is not None:
+                self._cells[cell] = value
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._cells = None
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            self._cells = None
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, _V]:
+        self._cells = None
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._cells = None
+
+    def __ior__(self, other: Any) -> "HexKeyedDict[_V]":
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._cells = None
+
+    def copy(self) -> "HexKeyedDict[_V]":
+        return type(self)(self)
+
+    def __reduce__(self) -> tuple:
+        return type(self), (dict(self),)
+
+
+class WallKeyedDict(HexKeyedDict[_V]):
+    """HexKeyedDict for "q,r:edge" wall keys, indexed by wall_cell ids."""
+
+    @staticmethod
+    def _cell_of(key: str) -> int | None:
+        try:
+            q, r, edge = _parse_wall_key(key)
+        except (AttributeError, ValueError):
+            return None
+        if edge != HEX_WALL_EDGE and not 0 <= edge < _HEX_WALL_SLOT:
+            return None
+        return wall_cell(q, r, edge)
+
+    def at(self, q: int, r: int, edge: int) -> _V | None:
+        """Wall on edge 0-5 of hex (q, r), or None."""
+        cells = self._cells
+        if cells is None:
+            cells = self._index()
+        return cells.get((q << _COORD_BITS | r & _COORD_MASK) << _EDGE_BITS | edge)
+
+    def hex_wall_at(self, q: int, r: int) -> _V | None:
+        """Wall filling hex (q, r), or None."""
+        cells = self._cells
+        if cells is None:
+            cells = self._index()
+        return cells.get((q << _COORD_BITS | r & _COORD_MASK) << _EDGE_BITS | _HEX_WALL_SLOT)
+
+    def cell_items(self) -> Iterator[tuple[int, int, int | str, _V]]:
+        """(q, r, edge, value) for every indexed key; edge is HEX_WALL_EDGE for full-hex walls."""
+        cells = self._cells
+        if cells is None:
+            cells = self._index()
+        for cell, value in cells.items():
+            slot = cell & _EDGE_MASK
+            yield (*cell_hex(cell >> _EDGE_BITS), HEX_WALL_EDGE if slot == _HEX_WALL_SLOT else slot, value)
 
 
 @dataclass
@@ -364,9 +527,24 @@ class CustomBarrierMaterial:
         )
 
 
+# MapLayer fields keyed by hex or wall strings, and the dict type each is held in
+_KEYED_FIELDS = {
+    "terrain": HexKeyedDict,
+    "obstacles": HexKeyedDict,
+    "walls": WallKeyedDict,
+    "stairs": HexKeyedDict,
+    "conditions": HexKeyedDict,
+}
+
+
 @dataclass
 class MapLayer:
-    """One elevation layer of the map."""
+    """
+    One elevation layer of the map.
+
+    The keyed fields are always HexKeyedDict or WallKeyedDict; plain dicts
+    assigned to them are converted.
+    """
 
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     name: str = "Ground"
@@ -375,15 +553,21 @@ class MapLayer:
     background: BackgroundImage | None = None
     annotations_b64: str = ""  # freehand PNG overlay; does not alter background
     annotations_mime: str = "image/png"
-    terrain: dict[str, TerrainTile] = field(default_factory=dict)
-    obstacles: dict[str, Obstacle] = field(default_factory=dict)
-    walls: dict[str, WallSegment] = field(default_factory=dict)
-    stairs: dict[str, LayerStair] = field(default_factory=dict)
-    conditions: dict[str, HexCondition] = field(default_factory=dict)
+    terrain: HexKeyedDict[TerrainTile] = field(default_factory=HexKeyedDict)
+    obstacles: HexKeyedDict[Obstacle] = field(default_factory=HexKeyedDict)
+    walls: WallKeyedDict[WallSegment] = field(default_factory=WallKeyedDict)
+    stairs: HexKeyedDict[LayerStair] = field(default_factory=HexKeyedDict)
+    conditions: HexKeyedDict[HexCondition] = field(default_factory=HexKeyedDict)
     default_visibility: str = "GOOD_VISIBILITY"
     visible: bool = True
     opacity: float = 1.0
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        keyed_type = _KEYED_FIELDS.get(name)
+        if keyed_type is not None and type(value) is not keyed_type:
+            value = keyed_type(value)
+        super().__setattr__(name, value)
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
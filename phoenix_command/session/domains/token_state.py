@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 FACING_RESOLUTION = 12
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenPlacement:
     """A token on the tactical map."""
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import TYPE_CHECKING
 
 from phoenix_command.models.gear import Armor, AmmoType, Gear, Grenade, Weapon
@@ -59,4 +58,4 @@ def resolve_gear_template(name: str) -> Gear:
 
 
 def clone_gear_template(name: str) -> Gear:
-    return deepcopy(resolve_gear_template(name))
+    return resolve_gear_template(name).instantiate()
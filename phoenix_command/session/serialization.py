@@ -149,6 +149,7 @@ def character_from_dict(data: dict) -> Character:
     )
     for gear_data in data.get("equipment", []):
         char.equipment.append(gear_from_dict(gear_data))
+    char.invalidate_stats()
     char.hit_history = [
         damage_result_from_dict(h) for h in data.get("hit_history", [])
     ]
@@ -1,6 +1,8 @@
 """Character generation system for Phoenix Command."""
 
 import random
+from typing import Optional
+
 from phoenix_command.models.character import Character
 
 
@@ -8,9 +10,10 @@ class CharacterGenerator:
     """Generates Phoenix Command characters following the official rules."""
     
     @staticmethod
-    def roll_characteristic() -> int:
+    def roll_characteristic(rng: Optional[random.Random] = None) -> int:
         """Roll 3d6 for a characteristic value."""
-        return sum(random.randint(1, 6) for _ in range(3))
+        rand = rng or random
+        return sum(rand.randint(1, 6) for _ in range(3))
     
     @staticmethod
     def generate_character(
@@ -19,14 +22,15 @@ class CharacterGenerator:
         intelligence: int = None,
         will: int = None,
         health: int = None,
-        agility: int = None
+        agility: int = None,
+        rng: Optional[random.Random] = None
     ) -> Character:
         """Generate a complete character following Phoenix Command rules."""
         return Character(
-            strength=strength if strength is not None else CharacterGenerator.roll_characteristic(),
-            intelligence=intelligence if intelligence is not None else CharacterGenerator.roll_characteristic(),
-            will=will if will is not None else CharacterGenerator.roll_characteristic(),
-            health=health if health is not None else CharacterGenerator.roll_characteristic(),
-            agility=agility if agility is not None else CharacterGenerator.roll_characteristic(),
+            strength=strength if strength is not None else CharacterGenerator.roll_characteristic(rng),
+            intelligence=intelligence if intelligence is not None else CharacterGenerator.roll_characteristic(rng),
+            will=will if will is not None else CharacterGenerator.roll_characteristic(rng),
+            health=health if health is not None else CharacterGenerator.roll_characteristic(rng),
+            agility=agility if agility is not None else CharacterGenerator.roll_characteristic(rng),
             gun_combat_skill_level=gun_combat_skill_level
         )
@@ -4,14 +4,18 @@ import random
 from typing import Optional, List
 
 from phoenix_command.models.character import Character
-from phoenix_command.models.enums import ShotType, TargetExposure, ExplosiveTarget, SituationStanceModifier4B, BlastModifier
+from phoenix_command.models.combat_trace import CombatTrace
+from phoenix_command.models.enums import AdvancedHitLocation, IncapacitationEffect, ShotType, TargetExposure, ExplosiveTarget, SituationStanceModifier4B, BlastModifier, MedicalAid
 from phoenix_command.models.gear import Weapon, AmmoType, Grenade
-from phoenix_command.models.hit_result_advanced import ShotParameters, ShotResult, TargetGroup, ExplosiveShotResult
+from phoenix_command.models.hit_result_advanced import ShotParameters, ShotResult, TargetGroup, ExplosiveShotResult, MonteCarloShotSummary, ShotResultBatch
 from phoenix_command.simulations.combat_simulator_utils import CombatSimulatorUtils
+from phoenix_command.simulations.rng import randints
+from phoenix_command.tables.advanced_damage_tables.table_1_get_hit_location import Table1AdvancedDamageHitLocation
 from phoenix_command.tables.advanced_rules.effective_min_arc import EffectiveMinimumArc
 from phoenix_command.tables.advanced_rules.three_round_burst import ThreeRoundBurstTable
 from phoenix_command.tables.core.table4_advanced_odds_of_hitting import Table4AdvancedOddsOfHitting
 from phoenix_command.tables.core.table5_auto_pellet_shrapnel import Table5AutoPelletShrapnel
+from phoenix_command.tables.core.table8_healing_and_recovery import Table8HealingAndRecovery
 
 
 class CombatSimulator:
@@ -31,31 +35,33 @@ class CombatSimulator:
         range_hexes: int,
         target_exposure: TargetExposure,
         shot_params: ShotParameters,
-        is_front_shot: bool
+        is_front_shot: bool,
+        rng: Optional[random.Random] = None,
+        trace: Optional[CombatTrace] = None
     ) -> ShotResult:
         """Simulate a single shot from shooter to target."""
-        log = []
-        log.append("=== SINGLE SHOT ===")
-        log.append(f"Shooter: {shooter.name}, Target: {target.name}")
-        log.append(f"Weapon: {weapon.name}, Ammo: {ammo.name}")
-        log.append(f"Range: {range_hexes} hexes, Exposure: {target_exposure.name}")
+        trace = CombatTrace() if trace is None else trace
+        trace.add("header", "=== SINGLE SHOT ===")
+        trace.add("header", "Shooter: %s, Target: %s", shooter.name, target.name)
+        trace.add("header", "Weapon: %s, Ammo: %s", weapon.name, ammo.name)
+        trace.add("header", "Range: %s hexes, Exposure: %s", range_hexes, target_exposure.name)
         
         eal = CombatSimulatorUtils.calculate_eal(
-            shooter, target, weapon, range_hexes, target_exposure, shot_params, log=log
+            shooter, target, weapon, range_hexes, target_exposure, shot_params, trace=trace
         )
         
         odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, ShotType.SINGLE)
-        roll = random.randint(0, 99)
+        roll = (rng or random).randint(0, 99)
         hit = roll <= odds
         
-        log.append(f"[Hit Check] EAL: {eal}, Odds: {odds}%, Roll: {roll}")
-        log.append(f"  Result: {'HIT!' if hit else 'MISS'}")
+        trace.add("roll", "[Hit Check] EAL: %s, Odds: %s%%, Roll: %s", eal, odds, roll)
+        trace.add("header", "  Result: %s", 'HIT!' if hit else 'MISS')
         
         if not hit:
-            return ShotResult(hit=False, eal=eal, odds=odds, roll=roll, target=target, log="\n".join(log))
+            return ShotResult(hit=False, eal=eal, odds=odds, roll=roll, target=target, trace=trace.snapshot())
         
         damage_result, incap_effect, recovery, incap_time = CombatSimulatorUtils.process_hit(
-            target, ammo, range_hexes, target_exposure, shot_params, is_front_shot, log
+            target, ammo, range_hexes, target_exposure, shot_params, is_front_shot, trace, rng
         )
         
         return ShotResult(
@@ -68,9 +74,170 @@ class CombatSimulator:
             incapacitation_effect=incap_effect,
             recovery=recovery,
             incapacitation_time_phases=incap_time,
-            log="\n".join(log)
+            trace=trace.snapshot()
         )
 
+    @staticmethod
+    def monte_carlo_single_shot(
+        shooter: Character,
+        target: Character,
+        weapon: Weapon,
+        ammo: AmmoType,
+        range_hexes: int,
+        target_exposure: TargetExposure,
+        shot_params: ShotParameters,
+        n: int,
+        is_front_shot: bool = True,
+        medical_aid: MedicalAid = MedicalAid.NO_AID,
+        rng: Optional[random.Random] = None
+    ) -> MonteCarloShotSummary:
+        """Run n independent single shots and aggregate their outcomes.
+
+        Every trial starts from the target's current damage and armor condition; the target is
+        never mutated and no logs are built. EAL and odds are computed once, hit locations are
+        drawn in one batch, and damage lookups go through the shared damage cache.
+
+        Args:
+            n: Number of trials.
+            medical_aid: Care level used for the Table 8A recovery chance behind death_probability.
+            rng: Random source; defaults to the module-level random functions.
+
+        Returns:
+            Summary with hit rate, damage histogram and percentiles, incapacitation and
+            death probabilities, and hit location counts.
+        """
+        if n < 0:
+            raise ValueError(f"Number of trials must be non-negative, got {n}")
+
+        eal = CombatSimulatorUtils.calculate_eal(
+            shooter, target, weapon, range_hexes, target_exposure, shot_params
+        )
+        odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, ShotType.SINGLE)
+        summary = MonteCarloShotSummary(trials=n, eal=eal, odds=odds)
+
+        summary.hits = sum(1 for roll in randints(rng, 0, 99, n) if roll <= odds)
+        if summary.hits < n:
+            summary.damage_histogram[0] = n - summary.hits
+        locations = Table1AdvancedDamageHitLocation.sample_hit_locations(
+            target_exposure, shot_params.target_orientation, summary.hits, rng
+        )
+
+        pen = ammo.get_pen(range_hexes)
+        dc = ammo.get_dc(range_hexes)
+        armor_by_location = {}
+        recovery_chances = {}
+
+        for location in locations:
+            summary.location_counts[location] = summary.location_counts.get(location, 0) + 1
+            damage, _, effect = CombatSimulator._resolve_untraced_hit(
+                target, location, pen, dc, is_front_shot, armor_by_location, rng
+            )
+            summary.damage_histogram[damage] = summary.damage_histogram.get(damage, 0) + 1
+            if effect is not None:
+                summary.incapacitation_counts[effect] = summary.incapacitation_counts.get(effect, 0) + 1
+
+            pd_total = target.physical_damage_total + damage
+            if damage > 0:
+                recovery_chance = recovery_chances.get(pd_total)
+                if recovery_chance is None:
+                    recovery = Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a(
+                        pd_total, target.health
+                    )
+                    recovery_chance = recovery_chances[pd_total] = recovery.aid_data[medical_aid][1]
+                summary.expected_deaths += (100 - recovery_chance) / 100
+
+        return summary
+
+    @staticmethod
+    def single_shot_batch(
+        shooter: Character,
+        target: Character,
+        weapon: Weapon,
+        ammo: AmmoType,
+        range_hexes: int,
+        target_exposure: TargetExposure,
+        shot_params: ShotParameters,
+        n: int,
+        is_front_shot: bool = True,
+        rng: Optional[random.Random] = None
+    ) -> ShotResultBatch:
+        """Resolve n independent single shots and keep every outcome in column form.
+
+        Like monte_carlo_single_shot, every shot starts from the target's current state and the
+        target is never mutated; unlike it, per-shot rolls, damage, locations and effects are kept.
+
+        Args:
+            n: Number of shots.
+            rng: Random source; defaults to the module-level random functions.
+
+        Returns:
+            Batch with one row per shot.
+        """
+        if n < 0:
+            raise ValueError(f"Number of shots must be non-negative, got {n}")
+
+        eal = CombatSimulatorUtils.calculate_eal(
+            shooter, target, weapon, range_hexes, target_exposure, shot_params
+        )
+        odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, ShotType.SINGLE)
+        rolls = randints(rng, 0, 99, n)
+        locations = iter(Table1AdvancedDamageHitLocation.sample_hit_locations(
+            target_exposure, shot_params.target_orientation, sum(roll <= odds for roll in rolls), rng
+        ))
+
+        pen = ammo.get_pen(range_hexes)
+        dc = ammo.get_dc(range_hexes)
+        armor_by_location = {}
+        batch = ShotResultBatch(target=target)
+
+        for roll in rolls:
+            if roll > odds:
+                batch.append(False, eal, odds, roll)
+                continue
+            location = next(locations)
+            damage, shock, effect = CombatSimulator._resolve_untraced_hit(
+                target, location, pen, dc, is_front_shot, armor_by_location, rng
+            )
+            batch.append(True, eal, odds, roll, damage, shock, location, effect)
+
+        return batch
+
+    @staticmethod
+    def _resolve_untraced_hit(
+        target: Character,
+        location: AdvancedHitLocation,
+        pen: float,
+        dc: int,
+        is_front_shot: bool,
+        armor_by_location: dict,
+        rng: Optional[random.Random] = None
+    ) -> tuple[int, int, Optional[IncapacitationEffect]]:
+        """Resolve one batched hit against the target's current state without mutating it.
+
+        Args:
+            armor_by_location: Per-batch cache of armor protection, filled on first use.
+
+        Returns:
+            Tuple of (damage, shock, incapacitation effect or None).
+        """
+        rand = rng or random
+        armor = armor_by_location.get(location)
+        if armor is None:
+            armor = armor_by_location[location] = CombatSimulatorUtils.get_armor_protection(
+                target, location, is_front_shot
+            )
+        damage, shock = CombatSimulatorUtils.resolve_hit_damage(location, pen, dc, is_front_shot, armor, rng)
+
+        effect = None
+        knockout_value = target.knockout_value
+        pd_with_shock = target.physical_damage_total + damage + shock
+        chance = Table8HealingAndRecovery.get_incapacitation_chance(pd_with_shock, knockout_value)
+        if chance and rand.randint(0, 99) < chance:
+            effect = Table8HealingAndRecovery.get_incapacitation_effect(
+                pd_with_shock, knockout_value, rand.randint(0, 99)
+            )
+        return damage, shock, effect
+
     @staticmethod
     def shotgun_shot(
         shooter: Character,
@@ -81,13 +248,16 @@ class CombatSimulator:
         exposures: List[TargetExposure],
         shot_params_list: List[ShotParameters],
         is_front_shots: List[bool],
-        primary_target_idx: int = 0
+        primary_target_idx: int = 0,
+        rng: Optional[random.Random] = None,
+        trace: Optional[CombatTrace] = None
     ) -> List[ShotResult]:
         """Simulate shotgun shot with pattern hitting multiple targets."""
-        log = []
-        log.append("=== SHOTGUN SHOT ===")
-        log.append(f"Shooter: {shooter.name}, Targets: {[t.name for t in targets]}")
-        log.append(f"Primary target: {targets[primary_target_idx].name}")
+        trace = CombatTrace() if trace is None else trace
+        trace.add("header", "=== SHOTGUN SHOT ===")
+        if trace.enabled:
+            trace.add("header", "Shooter: %s, Targets: %s", shooter.name, [t.name for t in targets])
+        trace.add("header", "Primary target: %s", targets[primary_target_idx].name)
         
         CombatSimulatorUtils.validate_shotgun_inputs(targets, ranges, exposures, shot_params_list, is_front_shots)
         
@@ -96,47 +266,48 @@ class CombatSimulator:
         primary_params = shot_params_list[primary_target_idx]
         
         data = CombatSimulatorUtils.get_shotgun_data_at_range(ammo, primary_range)
-        log.append(f"Range: {primary_range}, SALM: {data.shotgun_accuracy_level_modifier}, BPHC: {data.base_pellet_hit_chance}")
+        trace.add("header", "Range: %s, SALM: %s, BPHC: %s", primary_range, data.shotgun_accuracy_level_modifier, data.base_pellet_hit_chance)
 
         if data.shotgun_accuracy_level_modifier is None:
-            log.append("No SALM at range, treating as single shot")
+            trace.add("header", "No SALM at range, treating as single shot")
             result = CombatSimulator.single_shot(
                 shooter, targets[primary_target_idx], weapon, ammo,
-                primary_range, primary_exposure, primary_params, is_front_shots[primary_target_idx]
+                primary_range, primary_exposure, primary_params, is_front_shots[primary_target_idx], rng,
+                trace.branch()
             )
             return [result]
 
         eal = CombatSimulatorUtils.calculate_shotgun_eal(
             shooter, targets[primary_target_idx], weapon, primary_range,
-            primary_exposure, primary_params, data.shotgun_accuracy_level_modifier, 0, log
+            primary_exposure, primary_params, data.shotgun_accuracy_level_modifier, 0, trace
         )
         
         odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, ShotType.SINGLE)
-        roll = random.randint(0, 99)
+        roll = (rng or random).randint(0, 99)
         
-        log.append(f"[Pattern Hit Check] EAL: {eal}, Odds: {odds}%, Roll: {roll}")
+        trace.add("roll", "[Pattern Hit Check] EAL: %s, Odds: %s%%, Roll: %s", eal, odds, roll)
         
         if roll > odds:
-            log.append("  Pattern MISSED")
-            return [ShotResult(hit=False, eal=eal, odds=odds, roll=roll, target=targets[primary_target_idx], log="\n".join(log))]
+            trace.add("header", "  Pattern MISSED")
+            return [ShotResult(hit=False, eal=eal, odds=odds, roll=roll, target=targets[primary_target_idx], trace=trace.snapshot())]
 
-        log.append("  Pattern HIT, processing pellets...")
+        trace.add("header", "  Pattern HIT, processing pellets...")
         
         results = CombatSimulatorUtils.process_shotgun_pattern(
-            ammo, targets, ranges, exposures, shot_params_list, is_front_shots, data.base_pellet_hit_chance, log
+            ammo, targets, ranges, exposures, shot_params_list, is_front_shots, data.base_pellet_hit_chance, trace, rng
         )
         
         if not results:
-            results = [ShotResult(hit=False, eal=eal, odds=odds, roll=roll, target=targets[primary_target_idx], log="\n".join(log))]
+            results = [ShotResult(hit=False, eal=eal, odds=odds, roll=roll, target=targets[primary_target_idx], trace=trace.snapshot())]
         else:
-            if results[0].log:
+            if results[0].trace:
                 results[0] = ShotResult(
                     hit=results[0].hit, eal=eal, odds=odds, roll=roll,
                     target=results[0].target, damage_result=results[0].damage_result,
                     incapacitation_effect=results[0].incapacitation_effect,
                     recovery=results[0].recovery,
                     incapacitation_time_phases=results[0].incapacitation_time_phases,
-                    log="\n".join(log) + "\n" + results[0].log
+                    trace=trace.snapshot(results[0].trace)
                 )
         
         return results
@@ -148,31 +319,36 @@ class CombatSimulator:
         ammo: AmmoType,
         target_group: TargetGroup,
         arc_of_fire: Optional[float] = None,
-        continuous_burst_impulses: int = 0
+        continuous_burst_impulses: int = 0,
+        rng: Optional[random.Random] = None,
+        trace: Optional[CombatTrace] = None
     ) -> List[ShotResult]:
         """Simulate automatic burst fire."""
-        log = ["=== BURST FIRE ===", f"Shooter: {shooter.name}, Weapon: {weapon.name}",
-               f"Targets: {[t.name for t in target_group.targets]}"]
+        trace = CombatTrace() if trace is None else trace
+        trace.add("header", "=== BURST FIRE ===")
+        trace.add("header", "Shooter: %s, Weapon: %s", shooter.name, weapon.name)
+        if trace.enabled:
+            trace.add("header", "Targets: %s", [t.name for t in target_group.targets])
 
         sab_penalty, arc_of_fire = CombatSimulatorUtils.setup_burst_fire(
-            weapon, target_group, continuous_burst_impulses, arc_of_fire, shooter, log
+            weapon, target_group, continuous_burst_impulses, arc_of_fire, shooter, trace
         )
 
-        # Store tuples with (idx, hits, target, rng, exposure, shot_params, front, eal, odds, roll)
+        # Store tuples with (idx, hits, target, target_range, exposure, shot_params, front, eal, odds, roll)
         target_hits: List[tuple[int, int, Character, int, TargetExposure, ShotParameters, bool, int, int, int]] = []
         # Store miss results for targets that failed elevation check
         miss_results: List[tuple[Character, int, int, int]] = []  # (target, eal, odds, roll)
 
-        for idx, (target, rng, exposure, shot_params, front) in enumerate(zip(
+        for idx, (target, target_range, exposure, shot_params, front) in enumerate(zip(
             target_group.targets, target_group.ranges, target_group.exposures,
             target_group.shot_params_list, target_group.is_front_shots
         )):
             result = CombatSimulatorUtils.check_burst_elevation_and_get_hits(
-                shooter, target, weapon, rng, exposure, shot_params, arc_of_fire, sab_penalty, log
+                shooter, target, weapon, target_range, exposure, shot_params, arc_of_fire, sab_penalty, trace, rng
             )
 
             if result.hit and result.hits > 0:
-                target_hits.append((idx, result.hits, target, rng, exposure, shot_params, front, result.eal, result.odds, result.roll))
+                target_hits.append((idx, result.hits, target, target_range, exposure, shot_params, front, result.eal, result.odds, result.roll))
             else:
                 # Store miss with actual eal, odds, roll values
                 miss_results.append((target, result.eal, result.odds, result.roll))
@@ -181,30 +357,30 @@ class CombatSimulator:
         if target_hits:
             total_hits = sum(h[1] for h in target_hits)
             if total_hits > weapon.full_auto_rof:
-                log.append(f"[Redistribute] Total hits {total_hits} > ROF {weapon.full_auto_rof}, redistributing...")
+                trace.add("header", "[Redistribute] Total hits %s > ROF %s, redistributing...", total_hits, weapon.full_auto_rof)
                 total_eal = sum(h[7] for h in target_hits)
                 redistributed = []
                 remaining_rof = weapon.full_auto_rof
-                for i, (idx, hits, target, rng, exposure, shot_params, front, eal, odds, roll) in enumerate(target_hits):
+                for i, (idx, hits, target, target_range, exposure, shot_params, front, eal, odds, roll) in enumerate(target_hits):
                     if i == len(target_hits) - 1:
                         new_hits = remaining_rof
                     else:
                         proportion = eal / total_eal if total_eal > 0 else 1.0 / len(target_hits)
                         new_hits = max(1, int(weapon.full_auto_rof * proportion))
                         remaining_rof -= new_hits
-                    log.append(f"  Target {target.name}: {hits} -> {new_hits} hits")
-                    redistributed.append((idx, new_hits, target, rng, exposure, shot_params, front, eal, odds, roll))
+                    trace.add("header", "  Target %s: %s -> %s hits", target.name, hits, new_hits)
+                    redistributed.append((idx, new_hits, target, target_range, exposure, shot_params, front, eal, odds, roll))
                 target_hits = redistributed
 
         results = []
-        for idx, hits, target, rng, exposure, shot_params, front, eal, odds, roll in target_hits:
+        for idx, hits, target, target_range, exposure, shot_params, front, eal, odds, roll in target_hits:
             hit_results = CombatSimulatorUtils.process_target_hits(
-                target, ammo, rng, exposure, shot_params, front, hits, log,
-                eal=eal, odds=odds, roll=roll
+                target, ammo, target_range, exposure, shot_params, front, hits, trace,
+                eal=eal, odds=odds, roll=roll, rng=rng
             )
             results.extend(hit_results)
         
-        # Add header log to first result or create miss results
+        # Add header trace to first result or create miss results
         if results:
             results[0] = ShotResult(
                 hit=results[0].hit, eal=results[0].eal, odds=results[0].odds, roll=results[0].roll,
@@ -212,15 +388,15 @@ class CombatSimulator:
                 incapacitation_effect=results[0].incapacitation_effect,
                 recovery=results[0].recovery,
                 incapacitation_time_phases=results[0].incapacitation_time_phases,
-                log="\n".join(log) + "\n" + (results[0].log or "")
+                trace=trace.snapshot(results[0].trace)
             )
         else:
             # Create miss results with actual eal, odds, roll for each target
-            log.append("No targets hit")
+            trace.add("header", "No targets hit")
             for target, eal, odds, roll in miss_results:
                 results.append(ShotResult(
                     hit=False, eal=eal, odds=odds, roll=roll,
-                    target=target, log="\n".join(log) if not results else None
+                    target=target, trace=trace.snapshot() if not results else None
                 ))
         return results
 
@@ -233,11 +409,15 @@ class CombatSimulator:
         range_hexes: int,
         target_exposure: TargetExposure,
         shot_params: ShotParameters,
-        is_front_shot: bool
+        is_front_shot: bool,
+        rng: Optional[random.Random] = None,
+        trace: Optional[CombatTrace] = None
     ) -> List[ShotResult]:
         """Simulate a three round burst from shooter to target."""
-        log = ["=== THREE ROUND BURST ===", f"Shooter: {shooter.name}, Target: {target.name}",
-               f"Weapon: {weapon.name}, Range: {range_hexes}"]
+        trace = CombatTrace() if trace is None else trace
+        trace.add("header", "=== THREE ROUND BURST ===")
+        trace.add("header", "Shooter: %s, Target: %s", shooter.name, target.name)
+        trace.add("header", "Weapon: %s, Range: %s", weapon.name, range_hexes)
 
         if not weapon.ballistic_data:
             raise ValueError("Weapon must have ballistic_data for three round burst")
@@ -245,10 +425,10 @@ class CombatSimulator:
         if rb3_value is None:
             raise ValueError("Weapon must have three_round_burst data")
         
-        log.append(f"3RB value: {rb3_value}")
+        trace.add("header", "3RB value: %s", rb3_value)
         
         eal = CombatSimulatorUtils.calculate_eal(
-            shooter, target, weapon, range_hexes, target_exposure, shot_params, log=log
+            shooter, target, weapon, range_hexes, target_exposure, shot_params, trace=trace
         )
         
         # Get hit chances from table to record odds (chance to hit at least once)
@@ -257,18 +437,19 @@ class CombatSimulator:
         target_eal = max(3, min(28, eal))
         chances = ThreeRoundBurstTable.TABLE_9B[target_3rb][target_eal]
         odds = chances[0]
-        hits, roll = ThreeRoundBurstTable.calculate_3rb_hits(eal, rb3_value, log)
-        log.append(f"[3RB Result] EAL: {eal}, Odds (1+ hit): {odds}%, Roll: {roll}, Hits: {hits}")
+        hits, roll = ThreeRoundBurstTable.calculate_3rb_hits(eal, rb3_value, trace, rng)
+        trace.add("roll", "[3RB Result] EAL: %s, Odds (1+ hit): %s%%, Roll: %s, Hits: %s", eal, odds, roll, hits)
         if hits == 0:
-            log.append("  No hits")
-            return [ShotResult(hit=False, eal=eal, odds=odds, roll=roll, target=target, log="\n".join(log))]
+            trace.add("header", "  No hits")
+            return [ShotResult(hit=False, eal=eal, odds=odds, roll=roll, target=target, trace=trace.snapshot())]
         results = []
         for i in range(hits):
-            hit_log = [f"--- 3RB Hit {i+1}/{hits} ---"]
+            hit_trace = trace.branch()
+            hit_trace.add("header", "--- 3RB Hit %s/%s ---", i+1, hits)
             damage_result, incap_effect, recovery, incap_time = CombatSimulatorUtils.process_hit(
-                target, ammo, range_hexes, target_exposure, shot_params, is_front_shot, hit_log
+                target, ammo, range_hexes, target_exposure, shot_params, is_front_shot, hit_trace, rng
             )
-            log.extend(hit_log)
+            trace.extend(hit_trace)
             results.append(ShotResult(
                 hit=True,
                 eal=eal,
@@ -279,10 +460,10 @@ class CombatSimulator:
                 incapacitation_effect=incap_effect,
                 recovery=recovery,
                 incapacitation_time_phases=incap_time,
-                log="\n".join(hit_log)
+                trace=hit_trace.snapshot()
             ))
         
-        # Add header log to first result
+        # Add header trace to first result
         if results:
             results[0] = ShotResult(
                 hit=results[0].hit, eal=results[0].eal, odds=results[0].odds, roll=results[0].roll,
@@ -290,7 +471,7 @@ class CombatSimulator:
                 incapacitation_effect=results[0].incapacitation_effect,
                 recovery=results[0].recovery,
                 incapacitation_time_phases=results[0].incapacitation_time_phases,
-                log="\n".join(log)
+                trace=trace.snapshot()
             )
         
         return results
@@ -304,19 +485,23 @@ class CombatSimulator:
             pattern_target_groups: List[TargetGroup],
             arc_of_fire: Optional[float] = None,
             continuous_burst_impulses: int = 0,
+            rng: Optional[random.Random] = None,
+            trace: Optional[CombatTrace] = None,
     ) -> List[ShotResult]:
         """Simulate fully automatic shotgun burst with patterns hitting multiple targets."""
-        log = ["=== SHOTGUN BURST FIRE ===", f"Shooter: {shooter.name}, Weapon: {weapon.name}"]
+        trace = CombatTrace() if trace is None else trace
+        trace.add("header", "=== SHOTGUN BURST FIRE ===")
+        trace.add("header", "Shooter: %s, Weapon: %s", shooter.name, weapon.name)
 
         sab_penalty, arc_of_fire = CombatSimulatorUtils.setup_burst_fire(
-            weapon, primary_target_group, continuous_burst_impulses, arc_of_fire, shooter, log
+            weapon, primary_target_group, continuous_burst_impulses, arc_of_fire, shooter, trace
         )
 
         pattern_hits: List[
             tuple[int, int, Character, int, TargetExposure, ShotParameters, bool]
         ] = []
 
-        for idx, (target, rng, exposure, params, front) in enumerate(
+        for idx, (target, target_range, exposure, params, front) in enumerate(
             zip(
                 primary_target_group.targets,
                 primary_target_group.ranges,
@@ -325,42 +510,42 @@ class CombatSimulator:
                 primary_target_group.is_front_shots,
             )
         ):
-            data = CombatSimulatorUtils.get_shotgun_data_at_range(ammo, rng)
+            data = CombatSimulatorUtils.get_shotgun_data_at_range(ammo, target_range)
             
             result = CombatSimulatorUtils.check_shotgun_burst_elevation_and_get_hits(
-                shooter, target, weapon, rng, exposure, params, arc_of_fire, sab_penalty,
-                data.shotgun_accuracy_level_modifier, log
+                shooter, target, weapon, target_range, exposure, params, arc_of_fire, sab_penalty,
+                data.shotgun_accuracy_level_modifier, trace, rng
             )
             
             if result.hit and result.hits > 0:
-                pattern_hits.append((idx, result.hits, target, rng, exposure, params, front))
+                pattern_hits.append((idx, result.hits, target, target_range, exposure, params, front))
 
         pattern_hits = CombatSimulatorUtils.redistribute_hits_by_eal(
-            shooter, weapon, pattern_hits, sab_penalty, log
+            shooter, weapon, pattern_hits, sab_penalty, trace
         )
 
         results = []
 
-        for primary_idx, patterns, target, rng, exposure, params, front in pattern_hits:
+        for primary_idx, patterns, target, target_range, exposure, params, front in pattern_hits:
             pattern_group = pattern_target_groups[primary_idx]
 
             all_targets = [target] + pattern_group.targets
-            all_ranges = [rng] + pattern_group.ranges
+            all_ranges = [target_range] + pattern_group.ranges
             all_exposures = [exposure] + pattern_group.exposures
             all_params = [params] + pattern_group.shot_params_list
             all_fronts = [front] + pattern_group.is_front_shots
 
-            data = CombatSimulatorUtils.get_shotgun_data_at_range(ammo, rng)
+            data = CombatSimulatorUtils.get_shotgun_data_at_range(ammo, target_range)
 
             for pattern_num in range(patterns):
-                log.append(f"--- Pattern {pattern_num+1}/{patterns} at {target.name} ---")
+                trace.add("header", "--- Pattern %s/%s at %s ---", pattern_num+1, patterns, target.name)
                 pattern_results = CombatSimulatorUtils.process_shotgun_pattern(
                     ammo, all_targets, all_ranges, all_exposures, all_params, all_fronts,
-                    data.base_pellet_hit_chance, log
+                    data.base_pellet_hit_chance, trace, rng
                 )
                 results.extend(pattern_results)
 
-        # Add header log to first result or create miss result
+        # Add header trace to first result or create miss result
         if results:
             results[0] = ShotResult(
                 hit=results[0].hit, eal=results[0].eal, odds=results[0].odds, roll=results[0].roll,
@@ -368,11 +553,11 @@ class CombatSimulator:
                 incapacitation_effect=results[0].incapacitation_effect,
                 recovery=results[0].recovery,
                 incapacitation_time_phases=results[0].incapacitation_time_phases,
-                log="\n".join(log) + "\n" + (results[0].log or "")
+                trace=trace.snapshot(results[0].trace)
             )
         else:
-            log.append("No targets hit")
-            results = [ShotResult(hit=False, eal=0, odds=0, roll=0, target=primary_target_group.targets[0], log="\n".join(log))]
+            trace.add("header", "No targets hit")
+            results = [ShotResult(hit=False, eal=0, odds=0, roll=0, target=primary_target_group.targets[0], trace=trace.snapshot())]
 
         return results
 
@@ -382,28 +567,32 @@ class CombatSimulator:
         weapon: Weapon,
         range_hexes: int,
         target: ExplosiveTarget,
-        shot_params: ShotParameters
+        shot_params: ShotParameters,
+        rng: Optional[random.Random] = None,
+        trace: Optional[CombatTrace] = None
     ) -> ExplosiveShotResult:
         """Simulate explosive weapon shot at hex, window, or door."""
-        log = ["=== EXPLOSIVE WEAPON SHOT ===", f"Shooter: {shooter.name}, Weapon: {weapon.name}",
-               f"Target: {target.name}, Range: {range_hexes}"]
+        trace = CombatTrace() if trace is None else trace
+        trace.add("header", "=== EXPLOSIVE WEAPON SHOT ===")
+        trace.add("header", "Shooter: %s, Weapon: %s", shooter.name, weapon.name)
+        trace.add("header", "Target: %s, Range: %s", target.name, range_hexes)
 
         target_size_alm = target.value
         
         eal = CombatSimulatorUtils.calculate_explosive_eal(
-            shooter, weapon, range_hexes, target_size_alm, shot_params, log
+            shooter, weapon, range_hexes, target_size_alm, shot_params, trace
         )
         
         odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, ShotType.SINGLE)
-        roll = random.randint(0, 99)
+        roll = (rng or random).randint(0, 99)
         
-        log.append(f"[Hit Check] EAL: {eal}, Odds: {odds}%, Roll: {roll}")
+        trace.add("roll", "[Hit Check] EAL: %s, Odds: %s%%, Roll: %s", eal, odds, roll)
         
         if roll <= odds:
-            log.append("  Direct HIT!")
+            trace.add("header", "  Direct HIT!")
             return ExplosiveShotResult(hit=True, eal=eal, odds=odds, roll=roll, scatter_hexes=0)
         
-        log.append("  MISS, calculating scatter...")
+        trace.add("scatter", "  MISS, calculating scatter...")
         
         eal_diff = 0
         for test_eal in range(eal + 1, 29):
@@ -415,11 +604,11 @@ class CombatSimulator:
         scatter_hexes = Table5AutoPelletShrapnel.get_scatter_distance_5c(eal_diff)
         
         if scatter_hexes == 1:
-            is_long = random.randint(1, 6) > 3
+            is_long = (rng or random).randint(1, 6) > 3
         else:
-            is_long = random.randint(0, 9) >= 5
+            is_long = (rng or random).randint(0, 9) >= 5
         
-        log.append(f"  EAL diff: {eal_diff}, Scatter: {scatter_hexes} hexes, Long: {is_long}")
+        trace.add("scatter", "  EAL diff: %s, Scatter: %s hexes, Long: %s", eal_diff, scatter_hexes, is_long)
         
         return ExplosiveShotResult(
             hit=False, eal=eal, odds=odds, roll=roll,
@@ -433,32 +622,36 @@ class CombatSimulator:
         target: ExplosiveTarget,
         aim_time_ac: int,
         situation_stance_modifiers: List,
-        visibility_modifiers: List
+        visibility_modifiers: List,
+        rng: Optional[random.Random] = None,
+        trace: Optional[CombatTrace] = None
     ) -> ExplosiveShotResult:
         """Simulate thrown grenade at hex, window, or door."""
-        log = ["=== THROWN GRENADE ===", f"Thrower: {shooter.name}, Range: {range_hexes}",
-               f"Target: {target.name}, Aim time: {aim_time_ac} AC"]
+        trace = CombatTrace() if trace is None else trace
+        trace.add("header", "=== THROWN GRENADE ===")
+        trace.add("header", "Thrower: %s, Range: %s", shooter.name, range_hexes)
+        trace.add("header", "Target: %s, Aim time: %s AC", target.name, aim_time_ac)
 
         target_size_alm = target.value
         aim_alm = Table4AdvancedOddsOfHitting.get_thrown_grenade_aim_alm_4h(aim_time_ac)
         
-        log.append(f"Aim ALM (Table 4H): {aim_alm}")
+        trace.add("header", "Aim ALM (Table 4H): %s", aim_alm)
         
         eal = CombatSimulatorUtils.calculate_grenade_eal(
             shooter, range_hexes, target_size_alm, aim_alm,
-            situation_stance_modifiers, visibility_modifiers, log
+            situation_stance_modifiers, visibility_modifiers, trace
         )
         
         odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, ShotType.SINGLE)
-        roll = random.randint(0, 99)
+        roll = (rng or random).randint(0, 99)
         
-        log.append(f"[Hit Check] EAL: {eal}, Odds: {odds}%, Roll: {roll}")
+        trace.add("roll", "[Hit Check] EAL: %s, Odds: %s%%, Roll: %s", eal, odds, roll)
         
         if roll <= odds:
-            log.append("  Direct HIT!")
+            trace.add("header", "  Direct HIT!")
             return ExplosiveShotResult(hit=True, eal=eal, odds=odds, roll=roll, scatter_hexes=0)
         
-        log.append("  MISS, calculating scatter...")
+        trace.add("scatter", "  MISS, calculating scatter...")
         
         eal_diff = 0
         for test_eal in range(eal + 1, 29):
@@ -468,9 +661,9 @@ class CombatSimulator:
                 break
         
         scatter_hexes = Table5AutoPelletShrapnel.get_scatter_distance_5c(eal_diff)
-        is_long = random.randint(0, 9) >= 5
+        is_long = (rng or random).randint(0, 9) >= 5
         
-        log.append(f"  EAL diff: {eal_diff}, Scatter: {scatter_hexes} hexes, Long: {is_long}")
+        trace.add("scatter", "  EAL diff: %s, Scatter: %s hexes, Long: %s", eal_diff, scatter_hexes, is_long)
         
         return ExplosiveShotResult(
             hit=False, eal=eal, odds=odds, roll=roll,
@@ -485,11 +678,15 @@ class CombatSimulator:
         target: ExplosiveTarget,
         shot_params: ShotParameters,
         arc_of_fire: Optional[float] = None,
-        continuous_burst_impulses: int = 0
+        continuous_burst_impulses: int = 0,
+        rng: Optional[random.Random] = None,
+        trace: Optional[CombatTrace] = None
     ) -> List[ExplosiveShotResult]:
         """Simulate automatic grenade launcher burst."""
-        log = ["=== AUTO GRENADE LAUNCHER BURST ===", f"Shooter: {shooter.name}, Weapon: {weapon.name}",
-               f"Target: {target.name}, Range: {range_hexes}"]
+        trace = CombatTrace() if trace is None else trace
+        trace.add("header", "=== AUTO GRENADE LAUNCHER BURST ===")
+        trace.add("header", "Shooter: %s, Weapon: %s", shooter.name, weapon.name)
+        trace.add("header", "Target: %s, Range: %s", target.name, range_hexes)
 
         sab_penalty = 0
         if continuous_burst_impulses > 0:
@@ -497,7 +694,7 @@ class CombatSimulator:
                 raise ValueError("Weapon must have sustained_auto_burst")
             sab_penalty = continuous_burst_impulses * weapon.sustained_auto_burst
         
-        log.append(f"Continuous impulses: {continuous_burst_impulses}, SAB penalty: {sab_penalty}")
+        trace.add("header", "Continuous impulses: %s, SAB penalty: %s", continuous_burst_impulses, sab_penalty)
         
         min_arc = weapon.ballistic_data.get_minimum_arc(range_hexes)
         if min_arc is None:
@@ -519,22 +716,22 @@ class CombatSimulator:
         )
         
         final_arc = max(arc_of_fire, effective_ma) if arc_of_fire is not None else effective_ma
-        log.append(f"Min arc: {min_arc}, Effective MA: {effective_ma}, Final arc: {final_arc}")
+        trace.add("header", "Min arc: %s, Effective MA: %s, Final arc: %s", min_arc, effective_ma, final_arc)
         
         target_size_alm = target.value
         eal = CombatSimulatorUtils.calculate_explosive_eal(
-            shooter, weapon, range_hexes, target_size_alm, shot_params, log
+            shooter, weapon, range_hexes, target_size_alm, shot_params, trace
         ) - sab_penalty
         
-        log.append(f"EAL after SAB: {eal}")
+        trace.add("eal", "EAL after SAB: %s", eal)
         
         odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, ShotType.BURST)
-        roll = random.randint(0, 99)
+        roll = (rng or random).randint(0, 99)
         
-        log.append(f"[Elevation Check] Odds: {odds}%, Roll: {roll}")
+        trace.add("roll", "[Elevation Check] Odds: %s%%, Roll: %s", odds, roll)
         
         if roll > odds:
-            log.append("  Burst MISSED elevation, calculating scatter...")
+            trace.add("scatter", "  Burst MISSED elevation, calculating scatter...")
 
             eal_diff = 0
             for test_eal in range(eal + 1, 29):
@@ -546,11 +743,11 @@ class CombatSimulator:
             scatter_hexes = Table5AutoPelletShrapnel.get_scatter_distance_5c(eal_diff)
 
             if scatter_hexes == 1:
-                is_long = random.randint(1, 6) > 3
+                is_long = (rng or random).randint(1, 6) > 3
             else:
-                is_long = random.randint(0, 9) >= 5
+                is_long = (rng or random).randint(0, 9) >= 5
 
-            log.append(f"  EAL diff: {eal_diff}, Scatter: {scatter_hexes} hexes, Long: {is_long}")
+            trace.add("scatter", "  EAL diff: %s, Scatter: %s hexes, Long: %s", eal_diff, scatter_hexes, is_long)
 
             return [ExplosiveShotResult(
                 hit=False, eal=eal, odds=odds, roll=roll,
@@ -559,20 +756,20 @@ class CombatSimulator:
             )]
 
         hits = Table5AutoPelletShrapnel.get_fire_table_value5a(
-            final_arc, weapon.full_auto_rof, 0, log
+            final_arc, weapon.full_auto_rof, 0, trace, rng
         )
         
-        log.append(f"  Burst HIT, grenades on target: {hits}")
+        trace.add("header", "  Burst HIT, grenades on target: %s", hits)
         
         results = []
-        is_long = random.randint(0, 9) >= 5
+        is_long = (rng or random).randint(0, 9) >= 5
 
         for i in range(hits):
-            hit_roll = random.randint(0, 99)
-            log.append(f"--- Grenade {i+1}/{hits}, Roll: {hit_roll} ---")
+            hit_roll = (rng or random).randint(0, 99)
+            trace.add("header", "--- Grenade %s/%s, Roll: %s ---", i+1, hits, hit_roll)
             
             if hit_roll <= odds:
-                log.append("  Direct hit!")
+                trace.add("header", "  Direct hit!")
                 results.append(ExplosiveShotResult(hit=True, eal=eal, odds=odds, roll=hit_roll, scatter_hexes=0))
             else:
                 eal_diff = 0
@@ -583,7 +780,7 @@ class CombatSimulator:
                         break
                 
                 scatter_hexes = Table5AutoPelletShrapnel.get_scatter_distance_5c(eal_diff)
-                log.append(f"  Scatter: {scatter_hexes} hexes, Long: {is_long}")
+                trace.add("scatter", "  Scatter: %s hexes, Long: %s", scatter_hexes, is_long)
 
                 results.append(ExplosiveShotResult(
                     hit=False, eal=eal, odds=odds, roll=hit_roll,
@@ -600,10 +797,14 @@ class CombatSimulator:
         exposures: List[TargetExposure],
         shot_params_list: List[ShotParameters],
         is_front_shots: List[bool],
-        blast_modifiers: List[List[BlastModifier]]
+        blast_modifiers: List[List[BlastModifier]],
+        rng: Optional[random.Random] = None,
+        trace: Optional[CombatTrace] = None
     ) -> List[ShotResult]:
         """Calculate explosive damage (shrapnel + concussion) for multiple targets."""
-        log = ["=== EXPLOSION DAMAGE ===", f"Ammo: {ammo.name}, Targets: {len(targets)}"]
+        trace = CombatTrace() if trace is None else trace
+        trace.add("header", "=== EXPLOSION DAMAGE ===")
+        trace.add("header", "Ammo: %s, Targets: %s", ammo.name, len(targets))
 
         if not (len(targets) == len(ranges_from_burst) == len(exposures) ==
                 len(shot_params_list) == len(is_front_shots) == len(blast_modifiers)):
@@ -617,29 +818,29 @@ class CombatSimulator:
         for target, range_hex, exposure, params, front, modifiers in zip(
             targets, ranges_from_burst, exposures, shot_params_list, is_front_shots, blast_modifiers
         ):
-            log.append(f"\n--- Target: {target.name}, Range: {range_hex} ---")
+            trace.add("header", "\n--- Target: %s, Range: %s ---", target.name, range_hex)
             
             bshc = ammo.get_base_shrapnel_hit_chance(range_hex)
             base_concussion = ammo.get_base_concussion(range_hex)
             
-            log.append(f"  BSHC: {bshc}, Base concussion: {base_concussion}")
+            trace.add("header", "  BSHC: %s, Base concussion: %s", bshc, base_concussion)
 
             # Process shrapnel hits
             if bshc is not None:
                 shrapnel_results = CombatSimulatorUtils.process_shrapnel_hits(
-                    target, ammo, range_hex, exposure, params, front, bshc, log
+                    target, ammo, range_hex, exposure, params, front, bshc, trace, rng
                 )
                 results.extend(shrapnel_results)
 
             # Process concussion damage
             if base_concussion is not None and base_concussion > 0:
                 concussion_result = CombatSimulatorUtils.process_concussion_damage(
-                    target, base_concussion, modifiers, log
+                    target, base_concussion, modifiers, trace, rng
                 )
                 if concussion_result is not None:
                     results.append(concussion_result)
 
-        # Add header log to first result or create empty result
+        # Add header trace to first result or create empty result
         if results:
             results[0] = ShotResult(
                 hit=results[0].hit, eal=results[0].eal, odds=results[0].odds, roll=results[0].roll,
@@ -647,7 +848,7 @@ class CombatSimulator:
                 incapacitation_effect=results[0].incapacitation_effect,
                 recovery=results[0].recovery,
                 incapacitation_time_phases=results[0].incapacitation_time_phases,
-                log="\n".join(log) + "\n" + (results[0].log or "")
+                trace=trace.snapshot(results[0].trace)
             )
 
         return results
@@ -1,17 +1,26 @@
 """Probability calculations for combat simulation."""
 
-from typing import List, Tuple, Optional
+import functools
+from typing import Dict, List, Tuple, Optional
 
 from phoenix_command.models.character import Character
+from phoenix_command.models.combat_trace import NULL_TRACE
 from phoenix_command.models.enums import TargetExposure, ShotType, AccuracyModifiers, SituationStanceModifier4B, \
-    ExplosiveTarget
-from phoenix_command.models.gear import Weapon, AmmoType
-from phoenix_command.models.hit_result_advanced import ShotParameters
+    ExplosiveTarget, AdvancedHitLocation, IncapacitationEffect, MedicalAid
+from phoenix_command.models.gear import Weapon, AmmoType, ArmorProtectionData
+from phoenix_command.models.hit_result_advanced import ShotParameters, ShotOutcomeDistribution
 from phoenix_command.simulations.combat_simulator_utils import CombatSimulatorUtils
+from phoenix_command.tables.advanced_damage_tables.advanced_damage_calculator import AdvancedDamageCalculator
+from phoenix_command.tables.advanced_damage_tables.table_1_get_hit_location import Table1AdvancedDamageHitLocation
+from phoenix_command.tables.advanced_rules.blunt_damage import Table9ABluntDamage
 from phoenix_command.tables.advanced_rules.effective_min_arc import EffectiveMinimumArc
 from phoenix_command.tables.advanced_rules.three_round_burst import ThreeRoundBurstTable
 from phoenix_command.tables.core.table4_advanced_odds_of_hitting import Table4AdvancedOddsOfHitting
 from phoenix_command.tables.core.table5_auto_pellet_shrapnel import Table5AutoPelletShrapnel
+from phoenix_command.tables.core.table8_healing_and_recovery import Table8HealingAndRecovery
+
+# Armor at one location as ((effective protection per layer, outermost first), total blunt protection) per piece.
+ArmorSignature = Tuple[Tuple[Tuple[int, ...], int], ...]
 
 
 class CombatSimulatorProbabilities:
@@ -37,6 +46,96 @@ class CombatSimulatorProbabilities:
         odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, ShotType.SINGLE)
         return eal, odds
 
+    @staticmethod
+    def calculate_single_shot_distribution(
+        shooter: Character,
+        target: Character,
+        weapon: Weapon,
+        ammo: AmmoType,
+        range_hexes: int,
+        target_exposure: TargetExposure,
+        shot_params: ShotParameters,
+        is_front_shot: bool = True,
+        medical_aid: MedicalAid = MedicalAid.NO_AID
+    ) -> ShotOutcomeDistribution:
+        """Exact outcome distribution of one single shot, as CombatSimulator.single_shot resolves it.
+
+        Combines the hit odds, the Table 1 location distribution, every 0-9 armor roll per piece,
+        damage per location and the Table 8 incapacitation and effect rolls. Damage per
+        (location, PEN, DC, armor) and incapacitation per (damage with shock, KO value) are
+        cached, so repeated queries against similar targets only redo the cheap combination step.
+
+        Args:
+            is_front_shot: Whether the shot hits the target's front.
+            medical_aid: Care level used for the Table 8A recovery chance behind death_probability.
+
+        Returns:
+            Distribution over (damage, incapacitation effect), with hit and location probabilities.
+        """
+        eal, odds = CombatSimulatorProbabilities.calculate_single_shot_probability(
+            shooter, target, weapon, range_hexes, target_exposure, shot_params
+        )
+        # A hit is a d100 roll of 0-99 at or under the odds
+        hit_probability = min(max(odds + 1, 0), 100) / 100
+        distribution = ShotOutcomeDistribution(eal=eal, odds=odds, hit_probability=hit_probability)
+        if hit_probability < 1:
+            distribution.outcomes[(0, None)] = 1 - hit_probability
+        if not hit_probability:
+            return distribution
+
+        distribution.location_probabilities = Table1AdvancedDamageHitLocation.get_compiled_table(
+            target_exposure, shot_params.target_orientation
+        ).probabilities()
+        pen = ammo.get_pen(range_hexes)
+        dc = ammo.get_dc(range_hexes)
+        recovery_chances = {}
+
+        for location, location_probability in distribution.location_probabilities.items():
+            armor = CombatSimulatorUtils.get_armor_protection(target, location, is_front_shot)
+            damage_outcomes = CombatSimulatorProbabilities.hit_damage_distribution(
+                location, pen, dc, is_front_shot, armor
+            )
+            for (damage, shock), damage_probability in damage_outcomes:
+                probability = hit_probability * location_probability * damage_probability
+                pd_total = target.physical_damage_total + damage
+                for effect, effect_probability in _incapacitation_distribution(
+                    pd_total + shock, target.knockout_value
+                ):
+                    key = (damage, effect)
+                    distribution.outcomes[key] = distribution.outcomes.get(key, 0.0) + probability * effect_probability
+
+                if damage > 0:
+                    recovery_chance = recovery_chances.get(pd_total)
+                    if recovery_chance is None:
+                        recovery = Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a(
+                            pd_total, target.health
+                        )
+                        recovery_chance = recovery_chances[pd_total] = recovery.aid_data[medical_aid][1]
+                    distribution.death_probability += probability * (100 - recovery_chance) / 100
+
+        return distribution
+
+    @staticmethod
+    def hit_damage_distribution(
+        location: AdvancedHitLocation,
+        pen: float,
+        dc: int,
+        is_front_shot: bool,
+        armor: List[ArmorProtectionData]
+    ) -> Tuple[Tuple[Tuple[int, int], float], ...]:
+        """Exact (damage, shock) distribution of one hit, as CombatSimulatorUtils.resolve_hit_damage rolls it.
+
+        Returns:
+            Pairs of ((damage, shock), probability), cached per location, PEN, DC and armor state.
+        """
+        return _hit_damage_distribution(location, pen, dc, is_front_shot, armor_signature(armor))
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Empty the cached hit damage and incapacitation distributions."""
+        _hit_damage_distribution.cache_clear()
+        _incapacitation_distribution.cache_clear()
+
     @staticmethod
     def calculate_shotgun_probabilities(
         shooter: Character,
@@ -400,7 +499,7 @@ class CombatSimulatorProbabilities:
         target_size_alm = target.value
 
         eal = CombatSimulatorUtils.calculate_explosive_eal(
-            shooter, weapon, range_hexes, target_size_alm, shot_params, log=[]
+            shooter, weapon, range_hexes, target_size_alm, shot_params, trace=NULL_TRACE
         )
         odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, ShotType.SINGLE)
         return eal, odds
@@ -424,7 +523,7 @@ class CombatSimulatorProbabilities:
 
         eal = CombatSimulatorUtils.calculate_grenade_eal(
             shooter, range_hexes, target_size_alm, aim_alm,
-            situation_stance_modifiers, visibility_modifiers, log=[]
+            situation_stance_modifiers, visibility_modifiers, trace=NULL_TRACE
         )
         odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, ShotType.SINGLE)
         return eal, odds
@@ -474,7 +573,7 @@ class CombatSimulatorProbabilities:
 
         target_size_alm = target.value
         eal = CombatSimulatorUtils.calculate_explosive_eal(
-            shooter, weapon, range_hexes, target_size_alm, shot_params, log=[]
+            shooter, weapon, range_hexes, target_size_alm, shot_params, trace=NULL_TRACE
         ) - sab_penalty
 
         elevation_odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, ShotType.BURST)
@@ -493,3 +592,66 @@ class CombatSimulatorProbabilities:
 
         return eal, elevation_odds, final_arc, grenades_info
 
+
+
+def armor_signature(armor: List[ArmorProtectionData]) -> ArmorSignature:
+    """Hashable snapshot of the armor state that determines how a hit resolves."""
+    return tuple(
+        (tuple(layer.effective_protection for layer in protection_data.layers),
+         protection_data.get_total_blunt_protection())
+        for protection_data in armor
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _hit_damage_distribution(
+    location: AdvancedHitLocation, pen: float, dc: int, is_front: bool, armor: ArmorSignature
+) -> Tuple[Tuple[Tuple[int, int], float], ...]:
+    """Enumerate the 0-9 roll of each armor piece in turn; equal remaining PEN values are merged."""
+    total_protection = sum(sum(layers) for layers, _ in armor)
+    penetrating: Dict[float, float] = {pen: 1.0}  # Remaining PEN -> probability
+    stopped: Dict[int, float] = {}  # Blunt protection of the stopping piece -> probability
+
+    for layers, blunt_protection in armor:
+        next_penetrating: Dict[float, float] = {}
+        for epen, probability in penetrating.items():
+            for roll in range(10):
+                penetrated, remaining_pen, _ = ArmorProtectionData.resolve_layers(layers, epen, roll)
+                if penetrated:
+                    next_penetrating[remaining_pen] = next_penetrating.get(remaining_pen, 0.0) + probability / 10
+                else:
+                    stopped[blunt_protection] = stopped.get(blunt_protection, 0.0) + probability / 10
+        penetrating = next_penetrating
+
+    outcomes: Dict[Tuple[int, int], float] = {}
+    if stopped:
+        shock = AdvancedDamageCalculator.calculate_damage_cached(
+            location=location, dc=0, epen=0.0, is_front=is_front
+        ).shock
+        for blunt_pf, probability in stopped.items():
+            key = (Table9ABluntDamage.get_blunt_damage(location, blunt_pf, pen), shock)
+            outcomes[key] = outcomes.get(key, 0.0) + probability
+    for epen, probability in penetrating.items():
+        epen = max(0.0, epen)
+        record = AdvancedDamageCalculator.calculate_damage_cached(
+            location=location, dc=1 if total_protection > epen else dc, epen=epen, is_front=is_front
+        )
+        key = (record.damage, record.shock)
+        outcomes[key] = outcomes.get(key, 0.0) + probability
+    return tuple(outcomes.items())
+
+
+@functools.lru_cache(maxsize=4096)
+def _incapacitation_distribution(
+    pd_with_shock: int, knockout_value: int
+) -> Tuple[Tuple[Optional[IncapacitationEffect], float], ...]:
+    """Distribution of the Table 8 incapacitation check and effect roll; None means not incapacitated."""
+    chance = Table8HealingAndRecovery.get_incapacitation_chance(pd_with_shock, knockout_value)
+    if not chance:
+        return ((None, 1.0),)
+    incapacitated = min(chance, 100) / 100
+    result: Dict[Optional[IncapacitationEffect], float] = {None: 1 - incapacitated}
+    for effect_roll in range(100):
+        effect = Table8HealingAndRecovery.get_incapacitation_effect(pd_with_shock, knockout_value, effect_roll)
+        result[effect] = result.get(effect, 0.0) + incapacitated / 100
+    return tuple(result.items())
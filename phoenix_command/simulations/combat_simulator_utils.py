@@ -1,12 +1,15 @@
 """Utility functions for combat simulation."""
 
 import random
-from typing import Optional, List
+from collections import Counter
+from typing import Iterator, Optional, List, Sequence, Tuple
 
 from phoenix_command.models.character import Character
+from phoenix_command.models.combat_trace import NULL_TRACE, CombatTrace
 from phoenix_command.models.enums import ShotType, TargetExposure, AccuracyModifiers, IncapacitationEffect, SituationStanceModifier4B, BlastModifier, AdvancedHitLocation
-from phoenix_command.models.gear import Weapon, AmmoType, BallisticData, Armor, Grenade
-from phoenix_command.models.hit_result_advanced import ShotParameters, ShotResult, TargetGroup, BurstElevationResult, DamageResult
+from phoenix_command.models.gear import Weapon, AmmoType, BallisticData, ArmorProtectionData, Grenade
+from phoenix_command.models.hit_result_advanced import ShotParameters, ShotResult, TargetGroup, BurstElevationResult, DamageResult, \
+    PatternHits
 from phoenix_command.tables.advanced_damage_tables.advanced_damage_calculator import AdvancedDamageCalculator
 from phoenix_command.tables.advanced_damage_tables.table_1_get_hit_location import Table1AdvancedDamageHitLocation
 from phoenix_command.tables.advanced_rules.blunt_damage import Table9ABluntDamage
@@ -25,32 +28,32 @@ class CombatSimulatorUtils:
             weapon: Weapon,
             target_hits: List[tuple[int, int, Character, int, TargetExposure, ShotParameters, bool]],
             sab_penalty: int,
-            log: List[str]
+            trace: CombatTrace
     ) -> List[tuple[int, int, Character, int, TargetExposure, ShotParameters, bool]]:
         """Redistribute hits proportionally by EAL if total exceeds weapon ROF."""
         total_hits = sum(h[1] for h in target_hits)
         if total_hits <= weapon.full_auto_rof:
-            log.append(f"[Redistribute] Total hits {total_hits} <= ROF {weapon.full_auto_rof}, no redistribution needed")
+            trace.add("hits", "[Redistribute] Total hits %s <= ROF %s, no redistribution needed", total_hits, weapon.full_auto_rof)
             return target_hits
 
-        log.append(f"[Redistribute] Total hits {total_hits} > ROF {weapon.full_auto_rof}, redistributing...")
+        trace.add("hits", "[Redistribute] Total hits %s > ROF %s, redistributing...", total_hits, weapon.full_auto_rof)
 
         # Calculate EAL for each target
         target_eals = []
-        for idx, hits, target, rng, exposure, shot_params, front in target_hits:
+        for idx, hits, target, target_range, exposure, shot_params, front in target_hits:
             eal = CombatSimulatorUtils.calculate_eal(
-                shooter, target, weapon, rng, exposure, shot_params,
-                AccuracyModifiers.AUTO_ELEV, []  # Empty log for internal calculation
+                shooter, target, weapon, target_range, exposure, shot_params,
+                AccuracyModifiers.AUTO_ELEV, NULL_TRACE  # No trace for internal calculation
             ) - sab_penalty
             target_eals.append(eal)
-            log.append(f"  Target {target.name}: EAL={eal}")
+            trace.add("hits", "  Target %s: EAL=%s", target.name, eal)
 
         # Redistribute hits proportionally to EAL
         total_eal = sum(target_eals)
         redistributed_hits = []
         remaining_rof = weapon.full_auto_rof
 
-        for i, (eal, (idx, hits, target, rng, exposure, shot_params, front)) in enumerate(
+        for i, (eal, (idx, hits, target, target_range, exposure, shot_params, front)) in enumerate(
                 zip(target_eals, target_hits)):
             if i == len(target_eals) - 1:
                 new_hits = remaining_rof
@@ -59,8 +62,8 @@ class CombatSimulatorUtils:
                 new_hits = max(1, int(weapon.full_auto_rof * proportion))
                 remaining_rof -= new_hits
 
-            log.append(f"  Target {target.name}: {hits} -> {new_hits} hits")
-            redistributed_hits.append((idx, new_hits, target, rng, exposure, shot_params, front))
+            trace.add("hits", "  Target %s: %s -> %s hits", target.name, hits, new_hits)
+            redistributed_hits.append((idx, new_hits, target, target_range, exposure, shot_params, front))
 
         return redistributed_hits
 
@@ -75,22 +78,23 @@ class CombatSimulatorUtils:
             arc_of_fire: float,
             sab_penalty: int,
             salm: Optional[int],
-            log: List[str]
+            trace: CombatTrace,
+            rng: Optional[random.Random] = None
     ) -> BurstElevationResult:
         """Check elevation for shotgun burst and get hits."""
-        log.append(f"[Shotgun Burst Elevation] Target: {target.name}, Range: {range_hexes}, SALM: {salm}")
+        trace.add("eal", "[Shotgun Burst Elevation] Target: %s, Range: %s, SALM: %s", target.name, range_hexes, salm)
 
         if salm is not None:
             eal = CombatSimulatorUtils.calculate_shotgun_eal(
-                shooter, target, weapon, range_hexes, exposure, shot_params, salm, sab_penalty, log
+                shooter, target, weapon, range_hexes, exposure, shot_params, salm, sab_penalty, trace
             )
         else:
             eal = CombatSimulatorUtils.calculate_eal(
-                shooter, target, weapon, range_hexes, exposure, shot_params, AccuracyModifiers.AUTO_ELEV, log
+                shooter, target, weapon, range_hexes, exposure, shot_params, AccuracyModifiers.AUTO_ELEV, trace
             ) - sab_penalty
-            log.append(f"  SAB penalty: -{sab_penalty}, Final EAL: {eal}")
+            trace.add("eal", "  SAB penalty: -%s, Final EAL: %s", sab_penalty, eal)
 
-        return CombatSimulatorUtils.check_elevation_and_calculate_hits(eal, exposure, weapon, arc_of_fire, log)
+        return CombatSimulatorUtils.check_elevation_and_calculate_hits(eal, exposure, weapon, arc_of_fire, trace, rng)
 
     @staticmethod
     def get_shotgun_data_at_range(
@@ -124,26 +128,26 @@ class CombatSimulatorUtils:
             shot_params: ShotParameters,
             salm: int,
             sab_penalty: int = 0,
-            log: List[str] = None
+            trace: Optional[CombatTrace] = None
     ) -> int:
         """Calculate EAL for shotgun using larger of Target Size ALM or SALM."""
-        if log is None:
-            log = []
+        if trace is None:
+            trace = NULL_TRACE
 
         target_size_alm = Table4AdvancedOddsOfHitting.get_standard_target_size_modifier_4e(
             exposure, AccuracyModifiers.AUTO_ELEV if sab_penalty else AccuracyModifiers.TARGET_SIZE
         )
         eal_base = CombatSimulatorUtils.calculate_eal(
             shooter, target, weapon, range_hexes, exposure, shot_params,
-            AccuracyModifiers.AUTO_ELEV if sab_penalty else AccuracyModifiers.TARGET_SIZE, log
+            AccuracyModifiers.AUTO_ELEV if sab_penalty else AccuracyModifiers.TARGET_SIZE, trace
         )
 
         effective_size_alm = max(target_size_alm, salm)
         result = (eal_base - sab_penalty) - target_size_alm + effective_size_alm
 
-        log.append(f"[Shotgun EAL] Base EAL: {eal_base}, Target Size ALM: {target_size_alm}, SALM: {salm}")
-        log.append(f"  Using max({target_size_alm}, {salm}) = {effective_size_alm}")
-        log.append(f"  SAB penalty: {sab_penalty}, Final EAL: {result}")
+        trace.add("eal", "[Shotgun EAL] Base EAL: %s, Target Size ALM: %s, SALM: %s", eal_base, target_size_alm, salm)
+        trace.add("eal", "  Using max(%s, %s) = %s", target_size_alm, salm, effective_size_alm)
+        trace.add("eal", "  SAB penalty: %s, Final EAL: %s", sab_penalty, result)
 
         return result
 
@@ -157,19 +161,20 @@ class CombatSimulatorUtils:
             shot_params: ShotParameters,
             arc_of_fire: float,
             sab_penalty: int,
-            log: List[str]
+            trace: CombatTrace,
+            rng: Optional[random.Random] = None
     ) -> BurstElevationResult:
         """Check elevation and calculate hits for burst fire."""
-        log.append(f"[Burst Elevation] Target: {target.name}, Range: {range_hexes}")
+        trace.add("eal", "[Burst Elevation] Target: %s, Range: %s", target.name, range_hexes)
 
         eal = CombatSimulatorUtils.calculate_eal(
             shooter, target, weapon, range_hexes, exposure, shot_params,
-            AccuracyModifiers.AUTO_ELEV, log
+            AccuracyModifiers.AUTO_ELEV, trace
         ) - sab_penalty
 
-        log.append(f"  SAB penalty: -{sab_penalty}, Final EAL: {eal}")
+        trace.add("eal", "  SAB penalty: -%s, Final EAL: %s", sab_penalty, eal)
 
-        return CombatSimulatorUtils.check_elevation_and_calculate_hits(eal, exposure, weapon, arc_of_fire, log)
+        return CombatSimulatorUtils.check_elevation_and_calculate_hits(eal, exposure, weapon, arc_of_fire, trace, rng)
 
     @staticmethod
     def setup_burst_fire(
@@ -178,18 +183,18 @@ class CombatSimulatorUtils:
             continuous_burst_impulses: int,
             arc_of_fire: Optional[float],
             shooter: Character,
-            log: List[str]
+            trace: CombatTrace
     ) -> tuple[int, float]:
         """Setup burst fire parameters and return SAB penalty and arc of fire."""
-        log.append(f"[Burst Fire Setup] Weapon: {weapon.name}, ROF: {weapon.full_auto_rof}")
+        trace.add("eal", "[Burst Fire Setup] Weapon: %s, ROF: %s", weapon.name, weapon.full_auto_rof)
 
         sab_penalty, min_arc = CombatSimulatorUtils.validate_burst_fire_inputs(
             weapon, target_group.targets, target_group.ranges, target_group.exposures,
             target_group.shot_params_list, target_group.is_front_shots, continuous_burst_impulses
         )
         
-        log.append(f"  Continuous burst impulses: {continuous_burst_impulses}, SAB penalty: {sab_penalty}")
-        log.append(f"  Minimum arc from weapon: {min_arc}")
+        trace.add("eal", "  Continuous burst impulses: %s, SAB penalty: %s", continuous_burst_impulses, sab_penalty)
+        trace.add("eal", "  Minimum arc from weapon: %s", min_arc)
 
         shot_params = target_group.shot_params_list[0]
 
@@ -208,10 +213,10 @@ class CombatSimulatorUtils:
             min_arc, weapon.weapon_type, stance, shooter.strength, False, is_moving
         )
         
-        log.append(f"  Stance: {stance}, Moving: {is_moving}, Effective MA: {effective_ma}")
+        trace.add("eal", "  Stance: %s, Moving: %s, Effective MA: %s", stance, is_moving, effective_ma)
 
         final_arc = max(arc_of_fire, effective_ma) if arc_of_fire is not None else effective_ma
-        log.append(f"  Requested arc: {arc_of_fire}, Final arc of fire: {final_arc}")
+        trace.add("eal", "  Requested arc: %s, Final arc of fire: %s", arc_of_fire, final_arc)
 
         return sab_penalty, final_arc
 
@@ -224,14 +229,14 @@ class CombatSimulatorUtils:
         target_exposure: TargetExposure,
         shot_params: ShotParameters,
         target_size_modifier_type: AccuracyModifiers = AccuracyModifiers.TARGET_SIZE,
-        log: List[str] = None
+        trace: Optional[CombatTrace] = None
     ) -> int:
         """Calculate Effective Accuracy Level (EAL) for a shot."""
-        if log is None:
-            log = []
+        if trace is None:
+            trace = NULL_TRACE
 
-        log.append(f"[Calculate EAL] Shooter: {shooter.name} -> Target: {target.name}")
-        log.append(f"  Weapon: {weapon.name}, Range: {range_hexes} hexes, Exposure: {target_exposure.name}")
+        trace.add("eal", "[Calculate EAL] Shooter: %s -> Target: %s", shooter.name, target.name)
+        trace.add("eal", "  Weapon: %s, Range: %s hexes, Exposure: %s", weapon.name, range_hexes, target_exposure.name)
 
         max_aim_time_impulses = float('inf')
         movement_alm = 0
@@ -241,7 +246,7 @@ class CombatSimulatorUtils:
             )
             movement_alm += target_movement_alm
             max_aim_time_impulses = min(max_aim_time_impulses, target_max_aim)
-            log.append(f"  Target moving: {shot_params.target_speed_hex_per_impulse} hex/imp, ALM: {target_movement_alm}, Max aim: {target_max_aim}")
+            trace.add("eal", "  Target moving: %s hex/imp, ALM: %s, Max aim: %s", shot_params.target_speed_hex_per_impulse, target_movement_alm, target_max_aim)
 
         if shot_params.shooter_speed_hex_per_impulse > 0:
             shooter_movement_alm, _ = Table4AdvancedOddsOfHitting.get_movement_alm_and_max_aim_time_4d(
@@ -249,49 +254,44 @@ class CombatSimulatorUtils:
             )
             movement_alm += shooter_movement_alm
             max_aim_time_impulses = min(max_aim_time_impulses, 1.0)
-            log.append(f"  Shooter moving: {shot_params.shooter_speed_hex_per_impulse} hex/imp, ALM: {shooter_movement_alm}")
+            trace.add("eal", "  Shooter moving: %s hex/imp, ALM: %s", shot_params.shooter_speed_hex_per_impulse, shooter_movement_alm)
 
         effective_aim_time_ac = shot_params.aim_time_ac
         if max_aim_time_impulses < float('inf'):
             max_ac_per_impulse = max(shooter.impulses)
             max_aim_time_ac = int(max_aim_time_impulses * max_ac_per_impulse)
             effective_aim_time_ac = min(shot_params.aim_time_ac, max_aim_time_ac)
-            log.append(f"  Aim time limited: {shot_params.aim_time_ac} -> {effective_aim_time_ac} AC")
+            trace.add("eal", "  Aim time limited: %s -> %s AC", shot_params.aim_time_ac, effective_aim_time_ac)
 
         aim_time_alm = weapon.aim_time_modifiers.get(effective_aim_time_ac, 
                                                               weapon.aim_time_modifiers[max(weapon.aim_time_modifiers.keys())]) + shooter.skill_accuracy_level
         range_alm = Table4AdvancedOddsOfHitting.get_accuracy_level_modifier_by_range_4a(range_hexes)
         
-        log.append(f"  Aim time ALM: {weapon.aim_time_modifiers.get(effective_aim_time_ac, weapon.aim_time_modifiers[max(weapon.aim_time_modifiers.keys())])} + SAL {shooter.skill_accuracy_level} = {aim_time_alm}")
-        log.append(f"  Range ALM (Table 4A): {range_alm}")
+        trace.add("eal", "  Aim time ALM: %s + SAL %s = %s", aim_time_alm - shooter.skill_accuracy_level, shooter.skill_accuracy_level, aim_time_alm)
+        trace.add("eal", "  Range ALM (Table 4A): %s", range_alm)
 
         situation_stance_alm = sum(mod.value for mod in shot_params.situation_stance_modifiers)
         visibility_alm = sum(mod.value for mod in shot_params.visibility_modifiers)
         
-        log.append(f"  Situation/Stance ALM: {situation_stance_alm} ({[m.name for m in shot_params.situation_stance_modifiers]})")
-        log.append(f"  Visibility ALM: {visibility_alm} ({[m.name for m in shot_params.visibility_modifiers]})")
+        if trace.enabled:
+            trace.add("eal", "  Situation/Stance ALM: %s (%s)", situation_stance_alm, [m.name for m in shot_params.situation_stance_modifiers])
+            trace.add("eal", "  Visibility ALM: %s (%s)", visibility_alm, [m.name for m in shot_params.visibility_modifiers])
 
         duck_alm = 0
         if shot_params.reflexive_duck_shooter:
             duck_alm -= 10
-            log.append("  Shooter reflexive duck: -10")
+            trace.add("eal", "  Shooter reflexive duck: -10")
         if shot_params.reflexive_duck_target:
             duck_alm -= 5
-            log.append("  Target reflexive duck: -5")
+            trace.add("eal", "  Target reflexive duck: -5")
 
         defensive_alm = target.defensive_alm
-        log.append(f"  Defensive ALM: {defensive_alm}")
+        trace.add("eal", "  Defensive ALM: %s", defensive_alm)
 
         custom_alm = 0
-        for item in shot_params.custom_eal_modifiers or []:
-            if isinstance(item, (list, tuple)) and len(item) >= 2:
-                label, alm = item[0], int(item[1])
-            elif isinstance(item, dict):
-                label, alm = item.get("label", "custom"), int(item.get("alm", 0))
-            else:
-                continue
+        for label, alm in CombatSimulatorUtils._custom_eal_modifiers(shot_params):
             custom_alm += alm
-            log.append(f"  Custom EAL '{label}': {alm:+d}")
+            trace.add("eal", "  Custom EAL '%s': %+d", label, alm)
 
         alm_sum = (
             aim_time_alm
@@ -303,51 +303,184 @@ class CombatSimulatorUtils:
             + defensive_alm
             + custom_alm
         )
-        log.append(f"  Total ALM sum: {alm_sum}")
+        trace.add("eal", "  Total ALM sum: %s", alm_sum)
 
         ba = weapon.ballistic_data.get_ballistic_accuracy(range_hexes) if weapon.ballistic_data else float('inf')
-        log.append(f"  Ballistic Accuracy limit: {ba}")
+        trace.add("eal", "  Ballistic Accuracy limit: %s", ba)
 
         effective_alm = min(ba, alm_sum)
-        log.append(f"  Effective ALM: min({ba}, {alm_sum}) = {effective_alm}")
+        trace.add("eal", "  Effective ALM: min(%s, %s) = %s", ba, alm_sum, effective_alm)
 
         target_size_alm = Table4AdvancedOddsOfHitting.get_standard_target_size_modifier_4e(
             target_exposure, target_size_modifier_type
         )
-        log.append(f"  Target Size ALM (Table 4E, {target_size_modifier_type.name}): {target_size_alm}")
+        trace.add("eal", "  Target Size ALM (Table 4E, %s): %s", target_size_modifier_type.name, target_size_alm)
 
         eal = effective_alm + target_size_alm
-        log.append(f"  Final EAL: {effective_alm} + {target_size_alm} = {eal}")
+        trace.add("eal", "  Final EAL: %s + %s = %s", effective_alm, target_size_alm, eal)
 
         return eal
 
+    @staticmethod
+    def _custom_eal_modifiers(shot_params: ShotParameters) -> Iterator[Tuple[str, int]]:
+        """Yield (label, alm) for each custom EAL modifier given as a pair or a dict."""
+        for item in shot_params.custom_eal_modifiers or []:
+            if isinstance(item, (list, tuple)) and len(item) >= 2:
+                yield item[0], int(item[1])
+            elif isinstance(item, dict):
+                yield item.get("label", "custom"), int(item.get("alm", 0))
+
+    @staticmethod
+    def get_shot_parameter_alms(shot_params: ShotParameters) -> Tuple[int, int, int]:
+        """Return the (situation/stance, visibility, reflexive duck + custom) ALM sums of shot parameters."""
+        situation_stance_alm = sum(mod.value for mod in shot_params.situation_stance_modifiers)
+        visibility_alm = sum(mod.value for mod in shot_params.visibility_modifiers)
+        extra_alm = sum(alm for _, alm in CombatSimulatorUtils._custom_eal_modifiers(shot_params))
+        if shot_params.reflexive_duck_shooter:
+            extra_alm -= 10
+        if shot_params.reflexive_duck_target:
+            extra_alm -= 5
+        return situation_stance_alm, visibility_alm, extra_alm
+
+    @staticmethod
+    def calculate_eal_batch(
+        shooter: Character,
+        weapon: Weapon,
+        aim_time_ac: int,
+        ranges: Sequence[int],
+        exposures: Sequence[TargetExposure],
+        defensive_alms: Sequence[int],
+        situation_stance_alms: Optional[Sequence[int]] = None,
+        visibility_alms: Optional[Sequence[int]] = None,
+        target_speeds: Optional[Sequence[float]] = None,
+        shooter_speeds: Optional[Sequence[float]] = None,
+        extra_alms: Optional[Sequence[int]] = None,
+        target_size_modifier_type: AccuracyModifiers = AccuracyModifiers.TARGET_SIZE,
+        shot_type: ShotType = ShotType.SINGLE
+    ) -> Tuple[List[int], List[int]]:
+        """Vectorised form of calculate_eal for one shooter and weapon.
+
+        Aim time and target size lookups run once per distinct value; ballistic accuracy and
+        Tables 4A, 4D and 4G use their batch forms. Per-shot sequences are parallel to ranges;
+        omitted ones are all zero.
+
+        Args:
+            shooter: Character firing every shot.
+            weapon: Weapon fired.
+            aim_time_ac: Aim time of every shot, before moving-target limits.
+            ranges: Range of each shot in hexes.
+            exposures: Target exposure of each shot.
+            defensive_alms: Defensive ALM of each shot's target.
+            situation_stance_alms: Summed Table 4B modifiers per shot.
+            visibility_alms: Summed Table 4C modifiers per shot.
+            target_speeds: Target speed per shot in hexes per impulse.
+            shooter_speeds: Shooter speed per shot in hexes per impulse.
+            extra_alms: Reflexive duck and custom modifiers per shot (see get_shot_parameter_alms).
+            target_size_modifier_type: Table 4E column to use.
+            shot_type: Table 4G column to use.
+
+        Returns:
+            Tuple of (EALs, odds of hitting), in input order.
+        """
+        n = len(ranges)
+        zeros = [0] * n
+        columns = [
+            exposures,
+            defensive_alms,
+            situation_stance_alms if situation_stance_alms is not None else zeros,
+            visibility_alms if visibility_alms is not None else zeros,
+            target_speeds if target_speeds is not None else zeros,
+            shooter_speeds if shooter_speeds is not None else zeros,
+            extra_alms if extra_alms is not None else zeros,
+        ]
+        if any(len(column) != n for column in columns):
+            raise ValueError(f"Every per-shot sequence must have {n} entries")
+
+        aim_time_modifiers = weapon.aim_time_modifiers
+        fallback_aim_alm = aim_time_modifiers[max(aim_time_modifiers.keys())]
+        skill_accuracy_level = shooter.skill_accuracy_level
+        aim_time_alms = {}
+
+        range_alms = Table4AdvancedOddsOfHitting.get_accuracy_level_modifier_by_range_4a_batch(ranges)
+        if weapon.ballistic_data:
+            ballistic_accuracy = weapon.ballistic_data.get_ballistic_accuracy_batch(ranges)
+        else:
+            ballistic_accuracy = [float('inf')] * n
+        target_size_alms = {
+            exposure: Table4AdvancedOddsOfHitting.get_standard_target_size_modifier_4e(
+                exposure, target_size_modifier_type
+            )
+            for exposure in set(exposures)
+        }
+        target_movement_alms, target_max_aims = Table4AdvancedOddsOfHitting.get_movement_alm_and_max_aim_time_4d_batch(
+            columns[4], ranges
+        )
+        shooter_movement_alms, _ = Table4AdvancedOddsOfHitting.get_movement_alm_and_max_aim_time_4d_batch(
+            columns[5], ranges
+        )
+
+        eals = []
+        for i, (exposure, defensive_alm, situation_stance_alm, visibility_alm, target_speed, shooter_speed,
+                extra_alm) in enumerate(zip(*columns)):
+            max_aim_time_impulses = float('inf')
+            movement_alm = 0
+            if target_speed > 0:
+                movement_alm += target_movement_alms[i]
+                max_aim_time_impulses = min(max_aim_time_impulses, target_max_aims[i])
+            if shooter_speed > 0:
+                movement_alm += shooter_movement_alms[i]
+                max_aim_time_impulses = min(max_aim_time_impulses, 1.0)
+
+            effective_aim_time_ac = aim_time_ac
+            if max_aim_time_impulses < float('inf'):
+                effective_aim_time_ac = min(aim_time_ac, int(max_aim_time_impulses * max(shooter.impulses)))
+            aim_time_alm = aim_time_alms.get(effective_aim_time_ac)
+            if aim_time_alm is None:
+                aim_time_alm = aim_time_alms[effective_aim_time_ac] = (
+                    aim_time_modifiers.get(effective_aim_time_ac, fallback_aim_alm) + skill_accuracy_level
+                )
+
+            alm_sum = (
+                aim_time_alm
+                + range_alms[i]
+                + situation_stance_alm
+                + visibility_alm
+                + movement_alm
+                + extra_alm
+                + defensive_alm
+            )
+            eals.append(min(ballistic_accuracy[i], alm_sum) + target_size_alms[exposure])
+
+        return eals, Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g_batch(eals, shot_type)
+
     @staticmethod
     def determine_incapacitation(
         target: Character,
         pd_total: int,
         shock: int,
-        log: List[str]
+        trace: CombatTrace,
+        rng: Optional[random.Random] = None
     ) -> Optional[IncapacitationEffect]:
         """Determine incapacitation effect."""
         pd_with_shock = pd_total + shock
         
-        log.append(f"[Incapacitation Check] PD: {pd_total}, Shock: {shock}, Total: {pd_with_shock}, KO Value: {target.knockout_value}")
+        trace.add("incapacitation", "[Incapacitation Check] PD: %s, Shock: %s, Total: %s, KO Value: %s", pd_total, shock, pd_with_shock, target.knockout_value)
 
         chance = Table8HealingAndRecovery.get_incapacitation_chance(pd_with_shock, target.knockout_value)
         if chance == 0:
-            log.append("  No incapacitation chance")
+            trace.add("incapacitation", "  No incapacitation chance")
             return None
         
-        roll = random.randint(0, 99)
-        log.append(f"  Incapacitation chance: {chance}%, Roll: {roll}")
+        roll = (rng or random).randint(0, 99)
+        trace.add("incapacitation", "  Incapacitation chance: %s%%, Roll: %s", chance, roll)
 
         if roll >= chance:
-            log.append(f"  Roll {roll} >= {chance}, no incapacitation")
+            trace.add("incapacitation", "  Roll %s >= %s, no incapacitation", roll, chance)
             return None
         
-        effect_roll = random.randint(0, 99)
+        effect_roll = (rng or random).randint(0, 99)
         effect = Table8HealingAndRecovery.get_incapacitation_effect(pd_with_shock, target.knockout_value, effect_roll)
-        log.append(f"  Effect roll: {effect_roll}, Result: {effect.name if effect else 'None'}")
+        trace.add("incapacitation", "  Effect roll: %s, Result: %s", effect_roll, effect.name if effect else 'None')
 
         return effect
 
@@ -359,20 +492,52 @@ class CombatSimulatorUtils:
         target_exposure: TargetExposure,
         shot_params: ShotParameters,
         is_front_shot: bool,
-        log: List[str]
+        trace: CombatTrace,
+        rng: Optional[random.Random] = None
     ):
         """Process a successful hit and calculate damage."""
-        log.append(f"[Process Hit] Target: {target.name}, Ammo: {ammo.name}, Range: {range_hexes}")
+        trace.add("damage", "[Process Hit] Target: %s, Ammo: %s, Range: %s", target.name, ammo.name, range_hexes)
 
         location = Table1AdvancedDamageHitLocation.get_hit_location(
-            target_exposure, shot_params.target_orientation
+            target_exposure, shot_params.target_orientation, rng
         )
-        log.append(f"  Hit location: {location.name}")
+        trace.add("location", "  Hit location: %s", location.name)
 
         pen = ammo.get_pen(range_hexes)
         dc = ammo.get_dc(range_hexes)
-        log.append(f"  PEN: {pen}, DC: {dc}")
+        trace.add("damage", "  PEN: %s, DC: %s", pen, dc)
+
+        damage_result = CombatSimulatorUtils.apply_hit_at_location(
+            target, location, pen, dc, is_front_shot, trace, rng
+        )
 
+        trace.add("damage", "  Target total PD: %s", target.physical_damage_total)
+
+        incap_effect = CombatSimulatorUtils.determine_incapacitation(
+            target, target.physical_damage_total, damage_result.shock, trace, rng
+        )
+        
+        recovery = Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a(
+            target.physical_damage_total, target.health
+        )
+        
+        incap_time = CombatSimulatorUtils.roll_incapacitation_time(target, incap_effect, rng)
+        if incap_time is not None:
+            trace.add("incapacitation", "  Incapacitation time: %s phases", incap_time)
+
+        return damage_result, incap_effect, recovery, incap_time
+    
+    @staticmethod
+    def apply_hit_at_location(
+        target: Character,
+        location: AdvancedHitLocation,
+        pen: float,
+        dc: int,
+        is_front_shot: bool,
+        trace: CombatTrace,
+        rng: Optional[random.Random] = None
+    ) -> DamageResult:
+        """Resolve armor and damage of one hit at a known location and apply it to the target."""
         epen = pen
         penetrated = True
         blunt_pf = 0
@@ -380,70 +545,112 @@ class CombatSimulatorUtils:
         
         # Collect all armor protection for this location
         armor_pieces = []
-        for item in target.equipment:
-            if isinstance(item, Armor):
-                protection_data = item.get_protection(location, is_front_shot)
-                if protection_data and protection_data.get_total_protection() > 0:
-                    armor_pieces.append((item, protection_data))
-                    total_protection += protection_data.get_total_protection()
+        stack = target.armor_index.get((location, is_front_shot))
+        if stack is not None:
+            armor_pieces = stack.active_pieces()
+            total_protection = stack.total_protection
         
         # Process armor if present
         if armor_pieces:
-            log.append(f"  Total armor protection: {total_protection}")
+            trace.add("armor", "  Total armor protection: %s", total_protection)
             for armor_item, protection_data in armor_pieces:
-                log.append(f"  Armor: {armor_item.name}, Protection: {protection_data.get_total_protection()}")
-                penetrated, remaining_pen = armor_item.process_hit(location, is_front_shot, epen)
+                trace.add("armor", "  Armor: %s, Protection: %s", armor_item.name, protection_data.get_total_protection())
+                penetrated, remaining_pen = armor_item.process_hit(location, is_front_shot, epen, rng)
                 epen = remaining_pen
                 if not penetrated:
                     blunt_pf += protection_data.get_total_blunt_protection()
-                    log.append(f"  Armor NOT penetrated, Blunt PF: {blunt_pf}")
+                    trace.add("armor", "  Armor NOT penetrated, Blunt PF: %s", blunt_pf)
                     break
                 else:
-                    log.append(f"  Armor penetrated, Remaining PEN: {epen}")
+                    trace.add("armor", "  Armor penetrated, Remaining PEN: %s", epen)
         
         if not penetrated:
             blunt_damage = Table9ABluntDamage.get_blunt_damage(location, blunt_pf, pen)
-            log.append(f"  Blunt damage: {blunt_damage}")
-            damage_result = AdvancedDamageCalculator.calculate_damage(
+            trace.add("damage", "  Blunt damage: %s", blunt_damage)
+            damage_result = AdvancedDamageCalculator.calculate_damage_cached(
                 location=location, dc=0, epen=0.0, is_front=is_front_shot
-            )
+            ).to_damage_result()
             damage_result.damage = blunt_damage
             target.apply_damage(blunt_damage, damage_result)
         else:
             epen = max(0.0, epen)
             if total_protection > epen:
                 dc = 1
-                log.append("  Protection > EPEN, DC reduced to 1")
-            damage_result = AdvancedDamageCalculator.calculate_damage(
+                trace.add("damage", "  Protection > EPEN, DC reduced to 1")
+            damage_result = AdvancedDamageCalculator.calculate_damage_cached(
                 location=location, dc=dc, epen=epen, is_front=is_front_shot
-            )
-            log.append(f"  Damage: {damage_result.damage}, Shock: {damage_result.shock}")
+            ).to_damage_result()
+            trace.add("damage", "  Damage: %s, Shock: %s", damage_result.damage, damage_result.shock)
             if damage_result.pierced_organs:
-                log.append(f"  Pierced organs: {damage_result.pierced_organs}")
+                trace.add("damage", "  Pierced organs: %s", damage_result.pierced_organs)
             target.apply_damage(damage_result.damage, damage_result)
 
-        log.append(f"  Target total PD: {target.physical_damage_total}")
+        return damage_result
 
-        incap_effect = CombatSimulatorUtils.determine_incapacitation(
-            target, target.physical_damage_total, damage_result.shock, log
-        )
-        
-        recovery = Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a(
-            target.physical_damage_total, target.health
+    @staticmethod
+    def roll_incapacitation_time(
+        target: Character,
+        incap_effect: Optional[IncapacitationEffect],
+        rng: Optional[random.Random] = None
+    ) -> Optional[int]:
+        """Roll Table 8B incapacitation time for an effect; dazed and disoriented roll lower."""
+        if not incap_effect:
+            return None
+        modifier = 0
+        if incap_effect == IncapacitationEffect.DAZED:
+            modifier = -1
+        elif incap_effect == IncapacitationEffect.DISORIENTED:
+            modifier = -2
+        return Table8HealingAndRecovery.get_incapacitation_time_8b(target.physical_damage_total, modifier, rng)
+
+    @staticmethod
+    def get_armor_protection(
+        target: Character,
+        location: AdvancedHitLocation,
+        is_front_shot: bool
+    ) -> List[ArmorProtectionData]:
+        """Protection data of every armor piece covering a location, outermost first."""
+        stack = target.armor_index.get((location, is_front_shot))
+        if stack is None:
+            return []
+        return [protection_data for _, protection_data in stack.active_pieces()]
+
+    @staticmethod
+    def resolve_hit_damage(
+        location: AdvancedHitLocation,
+        pen: float,
+        dc: int,
+        is_front_shot: bool,
+        armor: List[ArmorProtectionData],
+        rng: Optional[random.Random] = None
+    ) -> Tuple[int, int]:
+        """Return (damage, shock) of one hit as process_hit would, without logging or degrading armor."""
+        rng = rng or random
+        epen = pen
+        penetrated = True
+        blunt_pf = 0
+        total_protection = sum(protection_data.get_total_protection() for protection_data in armor)
+
+        for protection_data in armor:
+            penetrated, epen, _ = protection_data.resolve_hit(epen, rng.randint(0, 9))
+            if not penetrated:
+                blunt_pf += protection_data.get_total_blunt_protection()
+                break
+
+        if not penetrated:
+            shock = AdvancedDamageCalculator.calculate_damage_cached(
+                location=location, dc=0, epen=0.0, is_front=is_front_shot
+            ).shock
+            return Table9ABluntDamage.get_blunt_damage(location, blunt_pf, pen), shock
+
+        epen = max(0.0, epen)
+        if total_protection > epen:
+            dc = 1
+        record = AdvancedDamageCalculator.calculate_damage_cached(
+            location=location, dc=dc, epen=epen, is_front=is_front_shot
         )
-        
-        incap_time = None
-        if incap_effect:
-            modifier = 0
-            if incap_effect == IncapacitationEffect.DAZED:
-                modifier = -1
-            elif incap_effect == IncapacitationEffect.DISORIENTED:
-                modifier = -2
-            incap_time = Table8HealingAndRecovery.get_incapacitation_time_8b(target.physical_damage_total, modifier)
-            log.append(f"  Incapacitation time: {incap_time} phases")
+        return record.damage, record.shock
 
-        return damage_result, incap_effect, recovery, incap_time
-    
     @staticmethod
     def process_target_hits(
         target: Character,
@@ -453,22 +660,23 @@ class CombatSimulatorUtils:
         shot_params: ShotParameters,
         is_front_shot: bool,
         hits: int,
-        log: List[str],
+        trace: CombatTrace,
         eal: int = 0,
         odds: int = 0,
-        roll: int = 0
+        roll: int = 0,
+        rng: Optional[random.Random] = None
     ) -> List[ShotResult]:
         """Process multiple hits on a single target."""
-        log.append(f"[Process Target Hits] {hits} hits on {target.name}")
+        trace.add("header", "[Process Target Hits] %s hits on %s", hits, target.name)
 
         target_results = []
         for i in range(hits):
-            hit_log = []
-            hit_log.append(f"--- Hit {i+1}/{hits} ---")
+            hit_trace = trace.branch()
+            hit_trace.add("header", "--- Hit %s/%s ---", i+1, hits)
             dmg, effect, recovery, time = CombatSimulatorUtils.process_hit(
-                target, ammo, range_hexes, exposure, shot_params, is_front_shot, hit_log
+                target, ammo, range_hexes, exposure, shot_params, is_front_shot, hit_trace, rng
             )
-            log.extend(hit_log)
+            trace.extend(hit_trace)
             target_results.append(ShotResult(
                 hit=True,
                 eal=eal,
@@ -479,7 +687,7 @@ class CombatSimulatorUtils:
                 incapacitation_effect=effect,
                 recovery=recovery,
                 incapacitation_time_phases=time,
-                log="\n".join(hit_log)
+                trace=hit_trace.snapshot()
             ))
         return target_results
     
@@ -521,16 +729,17 @@ class CombatSimulatorUtils:
         exposure: TargetExposure,
         weapon: Weapon,
         arc_of_fire: float,
-        log: List[str]
+        trace: CombatTrace,
+        rng: Optional[random.Random] = None
     ) -> BurstElevationResult:
         """Check elevation and calculate hits for burst fire."""
         odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, ShotType.BURST)
-        roll = random.randint(0, 99)
+        roll = (rng or random).randint(0, 99)
 
-        log.append(f"  Elevation check: EAL {eal}, Odds {odds}%, Roll {roll}")
+        trace.add("roll", "  Elevation check: EAL %s, Odds %s%%, Roll %s", eal, odds, roll)
 
         if roll > odds:
-            log.append(f"  Miss! Roll {roll} > Odds {odds}")
+            trace.add("roll", "  Miss! Roll %s > Odds %s", roll, odds)
             return BurstElevationResult(hit=False, eal=eal, odds=odds, roll=roll, hits=0)
         
         auto_width_modifier = Table4AdvancedOddsOfHitting.get_standard_target_size_modifier_4e(
@@ -538,11 +747,11 @@ class CombatSimulatorUtils:
         )
         
         hits = Table5AutoPelletShrapnel.get_fire_table_value5a(
-            arc_of_fire, weapon.full_auto_rof, auto_width_modifier, log
+            arc_of_fire, weapon.full_auto_rof, auto_width_modifier, trace, rng
         )
 
-        log.append(f"  Hit! Arc: {arc_of_fire}, ROF: {weapon.full_auto_rof}, Width mod: {auto_width_modifier}")
-        log.append(f"  Hits from Table 5A: {hits}")
+        trace.add("hits", "  Hit! Arc: %s, ROF: %s, Width mod: %s", arc_of_fire, weapon.full_auto_rof, auto_width_modifier)
+        trace.add("hits", "  Hits from Table 5A: %s", hits)
 
         return BurstElevationResult(hit=hits > 0, eal=eal, odds=odds, roll=roll, hits=hits)
 
@@ -555,25 +764,36 @@ class CombatSimulatorUtils:
         shot_params_list: List[ShotParameters],
         is_front_shots: List[bool],
         bphc: Optional[str],
-        log: List[str]
+        trace: CombatTrace,
+        rng: Optional[random.Random] = None
     ) -> List[ShotResult]:
-        """Process shotgun pattern hits for all targets."""
-        log.append(f"[Shotgun Pattern] BPHC: {bphc}, Targets: {len(targets)}")
+        """Process shotgun pattern hits for all targets.
+
+        With a disabled trace the pellets are resolved in groups (see process_shotgun_pattern_grouped),
+        since no per-hit log is wanted.
+        """
+        if not trace.enabled:
+            groups = CombatSimulatorUtils.process_shotgun_pattern_grouped(
+                ammo, targets, ranges, exposures, shot_params_list, is_front_shots, bphc, trace, rng
+            )
+            return [result for group in groups for result in group.to_shot_results()]
+
+        trace.add("header", "[Shotgun Pattern] BPHC: %s, Targets: %s", bphc, len(targets))
 
         if bphc is None:
             pellet_hits_data = []
         else:
             pellet_hits_data = CombatSimulatorUtils.calculate_pellet_hits_per_target(
-                targets, ranges, exposures, shot_params_list, is_front_shots, bphc, log
+                targets, ranges, exposures, shot_params_list, is_front_shots, bphc, trace, rng
             )
 
         if ammo.pellet_count is not None and pellet_hits_data:
-            pellet_hits_data = CombatSimulatorUtils.redistribute_pellets(pellet_hits_data, ammo.pellet_count, log)
+            pellet_hits_data = CombatSimulatorUtils.redistribute_pellets(pellet_hits_data, ammo.pellet_count, trace)
 
         results = []
-        for idx, hits, target, rng, exposure, params, front, _ in pellet_hits_data:
+        for idx, hits, target, target_range, exposure, params, front, _ in pellet_hits_data:
             hit_results = CombatSimulatorUtils.process_target_hits(
-                target, ammo, rng, exposure, params, front, hits, log
+                target, ammo, target_range, exposure, params, front, hits, trace, rng=rng
             )
             results.extend(hit_results)
 
@@ -587,58 +807,158 @@ class CombatSimulatorUtils:
         shot_params_list: List[ShotParameters],
         is_front_shots: List[bool],
         bphc: str,
-        log: List[str]
+        trace: CombatTrace,
+        rng: Optional[random.Random] = None
     ) -> List[tuple[int, int, Character, int, TargetExposure, ShotParameters, bool, int]]:
         """Calculate pellet hits for each target in pattern."""
         pellet_hits_data = []
         
-        for idx, (target, rng, exposure, params, front) in enumerate(zip(targets, ranges, exposures, shot_params_list, is_front_shots)):
+        for idx, (target, target_range, exposure, params, front) in enumerate(zip(targets, ranges, exposures, shot_params_list, is_front_shots)):
             target_size_modifier = Table4AdvancedOddsOfHitting.get_standard_target_size_modifier_4e(
                 exposure, AccuracyModifiers.AUTO_WIDTH
             )
             
-            if bphc.startswith('*'):
-                base_hits = int(bphc[1:])
-                pellet_hits = Table5AutoPelletShrapnel.get_shrapnel_pellet_hits_5a(
-                    base_hits, True, target_size_modifier
-                )
+            base_hits, is_guaranteed = CombatSimulatorUtils.parse_hit_chance(bphc)
+            pellet_hits = Table5AutoPelletShrapnel.get_shrapnel_pellet_hits_5a(
+                base_hits, is_guaranteed, target_size_modifier, rng
+            )
+            if is_guaranteed:
                 pellet_roll = 100
-                log.append(f"  {target.name}: Guaranteed {base_hits}, Size mod {target_size_modifier}, Hits: {pellet_hits}")
+                trace.add("hits", "  %s: Guaranteed %s, Size mod %s, Hits: %s", target.name, base_hits, target_size_modifier, pellet_hits)
             else:
-                pellet_hits = Table5AutoPelletShrapnel.get_shrapnel_pellet_hits_5a(
-                    int(bphc), False, target_size_modifier
-                )
-                pellet_roll = random.randint(0, 99)
-                log.append(f"  {target.name}: BPHC {bphc}, Size mod {target_size_modifier}, Roll {pellet_roll}, Hits: {pellet_hits}")
+                pellet_roll = (rng or random).randint(0, 99)
+                trace.add("roll", "  %s: BPHC %s, Size mod %s, Roll %s, Hits: %s", target.name, bphc, target_size_modifier, pellet_roll, pellet_hits)
 
             if pellet_hits > 0:
-                pellet_hits_data.append((idx, pellet_hits, target, rng, exposure, params, front, pellet_roll))
+                pellet_hits_data.append((idx, pellet_hits, target, target_range, exposure, params, front, pellet_roll))
         
         return pellet_hits_data
 
+    @staticmethod
+    def parse_hit_chance(code: str) -> tuple[int, bool]:
+        """Split a BPHC/BSHC code into (value, guaranteed): "*N" is N guaranteed hits, "P" a P% chance."""
+        if code.startswith('*'):
+            return int(code[1:]), True
+        return int(code), False
+
+    @staticmethod
+    def resolve_pattern_hits(
+        target: Character,
+        hits: int,
+        exposure: TargetExposure,
+        shot_params: ShotParameters,
+        is_front_shot: bool,
+        pen: float,
+        dc: int,
+        trace: CombatTrace,
+        odds: int = 0,
+        fragments: bool = False,
+        rng: Optional[random.Random] = None
+    ) -> PatternHits:
+        """Resolve many pellet or fragment hits on one target without per-hit logs or results.
+
+        Hit locations are drawn in one call from the Table 1 column and tallied into per-location
+        counts. Locations no armor covers take the same damage from every hit, so it is computed
+        once per location; armored locations are resolved hit by hit, in draw order, since each hit
+        degrades the armor. Incapacitation is still checked after every hit against the running
+        damage total, so outcomes follow the per-hit paths' distribution.
+
+        Args:
+            fragments: Resolve armor as shrapnel does (outermost piece only) rather than as a bullet.
+        """
+        locations = Table1AdvancedDamageHitLocation.sample_hit_locations(
+            exposure, shot_params.target_orientation, hits, rng
+        )
+        group = PatternHits(target=target, odds=odds, location_counts=dict(Counter(locations)))
+        apply_at_location = (
+            CombatSimulatorUtils.apply_fragment_at_location if fragments else CombatSimulatorUtils.apply_hit_at_location
+        )
+
+        unarmored_records = {}
+        for location in locations:
+            if location in unarmored_records:
+                record = unarmored_records[location]
+            else:
+                stack = target.armor_index.get((location, is_front_shot))
+                record = None
+                if stack is None or not stack.active_pieces():
+                    record = unarmored_records[location] = AdvancedDamageCalculator.calculate_damage_cached(
+                        location=location, dc=dc, epen=max(0.0, pen), is_front=is_front_shot
+                    )
+
+            if record is not None:
+                damage_result = record.to_damage_result()
+                target.apply_damage(damage_result.damage, damage_result)
+            else:
+                damage_result = apply_at_location(target, location, pen, dc, is_front_shot, NULL_TRACE, rng)
+            incap_effect = CombatSimulatorUtils.determine_incapacitation(
+                target, target.physical_damage_total, damage_result.shock, NULL_TRACE, rng
+            )
+            group.append(
+                damage_result,
+                incap_effect,
+                CombatSimulatorUtils.roll_incapacitation_time(target, incap_effect, rng),
+                target.physical_damage_total,
+            )
+
+        trace.add("damage", "  Hits by location: %s", {location.name: count for location, count in group.location_counts.items()})
+        trace.add("damage", "  Total damage: %s, Target PD: %s", group.total_damage, target.physical_damage_total)
+        return group
+
+    @staticmethod
+    def process_shotgun_pattern_grouped(
+        ammo: AmmoType,
+        targets: List[Character],
+        ranges: List[int],
+        exposures: List[TargetExposure],
+        shot_params_list: List[ShotParameters],
+        is_front_shots: List[bool],
+        bphc: Optional[str],
+        trace: CombatTrace,
+        rng: Optional[random.Random] = None
+    ) -> List[PatternHits]:
+        """Fast form of process_shotgun_pattern returning grouped hits per target (see resolve_pattern_hits)."""
+        trace.add("header", "[Shotgun Pattern] BPHC: %s, Targets: %s", bphc, len(targets))
+        if bphc is None:
+            return []
+
+        pellet_hits_data = CombatSimulatorUtils.calculate_pellet_hits_per_target(
+            targets, ranges, exposures, shot_params_list, is_front_shots, bphc, trace, rng
+        )
+        if ammo.pellet_count is not None and pellet_hits_data:
+            pellet_hits_data = CombatSimulatorUtils.redistribute_pellets(pellet_hits_data, ammo.pellet_count, trace)
+
+        return [
+            CombatSimulatorUtils.resolve_pattern_hits(
+                target, hits, exposure, params, front, ammo.get_pen(target_range), ammo.get_dc(target_range),
+                trace, rng=rng
+            )
+            for _, hits, target, target_range, exposure, params, front, _ in pellet_hits_data
+        ]
+
     @staticmethod
     def redistribute_pellets(
         pellet_hits_data: List[tuple[int, int, Character, int, TargetExposure, ShotParameters, bool, int]],
         pellet_count: int,
-        log: List[str]
+        trace: CombatTrace
     ) -> List[tuple[int, int, Character, int, TargetExposure, ShotParameters, bool, int]]:
         """Redistribute pellet hits if total exceeds pellet count."""
         total_hits = sum(h[1] for h in pellet_hits_data)
         if total_hits <= pellet_count:
             return pellet_hits_data
         
-        log.append(f"  Redistributing pellets: {total_hits} > {pellet_count}")
+        trace.add("hits", "  Redistributing pellets: %s > %s", total_hits, pellet_count)
 
         redistributed = []
         remaining = pellet_count
-        for i, (idx, hits, target, rng, exposure, params, front, pellet_roll) in enumerate(pellet_hits_data):
+        for i, (idx, hits, target, target_range, exposure, params, front, pellet_roll) in enumerate(pellet_hits_data):
             if i == len(pellet_hits_data) - 1:
                 new_hits = remaining
             else:
                 new_hits = max(1, int(pellet_count * (hits / total_hits)))
                 remaining -= new_hits
-            log.append(f"    {target.name}: {hits} -> {new_hits}")
-            redistributed.append((idx, new_hits, target, rng, exposure, params, front, pellet_roll))
+            trace.add("hits", "    %s: %s -> %s", target.name, hits, new_hits)
+            redistributed.append((idx, new_hits, target, target_range, exposure, params, front, pellet_roll))
         return redistributed
 
     @staticmethod
@@ -648,10 +968,10 @@ class CombatSimulatorUtils:
         range_hexes: int,
         target_size_alm: int,
         shot_params: ShotParameters,
-        log: List[str]
+        trace: CombatTrace
     ) -> int:
         """Calculate EAL for explosive weapon."""
-        log.append(f"[Explosive EAL] Weapon: {weapon.name}, Range: {range_hexes}")
+        trace.add("eal", "[Explosive EAL] Weapon: %s, Range: %s", weapon.name, range_hexes)
 
         max_aim_time_impulses = float('inf')
         movement_alm = 0
@@ -662,7 +982,7 @@ class CombatSimulatorUtils:
             )
             movement_alm += shooter_movement_alm
             max_aim_time_impulses = min(max_aim_time_impulses, 1.0)
-            log.append(f"  Shooter moving: {shot_params.shooter_speed_hex_per_impulse} hex/imp, ALM: {shooter_movement_alm}")
+            trace.add("eal", "  Shooter moving: %s hex/imp, ALM: %s", shot_params.shooter_speed_hex_per_impulse, shooter_movement_alm)
 
         effective_aim_time_ac = shot_params.aim_time_ac
         if max_aim_time_impulses < float('inf'):
@@ -673,28 +993,22 @@ class CombatSimulatorUtils:
         aim_time_alm = weapon.aim_time_modifiers.get(effective_aim_time_ac, 0) + shooter.skill_accuracy_level
         range_alm = Table4AdvancedOddsOfHitting.get_accuracy_level_modifier_by_range_4a(range_hexes)
         
-        log.append(f"  Aim time ALM: {aim_time_alm}, Range ALM: {range_alm}")
+        trace.add("eal", "  Aim time ALM: %s, Range ALM: %s", aim_time_alm, range_alm)
 
         situation_stance_alm = sum(mod.value for mod in shot_params.situation_stance_modifiers)
         visibility_alm = sum(mod.value for mod in shot_params.visibility_modifiers)
         
-        log.append(f"  Situation ALM: {situation_stance_alm}, Visibility ALM: {visibility_alm}")
+        trace.add("eal", "  Situation ALM: %s, Visibility ALM: %s", situation_stance_alm, visibility_alm)
 
         duck_alm = 0
         if shot_params.reflexive_duck_shooter:
             duck_alm -= 10
-            log.append("  Shooter duck: -10")
+            trace.add("eal", "  Shooter duck: -10")
 
         custom_alm = 0
-        for item in shot_params.custom_eal_modifiers or []:
-            if isinstance(item, (list, tuple)) and len(item) >= 2:
-                label, alm = item[0], int(item[1])
-            elif isinstance(item, dict):
-                label, alm = item.get("label", "custom"), int(item.get("alm", 0))
-            else:
-                continue
+        for label, alm in CombatSimulatorUtils._custom_eal_modifiers(shot_params):
             custom_alm += alm
-            log.append(f"  Custom EAL '{label}': {alm:+d}")
+            trace.add("eal", "  Custom EAL '%s': %+d", label, alm)
 
         alm_sum = (
             aim_time_alm
@@ -708,10 +1022,10 @@ class CombatSimulatorUtils:
         ba = weapon.ballistic_data.get_ballistic_accuracy(range_hexes) if weapon.ballistic_data else float('inf')
         effective_alm = min(ba, alm_sum)
         
-        log.append(f"  ALM sum: {alm_sum}, BA: {ba}, Effective: {effective_alm}")
+        trace.add("eal", "  ALM sum: %s, BA: %s, Effective: %s", alm_sum, ba, effective_alm)
 
         eal = effective_alm + target_size_alm
-        log.append(f"  Target size ALM: {target_size_alm}, Final EAL: {eal}")
+        trace.add("eal", "  Target size ALM: %s, Final EAL: %s", target_size_alm, eal)
 
         return eal
 
@@ -723,25 +1037,68 @@ class CombatSimulatorUtils:
         aim_alm: int,
         situation_stance_modifiers: List,
         visibility_modifiers: List,
-        log: List[str]
+        trace: CombatTrace
     ) -> int:
         """Calculate EAL for thrown grenade."""
-        log.append(f"[Grenade EAL] Range: {range_hexes}, Aim ALM: {aim_alm}")
+        trace.add("eal", "[Grenade EAL] Range: %s, Aim ALM: %s", range_hexes, aim_alm)
 
         range_alm = Table4AdvancedOddsOfHitting.get_accuracy_level_modifier_by_range_4a(range_hexes)
         situation_stance_alm = sum(mod.value for mod in situation_stance_modifiers)
         visibility_alm = sum(mod.value for mod in visibility_modifiers)
         
-        log.append(f"  Range ALM: {range_alm}, Situation: {situation_stance_alm}, Visibility: {visibility_alm}")
-        log.append(f"  SAL: {shooter.skill_accuracy_level}")
+        trace.add("eal", "  Range ALM: %s, Situation: %s, Visibility: %s", range_alm, situation_stance_alm, visibility_alm)
+        trace.add("eal", "  SAL: %s", shooter.skill_accuracy_level)
 
         alm_sum = aim_alm + shooter.skill_accuracy_level + range_alm + situation_stance_alm + visibility_alm
         eal = alm_sum + target_size_alm
 
-        log.append(f"  ALM sum: {alm_sum}, Target size: {target_size_alm}, EAL: {eal}")
+        trace.add("eal", "  ALM sum: %s, Target size: %s, EAL: %s", alm_sum, target_size_alm, eal)
 
         return eal
 
+    @staticmethod
+    def apply_fragment_at_location(
+        target: Character,
+        location: AdvancedHitLocation,
+        pen: float,
+        dc: int,
+        is_front_shot: bool,
+        trace: CombatTrace,
+        rng: Optional[random.Random] = None
+    ) -> DamageResult:
+        """Resolve one shrapnel fragment at a known location; only the outermost armor piece is rolled."""
+        epen = pen
+        penetrated = True
+        blunt_pf = 0
+        total_protection = 0
+
+        stack = target.armor_index.get((location, is_front_shot))
+        armor_pieces = stack.active_pieces() if stack is not None else []
+        if armor_pieces:
+            item, protection_data = armor_pieces[0]
+            total_protection += protection_data.get_total_protection()
+            penetrated, remaining_pen = item.process_hit(location, is_front_shot, pen, rng)
+            epen = remaining_pen
+            if not penetrated:
+                blunt_pf = protection_data.get_total_blunt_protection()
+            trace.add("armor", "  Armor: %s, Penetrated: %s", item.name, penetrated)
+
+        if not penetrated:
+            blunt_damage = Table9ABluntDamage.get_blunt_damage(location, blunt_pf, pen)
+            damage_result = DamageResult(location=location, damage=blunt_damage)
+            target.apply_damage(blunt_damage, damage_result)
+            trace.add("damage", "  Blunt damage: %s", blunt_damage)
+        else:
+            epen = max(0.0, epen)
+            effective_dc = 1 if total_protection > epen else dc
+            damage_result = AdvancedDamageCalculator.calculate_damage_cached(
+                location=location, dc=effective_dc, epen=epen, is_front=is_front_shot
+            ).to_damage_result()
+            target.apply_damage(damage_result.damage, damage_result)
+            trace.add("damage", "  Damage: %s, Shock: %s", damage_result.damage, damage_result.shock)
+
+        return damage_result
+
     @staticmethod
     def process_shrapnel_hits(
         target: Character,
@@ -751,96 +1108,68 @@ class CombatSimulatorUtils:
         shot_params: ShotParameters,
         is_front_shot: bool,
         bshc: str,
-        log: List[str]
+        trace: CombatTrace,
+        rng: Optional[random.Random] = None
     ) -> List[ShotResult]:
-        """Process shrapnel hits from explosion."""
-        log.append(f"[Shrapnel] Target: {target.name}, BSHC: {bshc}, Range: {range_from_burst}")
+        """Process shrapnel hits from explosion.
+
+        With a disabled trace the fragments are resolved in groups (see process_shrapnel_hits_grouped),
+        since no per-hit log is wanted.
+        """
+        if not trace.enabled:
+            group = CombatSimulatorUtils.process_shrapnel_hits_grouped(
+                target, ammo, range_from_burst, exposure, shot_params, is_front_shot, bshc, trace, rng
+            )
+            return group.to_shot_results() if group is not None else []
+
+        trace.add("damage", "[Shrapnel] Target: %s, BSHC: %s, Range: %s", target.name, bshc, range_from_burst)
 
         target_size_modifier = Table4AdvancedOddsOfHitting.get_standard_target_size_modifier_4e(
             exposure, AccuracyModifiers.AUTO_WIDTH
         )
-        if bshc.startswith('*'):
-            base_hits = int(bshc[1:])
-            is_guaranteed = True
-        else:
-            base_hits = int(bshc)
-            is_guaranteed = False
+        base_hits, is_guaranteed = CombatSimulatorUtils.parse_hit_chance(bshc)
 
         shrapnel_hits = Table5AutoPelletShrapnel.get_shrapnel_pellet_hits_5a(
-            base_hits, is_guaranteed, target_size_modifier
+            base_hits, is_guaranteed, target_size_modifier, rng
         )
 
-        log.append(f"  Base: {base_hits}, Guaranteed: {is_guaranteed}, Size mod: {target_size_modifier}, Hits: {shrapnel_hits}")
+        trace.add("damage", "  Base: %s, Guaranteed: %s, Size mod: %s, Hits: %s", base_hits, is_guaranteed, target_size_modifier, shrapnel_hits)
 
         if shrapnel_hits == 0:
-            log.append("  No shrapnel hits")
+            trace.add("damage", "  No shrapnel hits")
             return []
 
         pen = ammo.get_explosion_pen(range_from_burst)
         dc = ammo.get_explosion_dc(range_from_burst)
-        log.append(f"  Shrapnel PEN: {pen}, DC: {dc}")
+        trace.add("damage", "  Shrapnel PEN: %s, DC: %s", pen, dc)
 
         results = []
         for i in range(shrapnel_hits):
-            hit_log = [f"--- Shrapnel hit {i + 1}/{shrapnel_hits} ---"]
+            hit_trace = trace.branch()
+            hit_trace.add("header", "--- Shrapnel hit %s/%s ---", i + 1, shrapnel_hits)
 
             location = Table1AdvancedDamageHitLocation.get_hit_location(
-                exposure, shot_params.target_orientation
+                exposure, shot_params.target_orientation, rng
             )
-            hit_log.append(f"  Location: {location.name}")
-
-            epen = pen
-            penetrated = True
-            blunt_pf = 0
-            total_protection = 0
-
-            for item in target.equipment:
-                if isinstance(item, Armor):
-                    protection_data = item.get_protection(location, is_front_shot)
-                    if protection_data and protection_data.get_total_protection() > 0:
-                        total_protection += protection_data.get_total_protection()
-                        penetrated, remaining_pen = item.process_hit(location, is_front_shot, pen)
-                        epen = remaining_pen
-                        if not penetrated:
-                            blunt_pf = protection_data.get_total_blunt_protection()
-                        hit_log.append(f"  Armor: {item.name}, Penetrated: {penetrated}")
-                        break
+            hit_trace.add("location", "  Location: %s", location.name)
 
-            if not penetrated:
-                blunt_damage = Table9ABluntDamage.get_blunt_damage(location, blunt_pf, pen)
-                damage_result = DamageResult(location=location, damage=blunt_damage)
-                target.apply_damage(blunt_damage, damage_result)
-                hit_log.append(f"  Blunt damage: {blunt_damage}")
-            else:
-                epen = max(0.0, epen)
-                effective_dc = 1 if total_protection > epen else dc
-                damage_result = AdvancedDamageCalculator.calculate_damage(
-                    location=location, dc=effective_dc, epen=epen, is_front=is_front_shot
-                )
-                target.apply_damage(damage_result.damage, damage_result)
-                hit_log.append(f"  Damage: {damage_result.damage}, Shock: {damage_result.shock}")
+            damage_result = CombatSimulatorUtils.apply_fragment_at_location(
+                target, location, pen, dc, is_front_shot, hit_trace, rng
+            )
 
             incap_effect = CombatSimulatorUtils.determine_incapacitation(
-                target, target.physical_damage_total, damage_result.shock, hit_log
+                target, target.physical_damage_total, damage_result.shock, hit_trace, rng
             )
 
             recovery = Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a(
                 target.physical_damage_total, target.health
             )
 
-            incap_time = None
-            if incap_effect:
-                modifier = 0
-                if incap_effect == IncapacitationEffect.DAZED:
-                    modifier = -1
-                elif incap_effect == IncapacitationEffect.DISORIENTED:
-                    modifier = -2
-                incap_time = Table8HealingAndRecovery.get_incapacitation_time_8b(
-                    target.physical_damage_total, modifier
-                )
-                hit_log.append(f"  Incap time: {incap_time} phases")
+            incap_time = CombatSimulatorUtils.roll_incapacitation_time(target, incap_effect, rng)
+            if incap_time is not None:
+                hit_trace.add("incapacitation", "  Incap time: %s phases", incap_time)
 
-            log.extend(hit_log)
+            trace.extend(hit_trace)
             results.append(ShotResult(
                 hit=True,
                 eal=0,
@@ -851,38 +1180,70 @@ class CombatSimulatorUtils:
                 incapacitation_effect=incap_effect,
                 recovery=recovery,
                 incapacitation_time_phases=incap_time,
-                log="\n".join(hit_log)
+                trace=hit_trace.snapshot()
             ))
 
         return results
 
+    @staticmethod
+    def process_shrapnel_hits_grouped(
+        target: Character,
+        ammo: AmmoType | Grenade,
+        range_from_burst: int,
+        exposure: TargetExposure,
+        shot_params: ShotParameters,
+        is_front_shot: bool,
+        bshc: str,
+        trace: CombatTrace,
+        rng: Optional[random.Random] = None
+    ) -> Optional[PatternHits]:
+        """Fast form of process_shrapnel_hits returning grouped hits, or None when no fragment hits."""
+        target_size_modifier = Table4AdvancedOddsOfHitting.get_standard_target_size_modifier_4e(
+            exposure, AccuracyModifiers.AUTO_WIDTH
+        )
+        base_hits, is_guaranteed = CombatSimulatorUtils.parse_hit_chance(bshc)
+        shrapnel_hits = Table5AutoPelletShrapnel.get_shrapnel_pellet_hits_5a(
+            base_hits, is_guaranteed, target_size_modifier, rng
+        )
+        trace.add("damage", "[Shrapnel] Target: %s, BSHC: %s, Range: %s, Hits: %s", target.name, bshc, range_from_burst, shrapnel_hits)
+        if shrapnel_hits == 0:
+            return None
+
+        return CombatSimulatorUtils.resolve_pattern_hits(
+            target, shrapnel_hits, exposure, shot_params, is_front_shot,
+            ammo.get_explosion_pen(range_from_burst), ammo.get_explosion_dc(range_from_burst), trace,
+            odds=base_hits if not is_guaranteed else 100, fragments=True, rng=rng
+        )
+
     @staticmethod
     def process_concussion_damage(
         target: Character,
         base_concussion: int,
         blast_modifiers: List[BlastModifier],
-        log: List[str]
+        trace: CombatTrace,
+        rng: Optional[random.Random] = None
     ) -> Optional[ShotResult]:
         """Process concussion damage from explosion."""
-        log.append(f"[Concussion] Target: {target.name}, Base: {base_concussion}")
+        trace.add("damage", "[Concussion] Target: %s, Base: %s", target.name, base_concussion)
 
         if base_concussion <= 0:
-            log.append("  No concussion damage")
+            trace.add("damage", "  No concussion damage")
             return None
 
         total_modifier = 1.0
         for modifier in blast_modifiers:
             total_modifier *= modifier.value
 
-        log.append(f"  Blast modifiers: {[m.name for m in blast_modifiers]}, Total: {total_modifier}")
+        if trace.enabled:
+            trace.add("damage", "  Blast modifiers: %s, Total: %s", [m.name for m in blast_modifiers], total_modifier)
 
         concussion_damage = int(base_concussion * total_modifier)
 
         if concussion_damage <= 0:
-            log.append("  Final concussion damage: 0")
+            trace.add("damage", "  Final concussion damage: 0")
             return None
 
-        log.append(f"  Concussion damage: {concussion_damage}")
+        trace.add("damage", "  Concussion damage: %s", concussion_damage)
 
         damage_result = DamageResult(
             location=AdvancedHitLocation.MISS,
@@ -892,7 +1253,7 @@ class CombatSimulatorUtils:
         target.apply_damage(concussion_damage, damage_result)
 
         incap_effect = CombatSimulatorUtils.determine_incapacitation(
-            target, target.physical_damage_total, 0, log
+            target, target.physical_damage_total, 0, trace, rng
         )
 
         recovery = Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a(
@@ -907,9 +1268,9 @@ class CombatSimulatorUtils:
             elif incap_effect == IncapacitationEffect.DISORIENTED:
                 modifier = -2
             incap_time = Table8HealingAndRecovery.get_incapacitation_time_8b(
-                target.physical_damage_total, modifier
+                target.physical_damage_total, modifier, rng
             )
-            log.append(f"  Incap time: {incap_time} phases")
+            trace.add("incapacitation", "  Incap time: %s phases", incap_time)
 
         return ShotResult(
             hit=True,
@@ -921,5 +1282,5 @@ class CombatSimulatorUtils:
             incapacitation_effect=incap_effect,
             recovery=recovery,
             incapacitation_time_phases=incap_time,
-            log="\n".join(log)
+            trace=trace.snapshot()
         )
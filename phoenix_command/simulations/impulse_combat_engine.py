@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from phoenix_command.models.character import Character
 from phoenix_command.models.gear import Weapon
@@ -23,6 +23,9 @@ from phoenix_command.tables.catalogs.movement_catalog import (
     compute_movement_cost,
 )
 
+if TYPE_CHECKING:
+    from phoenix_command.simulations.map_pathfinding import MovePath, ReachabilityCache, ReachableArea
+
 # Table 7A costs are per 2 m hex; our grid is 1 m per hex.
 METER_SCALE = 0.5
 
@@ -41,6 +44,38 @@ STANCE_ACTION_MAP = {
 }
 
 
+def movement_blocked_reason(layer: MapLayer | None, q: int, r: int) -> str | None:
+    """Why a token cannot enter (q, r) on layer, or None if it can."""
+    if not layer:
+        return None
+    obstacle = layer.obstacles.at(q, r)
+    if obstacle and obstacle.blocks_movement:
+        return "Hex blocked by obstacle"
+    if layer.walls.hex_wall_at(q, r) is not None:
+        return "Hex blocked by wall"
+    return None
+
+
+def terrain_modifiers(
+    layer: MapLayer | None,
+    q: int,
+    r: int,
+    stance: str,
+) -> tuple[int | None, list[str]]:
+    """Terrain cost and Table 7A modifier ids for entering (q, r) in stance."""
+    modifier_ids = [STANCE_MODIFIER_MAP.get(stance, "stance_standing")]
+    terrain_cost: int | None = None
+    if not layer:
+        return terrain_cost, modifier_ids
+    tile = layer.terrain.at(q, r)
+    if tile:
+        terrain_cost = tile.movement_cost
+        preset = TERRAIN_PRESETS.get(tile.terrain_type)
+        if preset:
+            modifier_ids.extend(preset.modifier_ids)
+    return terrain_cost, modifier_ids
+
+
 @dataclass
 class ActionResult:
     """Outcome of applying a combat action."""
@@ -364,13 +399,9 @@ class ImpulseCombatEngine:
             return ActionResult(False, "Target is not an adjacent hex")
 
         layer = self._get_layer(placement.layer_id)
-        if layer:
-            key = f"{target_q},{target_r}"
-            if key in layer.obstacles and layer.obstacles[key].blocks_movement:
-                return ActionResult(False, "Hex blocked by obstacle")
-            from phoenix_command.session.domains.map_state import hex_wall_key
-            if hex_wall_key(target_q, target_r) in layer.walls:
-                return ActionResult(False, "Hex blocked by wall")
+        blocked = movement_blocked_reason(layer, target_q, target_r)
+        if blocked:
+            return ActionResult(False, blocked)
 
         base_id = classify_movement_base(placement.facing, dir_idx)
         terrain_cost, modifier_ids = self._terrain_modifiers(layer, target_q, target_r, rt.stance)
@@ -413,6 +444,47 @@ class ImpulseCombatEngine:
 
         return ActionResult(True, msg, spend)
 
+    def find_move_path(
+        self,
+        token_id: str,
+        goal_q: int,
+        goal_r: int,
+        goal_layer_id: str | None = None,
+        max_ac: float | None = None,
+    ) -> MovePath | None:
+        """Cheapest AC path for a token under its current stance and facing, or None."""
+        from phoenix_command.simulations.map_pathfinding import find_move_path
+
+        placement = self.tokens.placements.get(token_id)
+        if not placement:
+            return None
+        rt = self.get_runtime(token_id)
+        return find_move_path(self.map_state, placement, goal_q, goal_r, goal_layer_id, rt.stance, max_ac)
+
+    def movement_budgets(self, token_id: str) -> list[float]:
+        """AC a token can still spend per impulse this phase, the current impulse first."""
+        rt = self.get_runtime(token_id)
+        placement = self.tokens.placements.get(token_id)
+        char = self.characters.get(placement.character_name or "") if placement else None
+        later = char.impulses[self.impulse_combat.impulse + 1:] if char else []
+        return [rt.ac_remaining] + [float(ac) for ac in later]
+
+    def reachable_hexes(self, token_id: str, cache: ReachabilityCache | None = None) -> ReachableArea | None:
+        """Hexes a token can move into this impulse and phase under its stance and facing."""
+        from phoenix_command.simulations.map_pathfinding import find_reachable_hexes
+
+        placement = self.tokens.placements.get(token_id)
+        if not placement:
+            return None
+        budgets = self.movement_budgets(token_id)
+        rt = self.get_runtime(token_id)
+        move_target = None
+        if rt.move_target_q is not None and rt.move_target_r is not None:
+            move_target = (rt.move_target_q, rt.move_target_r)
+        if cache is not None:
+            return cache.get(placement, budgets, rt.stance, rt.move_progress, move_target)
+        return find_reachable_hexes(self.map_state, placement, budgets, rt.stance, rt.move_progress, move_target)
+
     def _terrain_modifiers(
         self,
         layer: MapLayer | None,
@@ -420,18 +492,7 @@ class ImpulseCombatEngine:
         r: int,
         stance: str,
     ) -> tuple[int | None, list[str]]:
-        modifier_ids = [STANCE_MODIFIER_MAP.get(stance, "stance_standing")]
-        terrain_cost: int | None = None
-        if not layer:
-            return terrain_cost, modifier_ids
-        key = f"{q},{r}"
-        tile = layer.terrain.get(key)
-        if tile:
-            terrain_cost = tile.movement_cost
-            preset = TERRAIN_PRESETS.get(tile.terrain_type)
-            if preset:
-                modifier_ids.extend(preset.modifier_ids)
-        return terrain_cost, modifier_ids
+        return terrain_modifiers(layer, q, r, stance)
 
     def _get_layer(self, layer_id: str) -> MapLayer | None:
         if not self.map_state:
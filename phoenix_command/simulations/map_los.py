@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Iterable
 
 from phoenix_command.models.enums import TargetExposure
 from phoenix_command.session.domains.impulse_combat_state import TokenCombatRuntime
@@ -10,6 +11,7 @@ from phoenix_command.session.domains.map_state import (
     MapLayer,
     MapState,
     WallSegment,
+    key_hexes,
     layer_has_hex_wall,
 )
 from phoenix_command.session.domains.token_state import TokenPlacement
@@ -27,28 +29,31 @@ class LosResult:
     notes: list[str] = field(default_factory=list)
 
 
-def _layer(map_state: MapState | None, layer_id: str) -> MapLayer | None:
+def layer_for(map_state: MapState | None, layer_id: str) -> MapLayer | None:
+    """Layer layer_id of map_state, or None without a map or layer."""
     if not map_state:
         return None
     return map_state.get_layer(layer_id)
 
 
-def _hex_obstacle_blocks(layer: MapLayer | None, q: int, r: int) -> bool:
+def hex_obstacle_blocks(layer: MapLayer | None, q: int, r: int) -> bool:
+    """True if hex (q, r) of layer holds an obstacle that blocks LOS."""
     if not layer:
         return False
-    obs = layer.obstacles.get(f"{q},{r}")
+    obs = layer.obstacles.at(q, r)
     return bool(obs and obs.blocks_los)
 
 
-def _hex_wall_blocks(layer: MapLayer | None, q: int, r: int) -> bool:
+def hex_wall_blocks(layer: MapLayer | None, q: int, r: int) -> bool:
     """Full-hex wall barriers block LOS like dense obstacles."""
     return layer_has_hex_wall(layer, q, r)
 
 
-def _wall_on_edge(layer: MapLayer | None, q: int, r: int, edge: int) -> WallSegment | None:
+def wall_on_edge(layer: MapLayer | None, q: int, r: int, edge: int) -> WallSegment | None:
+    """Wall on edge 0-5 of hex (q, r) in layer, or None."""
     if not layer:
         return None
-    return layer.walls.get(f"{q},{r}:{edge}")
+    return layer.walls.at(q, r, edge)
 
 
 def _stance_height_range(stance: str) -> tuple[float, float]:
@@ -59,7 +64,7 @@ def _stance_height_range(stance: str) -> tuple[float, float]:
     return (0.8, 1.8)
 
 
-def _opening_allows_los(wall: WallSegment, target_rt: TokenCombatRuntime) -> bool:
+def opening_allows_los(wall: WallSegment, target_rt: TokenCombatRuntime) -> bool:
     """True if wall has an opening that exposes some of the target body."""
     body_low, body_high = _stance_height_range(target_rt.stance)
     for opening in wall.openings:
@@ -73,7 +78,7 @@ def _opening_allows_los(wall: WallSegment, target_rt: TokenCombatRuntime) -> boo
     return False
 
 
-def _edge_between(q0: int, r0: int, q1: int, r1: int) -> int | None:
+def edge_between(q0: int, r0: int, q1: int, r1: int) -> int | None:
     """Approximate edge index on hex (q0,r0) toward neighbor (q1,r1)."""
     from phoenix_command.simulations.hex_tactical import neighbor_direction_index
 
@@ -109,83 +114,118 @@ def _cover_exposures() -> list[TargetExposure]:
     ]
 
 
-def check_los(
-    map_state: MapState | None,
-    shooter: TokenPlacement,
-    target: TokenPlacement,
-    target_rt: TokenCombatRuntime | None = None,
-) -> LosResult:
+def _walk_ray(
+    shooter_layer: MapLayer | None,
+    target_layer: MapLayer | None,
+    line: list[tuple[int, int]],
+    target_rt: TokenCombatRuntime,
+    notes: list[str] | None = None,
+) -> tuple[bool, bool]:
     """
-    Check LOS from shooter to target across layers.
+    Walk the shooter→target line for blocking obstacles, walls and openings.
 
-    Obstacles on intermediate hexes block. Walls without openings block.
-    Open/window openings allow through_opening (partial body visible).
-    Cross-layer shots require either same (q,r) different elevation (stairs/
-    vertical shaft) or a path that is not fully blocked; elevation delta
-    alone does not block if horizontal path is clear / through openings.
+    Returns (blocked, through_opening). Notes are appended when a list is given.
     """
-    notes: list[str] = []
     through_opening = False
-    target_rt = target_rt or TokenCombatRuntime()
-
-    shooter_layer = _layer(map_state, shooter.layer_id)
-    target_layer = _layer(map_state, target.layer_id)
-    elev_s = shooter_layer.elevation if shooter_layer else 0
-    elev_t = target_layer.elevation if target_layer else 0
-    if elev_s != elev_t:
-        notes.append(f"Cross-layer shot (elev {elev_s} → {elev_t})")
-
-    line = line_hexes(shooter.q, shooter.r, target.q, target.r)
-
     # Use shooter's layer for mid-path obstacles; also check target layer
     # for walls near the target (facade / window).
     for i in range(1, len(line) - 1):
         q, r = line[i]
-        if _hex_obstacle_blocks(shooter_layer, q, r) or _hex_obstacle_blocks(target_layer, q, r):
-            notes.append(f"LOS blocked by obstacle at ({q},{r})")
-            return LosResult(blocked=True, notes=notes)
-        if _hex_wall_blocks(shooter_layer, q, r) or _hex_wall_blocks(target_layer, q, r):
-            notes.append(f"LOS blocked by hex wall at ({q},{r})")
-            return LosResult(blocked=True, notes=notes)
+        if hex_obstacle_blocks(shooter_layer, q, r) or hex_obstacle_blocks(target_layer, q, r):
+            if notes is not None:
+                notes.append(f"LOS blocked by obstacle at ({q},{r})")
+            return True, through_opening
+        if hex_wall_blocks(shooter_layer, q, r) or hex_wall_blocks(target_layer, q, r):
+            if notes is not None:
+                notes.append(f"LOS blocked by hex wall at ({q},{r})")
+            return True, through_opening
 
         if i + 1 < len(line):
             nq, nr = line[i + 1]
-            edge = _edge_between(q, r, nq, nr)
+            edge = edge_between(q, r, nq, nr)
             if edge is not None:
                 for layer in (shooter_layer, target_layer):
-                    wall = _wall_on_edge(layer, q, r, edge)
+                    wall = wall_on_edge(layer, q, r, edge)
                     if wall is None:
                         continue
-                    if _opening_allows_los(wall, target_rt):
+                    if opening_allows_los(wall, target_rt):
                         through_opening = True
-                        notes.append(f"LOS through opening at ({q},{r}:{edge})")
+                        if notes is not None:
+                            notes.append(f"LOS through opening at ({q},{r}:{edge})")
                     else:
-                        notes.append(f"LOS blocked by wall at ({q},{r}:{edge})")
-                        return LosResult(blocked=True, notes=notes)
+                        if notes is not None:
+                            notes.append(f"LOS blocked by wall at ({q},{r}:{edge})")
+                        return True, through_opening
 
     # Final approach to target hex: wall on target hex facing shooter
     if len(line) >= 2:
         pq, pr = line[-2]
         tq, tr = line[-1]
-        edge = _edge_between(tq, tr, pq, pr)
+        edge = edge_between(tq, tr, pq, pr)
         if edge is not None and target_layer:
-            wall = _wall_on_edge(target_layer, tq, tr, edge)
+            wall = wall_on_edge(target_layer, tq, tr, edge)
             if wall is not None:
-                if _opening_allows_los(wall, target_rt):
+                if opening_allows_los(wall, target_rt):
                     through_opening = True
-                    notes.append(f"Target behind opening ({tq},{tr}:{edge})")
+                    if notes is not None:
+                        notes.append(f"Target behind opening ({tq},{tr}:{edge})")
                 else:
-                    notes.append(f"Target behind solid wall ({tq},{tr}:{edge})")
-                    return LosResult(blocked=True, notes=notes)
-        if _hex_wall_blocks(target_layer, tq, tr) and not through_opening:
-            notes.append(f"Target behind hex wall ({tq},{tr})")
-            return LosResult(blocked=True, notes=notes)
+                    if notes is not None:
+                        notes.append(f"Target behind solid wall ({tq},{tr}:{edge})")
+                    return True, through_opening
+        if hex_wall_blocks(target_layer, tq, tr) and not through_opening:
+            if notes is not None:
+                notes.append(f"Target behind hex wall ({tq},{tr})")
+            return True, through_opening
+    return False, through_opening
+
+
+def check_los(
+    map_state: MapState | None,
+    shooter: TokenPlacement,
+    target: TokenPlacement,
+    target_rt: TokenCombatRuntime | None = None,
+) -> LosResult:
+    """
+    Check LOS from shooter to target across layers.
+
+    Obstacles on intermediate hexes block. Walls without openings block.
+    Open/window openings allow through_opening (partial body visible).
+    Cross-layer shots require either same (q,r) different elevation (stairs/
+    vertical shaft) or a path that is not fully blocked; elevation delta
+    alone does not block if horizontal path is clear / through openings.
+    """
+    line = line_hexes(shooter.q, shooter.r, target.q, target.r)
+    return _check_los_along(map_state, shooter, target, target_rt, line)
+
+
+def _check_los_along(
+    map_state: MapState | None,
+    shooter: TokenPlacement,
+    target: TokenPlacement,
+    target_rt: TokenCombatRuntime | None,
+    line: list[tuple[int, int]],
+) -> LosResult:
+    """check_los for a precomputed shooter→target hex line."""
+    notes: list[str] = []
+    target_rt = target_rt or TokenCombatRuntime()
+
+    shooter_layer = layer_for(map_state, shooter.layer_id)
+    target_layer = layer_for(map_state, target.layer_id)
+    elev_s = shooter_layer.elevation if shooter_layer else 0
+    elev_t = target_layer.elevation if target_layer else 0
+    if elev_s != elev_t:
+        notes.append(f"Cross-layer shot (elev {elev_s} → {elev_t})")
+
+    blocked, through_opening = _walk_ray(shooter_layer, target_layer, line, target_rt, notes)
+    if blocked:
+        return LosResult(blocked=True, notes=notes)
 
     # Obstacle on target hex itself (partial cover)
-    if _hex_obstacle_blocks(target_layer, target.q, target.r):
+    if hex_obstacle_blocks(target_layer, target.q, target.r):
         through_opening = True
         notes.append("Target hex has LOS-blocking obstacle (cover)")
-    elif _hex_wall_blocks(target_layer, target.q, target.r):
+    elif hex_wall_blocks(target_layer, target.q, target.r):
         through_opening = True
         notes.append("Target hex has hex wall (cover)")
 
@@ -210,3 +250,143 @@ def check_los(
         exposures = [TargetExposure.RUNNING] + exposures
     notes.append("Clear LOS")
     return LosResult(clear=True, visible_exposures=exposures, notes=notes)
+
+
+_TokenPair = tuple[str, str]
+_LayerHex = tuple[str, int, int]
+
+
+class LosCache:
+    """
+    LOS results for token pairs, kept current across token moves and map edits.
+
+    Results are held per (shooter_id, target_id) and target stance/movement.
+    Moving a token drops only its row and column. Editing obstacles, walls,
+    openings or doors drops only the rays that read the edited hexes, found
+    through a (layer_id, q, r) → pairs reverse index; an edge wall keyed
+    "q,r:edge" belongs to hex (q, r). Adding, removing or re-elevating a
+    layer clears the cache. Results are shared between calls; do not mutate.
+    """
+
+    def __init__(self, map_state: MapState | None = None) -> None:
+        self.map_state = map_state
+        self._positions: dict[str, _LayerHex] = {}
+        self._results: dict[_TokenPair, dict[tuple[str, bool], LosResult]] = {}
+        self._ray_hexes: dict[_TokenPair, set[_LayerHex]] = {}
+        self._rays_by_hex: dict[_LayerHex, set[_TokenPair]] = {}
+        self._pairs_by_token: dict[str, set[_TokenPair]] = {}
+        self._layers = self._layer_signature()
+
+    def _layer_signature(self) -> tuple[tuple[str, int], ...]:
+        if not self.map_state:
+            return ()
+        return tuple((layer.id, layer.elevation) for layer in self.map_state.layers)
+
+    def get(
+        self,
+        shooter: TokenPlacement,
+        target: TokenPlacement,
+        target_rt: TokenCombatRuntime | None = None,
+    ) -> LosResult:
+        """check_los(map_state, shooter, target, target_rt), cached."""
+        layers = self._layer_signature()
+        if layers != self._layers:
+            self.clear()
+            self._layers = layers
+        self.move_token(shooter)
+        self.move_token(target)
+        target_rt = target_rt or TokenCombatRuntime()
+        pair = (shooter.token_id, target.token_id)
+        by_runtime = self._results.get(pair)
+        if by_runtime is None:
+            by_runtime = self._results[pair] = {}
+            self._index_ray(pair, shooter, target)
+        runtime_key = (target_rt.stance, target_rt.moved_this_impulse)
+        result = by_runtime.get(runtime_key)
+        if result is None:
+            line = line_hexes(shooter.q, shooter.r, target.q, target.r)
+            result = by_runtime[runtime_key] = _check_los_along(self.map_state, shooter, target, target_rt, line)
+        return result
+
+    def _index_ray(self, pair: _TokenPair, shooter: TokenPlacement, target: TokenPlacement) -> None:
+        # Every hex after the shooter's is read, on both the shooter and target layers
+        line = line_hexes(shooter.q, shooter.r, target.q, target.r)
+        hexes = {
+            (layer_id, q, r)
+            for layer_id in {shooter.layer_id, target.layer_id}
+            for q, r in line[1:]
+        }
+        self._ray_hexes[pair] = hexes
+        for key in hexes:
+            self._rays_by_hex.setdefault(key, set()).add(pair)
+        for token_id in pair:
+            self._pairs_by_token.setdefault(token_id, set()).add(pair)
+
+    def _drop_pair(self, pair: _TokenPair) -> None:
+        if self._results.pop(pair, None) is None:
+            return
+        for key in self._ray_hexes.pop(pair):
+            rays = self._rays_by_hex[key]
+            rays.discard(pair)
+            if not rays:
+                del self._rays_by_hex[key]
+        for token_id in pair:
+            pairs = self._pairs_by_token.get(token_id)
+            if pairs is not None:
+                pairs.discard(pair)
+
+    def move_token(self, token: TokenPlacement) -> None:
+        """Record token's position; if it moved, drop its row and column."""
+        position = (token.layer_id, token.q, token.r)
+        if self._positions.get(token.token_id) != position:
+            self.remove_token(token.token_id)
+            self._positions[token.token_id] = position
+
+    def remove_token(self, token_id: str) -> None:
+        """Drop every result with token_id as shooter or target."""
+        self._positions.pop(token_id, None)
+        for pair in self._pairs_by_token.pop(token_id, set()):
+            self._drop_pair(pair)
+
+    def sync(self, placements: Iterable[TokenPlacement]) -> None:
+        """Apply moves for every placement and forget tokens no longer placed."""
+        placed = set()
+        for token in placements:
+            placed.add(token.token_id)
+            self.move_token(token)
+        for token_id in set(self._positions) - placed:
+            self.remove_token(token_id)
+
+    def matrix(
+        self,
+        placements: Iterable[TokenPlacement],
+        token_runtime: dict[str, TokenCombatRuntime] | None = None,
+    ) -> dict[_TokenPair, LosResult]:
+        """LOS for every ordered pair of placements, recomputing only stale pairs."""
+        placements = list(placements)
+        self.sync(placements)
+        token_runtime = token_runtime or {}
+        return {
+            (shooter.token_id, target.token_id): self.get(shooter, target, token_runtime.get(target.token_id))
+            for shooter in placements
+            for target in placements
+            if shooter.token_id != target.token_id
+        }
+
+    def invalidate_hexes(self, layer_id: str, hexes: Iterable[tuple[int, int]]) -> None:
+        """Drop rays that read obstacles or walls on hexes of layer_id."""
+        for q, r in hexes:
+            for pair in list(self._rays_by_hex.get((layer_id, q, r), ())):
+                self._drop_pair(pair)
+
+    def invalidate_keys(self, layer_id: str, keys: Iterable[str]) -> None:
+        """Drop rays that read MapLayer obstacle or wall keys ("q,r" or "q,r:edge")."""
+        self.invalidate_hexes(layer_id, key_hexes(keys))
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._positions.clear()
+        self._results.clear()
+        self._ray_hexes.clear()
+        self._rays_by_hex.clear()
+        self._pairs_by_token.clear()
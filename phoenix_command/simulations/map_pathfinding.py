@@ -0,0 +1,416 @@
+"""Cheapest-AC token movement paths over map layers (Table 7A costs)."""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Sequence
+
+from phoenix_command.gui.utils.hex_geometry import is_in_bounds
+from phoenix_command.session.domains.map_state import MapState, key_hexes
+from phoenix_command.session.domains.token_state import TokenPlacement
+from phoenix_command.simulations.hex_tactical import AXIAL_NEIGHBORS, classify_movement_base
+from phoenix_command.simulations.impulse_combat_engine import (
+    METER_SCALE,
+    STANCE_MODIFIER_MAP,
+    movement_blocked_reason,
+    terrain_modifiers,
+)
+from phoenix_command.tables.catalogs.movement_catalog import compute_movement_cost
+
+# Taking a stair is a forward move onto the same hex of the linked layer, on stairs
+STAIR_MODIFIER_ID = "slope_across"
+
+_Node = tuple[str, int, int]
+
+_EPSILON = 1e-9
+
+
+@dataclass
+class MovePath:
+    """Cheapest route for a token; steps are (layer_id, q, r) after the start hex."""
+
+    steps: list[_Node] = field(default_factory=list)
+    step_costs: list[float] = field(default_factory=list)
+
+    @property
+    def ac_cost(self) -> float:
+        return sum(self.step_costs)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+def find_move_path(
+    map_state: MapState | None,
+    token: TokenPlacement,
+    goal_q: int,
+    goal_r: int,
+    goal_layer_id: str | None = None,
+    stance: str = "standing",
+    max_ac: float | None = None,
+) -> MovePath | None:
+    """
+    A* search for the cheapest AC path from token to a goal hex.
+
+    Each step costs what ImpulseCombatEngine charges for an unbraced move:
+    compute_movement_cost for the facing-relative Table 7A base, the stance
+    modifier and the target hex's terrain preset, scaled by METER_SCALE.
+    Obstacles that block movement, hex walls and impassable terrain cannot be
+    entered, and moves stay inside the map rectangle. Stairs link a hex to the
+    same hex of another layer. The heuristic is the open-ground cost of the
+    remaining displacement, which never overestimates (see _open_ground_bound).
+
+    Args:
+        map_state: Map to path over; None means open ground everywhere.
+        token: Moving token; its facing sets the per-direction base costs.
+        goal_q: Goal hex q.
+        goal_r: Goal hex r.
+        goal_layer_id: Goal layer; defaults to the token's layer.
+        stance: Stance the token moves in.
+        max_ac: Give up on paths costing more than this.
+
+    Returns:
+        The cheapest MovePath, or None if the goal cannot be reached.
+    """
+    goal = (goal_layer_id if goal_layer_id is not None else token.layer_id, goal_q, goal_r)
+    start = (token.layer_id, token.q, token.r)
+    graph = _MoveGraph(map_state, token.facing, stance)
+    if start == goal:
+        return MovePath()
+    if graph.grid is not None and not is_in_bounds(goal_q, goal_r, graph.grid):
+        return None
+
+    bound = _open_ground_bound(graph.open_ground_costs())
+    goal_bound = [y_q * goal_q + y_r * goal_r for y_q, y_r in bound]
+    max_cost = None if max_ac is None else max_ac / METER_SCALE
+
+    def heuristic(node: _Node) -> float:
+        q, r = node[1], node[2]
+        return max(at_goal - y_q * q - y_r * r for (y_q, y_r), at_goal in zip(bound, goal_bound)) - _EPSILON
+
+    best = {start: 0}
+    came_from: dict[_Node, tuple[_Node, int]] = {}
+    counter = 0
+    frontier = [(heuristic(start), 0, counter, start)]
+    while frontier:
+        _, neg_g, _, node = heapq.heappop(frontier)
+        g = -neg_g
+        if g > best.get(node, g):
+            continue
+        if node == goal:
+            return _reconstruct(came_from, start, goal)
+        for neighbor, cost in graph.moves(node):
+            new_g = g + cost
+            if max_cost is not None and new_g > max_cost:
+                continue
+            if new_g < best.get(neighbor, new_g + 1):
+                best[neighbor] = new_g
+                came_from[neighbor] = (node, cost)
+                counter += 1
+                heapq.heappush(frontier, (new_g + heuristic(neighbor), -new_g, counter, neighbor))
+    return None
+
+
+class _MoveGraph:
+    """Table 7A step costs for one facing and stance, memoised per hex."""
+
+    def __init__(self, map_state: MapState | None, facing: int, stance: str) -> None:
+        self.layers = {layer.id: layer for layer in map_state.layers} if map_state else {}
+        grid = map_state.grid if map_state else None
+        self.grid = grid if grid is not None and grid.cols > 0 and grid.rows > 0 else None
+        self.bases = [classify_movement_base(facing, direction) for direction in range(len(AXIAL_NEIGHBORS))]
+        self.stance = stance
+        # Every hex whose terrain was read, with None for hexes that cannot be entered
+        self.terrain: dict[_Node, tuple[int | None, list[str]] | None] = {}
+        self._step_costs: dict[tuple[_Node, str], int] = {}
+
+    def open_ground_costs(self) -> list[int]:
+        """Rule cost per direction on open ground."""
+        stance_modifier = STANCE_MODIFIER_MAP.get(self.stance, "stance_standing")
+        return [compute_movement_cost(base_id, [stance_modifier]) for base_id in self.bases]
+
+    def enter_cost(self, node: _Node, base_id: str, extra_modifier: str | None = None) -> int:
+        """Rule cost to enter node with base_id, or -1 if it cannot be entered."""
+        key = (node, extra_modifier or base_id)
+        cost = self._step_costs.get(key)
+        if cost is None:
+            if node not in self.terrain:
+                layer = self.layers.get(node[0])
+                self.terrain[node] = (
+                    None if movement_blocked_reason(layer, node[1], node[2])
+                    else terrain_modifiers(layer, node[1], node[2], self.stance)
+                )
+            entry = self.terrain[node]
+            if entry is None:
+                cost = -1
+            else:
+                terrain_cost, modifier_ids = entry
+                if extra_modifier:
+                    modifier_ids = modifier_ids + [extra_modifier]
+                cost = compute_movement_cost(base_id, modifier_ids, terrain_cost)
+            self._step_costs[key] = cost
+        return cost
+
+    def moves(self, node: _Node) -> list[tuple[_Node, int]]:
+        """(neighbor, rule cost) for every hex or stair that can be entered from node."""
+        layer_id, q, r = node
+        candidates = []
+        for direction, (dq, dr) in enumerate(AXIAL_NEIGHBORS):
+            nq, nr = q + dq, r + dr
+            if self.grid is not None and not is_in_bounds(nq, nr, self.grid):
+                continue
+            candidates.append(((layer_id, nq, nr), self.bases[direction], None))
+        layer = self.layers.get(layer_id)
+        stair = layer.stairs.at(q, r) if layer else None
+        if stair and stair.target_layer_id in self.layers and stair.target_layer_id != layer_id:
+            candidates.append(((stair.target_layer_id, q, r), "forward", STAIR_MODIFIER_ID))
+        moves = []
+        for neighbor, base_id, extra_modifier in candidates:
+            cost = self.enter_cost(neighbor, base_id, extra_modifier)
+            if cost >= 0:
+                moves.append((neighbor, cost))
+        return moves
+
+
+@dataclass
+class ReachableArea:
+    """
+    Hexes a token can move into this phase, packed for drawing as one item.
+
+    ``coords`` holds (layer index, q, r) triples into ``layer_ids``. For each
+    hex, ``impulses`` is the earliest impulse it can be reached in (0 being
+    the current one) and ``costs`` the AC spent in that impulse. Hexes are
+    ordered by (impulse, cost), so the first ``impulse_count`` are the ones
+    reachable this impulse.
+    """
+
+    layer_ids: list[str] = field(default_factory=list)
+    coords: array = field(default_factory=lambda: array("i"))
+    impulses: array = field(default_factory=lambda: array("b"))
+    costs: array = field(default_factory=lambda: array("d"))
+    impulse_count: int = 0
+
+    def __len__(self) -> int:
+        return len(self.costs)
+
+    def hexes(self, layer_id: str, within_impulse: bool = False) -> list[tuple[int, int]]:
+        """(q, r) of reachable hexes on layer_id, earliest first."""
+        if layer_id not in self.layer_ids:
+            return []
+        layer_index = self.layer_ids.index(layer_id)
+        count = self.impulse_count if within_impulse else len(self)
+        return [
+            (self.coords[i * 3 + 1], self.coords[i * 3 + 2])
+            for i in range(count)
+            if self.coords[i * 3] == layer_index
+        ]
+
+
+def find_reachable_hexes(
+    map_state: MapState | None,
+    token: TokenPlacement,
+    impulse_ac: Sequence[float],
+    stance: str = "standing",
+    move_progress: float = 0.0,
+    move_target: tuple[int, int] | None = None,
+) -> ReachableArea:
+    """
+    Dijkstra flood fill of every hex token can enter for the rest of the phase.
+
+    Step costs and blocking follow find_move_path. As in
+    ImpulseCombatEngine._apply_move, each impulse pays up to a step's full
+    cost from the AC it has left and the progress is kept when the next
+    impulse refills, so one hex can be paid over several impulses; a move in
+    progress must be finished before another is started. The search label is
+    (impulse, AC spent in it), and a hex reached in an earlier impulse
+    dominates any later arrival.
+
+    Args:
+        map_state: Map to move over; None means open ground everywhere.
+        token: Moving token.
+        impulse_ac: AC available per impulse, the current impulse's remaining
+            AC first, then each later impulse of the phase.
+        stance: Stance the token moves in.
+        move_progress: Fraction of the move into move_target already paid.
+        move_target: Hex (q, r) on the token's layer the token is moving into.
+
+    Returns:
+        ReachableArea of every enterable hex, excluding the token's own.
+    """
+    graph = _MoveGraph(map_state, token.facing, stance)
+    return _flood(graph, token, impulse_ac, move_progress, move_target)
+
+
+def _flood(
+    graph: _MoveGraph,
+    token: TokenPlacement,
+    impulse_ac: Sequence[float],
+    move_progress: float = 0.0,
+    move_target: tuple[int, int] | None = None,
+) -> ReachableArea:
+    start = (token.layer_id, token.q, token.r)
+    budgets = [ac / METER_SCALE for ac in impulse_ac]
+    area = ReachableArea()
+    if not budgets:
+        return area
+
+    def arrival(impulse: int, spent: float, cost: float, paid: float = 0.0) -> tuple[int, float] | None:
+        """
+        (impulse, spent) once a step is entered, paid as _apply_move does.
+
+        Every impulse with AC left pays min(AC left, cost) towards the step
+        until what was paid covers its cost.
+        """
+        for later in range(impulse, len(budgets)):
+            available = budgets[later] - spent
+            if available > _EPSILON or paid + _EPSILON >= cost:
+                pay = min(max(0.0, available), cost)
+                if paid + pay + _EPSILON >= cost:
+                    return later, spent + pay
+                paid += pay
+            spent = 0.0
+        return None
+
+    pending = None
+    if move_progress > 0 and move_target is not None:
+        pending = (token.layer_id, *move_target)
+
+    best = {start: (0, 0.0)}
+    frontier = [(0, 0.0, start)]
+    layer_indexes: dict[str, int] = {}
+    while frontier:
+        impulse, spent, node = heapq.heappop(frontier)
+        if (impulse, spent) > best[node]:
+            continue
+        if node != start:
+            layer_id, q, r = node
+            if layer_id not in layer_indexes:
+                layer_indexes[layer_id] = len(area.layer_ids)
+                area.layer_ids.append(layer_id)
+            area.coords.extend((layer_indexes[layer_id], q, r))
+            area.impulses.append(impulse)
+            area.costs.append(spent * METER_SCALE)
+            if impulse == 0:
+                area.impulse_count += 1
+        paid = 0.0
+        moves = graph.moves(node)
+        if node == start and pending is not None:
+            # A move in progress must be finished before any other
+            moves = [(neighbor, cost) for neighbor, cost in moves if neighbor == pending]
+            paid = move_progress * moves[0][1] if moves else 0.0
+        for neighbor, cost in moves:
+            label = arrival(impulse, spent, cost, paid)
+            if label is not None and label < best.get(neighbor, (len(budgets), 0.0)):
+                best[neighbor] = label
+                heapq.heappush(frontier, (*label, neighbor))
+    return area
+
+
+@dataclass
+class _CachedArea:
+    key: tuple
+    area: ReachableArea
+    read: set[_Node]
+
+
+class ReachabilityCache:
+    """
+    Reachable areas per token, kept until the token or nearby terrain changes.
+
+    An area is reused while the token's position, facing, stance, budgets and
+    move in progress are unchanged. Editing a hex drops only the areas whose flood fill read
+    it: the reached hexes and the ring just beyond them. Grid or layer
+    changes clear the cache.
+    """
+
+    def __init__(self, map_state: MapState | None) -> None:
+        self.map_state = map_state
+        self._entries: dict[str, _CachedArea] = {}
+        self._signature = self._map_signature()
+
+    def _map_signature(self) -> tuple:
+        if not self.map_state:
+            return ()
+        grid = self.map_state.grid
+        return grid.cols, grid.rows, grid.orientation, tuple(layer.id for layer in self.map_state.layers)
+
+    def get(
+        self,
+        token: TokenPlacement,
+        impulse_ac: Sequence[float],
+        stance: str = "standing",
+        move_progress: float = 0.0,
+        move_target: tuple[int, int] | None = None,
+    ) -> ReachableArea:
+        """find_reachable_hexes for token, reusing the cached area while nothing it depends on changed."""
+        signature = self._map_signature()
+        if signature != self._signature:
+            self.clear()
+            self._signature = signature
+        key = (
+            token.layer_id, token.q, token.r, token.facing, stance, tuple(impulse_ac), move_progress, move_target
+        )
+        entry = self._entries.get(token.token_id)
+        if entry is None or entry.key != key:
+            graph = _MoveGraph(self.map_state, token.facing, stance)
+            area = _flood(graph, token, impulse_ac, move_progress, move_target)
+            read = set(graph.terrain)
+            read.add((token.layer_id, token.q, token.r))
+            entry = self._entries[token.token_id] = _CachedArea(key, area, read)
+        return entry.area
+
+    def invalidate_hexes(self, layer_id: str, hexes: Iterable[tuple[int, int]]) -> None:
+        """Drop areas whose flood fill read any of hexes on layer_id."""
+        nodes = {(layer_id, q, r) for q, r in hexes}
+        for token_id in [token_id for token_id, entry in self._entries.items() if not nodes.isdisjoint(entry.read)]:
+            del self._entries[token_id]
+
+    def invalidate_keys(self, layer_id: str, keys: Iterable[str]) -> None:
+        """Drop areas that read MapLayer obstacle, terrain, stair or wall keys."""
+        self.invalidate_hexes(layer_id, key_hexes(keys))
+
+    def remove_token(self, token_id: str) -> None:
+        """Forget the area of token_id."""
+        self._entries.pop(token_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached area."""
+        self._entries.clear()
+
+
+def _open_ground_bound(costs: list[int]) -> list[tuple[float, float]]:
+    """
+    Vertices y of {y : y . v_d <= costs[d]} over the axial directions v_d.
+
+    The cheapest way to cover a displacement D with direction d costing
+    costs[d] per hex is a linear program whose dual optimum, max y . D, is
+    reached at one of these vertices. Terrain and modifiers only add cost, so
+    max y . D is an admissible and consistent A* heuristic.
+    """
+    vertices = []
+    for i, (qi, ri) in enumerate(AXIAL_NEIGHBORS):
+        for j in range(i + 1, len(AXIAL_NEIGHBORS)):
+            qj, rj = AXIAL_NEIGHBORS[j]
+            det = qi * rj - ri * qj
+            if det == 0:
+                continue
+            y = ((costs[i] * rj - costs[j] * ri) / det, (qi * costs[j] - qj * costs[i]) / det)
+            if all(y[0] * dq + y[1] * dr <= cost + _EPSILON for (dq, dr), cost in zip(AXIAL_NEIGHBORS, costs)):
+                vertices.append(y)
+    return vertices
+
+
+def _reconstruct(came_from: dict[_Node, tuple[_Node, int]], start: _Node, goal: _Node) -> MovePath:
+    steps: list[_Node] = []
+    costs: list[float] = []
+    node = goal
+    while node != start:
+        previous, cost = came_from[node]
+        steps.append(node)
+        costs.append(cost * METER_SCALE)
+        node = previous
+    steps.reverse()
+    costs.reverse()
+    return MovePath(steps, costs)
@@ -16,7 +16,7 @@ from phoenix_command.session.domains.impulse_combat_state import TokenCombatRunt
 from phoenix_command.session.domains.map_state import MapLayer, MapState, rules_hexes
 from phoenix_command.session.domains.token_state import TokenPlacement
 from phoenix_command.simulations.hex_tactical import line_hexes, relative_orientation
-from phoenix_command.simulations.map_los import LosResult, check_los
+from phoenix_command.simulations.map_los import LosCache, LosResult, check_los
 
 
 @dataclass
@@ -79,7 +79,7 @@ def _collect_visibility(
                 layers.append(layer)
     for layer in layers:
         for q, r in hexes:
-            cond = layer.conditions.get(f"{q},{r}")
+            cond = layer.conditions.at(q, r)
             vis_names = cond.visibility if cond and cond.visibility else [layer.default_visibility]
             for vis_name in vis_names:
                 if vis_name in seen:
@@ -100,6 +100,7 @@ def build_map_shot_context(
     target: TokenPlacement,
     target_rt: TokenCombatRuntime,
     map_state: MapState | None,
+    los_cache: LosCache | None = None,
 ) -> MapShotContext:
     """Derive range and shot modifiers from token positions on the map."""
     meters = (
@@ -119,7 +120,10 @@ def build_map_shot_context(
     line = line_hexes(shooter.q, shooter.r, target.q, target.r)
     visibility = _collect_visibility(map_state, shooter, target, line)
 
-    los = check_los(map_state, shooter, target, target_rt)
+    if los_cache is not None and los_cache.map_state is map_state:
+        los = los_cache.get(shooter, target, target_rt)
+    else:
+        los = check_los(map_state, shooter, target, target_rt)
 
     rel = relative_orientation(
         target.facing, target.q, target.r, shooter.q, shooter.r
@@ -0,0 +1,383 @@
+"""Per-token viewsheds on the hex map, using the map_los blocking rules."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from phoenix_command.gui.utils.hex_geometry import axial_to_offset, offset_to_axial
+from phoenix_command.session.domains.impulse_combat_state import TokenCombatRuntime
+from phoenix_command.session.domains.map_state import (
+    HexGridConfig,
+    MapLayer,
+    MapState,
+    cell_hex,
+    hex_cell,
+    key_hexes,
+)
+from phoenix_command.session.domains.token_state import TokenPlacement
+from phoenix_command.simulations.map_los import (
+    edge_between,
+    hex_obstacle_blocks,
+    hex_wall_blocks,
+    layer_for,
+    opening_allows_los,
+    wall_on_edge,
+)
+
+# Default viewshed radius in hexes; building a ray fan takes time cubic in the radius
+DEFAULT_MAX_RANGE = 50
+
+# Path state of a fan node: clear, clear but seen through an opening, or blocked
+_CLEAR, _THROUGH_OPENING, _BLOCKED = 0, 1, 2
+_NO_WALL, _OPENING, _SOLID = 0, 1, 2
+
+
+@dataclass
+class Viewshed:
+    """
+    Hexes of one layer visible from an observer, as a bitset over the map rectangle.
+
+    Bit ``col * grid.rows + row`` is set when a target standing in that
+    offset cell would not be blocked by check_los.
+    """
+
+    observer_id: str
+    layer_id: str
+    grid: HexGridConfig
+    bits: int = 0
+
+    def is_visible(self, q: int, r: int) -> bool:
+        col, row = axial_to_offset(q, r, self.grid)
+        if not (0 <= col < self.grid.cols and 0 <= row < self.grid.rows):
+            return False
+        return bool(self.bits >> (col * self.grid.rows + row) & 1)
+
+    def hexes(self) -> list[tuple[int, int]]:
+        """Visible axial hexes in bit order."""
+        rows = self.grid.rows
+        return [
+            offset_to_axial(index // rows, index % rows, self.grid)
+            for index in range(self.bits.bit_length())
+            if self.bits >> index & 1
+        ]
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+
+@dataclass
+class _RayFan:
+    """
+    Rays from one origin to every cell of the map rectangle, as a prefix tree.
+
+    Rays that start along the same hexes share those nodes, and nodes are
+    stored in flat arrays with every parent before its children, so one
+    forward pass walks all rays at once. Node n is hex ``cells[n]``, reached
+    from ``parents[n]`` (-1 for the origin) across edge ``out_edges[n]`` of
+    the parent hex; ``back_edges[n]`` is the edge of node n facing back along
+    the ray. Edges are -1 when the hexes are not adjacent. ``bits[n]`` is the
+    bitset index of the cell whose ray ends at node n, or -1.
+    """
+
+    cell_count: int
+    origin_bit: int = -1
+    parents: array = field(default_factory=lambda: array("i"))
+    cells: array = field(default_factory=lambda: array("q"))
+    out_edges: array = field(default_factory=lambda: array("b"))
+    back_edges: array = field(default_factory=lambda: array("b"))
+    bits: array = field(default_factory=lambda: array("i"))
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the node arrays."""
+        return sum(
+            len(column) * column.itemsize
+            for column in (self.parents, self.cells, self.out_edges, self.back_edges, self.bits)
+        )
+
+
+def _edge_code(q0: int, r0: int, q1: int, r1: int) -> int:
+    edge = edge_between(q0, r0, q1, r1)
+    return -1 if edge is None else edge
+
+
+def _ray_fan(q: int, r: int, grid: HexGridConfig, max_range: int | None) -> _RayFan:
+    """
+    Build the ray fan from (q, r) over grid, skipping cells beyond max_range.
+
+    Each ray is the line_hexes line to its cell, computed inline with the
+    same arithmetic and walked down the tree as it goes.
+    """
+    cols, rows = grid.cols, grid.rows
+    fan = _RayFan(cols * rows)
+    parents, cells, out_edges, back_edges, bits = (
+        fan.parents, fan.cells, fan.out_edges, fan.back_edges, fan.bits
+    )
+    children: dict[tuple[int, int, int], int] = {}
+    for col in range(cols):
+        for row in range(rows):
+            tq, tr = offset_to_axial(col, row, grid)
+            dq, dr = tq - q, tr - r
+            dist = max(abs(dq), abs(dr), abs(dq + dr))
+            if max_range is not None and dist > max_range:
+                continue
+            if dist == 0:
+                fan.origin_bit = col * rows + row
+                continue
+            node, pq, pr = -1, q, r
+            for i in range(1, dist + 1):
+                t = i / dist
+                hq = round(q + dq * t)
+                hr = round(r + dr * t)
+                if hq == pq and hr == pr:
+                    continue
+                child = children.get((node, hq, hr))
+                if child is None:
+                    child = children[(node, hq, hr)] = len(parents)
+                    parents.append(node)
+                    cells.append(hex_cell(hq, hr))
+                    out_edges.append(_edge_code(pq, pr, hq, hr) if node >= 0 else -1)
+                    back_edges.append(_edge_code(hq, hr, pq, pr))
+                    bits.append(-1)
+                node, pq, pr = child, hq, hr
+            bits[node] = col * rows + row
+    return fan
+
+
+def _walk_fan(
+    map_state: MapState | None,
+    observer_layer_id: str,
+    layer_id: str,
+    fan: _RayFan,
+    states: bytearray,
+    target_rt: TokenCombatRuntime,
+    nodes: Iterable[int] | None = None,
+) -> tuple[int, int]:
+    """
+    (mask of evaluated bits, visible bits) for the rays ending at nodes.
+
+    Follows map_los._walk_ray. ``states`` holds each node's path state with
+    the node itself as an intermediate hex; nodes (default: all) must come
+    in fan order and include every node whose parent state changed. Each hex
+    and edge is looked up once per call since neighbouring rays share them.
+    """
+    layers = (layer_for(map_state, observer_layer_id), layer_for(map_state, layer_id))
+    target_layer = layers[1]
+    hex_blocked: dict[int, bool] = {}
+    edge_states: dict[tuple[int, int, bool], int] = {}
+
+    def blocks(cell: int) -> bool:
+        blocked = hex_blocked.get(cell)
+        if blocked is None:
+            q, r = cell_hex(cell)
+            blocked = hex_blocked[cell] = any(
+                hex_obstacle_blocks(layer, q, r) or hex_wall_blocks(layer, q, r) for layer in layers
+            )
+        return blocked
+
+    def edge_state(cell: int, edge: int, final: bool) -> int:
+        """_NO_WALL, _OPENING or _SOLID for the walls the ray reads on this edge."""
+        key = (cell, edge, final)
+        state = edge_states.get(key)
+        if state is None:
+            state = _NO_WALL
+            q, r = cell_hex(cell)
+            for layer in (target_layer,) if final else layers:
+                wall = wall_on_edge(layer, q, r, edge)
+                if wall is None:
+                    continue
+                if not opening_allows_los(wall, target_rt):
+                    state = _SOLID
+                    break
+                state = _OPENING
+            edge_states[key] = state
+        return state
+
+    parents, cells, out_edges, back_edges, bits = (
+        fan.parents, fan.cells, fan.out_edges, fan.back_edges, fan.bits
+    )
+    # One b"0"/b"1" flag per cell, turned into the bitsets in one int() call
+    evaluated = bytearray(b"0" * fan.cell_count)
+    visible = bytearray(b"0" * fan.cell_count)
+    if nodes is None:
+        nodes = range(len(parents))
+        if fan.origin_bit >= 0:
+            evaluated[fan.origin_bit] = visible[fan.origin_bit] = ord("1")
+    for node in nodes:
+        parent = parents[node]
+        cell = cells[node]
+        state = _CLEAR if parent < 0 else states[parent]
+        if state != _BLOCKED and out_edges[node] >= 0:
+            crossed = edge_state(cells[parent], out_edges[node], False)
+            if crossed == _SOLID:
+                state = _BLOCKED
+            elif crossed == _OPENING:
+                state = _THROUGH_OPENING
+
+        bit = bits[node]
+        if bit >= 0:
+            evaluated[bit] = ord("1")
+            if _target_clear(state, cell, back_edges[node], edge_state, target_layer):
+                visible[bit] = ord("1")
+
+        if state != _BLOCKED and blocks(cell):
+            state = _BLOCKED
+        states[node] = state
+    return int(evaluated[::-1], 2), int(visible[::-1], 2)
+
+
+def _target_clear(
+    state: int,
+    cell: int,
+    back_edge: int,
+    edge_state: Callable[[int, int, bool], int],
+    target_layer: MapLayer | None,
+) -> bool:
+    """Whether a ray arriving in state ends clear at its target hex."""
+    if state == _BLOCKED:
+        return False
+    if back_edge >= 0 and target_layer:
+        facing = edge_state(cell, back_edge, True)
+        if facing == _SOLID:
+            return False
+        if facing == _OPENING:
+            state = _THROUGH_OPENING
+    return state == _THROUGH_OPENING or not hex_wall_blocks(target_layer, *cell_hex(cell))
+
+
+def compute_viewshed(
+    map_state: MapState,
+    observer: TokenPlacement,
+    layer_id: str | None = None,
+    stance: str = "standing",
+    max_range: int | None = DEFAULT_MAX_RANGE,
+) -> Viewshed:
+    """
+    Every hex of the map rectangle within max_range visible from observer.
+
+    Args:
+        map_state: Map whose grid bounds the viewshed.
+        observer: Token looking out.
+        layer_id: Layer of the target hexes; defaults to the observer's.
+        stance: Target stance used for window openings.
+        max_range: Skip hexes further than this many hexes; None covers the whole map.
+
+    Returns:
+        Viewshed of hexes where check_los would not be blocked.
+    """
+    layer_id = layer_id if layer_id is not None else observer.layer_id
+    grid = map_state.grid
+    fan = _ray_fan(observer.q, observer.r, grid, max_range)
+    _, bits = _walk_fan(
+        map_state, observer.layer_id, layer_id, fan, bytearray(len(fan)), TokenCombatRuntime(stance=stance)
+    )
+    return Viewshed(observer.token_id, layer_id, grid, bits)
+
+
+@dataclass
+class _CachedViewshed:
+    position: tuple[str, int, int]
+    viewshed: Viewshed
+    fan: _RayFan
+    states: bytearray
+
+
+class ViewshedCache:
+    """
+    Viewsheds per token, updated incrementally.
+
+    A moved token gets a fresh viewshed; its ray fan is shared with any other
+    cached viewshed from the same hex. Obstacle, wall, window or door edits
+    re-walk only the fan nodes on the edited hexes and the rays beyond them;
+    an edge wall keyed "q,r:edge" belongs to hex (q, r). Grid or layer
+    changes clear the cache.
+    """
+
+    def __init__(
+        self, map_state: MapState, stance: str = "standing", max_range: int | None = DEFAULT_MAX_RANGE
+    ) -> None:
+        self.map_state = map_state
+        self.stance = stance
+        self.max_range = max_range
+        self._entries: dict[tuple[str, str], _CachedViewshed] = {}
+        self._signature = self._map_signature()
+
+    def _map_signature(self) -> tuple:
+        grid = self.map_state.grid
+        return (
+            grid.cols, grid.rows, grid.orientation,
+            tuple((layer.id, layer.elevation) for layer in self.map_state.layers),
+        )
+
+    def _fan_at(self, q: int, r: int) -> _RayFan:
+        for entry in self._entries.values():
+            if entry.position[1:] == (q, r):
+                return entry.fan
+        return _ray_fan(q, r, self.map_state.grid, self.max_range)
+
+    def get(self, observer: TokenPlacement, layer_id: str | None = None) -> Viewshed:
+        """compute_viewshed for observer, reusing the cached result when it has not moved."""
+        signature = self._map_signature()
+        if signature != self._signature:
+            self.clear()
+            self._signature = signature
+        layer_id = layer_id if layer_id is not None else observer.layer_id
+        key = (observer.token_id, layer_id)
+        position = (observer.layer_id, observer.q, observer.r)
+        entry = self._entries.get(key)
+        if entry is None or entry.position != position:
+            self._entries.pop(key, None)
+            fan = self._fan_at(observer.q, observer.r)
+            states = bytearray(len(fan))
+            _, bits = _walk_fan(
+                self.map_state, observer.layer_id, layer_id, fan, states, TokenCombatRuntime(stance=self.stance)
+            )
+            entry = _CachedViewshed(position, Viewshed(observer.token_id, layer_id, self.map_state.grid, bits), fan, states)
+            self._entries[key] = entry
+        return entry.viewshed
+
+    def invalidate_hexes(self, layer_id: str, hexes: Iterable[tuple[int, int]]) -> None:
+        """Re-walk rays through hexes of layer_id in every affected viewshed."""
+        edited = {hex_cell(q, r) for q, r in hexes}
+        runtime = TokenCombatRuntime(stance=self.stance)
+        for (_, target_layer_id), entry in self._entries.items():
+            if layer_id not in (entry.position[0], target_layer_id):
+                continue
+            nodes = _subtrees(entry.fan, edited)
+            if not nodes:
+                continue
+            mask, bits = _walk_fan(
+                self.map_state, entry.position[0], target_layer_id, entry.fan, entry.states, runtime, nodes
+            )
+            entry.viewshed.bits = entry.viewshed.bits & ~mask | bits
+
+    def invalidate_keys(self, layer_id: str, keys: Iterable[str]) -> None:
+        """Re-walk rays through MapLayer obstacle or wall keys ("q,r" or "q,r:edge")."""
+        self.invalidate_hexes(layer_id, key_hexes(keys))
+
+    def remove_token(self, token_id: str) -> None:
+        """Forget every viewshed of token_id."""
+        for key in [key for key in self._entries if key[0] == token_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached viewshed."""
+        self._entries.clear()
+
+
+def _subtrees(fan: _RayFan, cells: set[int]) -> list[int]:
+    """Fan nodes on any of cells, and every node below them, in fan order."""
+    parents, node_cells = fan.parents, fan.cells
+    inside = bytearray(len(fan))
+    nodes = []
+    for node in range(len(fan)):
+        parent = parents[node]
+        if node_cells[node] in cells or (parent >= 0 and inside[parent]):
+            inside[node] = 1
+            nodes.append(node)
+    return nodes
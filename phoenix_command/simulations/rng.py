@@ -0,0 +1,138 @@
+"""Seedable, splittable random streams for reproducible simulation runs."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+from typing import Dict, List, Optional
+
+
+class RngStream(random.Random):
+    """A random.Random that can be split into independent, deterministic sub-streams.
+
+    Every stream is identified by its root seed and a key path such as "/worker/3". Children
+    derive their seed from that pair only, so a child's draws do not depend on how much its
+    parent has been used, and the same (root_seed, key) always reproduces the same rolls.
+    Streams pickle with their full state, so they can be handed to process pool workers.
+
+    Integer rolls over ranges of at most 256 values, which covers every d10 and d100 in the
+    rules, are drawn in bulk: one ``randbytes`` call fills a buffer per range size, bytes that
+    would bias the result are rejected, and ``randint``/``randints`` hand out buffered values.
+    The buffers are part of the stream state, so seeding, pickling and getstate/setstate
+    still reproduce every roll.
+    """
+
+    _BUFFER_SIZE = 4096
+
+    def __init__(self, seed: Optional[int] = None, key: str = ""):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self.root_seed = seed
+        self.key = key
+        self._children = 0
+        self._buffers: Dict[int, List[int]] = {}
+        super().__init__(self._derive(seed, key) if key else seed)
+
+    def seed(self, *args, **kwargs) -> None:
+        super().seed(*args, **kwargs)
+        self._buffers = {}
+
+    def getstate(self):
+        return super().getstate(), {span: list(buffer) for span, buffer in self._buffers.items()}
+
+    def setstate(self, state) -> None:
+        generator_state, buffers = state
+        super().setstate(generator_state)
+        self._buffers = {span: list(buffer) for span, buffer in buffers.items()}
+
+    @staticmethod
+    def _derive(seed: int, key: str) -> int:
+        digest = hashlib.blake2b(f"{seed}:{key}".encode(), digest_size=16).digest()
+        return int.from_bytes(digest, "little")
+
+    def child(self, name: str | int) -> RngStream:
+        """Return the named sub-stream of this stream."""
+        return RngStream(self.root_seed, f"{self.key}/{name}")
+
+    def spawn(self, n: int) -> List[RngStream]:
+        """Return n new sequentially numbered sub-streams, e.g. one per pool worker.
+
+        Repeated calls continue the numbering, so every spawned stream is distinct.
+        """
+        if n < 0:
+            raise ValueError(f"Number of streams must be non-negative, got {n}")
+        start = self._children
+        self._children += n
+        return [self.child(i) for i in range(start, start + n)]
+
+    def replay(self, key: Optional[str] = None) -> RngStream:
+        """Return a fresh stream of the same root seed, positioned at its first draw.
+
+        Args:
+            key: Key path of the stream to reproduce, e.g. the ``key`` recorded from the
+                child that rolled one shot; defaults to this stream's own key.
+        """
+        return RngStream(self.root_seed, self.key if key is None else key)
+
+    def _fill(self, span: int, n: int) -> List[int]:
+        """At least n uniform values in [0, span) from whole random bytes, rejecting the biased tail."""
+        limit = 256 - 256 % span
+        values = []
+        while len(values) < n:
+            count = (n - len(values)) * 256 // limit + 16
+            values += [byte % span for byte in self.randbytes(count) if byte < limit]
+        return values
+
+    def randint(self, a: int, b: int) -> int:
+        span = b - a + 1
+        if not 0 < span <= 256:
+            return super().randint(a, b)
+        buffer = self._buffers.get(span)
+        if not buffer:
+            buffer = self._buffers[span] = self._fill(span, self._BUFFER_SIZE)
+        return buffer.pop() + a
+
+    def randints(self, a: int, b: int, n: int) -> List[int]:
+        """Draw n integers in [a, b]; yields exactly what n calls to randint(a, b) would."""
+        if b < a:
+            raise ValueError(f"Empty range for randints({a}, {b})")
+        span = b - a + 1
+        if span > 256:
+            return [super(RngStream, self).randint(a, b) for _ in range(n)]
+        buffer = self._buffers.setdefault(span, [])
+        if len(buffer) < n:
+            # Refill in the same chunks randint does; values are popped from the end, so each
+            # later chunk goes underneath the earlier ones
+            chunks = [buffer]
+            missing = n - len(buffer)
+            while missing > 0:
+                chunks.append(self._fill(span, self._BUFFER_SIZE))
+                missing -= len(chunks[-1])
+            buffer = self._buffers[span] = [value for chunk in reversed(chunks) for value in chunk]
+        values = buffer[-n:] if n else []
+        del buffer[len(buffer) - n:]
+        values.reverse()
+        return [value + a for value in values] if a else values
+
+    def __reduce__(self):
+        return self.__class__, (self.root_seed, self.key), (self.getstate(), self._children)
+
+    def __setstate__(self, state):
+        stream_state, self._children = state
+        self.setstate(stream_state)
+
+
+def randints(rng: Optional[random.Random], a: int, b: int, n: int) -> List[int]:
+    """Draw n integers in [a, b] from rng, in bulk when it is an RngStream.
+
+    Args:
+        rng: Random source; defaults to the module-level random functions.
+
+    Returns:
+        The same values n calls to rng.randint(a, b) would return.
+    """
+    if isinstance(rng, RngStream):
+        return rng.randints(a, b, n)
+    rand = rng or random
+    return [rand.randint(a, b) for _ in range(n)]
@@ -0,0 +1,177 @@
+"""Fan burst and shotgun-burst scenarios out across a process pool."""
+
+import dataclasses
+import itertools
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from phoenix_command.models.character import Character
+from phoenix_command.models.combat_trace import NULL_TRACE
+from phoenix_command.models.gear import AmmoType, Weapon
+from phoenix_command.models.hit_result_advanced import BurstScenario, BurstScenarioSummary, TargetGroup
+from phoenix_command.simulations.combat_simulator import CombatSimulator
+from phoenix_command.simulations.rng import RngStream
+
+DEFAULT_CHUNK_TRIALS = 250
+
+
+def build_scenario_grid(
+    shooter: Character,
+    weapon_ammo: Iterable[Tuple[Weapon, AmmoType]],
+    arcs_of_fire: Iterable[Optional[float]],
+    rates_of_fire: Iterable[Optional[int]],
+    layouts: Iterable[TargetGroup],
+    ranges: Iterable[Optional[int]] = (None,),
+    pattern_layouts: Optional[List[TargetGroup]] = None,
+    continuous_burst_impulses: int = 0,
+) -> List[BurstScenario]:
+    """Return the cross product of the given parameters as scenarios.
+
+    Args:
+        shooter: Character firing every scenario.
+        weapon_ammo: (weapon, ammo) pairs to fire.
+        arcs_of_fire: Arcs of fire; None uses the weapon's effective minimum arc.
+        rates_of_fire: Full auto ROF overrides; None keeps the weapon's own ROF.
+        layouts: Target group layouts.
+        ranges: Range applied to every target of a layout and of its pattern layouts; None keeps
+            the layouts' own ranges.
+        pattern_layouts: Pattern groups, one per primary target of every layout; makes every
+            scenario a shotgun burst.
+        continuous_burst_impulses: Impulses of continuous fire before the burst (SAB penalty).
+
+    Returns:
+        One scenario per combination, labelled with its parameters.
+
+    Raises:
+        ValueError: If a layout's primary target count differs from the number of pattern layouts.
+    """
+    layouts = list(layouts)
+    if pattern_layouts is not None:
+        for layout in layouts:
+            if len(layout.targets) != len(pattern_layouts):
+                raise ValueError(
+                    f"Layout has {len(layout.targets)} primary targets but {len(pattern_layouts)} pattern layouts"
+                )
+
+    scenarios = []
+    for (weapon, ammo), arc, rof, layout, range_hexes in itertools.product(
+        list(weapon_ammo), list(arcs_of_fire), list(rates_of_fire), layouts, list(ranges)
+    ):
+        if rof is not None:
+            weapon = dataclasses.replace(weapon, full_auto_rof=rof)
+        patterns = pattern_layouts
+        if range_hexes is not None:
+            layout = dataclasses.replace(layout, ranges=[range_hexes] * len(layout.targets))
+            if patterns is not None:
+                patterns = [
+                    dataclasses.replace(group, ranges=[range_hexes] * len(group.targets)) for group in patterns
+                ]
+        scenarios.append(BurstScenario(
+            shooter=shooter,
+            weapon=weapon,
+            ammo=ammo,
+            target_group=layout,
+            arc_of_fire=arc,
+            continuous_burst_impulses=continuous_burst_impulses,
+            pattern_target_groups=patterns,
+            label=f"{weapon.name} / {ammo.name}, arc {arc}, ROF {weapon.full_auto_rof}, ranges {layout.ranges}",
+        ))
+    return scenarios
+
+
+def _run_trials(scenario_blob: bytes, targets_blob: bytes, trials: int, rng: RngStream) -> BurstScenarioSummary:
+    """Resolve trials of one pickled scenario; targets are unpickled fresh for every trial."""
+    scenario: BurstScenario = pickle.loads(scenario_blob)
+    summary = BurstScenarioSummary(
+        label=scenario.label, target_names=[target.name for target in scenario.all_targets]
+    )
+    for _ in range(trials):
+        target_group, pattern_groups = pickle.loads(targets_blob)
+        trial = dataclasses.replace(scenario, target_group=target_group, pattern_target_groups=pattern_groups)
+        index = {id(target): i for i, target in enumerate(trial.all_targets)}
+
+        if pattern_groups is None:
+            results = CombatSimulator.burst_fire(
+                trial.shooter, trial.weapon, trial.ammo, target_group, trial.arc_of_fire,
+                trial.continuous_burst_impulses, rng, NULL_TRACE
+            )
+        else:
+            results = CombatSimulator.shotgun_burst_fire(
+                trial.shooter, trial.weapon, trial.ammo, target_group, pattern_groups, trial.arc_of_fire,
+                trial.continuous_burst_impulses, rng, NULL_TRACE
+            )
+
+        incapacitated = set()
+        any_hit = False
+        for result in results:
+            if not result.hit:
+                continue
+            any_hit = True
+            i = index[id(result.target)]
+            summary.hits[i] += 1
+            if result.damage_result is not None:
+                summary.damage[i] += result.damage_result.damage
+            if result.incapacitation_effect is not None:
+                incapacitated.add(i)
+        for i in incapacitated:
+            summary.incapacitated[i] += 1
+        summary.volleys_hit += any_hit
+        summary.trials += 1
+    return summary
+
+
+def run_scenarios(
+    scenarios: Sequence[BurstScenario],
+    trials: int,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    chunk_trials: int = DEFAULT_CHUNK_TRIALS,
+) -> List[BurstScenarioSummary]:
+    """Resolve every scenario over the given number of trials, in parallel.
+
+    Trials are split into chunks of chunk_trials and each chunk runs on its own RNG sub-stream
+    keyed by (scenario, chunk), so results depend only on the seed, never on worker count or
+    scheduling. Workers receive pickled snapshots and return per-target summaries.
+
+    Args:
+        scenarios: Scenarios to resolve.
+        trials: Trials per scenario.
+        seed: Root seed; None draws one from the OS.
+        max_workers: Process count; None uses every core, 1 runs in the calling process.
+        chunk_trials: Trials per task sent to a worker.
+
+    Returns:
+        One merged summary per scenario, in input order.
+    """
+    if trials < 0:
+        raise ValueError(f"Number of trials must be non-negative, got {trials}")
+    if chunk_trials < 1:
+        raise ValueError(f"chunk_trials must be positive, got {chunk_trials}")
+
+    root = RngStream(seed)
+    tasks = []
+    for scenario_idx, scenario in enumerate(scenarios):
+        scenario_blob = pickle.dumps(scenario)
+        targets_blob = pickle.dumps((scenario.target_group, scenario.pattern_target_groups))
+        for chunk_idx, start in enumerate(range(0, trials, chunk_trials)):
+            tasks.append((
+                scenario_idx,
+                (scenario_blob, targets_blob, min(chunk_trials, trials - start),
+                 root.child(f"{scenario_idx}/{chunk_idx}")),
+            ))
+
+    summaries = [
+        BurstScenarioSummary(label=scenario.label, target_names=[target.name for target in scenario.all_targets])
+        for scenario in scenarios
+    ]
+    if max_workers == 1:
+        for scenario_idx, args in tasks:
+            summaries[scenario_idx].merge(_run_trials(*args))
+        return summaries
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [(scenario_idx, pool.submit(_run_trials, *args)) for scenario_idx, args in tasks]
+        for scenario_idx, future in futures:
+            summaries[scenario_idx].merge(future.result())
+    return summaries
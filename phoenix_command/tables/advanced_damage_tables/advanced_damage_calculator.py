@@ -1,11 +1,50 @@
-import re
+import bisect
+import functools
 
 from phoenix_command.models.enums import AdvancedHitLocation
-from phoenix_command.models.hit_result_advanced import DamageResult
-from phoenix_command.tables.advanced_damage_tables.tables_data import TablesData
+from phoenix_command.models.hit_result_advanced import DamageResult, DamageRecord
+from phoenix_command.tables.advanced_damage_tables.compiled_tables_data import (
+    CompiledDamageTable,
+    CompiledTablesData,
+    parse_table_value,
+)
 
 
 class AdvancedDamageCalculator:
+    # EPEN is quantized to 0.01 for cache keys: table thresholds step by 0.1 and item PEN data by 0.01,
+    # so only floating point noise from armor arithmetic is collapsed.
+    EPEN_STEPS_PER_UNIT = 100
+    DEFAULT_CACHE_SIZE = 4096
+
+    @classmethod
+    def calculate_damage_cached(
+        cls,
+        location: AdvancedHitLocation,
+        dc: int,
+        epen: float,
+        is_front: bool,
+    ) -> DamageRecord:
+        """Memoized calculate_damage returning a shared, immutable record.
+
+        Use DamageRecord.to_damage_result() to get a mutable copy.
+        """
+        return _damage_record_cache(location, dc, round(epen * cls.EPEN_STEPS_PER_UNIT), is_front)
+
+    @classmethod
+    def cache_info(cls) -> tuple[int, int, int | None, int]:
+        """(hits, misses, maxsize, currsize) of the damage record cache, as a named tuple."""
+        return _damage_record_cache.cache_info()
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        _damage_record_cache.cache_clear()
+
+    @classmethod
+    def set_cache_size(cls, maxsize: int | None) -> None:
+        """Replace the damage record cache with an empty one of the given size (None = unbounded)."""
+        global _damage_record_cache
+        _damage_record_cache = functools.lru_cache(maxsize=maxsize)(_compute_damage_record)
+
     @classmethod
     def calculate_damage(
         cls,
@@ -14,23 +53,14 @@ class AdvancedDamageCalculator:
         epen: float,
         is_front: bool,
     ) -> DamageResult:
-        table_references: list[int | str] = []
-        if '(' in location.value:
-            for part in location.value.split('(')[-1].rstrip(')').split('&'):
-                part = part.strip()
-                if part == 'Weapon':
-                    table_references.append('Weapon')
-                else:
-                    m = re.search(r'\d+', part)
-                    if m:
-                        table_references.append(int(m.group()))
+        if is_front:
+            table_references = CompiledTablesData.FRONT_REFERENCES[location]
+        else:
+            table_references = CompiledTablesData.REAR_REFERENCES[location]
 
         final_res = DamageResult(location=location)
         current_epen = epen
 
-        if not is_front:
-            table_references.reverse()
-
         for ref in table_references:
             if ref == 'Weapon':
                 if current_epen > 0:
@@ -38,21 +68,20 @@ class AdvancedDamageCalculator:
                     current_epen = max(0.0, current_epen - 10.0)
                 continue
 
-            data = TablesData.TABLES_DATA.get(ref)
-            if not data:
+            table = CompiledTablesData.TABLES.get(ref)
+            if table is None:
                 continue
 
-            thresholds = data["epen"]
-            dc_values = data["dc"].get(dc)
+            dc_values = table.damage.get(dc)
             if not dc_values:
                 continue
 
             final_res.excess_epen = 0.0
 
             if is_front:
-                cls._process_front_table(data, thresholds, dc_values, current_epen, final_res)
+                cls._process_front_table(table, dc_values, current_epen, final_res)
             else:
-                cls._process_rear_table(data, thresholds, dc_values, current_epen, final_res)
+                cls._process_rear_table(table, dc_values, current_epen, final_res)
 
             current_epen = final_res.excess_epen
 
@@ -61,24 +90,20 @@ class AdvancedDamageCalculator:
     @classmethod
     def _process_front_table(
         cls,
-        data: dict,
-        thresholds: list[float],
-        dc_values: list[str],
+        table: CompiledDamageTable,
+        dc_values: tuple[int, ...],
         epen: float,
         final_res: DamageResult,
     ) -> None:
-        penetration_idx = max(
-            (i for i, t in enumerate(thresholds) if epen >= t),
-            default=-1,
-        )
+        thresholds = table.thresholds
+        penetration_idx = bisect.bisect_right(thresholds, epen) - 1
 
         if penetration_idx >= 0:
-            final_res.damage += cls.parse_val(dc_values[penetration_idx])
-
-        path = range(penetration_idx + 1)
-        cls._collect_organs_along_path(data, thresholds, path, final_res, is_front=True)
-
-        final_res.shock += cls._calculate_front_shock(data, thresholds, path)
+            final_res.damage += dc_values[penetration_idx]
+            final_res.pierced_organs.extend(name for name, _ in table.front_organs[penetration_idx])
+            if table.front_disabled[penetration_idx]:
+                final_res.is_disabled = True
+            final_res.shock += table.shock_prefix_max[penetration_idx]
 
         if penetration_idx == len(thresholds) - 1:
             final_res.excess_epen = max(0.0, epen - thresholds[-1])
@@ -86,96 +111,40 @@ class AdvancedDamageCalculator:
     @classmethod
     def _process_rear_table(
         cls,
-        data: dict,
-        thresholds: list[float],
-        dc_values: list[str],
+        table: CompiledDamageTable,
+        dc_values: tuple[int, ...],
         epen: float,
         final_res: DamageResult,
     ) -> None:
+        thresholds = table.thresholds
         max_idx = len(thresholds) - 1
         max_threshold = thresholds[max_idx]
-        stop_threshold = max_threshold - epen
-
-        stop_idx = next(
-            (i for i in range(max_idx, -1, -1) if thresholds[i] <= stop_threshold),
-            -1,
-        )
+        stop_idx = bisect.bisect_right(thresholds, max_threshold - epen) - 1
 
-        max_val = cls.parse_val(dc_values[max_idx])
+        max_val = dc_values[max_idx]
         if stop_idx >= 0:
-            final_res.damage += max_val - cls.parse_val(dc_values[stop_idx])
+            final_res.damage += max_val - dc_values[stop_idx]
+            max_unreached = table.shock_prefix_max[stop_idx]
         else:
             final_res.damage += max_val
             final_res.excess_epen = epen - max_threshold
+            max_unreached = 0
 
-        path = range(max_idx, stop_idx, -1)
-        cls._collect_organs_along_path(data, thresholds, path, final_res, is_front=False)
+        if stop_idx < max_idx:
+            final_res.pierced_organs.extend(name for name, _ in table.rear_organs[stop_idx + 1])
+            if table.rear_disabled[stop_idx + 1]:
+                final_res.is_disabled = True
 
-        final_res.shock += cls._calculate_rear_shock(data, thresholds, stop_idx)
+        final_res.shock += max(0, table.max_shock - max_unreached)
 
-    @classmethod
-    def _collect_organs_along_path(
-        cls,
-        data: dict,
-        thresholds: list[float],
-        path: range,
-        final_res: DamageResult,
-        *,
-        is_front: bool,
-    ) -> None:
-        for idx in path:
-            current_threshold = thresholds[idx]
-            for start, end, name, is_gray in data["organs"]:
-                boundary = start if is_front else end
-                if current_threshold == boundary:
-                    final_res.pierced_organs.append(name)
-                    if is_gray:
-                        final_res.is_disabled = True
+    @staticmethod
+    def parse_val(val: str) -> int:
+        return parse_table_value(val)
 
-    @classmethod
-    def _calculate_front_shock(
-        cls,
-        data: dict,
-        thresholds: list[float],
-        path: range,
-    ) -> int:
-        return max(
-            (
-                cls.parse_val(data["shock"][thresholds[i]])
-                for i in path
-                if thresholds[i] in data["shock"]
-            ),
-            default=0,
-        )
 
-    @classmethod
-    def _calculate_rear_shock(
-        cls,
-        data: dict,
-        thresholds: list[float],
-        stop_idx: int,
-    ) -> int:
-        max_shock = max(
-            (cls.parse_val(data["shock"][t]) for t in thresholds if t in data["shock"]),
-            default=0,
-        )
-        max_unreached = max(
-            (
-                cls.parse_val(data["shock"][thresholds[i]])
-                for i in range(stop_idx + 1)
-                if thresholds[i] in data["shock"]
-            ),
-            default=0,
-        )
-        return max(0, max_shock - max_unreached)
+def _compute_damage_record(location: AdvancedHitLocation, dc: int, epen_steps: int, is_front: bool) -> DamageRecord:
+    epen = epen_steps / AdvancedDamageCalculator.EPEN_STEPS_PER_UNIT
+    return DamageRecord.from_damage_result(AdvancedDamageCalculator.calculate_damage(location, dc, epen, is_front))
 
-    @staticmethod
-    def parse_val(val: str) -> int:
-        if not val or val == '-':
-            return 0
-        multipliers = {'H': 100, 'K': 1_000, 'T': 10_000, 'X': 100_000, 'M': 1_000_000}
-        val = val.strip()
-        suffix = val[-1]
-        if suffix in multipliers:
-            return int(float(val[:-1]) * multipliers[suffix])
-        return int(val)
\ No newline at end of file
+
+_damage_record_cache = functools.lru_cache(maxsize=AdvancedDamageCalculator.DEFAULT_CACHE_SIZE)(_compute_damage_record)
@@ -0,0 +1,101 @@
+import re
+from dataclasses import dataclass
+
+from phoenix_command.models.enums import AdvancedHitLocation
+from phoenix_command.tables.advanced_damage_tables.tables_data import TablesData
+
+_MULTIPLIERS = {'H': 100, 'K': 1_000, 'T': 10_000, 'X': 100_000, 'M': 1_000_000}
+
+Organ = tuple[str, bool]  # (name, is_gray)
+
+
+def parse_table_value(val: str) -> int:
+    """Parse a damage table cell such as "29K" or "15X" into an integer."""
+    if not val or val == '-':
+        return 0
+    val = val.strip()
+    suffix = val[-1]
+    if suffix in _MULTIPLIERS:
+        return int(float(val[:-1]) * _MULTIPLIERS[suffix])
+    return int(val)
+
+
+@dataclass(frozen=True)
+class CompiledDamageTable:
+    """Numeric form of one TABLES_DATA entry, indexed by EPEN threshold position.
+
+    Per-index arrays are precomputed along both directions a bullet can travel:
+    front hits accumulate from index 0 upwards, rear hits from the last index downwards.
+    """
+    thresholds: tuple[float, ...]
+    damage: dict[int, tuple[int, ...]]  # DC -> damage at each threshold
+    shock_prefix_max: tuple[int, ...]  # Max shock over thresholds[0..i]
+    max_shock: int
+    front_organs: tuple[tuple[Organ, ...], ...]  # Organs entered crossing thresholds[0..i], in path order
+    front_disabled: tuple[bool, ...]
+    rear_organs: tuple[tuple[Organ, ...], ...]  # Organs exited crossing thresholds[last..i], in path order
+    rear_disabled: tuple[bool, ...]
+
+
+def _compile_table(data: dict) -> CompiledDamageTable:
+    thresholds = tuple(data["epen"])
+    shock = data["shock"]
+    organs = data["organs"]
+
+    shock_prefix_max = []
+    running = 0
+    for t in thresholds:
+        if t in shock:
+            running = max(running, parse_table_value(shock[t]))
+        shock_prefix_max.append(running)
+
+    front_organs = []
+    path: list[Organ] = []
+    for t in thresholds:
+        path.extend((name, is_gray) for start, _, name, is_gray in organs if start == t)
+        front_organs.append(tuple(path))
+
+    rear_organs: list[tuple[Organ, ...]] = [()] * len(thresholds)
+    path = []
+    for i in range(len(thresholds) - 1, -1, -1):
+        path.extend((name, is_gray) for _, end, name, is_gray in organs if end == thresholds[i])
+        rear_organs[i] = tuple(path)
+
+    return CompiledDamageTable(
+        thresholds=thresholds,
+        damage={dc: tuple(parse_table_value(v) for v in values) for dc, values in data["dc"].items()},
+        shock_prefix_max=tuple(shock_prefix_max),
+        max_shock=max((parse_table_value(shock[t]) for t in thresholds if t in shock), default=0),
+        front_organs=tuple(front_organs),
+        front_disabled=tuple(any(gray for _, gray in o) for o in front_organs),
+        rear_organs=tuple(rear_organs),
+        rear_disabled=tuple(any(gray for _, gray in o) for o in rear_organs),
+    )
+
+
+def _table_references(location: AdvancedHitLocation) -> tuple[int | str, ...]:
+    """Table references named in a location label, e.g. "(Table 12 & Weapon)" -> (12, 'Weapon')."""
+    references: list[int | str] = []
+    if '(' in location.value:
+        for part in location.value.split('(')[-1].rstrip(')').split('&'):
+            part = part.strip()
+            if part == 'Weapon':
+                references.append('Weapon')
+            else:
+                m = re.search(r'\d+', part)
+                if m:
+                    references.append(int(m.group()))
+    return tuple(references)
+
+
+class CompiledTablesData:
+    """One-time compiled view of TablesData.TABLES_DATA used by AdvancedDamageCalculator."""
+    TABLES: dict[int, CompiledDamageTable] = {
+        table_id: _compile_table(data) for table_id, data in TablesData.TABLES_DATA.items()
+    }
+    FRONT_REFERENCES: dict[AdvancedHitLocation, tuple[int | str, ...]] = {
+        location: _table_references(location) for location in AdvancedHitLocation
+    }
+    REAR_REFERENCES: dict[AdvancedHitLocation, tuple[int | str, ...]] = {
+        location: refs[::-1] for location, refs in FRONT_REFERENCES.items()
+    }
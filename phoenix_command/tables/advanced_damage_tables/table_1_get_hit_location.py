@@ -1,37 +1,181 @@
+import bisect
 import random
+from dataclasses import dataclass
 
 from phoenix_command.models.enums import TargetExposure, AdvancedHitLocation, TargetOrientation
 
 
+@dataclass(frozen=True)
+class CompiledHitLocationTable:
+    """Cumulative-distribution form of one (orientation, exposure) hit location column.
+
+    Consecutive rolls resolving to the same location are merged into one segment, so a roll
+    is resolved with a single bisect over ``upper_rolls``.
+    """
+    roll_min: int
+    roll_max: int
+    upper_rolls: tuple[int, ...]  # Inclusive last roll of each segment, ascending
+    locations: tuple[AdvancedHitLocation, ...]  # Location of each segment
+    cum_weights: tuple[int, ...]  # Number of rolls covered up to and including each segment
+
+    def resolve(self, roll: int) -> AdvancedHitLocation:
+        """Map a roll in [roll_min, roll_max] to its hit location."""
+        return self.locations[bisect.bisect_left(self.upper_rolls, roll)]
+
+    def sample(self, rng: random.Random | None = None) -> AdvancedHitLocation:
+        """Roll once and resolve the hit location."""
+        return self.resolve((rng or random).randint(self.roll_min, self.roll_max))
+
+    def sample_many(self, n: int, rng: random.Random | None = None) -> list[AdvancedHitLocation]:
+        """Draw n independent hit locations in one call."""
+        return (rng or random).choices(self.locations, cum_weights=self.cum_weights, k=n)
+
+    def probabilities(self) -> dict[AdvancedHitLocation, float]:
+        """Probability of each location for a uniform roll over the column."""
+        total = self.cum_weights[-1]
+        result: dict[AdvancedHitLocation, float] = {}
+        previous = 0
+        for location, cumulative in zip(self.locations, self.cum_weights):
+            result[location] = result.get(location, 0.0) + (cumulative - previous) / total
+            previous = cumulative
+        return result
+
+
 class Table1AdvancedDamageHitLocation:
+    # Inclusive d1000 roll window used "in the open" when only part of the target is exposed.
+    # HEAD covers the head/neck rows, BODY shoulders, arms, torso and pelvis, LEGS hips and legs,
+    # and ARMS shoulders, hands and arms with weapon. Other open exposures roll the full 000-999
+    # column; cover exposures roll their own d100 column.
+    OPEN_ROLL_RANGES: dict[TargetOrientation, dict[TargetExposure, tuple[int, int]]] = {
+        TargetOrientation.FRONT_REAR: {
+            TargetExposure.HEAD: (0, 59),
+            TargetExposure.BODY: (60, 533),
+            TargetExposure.LEGS: (534, 999),
+            TargetExposure.ARMS: (60, 166),
+        },
+        TargetOrientation.OBLIQUE: {
+            TargetExposure.HEAD: (0, 63),
+            TargetExposure.BODY: (64, 498),
+            TargetExposure.LEGS: (499, 999),
+            TargetExposure.ARMS: (64, 195),
+        },
+        TargetOrientation.RIGHT_SIDE: {
+            TargetExposure.HEAD: (0, 77),
+            TargetExposure.BODY: (78, 460),
+            TargetExposure.LEGS: (461, 999),
+            TargetExposure.ARMS: (78, 209),
+        },
+        TargetOrientation.LEFT_SIDE: {
+            TargetExposure.HEAD: (0, 77),
+            TargetExposure.BODY: (78, 460),
+            TargetExposure.LEGS: (461, 999),
+            TargetExposure.ARMS: (78, 209),
+        },
+    }
+
+    _compiled_tables: dict[tuple[TargetOrientation, TargetExposure], CompiledHitLocationTable] = {}
 
     @classmethod
     def get_hit_location(
         cls,
         exposure: TargetExposure,
-        orientation: TargetOrientation
+        orientation: TargetOrientation,
+        rng: random.Random | None = None,
     ) -> AdvancedHitLocation:
         """Get hit location based on target exposure and orientation."""
-        if orientation == TargetOrientation.FRONT_REAR:
-            return cls.get_hit_location_front_rear(exposure)
-        elif orientation == TargetOrientation.OBLIQUE:
-            return cls.get_hit_location_oblique(exposure)
-        elif orientation == TargetOrientation.RIGHT_SIDE:
-            return cls.get_hit_location_right_side(exposure)
-        elif orientation == TargetOrientation.LEFT_SIDE:
-            return cls.get_hit_location_left_side(exposure)
-        else:
-            return cls.get_hit_location_front_rear(exposure)
+        return cls.get_compiled_table(exposure, orientation).sample(rng)
+
+    @classmethod
+    def get_hit_location_front_rear(cls, exposure: TargetExposure, rng: random.Random | None = None) -> AdvancedHitLocation:
+        """Roll a hit location for FRONT/REAR fire."""
+        return cls.get_compiled_table(exposure, TargetOrientation.FRONT_REAR).sample(rng)
+
+    @classmethod
+    def get_hit_location_oblique(cls, exposure: TargetExposure, rng: random.Random | None = None) -> AdvancedHitLocation:
+        """Roll a hit location for OBLIQUE fire (Table 4F)."""
+        return cls.get_compiled_table(exposure, TargetOrientation.OBLIQUE).sample(rng)
+
+    @classmethod
+    def get_hit_location_right_side(cls, exposure: TargetExposure, rng: random.Random | None = None) -> AdvancedHitLocation:
+        """Roll a hit location for right SIDE fire (Table 1C / 4G)."""
+        return cls.get_compiled_table(exposure, TargetOrientation.RIGHT_SIDE).sample(rng)
+
+    @classmethod
+    def get_hit_location_left_side(cls, exposure: TargetExposure, rng: random.Random | None = None) -> AdvancedHitLocation:
+        """Roll a hit location for left SIDE fire (Table 1C / 4G)."""
+        return cls.get_compiled_table(exposure, TargetOrientation.LEFT_SIDE).sample(rng)
+
+    @classmethod
+    def sample_hit_locations(
+        cls,
+        exposure: TargetExposure,
+        orientation: TargetOrientation,
+        n: int,
+        rng: random.Random | None = None,
+    ) -> list[AdvancedHitLocation]:
+        """Draw n hit locations at once, e.g. for shrapnel or burst hits on one target."""
+        return cls.get_compiled_table(exposure, orientation).sample_many(n, rng)
+
+    @classmethod
+    def get_roll_range(cls, exposure: TargetExposure, orientation: TargetOrientation) -> tuple[int, int]:
+        """Inclusive roll window used for the given exposure and orientation."""
+        if exposure in (TargetExposure.LOOKING_OVER_COVER, TargetExposure.FIRING_OVER_COVER):
+            return 0, 99
+        return cls.OPEN_ROLL_RANGES[orientation].get(exposure, (0, 999))
+
+    @classmethod
+    def get_compiled_table(
+        cls,
+        exposure: TargetExposure,
+        orientation: TargetOrientation,
+    ) -> CompiledHitLocationTable:
+        """Compiled column for (orientation, exposure), built on first use from the resolvers below."""
+        if orientation not in cls.OPEN_ROLL_RANGES:
+            orientation = TargetOrientation.FRONT_REAR
+        key = (orientation, exposure)
+        table = cls._compiled_tables.get(key)
+        if table is None:
+            table = cls._compile_table(exposure, orientation)
+            cls._compiled_tables[key] = table
+        return table
+
+    @classmethod
+    def _compile_table(cls, exposure: TargetExposure, orientation: TargetOrientation) -> CompiledHitLocationTable:
+        resolve = {
+            TargetOrientation.FRONT_REAR: cls._resolve_front_rear,
+            TargetOrientation.OBLIQUE: cls._resolve_oblique,
+            TargetOrientation.RIGHT_SIDE: cls._resolve_right_side,
+            TargetOrientation.LEFT_SIDE: cls._resolve_left_side,
+        }[orientation]
+        roll_min, roll_max = cls.get_roll_range(exposure, orientation)
+
+        upper_rolls: list[int] = []
+        locations: list[AdvancedHitLocation] = []
+        for roll in range(roll_min, roll_max + 1):
+            location = resolve(exposure, roll)
+            if locations and locations[-1] == location:
+                upper_rolls[-1] = roll
+            else:
+                upper_rolls.append(roll)
+                locations.append(location)
+
+        return CompiledHitLocationTable(
+            roll_min=roll_min,
+            roll_max=roll_max,
+            upper_rolls=tuple(upper_rolls),
+            locations=tuple(locations),
+            cum_weights=tuple(upper - roll_min + 1 for upper in upper_rolls),
+        )
 
     @classmethod
-    def get_hit_location_front_rear(cls, exposure: TargetExposure) -> AdvancedHitLocation:
+    def _resolve_front_rear(cls, exposure: TargetExposure, roll: int) -> AdvancedHitLocation:
         """
-        Generates a random roll internally and determines hit location.
+        Resolve a front/rear roll to a hit location.
 
         Logic:
         1. Looking/Firing Over Cover -> Uses specific d100 columns.
-        2. Head/Body/Legs -> Uses "In The Open" column but restricts the random range
-           to focus on those areas (Invented Logic based on table distribution).
+        2. Head/Body/Legs/Arms -> Uses "In The Open" column; the roll window is restricted
+           by OPEN_ROLL_RANGES (Invented Logic based on table distribution).
         3. Other -> Uses full "In The Open" d1000 column (0-999).
         """
 
@@ -39,14 +183,12 @@ class Table1AdvancedDamageHitLocation:
         # 1. LOGIC FOR COVER (d100 Tables)
         # ---------------------------------------------------------
         if exposure == TargetExposure.LOOKING_OVER_COVER:
-            roll = random.randint(0, 99)
             if 0 <= roll <= 11: return AdvancedHitLocation.HEAD_GLANCE
             if 12 <= roll <= 77: return AdvancedHitLocation.FOREHEAD
             if 78 <= roll <= 99: return AdvancedHitLocation.EYE_NOSE
             return AdvancedHitLocation.MISS
 
         elif exposure == TargetExposure.FIRING_OVER_COVER:
-            roll = random.randint(0, 99)
             if 0 <= roll <= 2: return AdvancedHitLocation.HEAD_GLANCE
             if 3 <= roll <= 16: return AdvancedHitLocation.FOREHEAD
             if 17 <= roll <= 21: return AdvancedHitLocation.EYE_NOSE
@@ -84,23 +226,6 @@ class Table1AdvancedDamageHitLocation:
         # 2. LOGIC FOR "IN THE OPEN" (d1000 Table)
         # ---------------------------------------------------------
         else:
-            # Determine the range for the random roll based on target
-            if exposure == TargetExposure.HEAD:
-                # Table 000-059 represents head/neck area
-                roll = random.randint(0, 59)
-            elif exposure == TargetExposure.BODY:
-                # Table 060-533 represents shoulders, arms, torso, pelvis
-                roll = random.randint(60, 533)
-            elif exposure == TargetExposure.LEGS:
-                # Table 534-999 represents hips and legs
-                roll = random.randint(534, 999)
-            elif exposure == TargetExposure.ARMS:
-                # Table 060-166 represents shoulders, hands and arms with weapon
-                roll = random.randint(60, 166)
-            else:
-                # Full table for general exposure
-                roll = random.randint(0, 999)
-
             # Mapping Logic (Left column usually 1st range, Right column 2nd range)
 
             if 0 <= roll <= 4: return AdvancedHitLocation.HEAD_GLANCE
@@ -193,23 +318,21 @@ class Table1AdvancedDamageHitLocation:
             return AdvancedHitLocation.MISS
 
     @classmethod
-    def get_hit_location_oblique(cls, exposure: TargetExposure) -> AdvancedHitLocation:
+    def _resolve_oblique(cls, exposure: TargetExposure, roll: int) -> AdvancedHitLocation:
         """
-        Generates a random roll for OBLIQUE fire (Table 4F).
+        Resolve a roll for OBLIQUE fire (Table 4F) to a hit location.
         """
 
         # ---------------------------------------------------------
         # 1. LOGIC FOR COVER (d100 Tables)
         # ---------------------------------------------------------
         if exposure == TargetExposure.LOOKING_OVER_COVER:
-            roll = random.randint(0, 99)
             if 0 <= roll <= 10: return AdvancedHitLocation.HEAD_GLANCE
             if 11 <= roll <= 81: return AdvancedHitLocation.FOREHEAD_SIDE
             if 82 <= roll <= 99: return AdvancedHitLocation.EYE_NOSE
             return AdvancedHitLocation.MISS
 
         elif exposure == TargetExposure.FIRING_OVER_COVER:
-            roll = random.randint(0, 99)
             if 0 <= roll <= 2: return AdvancedHitLocation.HEAD_GLANCE
             if 3 <= roll <= 15: return AdvancedHitLocation.FOREHEAD_SIDE
             if 16 <= roll <= 19: return AdvancedHitLocation.EYE_NOSE
@@ -255,18 +378,6 @@ class Table1AdvancedDamageHitLocation:
         # 2. LOGIC FOR "IN THE OPEN" (d1000 Table) - OBLIQUE
         # ---------------------------------------------------------
         else:
-            # Determine the range for the random roll based on target
-            if exposure == TargetExposure.HEAD:
-                roll = random.randint(0, 63)
-            elif exposure == TargetExposure.BODY:
-                roll = random.randint(64, 498)
-            elif exposure == TargetExposure.LEGS:
-                roll = random.randint(499, 999)
-            elif exposure == TargetExposure.ARMS:
-                roll = random.randint(64, 195)
-            else:
-                roll = random.randint(0, 999)
-
             # Hit Location Mapping (Table 4F)
             if 0 <= roll <= 5: return AdvancedHitLocation.HEAD_GLANCE
             if 6 <= roll <= 29: return AdvancedHitLocation.FOREHEAD_SIDE
@@ -359,22 +470,20 @@ class Table1AdvancedDamageHitLocation:
             return AdvancedHitLocation.MISS
 
     @classmethod
-    def get_hit_location_right_side(cls, exposure: TargetExposure) -> AdvancedHitLocation:
+    def _resolve_right_side(cls, exposure: TargetExposure, roll: int) -> AdvancedHitLocation:
         """
-        Generates a random roll for right SIDE fire (Table 1C / 4G).
+        Resolve a roll for right SIDE fire (Table 1C / 4G) to a hit location.
         """
 
         # ---------------------------------------------------------
         # 1. LOGIC FOR COVER (d100 Tables)
         # ---------------------------------------------------------
         if exposure == TargetExposure.LOOKING_OVER_COVER:
-            roll = random.randint(0, 99)
             if 0 <= roll <= 11: return AdvancedHitLocation.HEAD_GLANCE
             if 12 <= roll <= 87: return AdvancedHitLocation.SKULL_SIDE
             if 88 <= roll <= 99: return AdvancedHitLocation.EYE_SIDE
             return AdvancedHitLocation.MISS
         elif exposure == TargetExposure.FIRING_OVER_COVER:
-            roll = random.randint(0, 99)
             if 0 <= roll <= 2: return AdvancedHitLocation.HEAD_GLANCE
             if 3 <= roll <= 14: return AdvancedHitLocation.SKULL_SIDE
             if 15 <= roll <= 16: return AdvancedHitLocation.EYE_SIDE
@@ -400,17 +509,6 @@ class Table1AdvancedDamageHitLocation:
         # 2. LOGIC FOR "IN THE OPEN" (d1000 Table)
         # ---------------------------------------------------------
         else:
-            # Range determination based on exposure
-            if exposure == TargetExposure.HEAD:
-                roll = random.randint(0, 77)
-            elif exposure == TargetExposure.BODY:
-                roll = random.randint(78, 460)
-            elif exposure == TargetExposure.LEGS:
-                roll = random.randint(461, 999)
-            elif exposure == TargetExposure.ARMS:
-                roll = random.randint(78, 209)
-            else:
-                roll = random.randint(0, 999)
             if 0 <= roll <= 5: return AdvancedHitLocation.HEAD_GLANCE
             if 6 <= roll <= 31: return AdvancedHitLocation.SKULL_SIDE
             if 32 <= roll <= 35: return AdvancedHitLocation.EYE_SIDE
@@ -477,22 +575,20 @@ class Table1AdvancedDamageHitLocation:
             return AdvancedHitLocation.MISS
 
     @classmethod
-    def get_hit_location_left_side(cls, exposure: TargetExposure) -> AdvancedHitLocation:
+    def _resolve_left_side(cls, exposure: TargetExposure, roll: int) -> AdvancedHitLocation:
         """
-        Generates a random roll for left SIDE fire (Table 1C / 4G).
+        Resolve a roll for left SIDE fire (Table 1C / 4G) to a hit location.
         """
 
         # ---------------------------------------------------------
         # 1. LOGIC FOR COVER (d100 Tables)
         # ---------------------------------------------------------
         if exposure == TargetExposure.LOOKING_OVER_COVER:
-            roll = random.randint(0, 99)
             if 0 <= roll <= 11: return AdvancedHitLocation.HEAD_GLANCE
             if 12 <= roll <= 87: return AdvancedHitLocation.SKULL_SIDE
             if 88 <= roll <= 99: return AdvancedHitLocation.EYE_SIDE
             return AdvancedHitLocation.MISS
         elif exposure == TargetExposure.FIRING_OVER_COVER:
-            roll = random.randint(0, 99)
             if 0 <= roll <= 2: return AdvancedHitLocation.HEAD_GLANCE
             if 3 <= roll <= 14: return AdvancedHitLocation.SKULL_SIDE
             if 15 <= roll <= 16: return AdvancedHitLocation.EYE_SIDE
@@ -518,17 +614,6 @@ class Table1AdvancedDamageHitLocation:
         # 2. LOGIC FOR "IN THE OPEN" (d1000 Table)
         # ---------------------------------------------------------
         else:
-            # Range determination based on exposure
-            if exposure == TargetExposure.HEAD:
-                roll = random.randint(0, 77)
-            elif exposure == TargetExposure.BODY:
-                roll = random.randint(78, 460)
-            elif exposure == TargetExposure.LEGS:
-                roll = random.randint(461, 999)
-            elif exposure == TargetExposure.ARMS:
-                roll = random.randint(78, 209)
-            else:
-                roll = random.randint(0, 999)
             if 0 <= roll <= 5: return AdvancedHitLocation.HEAD_GLANCE
             if 6 <= roll <= 31: return AdvancedHitLocation.SKULL_SIDE
             if 32 <= roll <= 35: return AdvancedHitLocation.EYE_SIDE
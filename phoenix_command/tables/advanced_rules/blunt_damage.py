@@ -1,131 +1,196 @@
+import bisect
+from typing import Dict, FrozenSet, Iterable, List, Tuple, Union
+
 from phoenix_command.models.enums import AdvancedHitLocation
 
 
+def _parse_blunt_value(val: Union[int, str]) -> int:
+    if val == "-": return 0
+    if isinstance(val, int): return val
+    if "H" in val: return int(val.replace("H", "")) * 100
+    if "K" in val: return int(val.replace("K", "")) * 1000
+    return int(val)
+
+
+def _compile_blunt_matrix(table: Dict[int, list]) -> Tuple[Tuple[int, ...], ...]:
+    """Return integer damage indexed as [bpf_idx][pen row], rows in ascending PEN order."""
+    rows = [[_parse_blunt_value(v) for v in table[pen]] for pen in sorted(table)]
+    return tuple(tuple(row[bpf_idx] for row in rows) for bpf_idx in range(len(rows[0])))
+
+
+def _compile_location_groups(
+    head: FrozenSet[AdvancedHitLocation], torso: FrozenSet[AdvancedHitLocation]
+) -> Dict[AdvancedHitLocation, int]:
+    return {
+        location: 0 if location in head else 1 if location in torso else 2
+        for location in AdvancedHitLocation
+    }
+
+
 class Table9ABluntDamage:
 
+    # Head, neck and heart locations share the most lethal table
+    HEAD_LOCATIONS = frozenset((
+        AdvancedHitLocation.HEAD_GLANCE,
+        AdvancedHitLocation.SKULL_SIDE,
+        AdvancedHitLocation.FOREHEAD,
+        AdvancedHitLocation.FOREHEAD_SIDE,
+        AdvancedHitLocation.EYE_NOSE,
+        AdvancedHitLocation.EYE_SIDE,
+        AdvancedHitLocation.MOUTH,
+        AdvancedHitLocation.JAW_SIDE,
+        AdvancedHitLocation.NECK_FLESH,
+        AdvancedHitLocation.NECK_THROAT,
+        AdvancedHitLocation.BASE_OF_SKULL_SIDE,
+        AdvancedHitLocation.NECK_THROAT_SIDE,
+        AdvancedHitLocation.NECK_SPINE_SIDE,
+        AdvancedHitLocation.HEART_RIB_SIDE,
+        AdvancedHitLocation.HEART_SIDE,
+        AdvancedHitLocation.HEART,
+    ))
+    TORSO_LOCATIONS = frozenset((
+        AdvancedHitLocation.LUNG_RIB,
+        AdvancedHitLocation.LUNG,
+        AdvancedHitLocation.LIVER_RIB,
+        AdvancedHitLocation.LIVER,
+        AdvancedHitLocation.STOMACH_RIB,
+        AdvancedHitLocation.STOMACH,
+        AdvancedHitLocation.STOMACH_SPLEEN,
+        AdvancedHitLocation.STOMACH_KIDNEY,
+        AdvancedHitLocation.LIVER_KIDNEY,
+        AdvancedHitLocation.LIVER_SPINE,
+        AdvancedHitLocation.INTESTINES,
+        AdvancedHitLocation.SPINE,
+        AdvancedHitLocation.PELVIS,
+        AdvancedHitLocation.LUNG_SIDE,
+        AdvancedHitLocation.LUNG_RIB_SIDE,
+        AdvancedHitLocation.SPINE_SIDE,
+        AdvancedHitLocation.STOMACH_LIVER_RIB_SIDE,
+        AdvancedHitLocation.STOMACH_LIVER_SIDE,
+        AdvancedHitLocation.SPLEEN_LIVER_SIDE,
+        AdvancedHitLocation.KIDNEY_SPINE_SIDE,
+        AdvancedHitLocation.INTESTINES_SIDE,
+        AdvancedHitLocation.INTESTINES_SPINE_SIDE,
+        AdvancedHitLocation.PELVIS_SIDE,
+    ))
+
+    # PEN -> blunt damage for BPF 10..1
+    HEAD_TABLE_9A = {
+        1: ["-", "-", "-", "-", "-", "-", "-", "-", 1, 1],
+        2: ["-", "-", "-", "-", "-", "-", "-", 1, 2, 8],
+        3: ["-", "-", "-", "-", "-", "-", "-", 1, 40, 64],
+        4: ["-", "-", "-", "-", "-", "-", "-", 14, 87, "1H"],
+        5: ["-", "-", "-", "-", "-", "-", "-", 56, "2H", "3H"],
+        6: ["-", "-", "-", "-", "-", "-", "-", 84, "3H", "5H"],
+        7: ["-", "-", "-", "-", "-", "-", "-", "1H", "5H", "8H"],
+        8: ["-", "-", "-", "-", "-", "-", "-", "2H", "8H", "1K"],
+        10: ["-", "-", "-", "-", "-", "-", "-", "4H", "1K", "2K"],
+        12: ["-", "-", "-", "-", "-", "-", "-", "7H", "2K", "3K"],
+        14: ["-", "-", "-", "-", "-", "-", "-", "1K", "2K", "3K"],
+        16: ["-", "-", "-", "-", "-", "-", "-", "2K", "3K", "4K"],
+        20: ["-", "-", "-", "-", "-", 1, 1, "3K", "5K", "6K"],
+        30: ["-", "-", "-", 1, 1, 1, 2, "4K", "6K", "10K"],
+        50: [1, 1, 1, 2, 2, 2, 3, "5K", "7K", "12K"],
+        70: [1, 1, 2, 2, 3, 4, 4, "6K", "12K", "18K"],
+        90: [1, 2, 2, 3, 4, 5, "3K", "7K", "14K", "21K"]
+    }
+    TORSO_TABLE_9A = {
+        1: ["-", "-", "-", "-", "-", "-", "-", 1, 1, 1],
+        2: ["-", "-", "-", "-", "-", "-", "-", 1, 2, 3],
+        3: ["-", "-", "-", "-", "-", "-", "-", 2, 5, 7],
+        4: ["-", "-", "-", "-", "-", "-", "-", 4, 10, 15],
+        5: ["-", "-", "-", "-", "-", "-", "-", 6, 17, 23],
+        6: ["-", "-", "-", "-", "-", "-", "-", 10, 26, 36],
+        7: ["-", "-", "-", "-", "-", "-", 1, 14, 37, 54],
+        8: ["-", "-", "-", "-", "-", "-", 1, 18, 53, "-"],
+        10: ["-", "-", "-", "-", "-", "-", 1, 1, 31, 93],
+        12: ["-", "-", "-", "-", "-", 1, 1, 1, 49, "1H"],
+        14: ["-", "-", "-", "-", 1, 1, 1, 1, 72, "1H"],
+        16: ["-", "-", "-", "-", 1, 1, 1, 1, "1H", "2H"],
+        20: ["-", "-", "-", 1, 1, 1, 1, 1, "2H", "4H"],
+        30: [1, 1, 1, 1, 1, 2, 2, 4, 16, 64],
+        50: [1, 1, 2, 2, 2, 3, 4, 16, 64, "3H"],
+        70: [1, 2, 2, 3, 3, 4, 5, 20, "1H", "4H"],
+        90: [2, 2, 3, 3, 3, 5, 7, "1H", "2H", "8H"]
+    }
+    # Limbs and every other location
+    LIMB_TABLE_9A = {
+        1: ["-", "-", "-", "-", "-", "-", "-", 1, 1, 1],
+        2: ["-", "-", "-", "-", "-", "-", "-", 1, 2, 3],
+        3: ["-", "-", "-", "-", "-", "-", "-", 2, 5, 7],
+        4: ["-", "-", "-", "-", "-", "-", "-", 4, 10, 14],
+        5: ["-", "-", "-", "-", "-", "-", "-", 6, 16, 24],
+        6: ["-", "-", "-", "-", "-", "-", "-", 10, 24, 35],
+        7: ["-", "-", "-", "-", "-", "-", "-", 14, 34, 50],
+        8: ["-", "-", "-", "-", "-", "-", "-", 18, 46, 67],
+        10: ["-", "-", "-", "-", "-", "-", "-", 1, 30, 74],
+        12: ["-", "-", "-", "-", "-", "-", "-", 1, 38, "1H"],
+        14: ["-", "-", "-", "-", "-", 1, 1, 1, 46, "2H"],
+        16: ["-", "-", "-", "-", "-", 1, 1, 1, 55, "3H"],
+        20: ["-", "-", "-", "-", 1, 1, 1, 1, 2, 8],
+        30: ["-", "-", "-", 1, 1, 1, 1, 2, 8, 64],
+        50: [1, 1, 1, 1, 2, 2, 3, 27, "1H", "4H"],
+        70: [1, 1, 1, 2, 2, 3, 4, 64, "2H", "5H"],
+        90: [1, 1, 2, 2, 3, 3, 5, "1H", "3H", "6H"]
+    }
+
+    # All three tables share the same PEN rows
+    PEN_KEYS_9A = tuple(sorted(HEAD_TABLE_9A))
+    MATRICES_9A = (
+        _compile_blunt_matrix(HEAD_TABLE_9A),
+        _compile_blunt_matrix(TORSO_TABLE_9A),
+        _compile_blunt_matrix(LIMB_TABLE_9A),
+    )
+    _LOCATION_GROUPS = _compile_location_groups(HEAD_LOCATIONS, TORSO_LOCATIONS)
+
+    @classmethod
+    def get_location_group(cls, location: AdvancedHitLocation) -> int:
+        """Return the Table 9A group of a location: 0 head/neck/heart, 1 torso, 2 limbs and other."""
+        return cls._LOCATION_GROUPS.get(location, 2)
+
+    @classmethod
+    def _interpolate(cls, column: Tuple[int, ...], pen: float) -> int:
+        keys = cls.PEN_KEYS_9A
+        if pen >= keys[-1]:
+            return column[-1]
+        if pen <= keys[0]:
+            return column[0]
+        i = bisect.bisect_left(keys, pen)
+        if keys[i] == pen:
+            return column[i]
+        x0, x1 = keys[i - 1], keys[i]
+        y0, y1 = column[i - 1], column[i]
+        res = y0 + (pen - x0) * (y1 - y0) / (x1 - x0)
+        return round(res)
+
     @classmethod
     def get_blunt_damage(cls, location: AdvancedHitLocation, bpf: int, pen: float) -> int:
         if bpf > 10:
             return 0
         bpf = max(1, bpf)
         bpf_idx = 10 - bpf
-        def parse_val(val):
-            if val == "-": return 0
-            if isinstance(val, int): return val
-            if "H" in val: return int(val.replace("H", "")) * 100
-            if "K" in val: return int(val.replace("K", "")) * 1000
-            return int(val)
-
-        if location in (AdvancedHitLocation.HEAD_GLANCE,
-                        AdvancedHitLocation.SKULL_SIDE,
-                        AdvancedHitLocation.FOREHEAD,
-                        AdvancedHitLocation.FOREHEAD_SIDE,
-                        AdvancedHitLocation.EYE_NOSE,
-                        AdvancedHitLocation.EYE_SIDE,
-                        AdvancedHitLocation.MOUTH,
-                        AdvancedHitLocation.JAW_SIDE,
-                        AdvancedHitLocation.NECK_FLESH,
-                        AdvancedHitLocation.NECK_THROAT,
-                        AdvancedHitLocation.BASE_OF_SKULL_SIDE,
-                        AdvancedHitLocation.NECK_THROAT_SIDE,
-                        AdvancedHitLocation.NECK_SPINE_SIDE,
-                        AdvancedHitLocation.HEART_RIB_SIDE,
-                        AdvancedHitLocation.HEART_SIDE,
-                        AdvancedHitLocation.HEART):
-            data = {
-                1: ["-", "-", "-", "-", "-", "-", "-", "-", 1, 1],
-                2: ["-", "-", "-", "-", "-", "-", "-", 1, 2, 8],
-                3: ["-", "-", "-", "-", "-", "-", "-", 1, 40, 64],
-                4: ["-", "-", "-", "-", "-", "-", "-", 14, 87, "1H"],
-                5: ["-", "-", "-", "-", "-", "-", "-", 56, "2H", "3H"],
-                6: ["-", "-", "-", "-", "-", "-", "-", 84, "3H", "5H"],
-                7: ["-", "-", "-", "-", "-", "-", "-", "1H", "5H", "8H"],
-                8: ["-", "-", "-", "-", "-", "-", "-", "2H", "8H", "1K"],
-                10: ["-", "-", "-", "-", "-", "-", "-", "4H", "1K", "2K"],
-                12: ["-", "-", "-", "-", "-", "-", "-", "7H", "2K", "3K"],
-                14: ["-", "-", "-", "-", "-", "-", "-", "1K", "2K", "3K"],
-                16: ["-", "-", "-", "-", "-", "-", "-", "2K", "3K", "4K"],
-                20: ["-", "-", "-", "-", "-", 1, 1, "3K", "5K", "6K"],
-                30: ["-", "-", "-", 1, 1, 1, 2, "4K", "6K", "10K"],
-                50: [1, 1, 1, 2, 2, 2, 3, "5K", "7K", "12K"],
-                70: [1, 1, 2, 2, 3, 4, 4, "6K", "12K", "18K"],
-                90: [1, 2, 2, 3, 4, 5, "3K", "7K", "14K", "21K"]
-            }
-
-        elif location in (
-                AdvancedHitLocation.LUNG_RIB,
-                AdvancedHitLocation.LUNG,
-                AdvancedHitLocation.LIVER_RIB,
-                AdvancedHitLocation.LIVER,
-                AdvancedHitLocation.STOMACH_RIB,
-                AdvancedHitLocation.STOMACH,
-                AdvancedHitLocation.STOMACH_SPLEEN,
-                AdvancedHitLocation.STOMACH_KIDNEY,
-                AdvancedHitLocation.LIVER_KIDNEY,
-                AdvancedHitLocation.LIVER_SPINE,
-                AdvancedHitLocation.INTESTINES,
-                AdvancedHitLocation.SPINE,
-                AdvancedHitLocation.PELVIS,
-                AdvancedHitLocation.LUNG_SIDE,
-                AdvancedHitLocation.LUNG_RIB_SIDE,
-                AdvancedHitLocation.SPINE_SIDE,
-                AdvancedHitLocation.STOMACH_LIVER_RIB_SIDE,
-                AdvancedHitLocation.STOMACH_LIVER_SIDE,
-                AdvancedHitLocation.SPLEEN_LIVER_SIDE,
-                AdvancedHitLocation.KIDNEY_SPINE_SIDE,
-                AdvancedHitLocation.INTESTINES_SIDE,
-                AdvancedHitLocation.INTESTINES_SPINE_SIDE,
-                AdvancedHitLocation.PELVIS_SIDE
-        ):
-            data = {
-                1: ["-", "-", "-", "-", "-", "-", "-", 1, 1, 1],
-                2: ["-", "-", "-", "-", "-", "-", "-", 1, 2, 3],
-                3: ["-", "-", "-", "-", "-", "-", "-", 2, 5, 7],
-                4: ["-", "-", "-", "-", "-", "-", "-", 4, 10, 15],
-                5: ["-", "-", "-", "-", "-", "-", "-", 6, 17, 23],
-                6: ["-", "-", "-", "-", "-", "-", "-", 10, 26, 36],
-                7: ["-", "-", "-", "-", "-", "-", 1, 14, 37, 54],
-                8: ["-", "-", "-", "-", "-", "-", 1, 18, 53, "-"],
-                10: ["-", "-", "-", "-", "-", "-", 1, 1, 31, 93],
-                12: ["-", "-", "-", "-", "-", 1, 1, 1, 49, "1H"],
-                14: ["-", "-", "-", "-", 1, 1, 1, 1, 72, "1H"],
-                16: ["-", "-", "-", "-", 1, 1, 1, 1, "1H", "2H"],
-                20: ["-", "-", "-", 1, 1, 1, 1, 1, "2H", "4H"],
-                30: [1, 1, 1, 1, 1, 2, 2, 4, 16, 64],
-                50: [1, 1, 2, 2, 2, 3, 4, 16, 64, "3H"],
-                70: [1, 2, 2, 3, 3, 4, 5, 20, "1H", "4H"],
-                90: [2, 2, 3, 3, 3, 5, 7, "1H", "2H", "8H"]
-            }
-        else:  # LIMBS
-            data = {
-                1: ["-", "-", "-", "-", "-", "-", "-", 1, 1, 1],
-                2: ["-", "-", "-", "-", "-", "-", "-", 1, 2, 3],
-                3: ["-", "-", "-", "-", "-", "-", "-", 2, 5, 7],
-                4: ["-", "-", "-", "-", "-", "-", "-", 4, 10, 14],
-                5: ["-", "-", "-", "-", "-", "-", "-", 6, 16, 24],
-                6: ["-", "-", "-", "-", "-", "-", "-", 10, 24, 35],
-                7: ["-", "-", "-", "-", "-", "-", "-", 14, 34, 50],
-                8: ["-", "-", "-", "-", "-", "-", "-", 18, 46, 67],
-                10: ["-", "-", "-", "-", "-", "-", "-", 1, 30, 74],
-                12: ["-", "-", "-", "-", "-", "-", "-", 1, 38, "1H"],
-                14: ["-", "-", "-", "-", "-", 1, 1, 1, 46, "2H"],
-                16: ["-", "-", "-", "-", "-", 1, 1, 1, 55, "3H"],
-                20: ["-", "-", "-", "-", 1, 1, 1, 1, 2, 8],
-                30: ["-", "-", "-", 1, 1, 1, 1, 2, 8, 64],
-                50: [1, 1, 1, 1, 2, 2, 3, 27, "1H", "4H"],
-                70: [1, 1, 1, 2, 2, 3, 4, 64, "2H", "5H"],
-                90: [1, 1, 2, 2, 3, 3, 5, "1H", "3H", "6H"]
-            }
-        sorted_keys = sorted(data.keys())
-        if pen >= sorted_keys[-1]:
-            return parse_val(data[sorted_keys[-1]][bpf_idx])
-        if pen <= sorted_keys[0]:
-            return parse_val(data[sorted_keys[0]][bpf_idx])
-        if pen in data:
-            return parse_val(data[pen][bpf_idx])
-        x0 = max(k for k in sorted_keys if k < pen)
-        x1 = min(k for k in sorted_keys if k > pen)
-        y0 = parse_val(data[x0][bpf_idx])
-        y1 = parse_val(data[x1][bpf_idx])
-        res = y0 + (pen - x0) * (y1 - y0) / (x1 - x0)
-        return round(res)
+        column = cls.MATRICES_9A[cls._LOCATION_GROUPS.get(location, 2)][bpf_idx]
+        return cls._interpolate(column, pen)
+
+    @classmethod
+    def get_blunt_damage_batch(
+        cls,
+        locations: Iterable[AdvancedHitLocation],
+        bpfs: Iterable[int],
+        pens: Iterable[float],
+    ) -> List[int]:
+        """Return blunt damage for parallel sequences of hit locations, BPF and PEN values.
+
+        Args:
+            locations: Hit location of each non-penetrating hit.
+            bpfs: Blunt protection factor of the armor at each location.
+            pens: Remaining penetration of each hit.
+
+        Returns:
+            Blunt damage for each hit, as get_blunt_damage would return.
+        """
+        groups, matrices, interpolate = cls._LOCATION_GROUPS, cls.MATRICES_9A, cls._interpolate
+        return [
+            0 if bpf > 10 else interpolate(matrices[groups.get(location, 2)][10 - max(1, bpf)], pen)
+            for location, bpf, pen in zip(locations, bpfs, pens, strict=True)
+        ]
@@ -230,26 +230,26 @@ class ThreeRoundBurstTable:
     }
 
     @classmethod
-    def calculate_3rb_hits(cls, eal, rb3_value, log):
-        roll = random.randint(0, 99)
+    def calculate_3rb_hits(cls, eal, rb3_value, log, rng=None):
+        roll = (rng or random).randint(0, 99)
         available_3rb = sorted(cls.TABLE_9B.keys())
         target_3rb = min(available_3rb, key=lambda x: abs(x - rb3_value))
         target_eal = max(3, min(28, eal))
         chances = cls.TABLE_9B[target_3rb][target_eal]
         
-        log.append(f"[3RB Table 9B] RB3 value: {rb3_value}, Using column: {target_3rb}")
-        log.append(f"  EAL: {eal}, Using row: {target_eal}")
-        log.append(f"  Hit chances: {chances}")
-        log.append(f"  Roll: {roll}")
+        log.add("hits", "[3RB Table 9B] RB3 value: %s, Using column: %s", rb3_value, target_3rb)
+        log.add("hits", "  EAL: %s, Using row: %s", eal, target_eal)
+        log.add("hits", "  Hit chances: %s", chances)
+        log.add("roll", "  Roll: %s", roll)
         
         hits = 0
         for i, chance in enumerate(chances):
             if roll <= chance:
                 hits += 1
-                log.append(f"  Round {i+1}: {roll} <= {chance}, HIT")
+                log.add("hits", "  Round %s: %s <= %s, HIT", i+1, roll, chance)
             else:
-                log.append(f"  Round {i+1}: {roll} > {chance}, MISS")
+                log.add("hits", "  Round %s: %s > %s, MISS", i+1, roll, chance)
                 break
         
-        log.append(f"  Total hits: {hits}")
+        log.add("hits", "  Total hits: %s", hits)
         return hits, roll
@@ -1,5 +1,6 @@
 import math
 import random
+from typing import Optional
 
 from phoenix_command.models.enums import WoundType, DamageType, TargetExposure, HitLocation
 from phoenix_command.models.hit_result_simple import HitResult
@@ -288,14 +289,15 @@ class Table3HitLocationAndDamage:
 
     @classmethod
     def hit_location_and_damage_3a(
-        cls, damage_type: DamageType, target_exposure: TargetExposure, wdc: int
+        cls, damage_type: DamageType, target_exposure: TargetExposure, wdc: int,
+        rng: Optional[random.Random] = None
     ) -> HitResult:
         """
         Determines hit location and damage based on the provided inputs.
         Generates a random roll from 0 to 99 and selects the appropriate location based on target exposure.
         Returns the damage amount, wound type, and hit location.
         """
-        roll = random.randint(0, 99)
+        roll = (rng or random).randint(0, 99)
         location = cls.get_hit_location(roll, target_exposure)
 
         if damage_type == DamageType.LOW_VELOCITY:
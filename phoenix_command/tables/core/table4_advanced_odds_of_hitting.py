@@ -1,76 +1,268 @@
 import bisect
-from typing import Dict, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from phoenix_command.models.enums import ShotType, TargetExposure, AccuracyModifiers
 
 
+def _max_aim_impulses_4d(modifier: int) -> float:
+    """Maximum aim impulses for a Table 4D movement modifier."""
+    if modifier <= -10:
+        return 2
+    if modifier >= -5:
+        return float('inf')
+    return {-9: 3, -8: 4, -7: 5, -6: 6}.get(modifier, 2)
+
+
+def _compile_odds_4g(table: Dict[int, Dict[ShotType, int]]) -> Dict[ShotType, Tuple[int, ...]]:
+    """Flatten Table 4G into one odds array per shot type, ordered by ascending EAL key."""
+    keys = sorted(table.keys())
+    return {shot_type: tuple(table[k][shot_type] for k in keys) for shot_type in ShotType}
+
+
+def _compile_movement_4d(table: Dict[float, Dict[float, int]]) -> Tuple[Tuple[Tuple[int, float], ...], ...]:
+    """Flatten Table 4D into a speed x HPI matrix of (modifier, max aim impulses) cells."""
+    return tuple(
+        tuple((row[hpi], _max_aim_impulses_4d(row[hpi])) for hpi in sorted(row.keys()))
+        for _, row in sorted(table.items())
+    )
+
+
 class Table4AdvancedOddsOfHitting:
+    TABLE_4A: Tuple[Tuple[int, int], ...] = (
+        (1, 33),
+        (2, 28),
+        (3, 25),
+        (4, 23),
+        (5, 22),
+        (6, 20),
+        (7, 19),
+        (8, 18),
+        (9, 17),
+        (11, 16),
+        (12, 15),
+        (14, 14),
+        (16, 13),
+        (19, 12),
+        (22, 11),
+        (25, 10),
+        (30, 9),
+        (35, 8),
+        (40, 7),
+        (45, 6),
+        (50, 5),
+        (55, 4),
+        (65, 3),
+        (75, 2),
+        (85, 1),
+        (100, 0),
+        (115, -1),
+        (130, -2),
+        (150, -3),
+        (170, -4),
+        (200, -5),
+        (230, -6),
+        (250, -7),
+        (300, -8),
+        (350, -9),
+        (400, -10),
+        (450, -11),
+        (500, -12),
+        (600, -13),
+        (700, -14),
+        (800, -15),
+        (950, -16),
+        (1100, -17),
+        (1250, -18),
+        (1400, -19),
+        (1650, -20),
+        (1900, -21),
+        (2150, -22),
+        (2500, -23),
+        (2850, -24),
+        (3300, -25),
+        (3800, -26),
+        (4350, -27),
+    )
+
+    TABLE_4G: Dict[int, Dict[ShotType, int]] = {
+        28: {ShotType.SINGLE: 99, ShotType.BURST: 99},
+        27: {ShotType.SINGLE: 98, ShotType.BURST: 98},
+        26: {ShotType.SINGLE: 96, ShotType.BURST: 98},
+        25: {ShotType.SINGLE: 94, ShotType.BURST: 97},
+        24: {ShotType.SINGLE: 90, ShotType.BURST: 95},
+        23: {ShotType.SINGLE: 86, ShotType.BURST: 92},
+        22: {ShotType.SINGLE: 80, ShotType.BURST: 90},
+        21: {ShotType.SINGLE: 74, ShotType.BURST: 86},
+        20: {ShotType.SINGLE: 67, ShotType.BURST: 82},
+        19: {ShotType.SINGLE: 60, ShotType.BURST: 77},
+        18: {ShotType.SINGLE: 53, ShotType.BURST: 73},
+        17: {ShotType.SINGLE: 46, ShotType.BURST: 68},
+        16: {ShotType.SINGLE: 39, ShotType.BURST: 62},
+        15: {ShotType.SINGLE: 33, ShotType.BURST: 57},
+        14: {ShotType.SINGLE: 27, ShotType.BURST: 52},
+        13: {ShotType.SINGLE: 22, ShotType.BURST: 47},
+        12: {ShotType.SINGLE: 18, ShotType.BURST: 43},
+        11: {ShotType.SINGLE: 15, ShotType.BURST: 38},
+        10: {ShotType.SINGLE: 12, ShotType.BURST: 34},
+        9: {ShotType.SINGLE: 9, ShotType.BURST: 31},
+        8: {ShotType.SINGLE: 7, ShotType.BURST: 27},
+        7: {ShotType.SINGLE: 6, ShotType.BURST: 24},
+        6: {ShotType.SINGLE: 5, ShotType.BURST: 21},
+        5: {ShotType.SINGLE: 4, ShotType.BURST: 19},
+        4: {ShotType.SINGLE: 3, ShotType.BURST: 17},
+        3: {ShotType.SINGLE: 2, ShotType.BURST: 15},
+        2: {ShotType.SINGLE: 2, ShotType.BURST: 13},
+        1: {ShotType.SINGLE: 1, ShotType.BURST: 11},
+        0: {ShotType.SINGLE: 1, ShotType.BURST: 10},
+        -1: {ShotType.SINGLE: 1, ShotType.BURST: 9},
+        -2: {ShotType.SINGLE: 0, ShotType.BURST: 8},
+        -3: {ShotType.SINGLE: 0, ShotType.BURST: 7},
+        -4: {ShotType.SINGLE: 0, ShotType.BURST: 6},
+        -5: {ShotType.SINGLE: 0, ShotType.BURST: 5},
+        -6: {ShotType.SINGLE: 0, ShotType.BURST: 4},
+        -8: {ShotType.SINGLE: 0, ShotType.BURST: 3},
+        -10: {ShotType.SINGLE: 0, ShotType.BURST: 2},
+        -15: {ShotType.SINGLE: 0, ShotType.BURST: 1},
+        -17: {ShotType.SINGLE: 0, ShotType.BURST: 0},
+        -22: {ShotType.SINGLE: 0, ShotType.BURST: 0},
+    }
+
+    TABLE_4E: Dict[TargetExposure, Dict[AccuracyModifiers, int]] = {
+        TargetExposure.LOOKING_OVER_COVER: {
+            AccuracyModifiers.TARGET_SIZE: -4,
+            AccuracyModifiers.AUTO_ELEV: -3,
+            AccuracyModifiers.AUTO_WIDTH: -3,
+        },
+        TargetExposure.FIRING_OVER_COVER: {
+            AccuracyModifiers.TARGET_SIZE: 0,
+            AccuracyModifiers.AUTO_ELEV: 2,
+            AccuracyModifiers.AUTO_WIDTH: 2,
+        },
+        TargetExposure.STANDING_EXPOSED: {
+            AccuracyModifiers.TARGET_SIZE: 7,
+            AccuracyModifiers.AUTO_ELEV: 14,
+            AccuracyModifiers.AUTO_WIDTH: 3, #fixed rules bullshit
+        },
+        TargetExposure.KNEELING_EXPOSED: {
+            AccuracyModifiers.TARGET_SIZE: 6,
+            AccuracyModifiers.AUTO_ELEV: 11,
+            AccuracyModifiers.AUTO_WIDTH: 3,
+        },
+        TargetExposure.PRONE_EXPOSED: {
+            AccuracyModifiers.TARGET_SIZE: 2,
+            AccuracyModifiers.AUTO_ELEV: 2,
+            AccuracyModifiers.AUTO_WIDTH: 3,
+        },
+        TargetExposure.RUNNING: {
+            AccuracyModifiers.TARGET_SIZE: 8,
+            AccuracyModifiers.AUTO_ELEV: 14,
+            AccuracyModifiers.AUTO_WIDTH: 3,
+        },
+        TargetExposure.LOW_CROUCH: {
+            AccuracyModifiers.TARGET_SIZE: 7,
+            AccuracyModifiers.AUTO_ELEV: 11,
+            AccuracyModifiers.AUTO_WIDTH: 3,
+        },
+        TargetExposure.HANDS_AND_KNEES_CROUCH: {
+            AccuracyModifiers.TARGET_SIZE: 6,
+            AccuracyModifiers.AUTO_ELEV: 8,
+            AccuracyModifiers.AUTO_WIDTH: 3,
+        },
+        TargetExposure.LOW_PRONE: {
+            AccuracyModifiers.TARGET_SIZE: 1,
+            AccuracyModifiers.AUTO_ELEV: 0,
+            AccuracyModifiers.AUTO_WIDTH: 3,
+        },
+        TargetExposure.HEAD: {
+            AccuracyModifiers.TARGET_SIZE: -3,
+            AccuracyModifiers.AUTO_ELEV: 0,
+            AccuracyModifiers.AUTO_WIDTH: -1,
+        },
+        TargetExposure.BODY: {
+            AccuracyModifiers.TARGET_SIZE: 5,
+            AccuracyModifiers.AUTO_ELEV: 8,
+            AccuracyModifiers.AUTO_WIDTH: 3,
+        },
+        TargetExposure.ARMS: {
+            AccuracyModifiers.TARGET_SIZE: 3,
+            AccuracyModifiers.AUTO_ELEV: 8,
+            AccuracyModifiers.AUTO_WIDTH: 0,
+        },
+        TargetExposure.LEGS: {
+            AccuracyModifiers.TARGET_SIZE: 4,
+            AccuracyModifiers.AUTO_ELEV: 8,
+            AccuracyModifiers.AUTO_WIDTH: 0,
+        },
+    }
+
+    TABLE_4D: Dict[float, Dict[float, int]] = {
+        0.5: {10: -6, 20: -5, 40: -5, 70: -5, 100: -5, 200: -5, 300: -5, 400: -5, 600: -5, 800: -5, 1000: -5,
+              1200: -5, 1500: -5},
+        1.0: {10: -8, 20: -6, 40: -5, 70: -5, 100: -5, 200: -5, 300: -5, 400: -5, 600: -5, 800: -5, 1000: -5,
+              1200: -5, 1500: -5},
+        2.0: {10: -10, 20: -8, 40: -6, 70: -5, 100: -5, 200: -5, 300: -5, 400: -5, 600: -5, 800: -5, 1000: -5,
+              1200: -5, 1500: -5},
+        3.0: {10: -10, 20: -10, 40: -7, 70: -6, 100: -5, 200: -5, 300: -5, 400: -5, 600: -5, 800: -5, 1000: -5,
+              1200: -5, 1500: -5},
+        4.0: {10: -10, 20: -10, 40: -8, 70: -6, 100: -6, 200: -5, 300: -5, 400: -5, 600: -5, 800: -5, 1000: -5,
+              1200: -5, 1500: -5},
+        10.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -8, 200: -6, 300: -5, 400: -5, 600: -5, 800: -5, 1000: -5,
+               1200: -5, 1500: -5},
+        20.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -8, 300: -7, 400: -6, 600: -5, 800: -5, 1000: -5,
+               1200: -5, 1500: -5},
+        30.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -8, 400: -7, 600: -6, 800: -6, 1000: -5,
+               1200: -5, 1500: -5},
+        40.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -9, 400: -8, 600: -7, 800: -6, 1000: -5,
+               1200: -5, 1500: -5},
+        50.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -9, 800: -8,
+               1000: -7, 1200: -6, 1500: -5},
+        60.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -8, 800: -7,
+               1000: -6, 1200: -6, 1500: -6},
+        70.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -9, 800: -8,
+               1000: -7, 1200: -6, 1500: -6},
+        80.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -9, 800: -8,
+               1000: -7, 1200: -7, 1500: -6},
+        90.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -10, 800: -9,
+               1000: -8, 1200: -7, 1500: -6},
+        100.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -10, 800: -9,
+                1000: -8, 1200: -7, 1500: -7},
+        110.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -10, 800: -10,
+                1000: -9, 1200: -8, 1500: -7},
+        120.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -10, 800: -10,
+                1000: -9, 1200: -8, 1500: -7},
+    }
+
+    # Flat lookup arrays compiled once from the tables above; the getters below only bisect or index them.
+    RANGE_LIMITS_4A: Tuple[int, ...] = tuple(max_range for max_range, _ in TABLE_4A)
+    RANGE_ALMS_4A: Tuple[int, ...] = tuple(alm for _, alm in TABLE_4A)
+    EAL_KEYS_4G: Tuple[int, ...] = tuple(sorted(TABLE_4G.keys()))
+    ODDS_4G: Dict[ShotType, Tuple[int, ...]] = _compile_odds_4g(TABLE_4G)
+    SPEED_KEYS_4D: Tuple[float, ...] = tuple(sorted(TABLE_4D.keys()))
+    HPI_KEYS_4D: Tuple[float, ...] = tuple(sorted(TABLE_4D[SPEED_KEYS_4D[0]].keys()))
+    MOVEMENT_4D: Tuple[Tuple[Tuple[int, float], ...], ...] = _compile_movement_4d(TABLE_4D)
+
     @classmethod
     def get_accuracy_level_modifier_by_range_4a(cls, distance: float) -> int:
-        TABLE = [
-            (1, 33),
-            (2, 28),
-            (3, 25),
-            (4, 23),
-            (5, 22),
-            (6, 20),
-            (7, 19),
-            (8, 18),
-            (9, 17),
-            (11, 16),
-            (12, 15),
-            (14, 14),
-            (16, 13),
-            (19, 12),
-            (22, 11),
-            (25, 10),
-            (30, 9),
-            (35, 8),
-            (40, 7),
-            (45, 6),
-            (50, 5),
-            (55, 4),
-            (65, 3),
-            (75, 2),
-            (85, 1),
-            (100, 0),
-            (115, -1),
-            (130, -2),
-            (150, -3),
-            (170, -4),
-            (200, -5),
-            (230, -6),
-            (250, -7),
-            (300, -8),
-            (350, -9),
-            (400, -10),
-            (450, -11),
-            (500, -12),
-            (600, -13),
-            (700, -14),
-            (800, -15),
-            (950, -16),
-            (1100, -17),
-            (1250, -18),
-            (1400, -19),
-            (1650, -20),
-            (1900, -21),
-            (2150, -22),
-            (2500, -23),
-            (2850, -24),
-            (3300, -25),
-            (3800, -26),
-            (4350, -27),
-        ]
-
-        if distance > 4350:
+        if distance > cls.RANGE_LIMITS_4A[-1]:
             raise ValueError("Range exceeds maximum supported distance (4350).")
 
-        for max_range, alm in TABLE:
-            if distance <= max_range:
-                return alm
+        return cls.RANGE_ALMS_4A[bisect.bisect_left(cls.RANGE_LIMITS_4A, distance)]
 
-        raise ValueError("Unreachable range lookup state.")
+    @classmethod
+    def get_accuracy_level_modifier_by_range_4a_batch(cls, distances: Iterable[float]) -> List[int]:
+        """
+        Vectorised form of get_accuracy_level_modifier_by_range_4a.
+        Accepts any iterable of ranges (list, tuple, array) and returns the range ALMs in the same order.
+        """
+        limits = cls.RANGE_LIMITS_4A
+        alms = cls.RANGE_ALMS_4A
+        max_range = limits[-1]
+        result = []
+        for distance in distances:
+            if distance > max_range:
+                raise ValueError("Range exceeds maximum supported distance (4350).")
+            result.append(alms[bisect.bisect_left(limits, distance)])
+        return result
 
     @classmethod
     def get_odds_of_hitting_4g(cls, effective_accuracy_level: int, shot_type: ShotType) -> int:
@@ -85,59 +277,26 @@ class Table4AdvancedOddsOfHitting:
         if effective_accuracy_level < -22:
             return 0
 
-        table: Dict[int, Dict[ShotType, int]] = {
-            28: {ShotType.SINGLE: 99, ShotType.BURST: 99},
-            27: {ShotType.SINGLE: 98, ShotType.BURST: 98},
-            26: {ShotType.SINGLE: 96, ShotType.BURST: 98},
-            25: {ShotType.SINGLE: 94, ShotType.BURST: 97},
-            24: {ShotType.SINGLE: 90, ShotType.BURST: 95},
-            23: {ShotType.SINGLE: 86, ShotType.BURST: 92},
-            22: {ShotType.SINGLE: 80, ShotType.BURST: 90},
-            21: {ShotType.SINGLE: 74, ShotType.BURST: 86},
-            20: {ShotType.SINGLE: 67, ShotType.BURST: 82},
-            19: {ShotType.SINGLE: 60, ShotType.BURST: 77},
-            18: {ShotType.SINGLE: 53, ShotType.BURST: 73},
-            17: {ShotType.SINGLE: 46, ShotType.BURST: 68},
-            16: {ShotType.SINGLE: 39, ShotType.BURST: 62},
-            15: {ShotType.SINGLE: 33, ShotType.BURST: 57},
-            14: {ShotType.SINGLE: 27, ShotType.BURST: 52},
-            13: {ShotType.SINGLE: 22, ShotType.BURST: 47},
-            12: {ShotType.SINGLE: 18, ShotType.BURST: 43},
-            11: {ShotType.SINGLE: 15, ShotType.BURST: 38},
-            10: {ShotType.SINGLE: 12, ShotType.BURST: 34},
-            9: {ShotType.SINGLE: 9, ShotType.BURST: 31},
-            8: {ShotType.SINGLE: 7, ShotType.BURST: 27},
-            7: {ShotType.SINGLE: 6, ShotType.BURST: 24},
-            6: {ShotType.SINGLE: 5, ShotType.BURST: 21},
-            5: {ShotType.SINGLE: 4, ShotType.BURST: 19},
-            4: {ShotType.SINGLE: 3, ShotType.BURST: 17},
-            3: {ShotType.SINGLE: 2, ShotType.BURST: 15},
-            2: {ShotType.SINGLE: 2, ShotType.BURST: 13},
-            1: {ShotType.SINGLE: 1, ShotType.BURST: 11},
-            0: {ShotType.SINGLE: 1, ShotType.BURST: 10},
-            -1: {ShotType.SINGLE: 1, ShotType.BURST: 9},
-            -2: {ShotType.SINGLE: 0, ShotType.BURST: 8},
-            -3: {ShotType.SINGLE: 0, ShotType.BURST: 7},
-            -4: {ShotType.SINGLE: 0, ShotType.BURST: 6},
-            -5: {ShotType.SINGLE: 0, ShotType.BURST: 5},
-            -6: {ShotType.SINGLE: 0, ShotType.BURST: 4},
-            -8: {ShotType.SINGLE: 0, ShotType.BURST: 3},
-            -10: {ShotType.SINGLE: 0, ShotType.BURST: 2},
-            -15: {ShotType.SINGLE: 0, ShotType.BURST: 1},
-            -17: {ShotType.SINGLE: 0, ShotType.BURST: 0},
-            -22: {ShotType.SINGLE: 0, ShotType.BURST: 0},
-        }
+        index = bisect.bisect_left(cls.EAL_KEYS_4G, effective_accuracy_level)
+        return cls.ODDS_4G[shot_type][max(0, index - 1)]
 
-        keys = sorted(table.keys())
-        index = bisect.bisect_left(keys, effective_accuracy_level)
-
-        if index == 0:
-            return table[keys[0]][shot_type]
-        elif index == len(keys):
-            return table[keys[-1]][shot_type]
-        else:
-            # Floor to the nearest lower key
-            return table[keys[index - 1]][shot_type]
+    @classmethod
+    def get_odds_of_hitting_4g_batch(cls, effective_accuracy_levels: Iterable[float], shot_type: ShotType) -> List[int]:
+        """
+        Vectorised form of get_odds_of_hitting_4g for a single shot type.
+        Accepts any iterable of EALs and returns the odds of hitting in the same order.
+        """
+        keys = cls.EAL_KEYS_4G
+        odds = cls.ODDS_4G[shot_type]
+        result = []
+        for eal in effective_accuracy_levels:
+            if eal > 28:
+                result.append(99)
+            elif eal < -22:
+                result.append(0)
+            else:
+                result.append(odds[max(0, bisect.bisect_left(keys, eal) - 1)])
+        return result
 
     @classmethod
     def get_standard_target_size_modifier_4e(cls, target_exposure: TargetExposure,
@@ -152,82 +311,15 @@ class Table4AdvancedOddsOfHitting:
         Raises:
             ValueError: If the combination is invalid (unsupported exposure or type).
         """
-        table = {
-            TargetExposure.LOOKING_OVER_COVER: {
-                AccuracyModifiers.TARGET_SIZE: -4,
-                AccuracyModifiers.AUTO_ELEV: -3,
-                AccuracyModifiers.AUTO_WIDTH: -3,
-            },
-            TargetExposure.FIRING_OVER_COVER: {
-                AccuracyModifiers.TARGET_SIZE: 0,
-                AccuracyModifiers.AUTO_ELEV: 2,
-                AccuracyModifiers.AUTO_WIDTH: 2,
-            },
-            TargetExposure.STANDING_EXPOSED: {
-                AccuracyModifiers.TARGET_SIZE: 7,
-                AccuracyModifiers.AUTO_ELEV: 14,
-                AccuracyModifiers.AUTO_WIDTH: 3, #fixed rules bullshit
-            },
-            TargetExposure.KNEELING_EXPOSED: {
-                AccuracyModifiers.TARGET_SIZE: 6,
-                AccuracyModifiers.AUTO_ELEV: 11,
-                AccuracyModifiers.AUTO_WIDTH: 3,
-            },
-            TargetExposure.PRONE_EXPOSED: {
-                AccuracyModifiers.TARGET_SIZE: 2,
-                AccuracyModifiers.AUTO_ELEV: 2,
-                AccuracyModifiers.AUTO_WIDTH: 3,
-            },
-            TargetExposure.RUNNING: {
-                AccuracyModifiers.TARGET_SIZE: 8,
-                AccuracyModifiers.AUTO_ELEV: 14,
-                AccuracyModifiers.AUTO_WIDTH: 3,
-            },
-            TargetExposure.LOW_CROUCH: {
-                AccuracyModifiers.TARGET_SIZE: 7,
-                AccuracyModifiers.AUTO_ELEV: 11,
-                AccuracyModifiers.AUTO_WIDTH: 3,
-            },
-            TargetExposure.HANDS_AND_KNEES_CROUCH: {
-                AccuracyModifiers.TARGET_SIZE: 6,
-                AccuracyModifiers.AUTO_ELEV: 8,
-                AccuracyModifiers.AUTO_WIDTH: 3,
-            },
-            TargetExposure.LOW_PRONE: {
-                AccuracyModifiers.TARGET_SIZE: 1,
-                AccuracyModifiers.AUTO_ELEV: 0,
-                AccuracyModifiers.AUTO_WIDTH: 3,
-            },
-            TargetExposure.HEAD: {
-                AccuracyModifiers.TARGET_SIZE: -3,
-                AccuracyModifiers.AUTO_ELEV: 0,
-                AccuracyModifiers.AUTO_WIDTH: -1,
-            },
-            TargetExposure.BODY: {
-                AccuracyModifiers.TARGET_SIZE: 5,
-                AccuracyModifiers.AUTO_ELEV: 8,
-                AccuracyModifiers.AUTO_WIDTH: 3,
-            },
-            TargetExposure.ARMS: {
-                AccuracyModifiers.TARGET_SIZE: 3,
-                AccuracyModifiers.AUTO_ELEV: 8,
-                AccuracyModifiers.AUTO_WIDTH: 0,
-            },
-            TargetExposure.LEGS: {
-                AccuracyModifiers.TARGET_SIZE: 4,
-                AccuracyModifiers.AUTO_ELEV: 8,
-                AccuracyModifiers.AUTO_WIDTH: 0,
-            },
-        }
-
-        if target_exposure not in table:
+        modifiers = cls.TABLE_4E.get(target_exposure)
+        if modifiers is None:
             raise ValueError(f"Unsupported TargetExposure: {target_exposure}")
 
-        modifiers = table[target_exposure]
-        if modifier_type not in modifiers:
+        modifier = modifiers.get(modifier_type)
+        if modifier is None:
             raise ValueError(f"Unsupported AccuracyModifiers for {target_exposure}: {modifier_type}")
 
-        return modifiers[modifier_type]
+        return modifier
 
     @classmethod
     def get_movement_alm_and_max_aim_time_4d(cls, speed: float, target_hpi: float) -> Tuple[int, float]:
@@ -236,77 +328,32 @@ class Table4AdvancedOddsOfHitting:
         For non-exact speed or HPI, floors to the nearest lower value in the table.
         Maximum aim impulses: 2 for -10, 3 for -9, 4 for -8, 5 for -7, 6 for -6, infinity for -5 and above.
         """
-        # Table: speed -> hpi -> modifier
-        table: Dict[float, Dict[float, int]] = {
-            0.5: {10: -6, 20: -5, 40: -5, 70: -5, 100: -5, 200: -5, 300: -5, 400: -5, 600: -5, 800: -5, 1000: -5,
-                  1200: -5, 1500: -5},
-            1.0: {10: -8, 20: -6, 40: -5, 70: -5, 100: -5, 200: -5, 300: -5, 400: -5, 600: -5, 800: -5, 1000: -5,
-                  1200: -5, 1500: -5},
-            2.0: {10: -10, 20: -8, 40: -6, 70: -5, 100: -5, 200: -5, 300: -5, 400: -5, 600: -5, 800: -5, 1000: -5,
-                  1200: -5, 1500: -5},
-            3.0: {10: -10, 20: -10, 40: -7, 70: -6, 100: -5, 200: -5, 300: -5, 400: -5, 600: -5, 800: -5, 1000: -5,
-                  1200: -5, 1500: -5},
-            4.0: {10: -10, 20: -10, 40: -8, 70: -6, 100: -6, 200: -5, 300: -5, 400: -5, 600: -5, 800: -5, 1000: -5,
-                  1200: -5, 1500: -5},
-            10.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -8, 200: -6, 300: -5, 400: -5, 600: -5, 800: -5, 1000: -5,
-                   1200: -5, 1500: -5},
-            20.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -8, 300: -7, 400: -6, 600: -5, 800: -5, 1000: -5,
-                   1200: -5, 1500: -5},
-            30.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -8, 400: -7, 600: -6, 800: -6, 1000: -5,
-                   1200: -5, 1500: -5},
-            40.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -9, 400: -8, 600: -7, 800: -6, 1000: -5,
-                   1200: -5, 1500: -5},
-            50.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -9, 800: -8,
-                   1000: -7, 1200: -6, 1500: -5},
-            60.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -8, 800: -7,
-                   1000: -6, 1200: -6, 1500: -6},
-            70.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -9, 800: -8,
-                   1000: -7, 1200: -6, 1500: -6},
-            80.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -9, 800: -8,
-                   1000: -7, 1200: -7, 1500: -6},
-            90.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -10, 800: -9,
-                   1000: -8, 1200: -7, 1500: -6},
-            100.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -10, 800: -9,
-                    1000: -8, 1200: -7, 1500: -7},
-            110.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -10, 800: -10,
-                    1000: -9, 1200: -8, 1500: -7},
-            120.0: {10: -10, 20: -10, 40: -10, 70: -10, 100: -10, 200: -10, 300: -10, 400: -10, 600: -10, 800: -10,
-                    1000: -9, 1200: -8, 1500: -7},
-        }
-
-        # Max aim impulses mapping
-        max_aim_map = {
-            -10: 2,
-            -9: 3,
-            -8: 4,
-            -7: 5,
-            -6: 6,
-            -5: float('inf'),
-        }
+        speed_index = max(0, bisect.bisect_right(cls.SPEED_KEYS_4D, speed) - 1)
+        hpi_index = max(0, bisect.bisect_right(cls.HPI_KEYS_4D, target_hpi) - 1)
+        return cls.MOVEMENT_4D[speed_index][hpi_index]
 
-        # Get sorted keys for speed and hpi
-        speed_keys = sorted(table.keys())
-        hpi_keys = sorted(table[speed_keys[0]].keys()) if table else []
-
-        # Floor speed
-        speed_index = bisect.bisect_right(speed_keys, speed) - 1
-        floored_speed = speed_keys[speed_index] if speed_index >= 0 else speed_keys[0]
-
-        # Floor hpi
-        hpi_index = bisect.bisect_right(hpi_keys, target_hpi) - 1
-        floored_hpi = hpi_keys[hpi_index] if hpi_index >= 0 else hpi_keys[0]
-
-        modifier = table[floored_speed][floored_hpi]
-
-        # Get max aim: extend pattern for modifiers > -5 or < -10
-        if modifier <= -10:
-            max_aim = 2
-        elif modifier >= -5:
-            max_aim = float('inf')
-        else:
-            max_aim = max_aim_map.get(modifier, 2)  # Default to 2 for unknown
-
-        return modifier, max_aim
+    @classmethod
+    def get_movement_alm_and_max_aim_time_4d_batch(
+            cls,
+            speeds: Iterable[float],
+            target_hpis: Iterable[float],
+    ) -> Tuple[List[int], List[float]]:
+        """
+        Vectorised form of get_movement_alm_and_max_aim_time_4d.
+        Takes parallel iterables of speeds and target HPIs and returns (movement ALMs, max aim impulses).
+        """
+        speed_keys = cls.SPEED_KEYS_4D
+        hpi_keys = cls.HPI_KEYS_4D
+        matrix = cls.MOVEMENT_4D
+        modifiers = []
+        max_aims = []
+        for speed, target_hpi in zip(speeds, target_hpis, strict=True):
+            modifier, max_aim = matrix[max(0, bisect.bisect_right(speed_keys, speed) - 1)][
+                max(0, bisect.bisect_right(hpi_keys, target_hpi) - 1)
+            ]
+            modifiers.append(modifier)
+            max_aims.append(max_aim)
+        return modifiers, max_aims
 
     @classmethod
     def get_target_size_by_alm_4f(cls, alm: float) -> float:
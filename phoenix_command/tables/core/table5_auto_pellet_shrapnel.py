@@ -1,8 +1,93 @@
+import bisect
 import random
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from phoenix_command.models.combat_trace import CombatTrace
+from phoenix_command.simulations.rng import randints
+
+
+def _parse_fire_cell(cell: str) -> Tuple[int, int]:
+    """Parse a Table 5A cell: "*N" -> (N guaranteed hits, 0), "P" -> (0, P percent)."""
+    if cell.startswith("*"):
+        return int(cell[1:]), 0
+    return 0, int(cell)
+
+
+def _compile_fire_grid(table: Dict[float, List[str]]) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """Table 5A rows ordered by ascending arc of fire, each a tuple of (guaranteed, percent) cells."""
+    return tuple(tuple(_parse_fire_cell(cell) for cell in table[key]) for key in sorted(table.keys()))
 
 
 class Table5AutoPelletShrapnel:
+    FIRE_TABLE_5A: Dict[float, List[str]] = {
+        0.000001: ["*3", "*4", "*5", "*6", "*7", "*8", "*9", "*10", "*12", "*18", "*36", "*54", "*72", "*144"],
+        0.000002: ["*3", "*4", "*5", "*5", "*6", "*7", "*8", "*9", "*11", "*16", "*33", "*49", "*65", "*131"],
+        0.000003: ["*2", "*3", "*4", "*5", "*6", "*6", "*7", "*8", "*9", "*14", "*28", "*43", "*57", "*114"],
+        0.2: ["*2", "*3", "*3", "*4", "*5", "*5", "*6", "*7", "*8", "*12", "*25", "*37", "*50", "*99"],
+        0.200001: ["*2", "*2", "*3", "*4", "*4", "*5", "*5", "*6", "*7", "*11", "*22", "*32", "*43", "*86"],
+        0.200002: ["*2", "*2", "*3", "*3", "*4", "*4", "*5", "*5", "*6", "*9", "*19", "*28", "*37", "*75"],
+        0.3: ["*1", "*2", "*2", "*3", "*3", "*4", "*4", "*5", "*5", "*8", "*16", "*24", "*33", "*65"],
+        0.300001: ["*1", "*2", "*2", "*2", "*3", "*3", "*4", "*4", "*5", "*7", "*14", "*21", "*28", "*57"],
+        0.4: ["*1", "*1", "*2", "*2", "*2", "*3", "*3", "*3", "*4", "*6", "*12", "*18", "*25", "*49"],
+        0.400001: ["89", "*1", "*1", "*2", "*2", "*2", "*3", "*3", "*4", "*5", "*11", "*16", "*21", "*43"],
+        0.5: ["77", "*1", "*1", "*2", "*2", "*2", "*2", "*3", "*3", "*5", "*9", "*14", "*19", "*37"],
+        0.6: ["67", "89", "*1", "*1", "*2", "*2", "*2", "*2", "*3", "*4", "*8", "*12", "*16", "*32"],
+        0.7: ["58", "78", "97", "*1", "*1", "*2", "*2", "*2", "*2", "*4", "*7", "*11", "*14", "*28"],
+        0.8: ["51", "67", "84", "*1", "*1", "*1", "*2", "*2", "*2", "*3", "*6", "*9", "*12", "*24"],
+        0.9: ["44", "58", "73", "88", "*1", "*1", "*1", "*1", "*2", "*3", "*5", "*8", "*11", "*21"],
+        1: ["38", "51", "64", "77", "89", "*1", "*1", "*1", "*2", "*2", "*5", "*7", "*9", "*19"],
+        1.000001: ["33", "44", "55", "66", "78", "89", "*1", "*1", "*1", "*2", "*4", "*6", "*8", "*16"],
+        1.000002: ["28", "38", "48", "58", "67", "77", "87", "97", "*1", "*2", "*3", "*5", "*7", "*14"],
+        1.000003: ["25", "33", "41", "50", "58", "67", "75", "84", "*1", "*2", "*3", "*5", "*6", "*12"],
+        2: ["21", "29", "36", "43", "51", "58", "65", "73", "88", "*1", "*2", "*3", "*5", "*11"],
+        2.000001: ["18", "25", "31", "38", "44", "50", "57", "63", "76", "*1", "*2", "*3", "*5", "*9"],
+        2.000002: ["16", "21", "27", "33", "38", "44", "49", "55", "66", "*1", "*2", "*3", "*4", "*8"],
+        3: ["14", "18", "23", "28", "33", "38", "43", "48", "57", "86", "*2", "*3", "*3", "*7"],
+        3.000001: ["12", "16", "20", "24", "29", "33", "37", "41", "50", "75", "*2", "*2", "*3", "*6"],
+        4: ["10", "14", "17", "21", "25", "28", "32", "36", "43", "65", "*1", "*2", "*3", "*5"],
+        4.000001: ["9", "12", "15", "18", "21", "25", "28", "31", "37", "56", "*1", "*2", "*2", "*5"],
+        5: ["7", "10", "13", "16", "18", "21", "24", "27", "32", "49", "98", "*1", "*2", "*4"],
+        5.000001: ["6", "9", "11", "13", "16", "18", "21", "23", "28", "42", "85", "*1", "*2", "*3"],
+        6: ["5", "7", "10", "12", "14", "16", "18", "20", "24", "37", "74", "*1", "*2", "*3"],
+        7: ["5", "6", "8", "10", "12", "14", "15", "17", "21", "32", "64", "97", "*1", "*3"],
+        8: ["4", "5", "7", "9", "10", "12", "13", "15", "18", "28", "56", "84", "*1", "*2"],
+        10: ["3", "5", "6", "7", "9", "10", "11", "13", "16", "24", "48", "73", "98", "*2"],
+        11: ["3", "4", "5", "6", "7", "9", "10", "11", "13", "21", "42", "64", "85", "*2"],
+        13: ["2", "3", "4", "5", "6", "7", "8", "9", "12", "18", "36", "55", "74", "*1"],
+        15: ["2", "3", "4", "4", "5", "6", "7", "8", "10", "15", "32", "48", "64", "*1"],
+        17: ["1", "2", "3", "4", "5", "5", "6", "7", "8", "13", "27", "41", "56", "*1"],
+        20: ["1", "2", "2", "3", "4", "5", "5", "6", "7", "11", "24", "36", "48", "97"],
+        23: ["1", "1", "2", "3", "3", "4", "4", "5", "6", "10", "20", "31", "42", "85"],
+        26: ["1", "1", "2", "2", "3", "3", "4", "4", "5", "8", "18", "27", "36", "73"],
+        30: ["0", "1", "1", "2", "2", "3", "3", "3", "4", "7", "15", "23", "31", "64"],
+        35: ["0", "1", "1", "1", "2", "2", "3", "3", "4", "6", "13", "20", "27", "55"],
+        40: ["0", "0", "1", "1", "1", "2", "2", "2", "3", "5", "11", "17", "23", "48"],
+        46: ["0", "0", "0", "1", "1", "1", "2", "2", "3", "4", "10", "15", "20", "42"],
+        53: ["0", "0", "0", "1", "1", "1", "1", "2", "2", "4", "8", "13", "17", "37"],
+        61: ["0", "0", "0", "0", "1", "1", "1", "1", "2", "3", "7", "11", "15", "31"],
+        70: ["0", "0", "0", "0", "0", "1", "1", "1", "1", "2", "6", "9", "13", "27"],
+        81: ["0", "0", "0", "0", "0", "0", "1", "1", "1", "2", "5", "8", "11", "23"],
+        93: ["0", "0", "0", "0", "0", "0", "0", "0", "1", "2", "4", "7", "10", "20"],
+        107: ["0", "0", "0", "0", "0", "0", "0", "0", "1", "1", "4", "6", "8", "17"],
+        123: ["0", "0", "0", "0", "0", "0", "0", "0", "0", "1", "3", "5", "7", "15"],
+        142: ["0", "0", "0", "0", "0", "0", "0", "0", "0", "1", "2", "4", "6", "13"],
+        163: ["0", "0", "0", "0", "0", "0", "0", "0", "0", "1", "2", "4", "5", "11"],
+        188: ["0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "2", "3", "4", "10"],
+    }
+
+    FIRE_COLUMNS_5A: Tuple[int, ...] = (3, 4, 5, 6, 7, 8, 9, 10, 12, 18, 36, 54, 72, 144)
+
+    # Shrapnel/pellet column: guaranteed (*) values first, then probability values.
+    PELLET_VALUES_5A: Tuple[int, ...] = (58, 44, 33, 25, 19, 14, 11, 8, 6, 5, 4, 3, 2, 2, 1,
+                                         87, 65, 49, 37, 28, 21, 15, 11, 8, 6, 4, 3, 2, 1, 1, 0)
+    PELLET_GUARANTEED_COUNT_5A = 15
+
+    # Compiled once from the literals above: sorted arc keys and a grid of (guaranteed, percent) pairs.
+    ARC_KEYS_5A: Tuple[float, ...] = tuple(sorted(FIRE_TABLE_5A.keys()))
+    FIRE_GRID_5A: Tuple[Tuple[Tuple[int, int], ...], ...] = _compile_fire_grid(FIRE_TABLE_5A)
+    # Pellet segments negated so that bisect can search the descending values.
+    _NEG_GUARANTEED_5A: Tuple[int, ...] = tuple(-v for v in PELLET_VALUES_5A[:PELLET_GUARANTEED_COUNT_5A])
+    _NEG_PROBABILITY_5A: Tuple[int, ...] = tuple(-v for v in PELLET_VALUES_5A[PELLET_GUARANTEED_COUNT_5A:])
 
     @classmethod
     def ceil_key(cls, value: float, keys):
@@ -11,99 +96,71 @@ class Table5AutoPelletShrapnel:
                 return k
         raise ValueError("Value too large")
 
+    @classmethod
+    def _fire_cell_5a(cls, arc_of_fire: float, rate_of_fire: float, size_modifier: int) -> Tuple[int, int]:
+        """(guaranteed, percent) cell for an in-range arc of fire and rate of fire."""
+        last_row = len(cls.ARC_KEYS_5A) - 1
+        row_index = bisect.bisect_left(cls.ARC_KEYS_5A, arc_of_fire) - size_modifier
+        row_index = max(0, min(last_row, row_index))  # Clamp to bounds
+        return cls.FIRE_GRID_5A[row_index][bisect.bisect_left(cls.FIRE_COLUMNS_5A, rate_of_fire)]
+
     @classmethod
     def get_fire_table_value5a(cls, arc_of_fire: float, rate_of_fire: float, size_modifier: int,
-                                log: Optional[List[str]] = None) -> int:
-        FIRE_TABLE = {
-            0.000001: ["*3", "*4", "*5", "*6", "*7", "*8", "*9", "*10", "*12", "*18", "*36", "*54", "*72", "*144"],
-            0.000002: ["*3", "*4", "*5", "*5", "*6", "*7", "*8", "*9", "*11", "*16", "*33", "*49", "*65", "*131"],
-            0.000003: ["*2", "*3", "*4", "*5", "*6", "*6", "*7", "*8", "*9", "*14", "*28", "*43", "*57", "*114"],
-            0.2: ["*2", "*3", "*3", "*4", "*5", "*5", "*6", "*7", "*8", "*12", "*25", "*37", "*50", "*99"],
-            0.200001: ["*2", "*2", "*3", "*4", "*4", "*5", "*5", "*6", "*7", "*11", "*22", "*32", "*43", "*86"],
-            0.200002: ["*2", "*2", "*3", "*3", "*4", "*4", "*5", "*5", "*6", "*9", "*19", "*28", "*37", "*75"],
-            0.3: ["*1", "*2", "*2", "*3", "*3", "*4", "*4", "*5", "*5", "*8", "*16", "*24", "*33", "*65"],
-            0.300001: ["*1", "*2", "*2", "*2", "*3", "*3", "*4", "*4", "*5", "*7", "*14", "*21", "*28", "*57"],
-            0.4: ["*1", "*1", "*2", "*2", "*2", "*3", "*3", "*3", "*4", "*6", "*12", "*18", "*25", "*49"],
-            0.400001: ["89", "*1", "*1", "*2", "*2", "*2", "*3", "*3", "*4", "*5", "*11", "*16", "*21", "*43"],
-            0.5: ["77", "*1", "*1", "*2", "*2", "*2", "*2", "*3", "*3", "*5", "*9", "*14", "*19", "*37"],
-            0.6: ["67", "89", "*1", "*1", "*2", "*2", "*2", "*2", "*3", "*4", "*8", "*12", "*16", "*32"],
-            0.7: ["58", "78", "97", "*1", "*1", "*2", "*2", "*2", "*2", "*4", "*7", "*11", "*14", "*28"],
-            0.8: ["51", "67", "84", "*1", "*1", "*1", "*2", "*2", "*2", "*3", "*6", "*9", "*12", "*24"],
-            0.9: ["44", "58", "73", "88", "*1", "*1", "*1", "*1", "*2", "*3", "*5", "*8", "*11", "*21"],
-            1: ["38", "51", "64", "77", "89", "*1", "*1", "*1", "*2", "*2", "*5", "*7", "*9", "*19"],
-            1.000001: ["33", "44", "55", "66", "78", "89", "*1", "*1", "*1", "*2", "*4", "*6", "*8", "*16"],
-            1.000002: ["28", "38", "48", "58", "67", "77", "87", "97", "*1", "*2", "*3", "*5", "*7", "*14"],
-            1.000003: ["25", "33", "41", "50", "58", "67", "75", "84", "*1", "*2", "*3", "*5", "*6", "*12"],
-            2: ["21", "29", "36", "43", "51", "58", "65", "73", "88", "*1", "*2", "*3", "*5", "*11"],
-            2.000001: ["18", "25", "31", "38", "44", "50", "57", "63", "76", "*1", "*2", "*3", "*5", "*9"],
-            2.000002: ["16", "21", "27", "33", "38", "44", "49", "55", "66", "*1", "*2", "*3", "*4", "*8"],
-            3: ["14", "18", "23", "28", "33", "38", "43", "48", "57", "86", "*2", "*3", "*3", "*7"],
-            3.000001: ["12", "16", "20", "24", "29", "33", "37", "41", "50", "75", "*2", "*2", "*3", "*6"],
-            4: ["10", "14", "17", "21", "25", "28", "32", "36", "43", "65", "*1", "*2", "*3", "*5"],
-            4.000001: ["9", "12", "15", "18", "21", "25", "28", "31", "37", "56", "*1", "*2", "*2", "*5"],
-            5: ["7", "10", "13", "16", "18", "21", "24", "27", "32", "49", "98", "*1", "*2", "*4"],
-            5.000001: ["6", "9", "11", "13", "16", "18", "21", "23", "28", "42", "85", "*1", "*2", "*3"],
-            6: ["5", "7", "10", "12", "14", "16", "18", "20", "24", "37", "74", "*1", "*2", "*3"],
-            7: ["5", "6", "8", "10", "12", "14", "15", "17", "21", "32", "64", "97", "*1", "*3"],
-            8: ["4", "5", "7", "9", "10", "12", "13", "15", "18", "28", "56", "84", "*1", "*2"],
-            10: ["3", "5", "6", "7", "9", "10", "11", "13", "16", "24", "48", "73", "98", "*2"],
-            11: ["3", "4", "5", "6", "7", "9", "10", "11", "13", "21", "42", "64", "85", "*2"],
-            13: ["2", "3", "4", "5", "6", "7", "8", "9", "12", "18", "36", "55", "74", "*1"],
-            15: ["2", "3", "4", "4", "5", "6", "7", "8", "10", "15", "32", "48", "64", "*1"],
-            17: ["1", "2", "3", "4", "5", "5", "6", "7", "8", "13", "27", "41", "56", "*1"],
-            20: ["1", "2", "2", "3", "4", "5", "5", "6", "7", "11", "24", "36", "48", "97"],
-            23: ["1", "1", "2", "3", "3", "4", "4", "5", "6", "10", "20", "31", "42", "85"],
-            26: ["1", "1", "2", "2", "3", "3", "4", "4", "5", "8", "18", "27", "36", "73"],
-            30: ["0", "1", "1", "2", "2", "3", "3", "3", "4", "7", "15", "23", "31", "64"],
-            35: ["0", "1", "1", "1", "2", "2", "3", "3", "4", "6", "13", "20", "27", "55"],
-            40: ["0", "0", "1", "1", "1", "2", "2", "2", "3", "5", "11", "17", "23", "48"],
-            46: ["0", "0", "0", "1", "1", "1", "2", "2", "3", "4", "10", "15", "20", "42"],
-            53: ["0", "0", "0", "1", "1", "1", "1", "2", "2", "4", "8", "13", "17", "37"],
-            61: ["0", "0", "0", "0", "1", "1", "1", "1", "2", "3", "7", "11", "15", "31"],
-            70: ["0", "0", "0", "0", "0", "1", "1", "1", "1", "2", "6", "9", "13", "27"],
-            81: ["0", "0", "0", "0", "0", "0", "1", "1", "1", "2", "5", "8", "11", "23"],
-            93: ["0", "0", "0", "0", "0", "0", "0", "0", "1", "2", "4", "7", "10", "20"],
-            107: ["0", "0", "0", "0", "0", "0", "0", "0", "1", "1", "4", "6", "8", "17"],
-            123: ["0", "0", "0", "0", "0", "0", "0", "0", "0", "1", "3", "5", "7", "15"],
-            142: ["0", "0", "0", "0", "0", "0", "0", "0", "0", "1", "2", "4", "6", "13"],
-            163: ["0", "0", "0", "0", "0", "0", "0", "0", "0", "1", "2", "4", "5", "11"],
-            188: ["0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "2", "3", "4", "10"],
-        }
-
-        FIRE_COLUMNS = [3, 4, 5, 6, 7, 8, 9, 10, 12, 18, 36, 54, 72, 144]
-        arc_keys = list(FIRE_TABLE.keys())
-        arc_keys.sort()
-        if arc_of_fire > arc_keys[-1]:
+                                trace: Optional[CombatTrace] = None, rng: Optional[random.Random] = None) -> int:
+        if arc_of_fire > cls.ARC_KEYS_5A[-1]:
             raise ValueError("arc_of_fire too large")
-        arc_key = Table5AutoPelletShrapnel.ceil_key(arc_of_fire, arc_keys)
-
-        row_index = arc_keys.index(arc_key)
-        shifted_index = row_index - size_modifier
-        shifted_index = max(0, min(len(arc_keys) - 1, shifted_index))  # Clamp to bounds
-        if not (0 <= shifted_index < len(arc_keys)):
-            raise ValueError("size_modifier moves arc_of_fire out of table range")
-        row_key = arc_keys[shifted_index]
-
-        row = FIRE_TABLE[row_key]
         if rate_of_fire > 144:
             raise ValueError("rate_of_fire too large")
-        col_key = Table5AutoPelletShrapnel.ceil_key(rate_of_fire, FIRE_COLUMNS)
-        col_index = FIRE_COLUMNS.index(col_key)
-        cell = row[col_index]
-        if cell.startswith("*"):
-            hits = int(cell[1:])
-            if log is not None:
-                log.append(f"  [Table 5A] Arc: {arc_of_fire}, ROF: {rate_of_fire}, Size mod: {size_modifier}")
-                log.append(f"    Cell: {cell} -> {hits} guaranteed hits")
-            return hits
-        threshold = int(cell)
-        roll = random.randint(0, 99)
+        guaranteed, threshold = cls._fire_cell_5a(arc_of_fire, rate_of_fire, size_modifier)
+        if guaranteed:
+            if trace is not None:
+                trace.add("hits", "  [Table 5A] Arc: %s, ROF: %s, Size mod: %s", arc_of_fire, rate_of_fire, size_modifier)
+                trace.add("hits", "    Cell: *%s -> %s guaranteed hits", guaranteed, guaranteed)
+            return guaranteed
+        roll = (rng or random).randint(0, 99)
         hits = 1 if roll < threshold else 0
-        if log is not None:
-            log.append(f"  [Table 5A] Arc: {arc_of_fire}, ROF: {rate_of_fire}, Size mod: {size_modifier}")
-            log.append(f"    Cell: {cell} ({threshold}% chance), Roll: {roll} -> {hits} hits")
+        if trace is not None:
+            trace.add("hits", "  [Table 5A] Arc: %s, ROF: %s, Size mod: %s", arc_of_fire, rate_of_fire, size_modifier)
+            trace.add("roll", "    Cell: %s (%s%% chance), Roll: %s -> %s hits", threshold, threshold, roll, hits)
         return hits
 
+    @classmethod
+    def get_fire_table_value5a_batch(
+            cls,
+            arcs_of_fire: Iterable[float],
+            rates_of_fire: Iterable[float],
+            size_modifiers: Iterable[int],
+            rolls: Optional[Sequence[int]] = None,
+            rng: Optional[random.Random] = None,
+    ) -> List[int]:
+        """
+        Vectorised form of get_fire_table_value5a.
+
+        Args:
+            arcs_of_fire, rates_of_fire, size_modifiers: Parallel iterables, one entry per burst.
+            rolls: Optional d100 rolls (0-99), one per burst; drawn from rng when omitted.
+                Rolls are only consumed by probability cells.
+            rng: Random source; defaults to the module-level random functions.
+
+        Returns:
+            Hits for each burst.
+        """
+        cells = []
+        for arc_of_fire, rate_of_fire, size_modifier in zip(arcs_of_fire, rates_of_fire, size_modifiers, strict=True):
+            if arc_of_fire > cls.ARC_KEYS_5A[-1]:
+                raise ValueError("arc_of_fire too large")
+            if rate_of_fire > 144:
+                raise ValueError("rate_of_fire too large")
+            cells.append(cls._fire_cell_5a(arc_of_fire, rate_of_fire, size_modifier))
+
+        if rolls is None:
+            drawn = iter(randints(rng, 0, 99, sum(1 for guaranteed, _ in cells if not guaranteed)))
+            rolls = [0 if guaranteed else next(drawn) for guaranteed, _ in cells]
+        return [
+            guaranteed if guaranteed else (1 if roll < threshold else 0)
+            for (guaranteed, threshold), roll in zip(cells, rolls, strict=True)
+        ]
+
     @classmethod
     def get_fire_table_probability_5a(cls, arc_of_fire: float, rate_of_fire: float, size_modifier: int) -> tuple[int, int]:
         """
@@ -119,92 +176,53 @@ class Table5AutoPelletShrapnel:
             - guaranteed_hits: Number of guaranteed hits (0 if not guaranteed)
             - probability_percent: Probability of 1 hit (0-100, 0 if guaranteed)
         """
-        FIRE_TABLE = {
-            0.000001: ["*3", "*4", "*5", "*6", "*7", "*8", "*9", "*10", "*12", "*18", "*36", "*54", "*72", "*144"],
-            0.000002: ["*3", "*4", "*5", "*5", "*6", "*7", "*8", "*9", "*11", "*16", "*33", "*49", "*65", "*131"],
-            0.000003: ["*2", "*3", "*4", "*5", "*6", "*6", "*7", "*8", "*9", "*14", "*28", "*43", "*57", "*114"],
-            0.2: ["*2", "*3", "*3", "*4", "*5", "*5", "*6", "*7", "*8", "*12", "*25", "*37", "*50", "*99"],
-            0.200001: ["*2", "*2", "*3", "*4", "*4", "*5", "*5", "*6", "*7", "*11", "*22", "*32", "*43", "*86"],
-            0.200002: ["*2", "*2", "*3", "*3", "*4", "*4", "*5", "*5", "*6", "*9", "*19", "*28", "*37", "*75"],
-            0.3: ["*1", "*2", "*2", "*3", "*3", "*4", "*4", "*5", "*5", "*8", "*16", "*24", "*33", "*65"],
-            0.300001: ["*1", "*2", "*2", "*2", "*3", "*3", "*4", "*4", "*5", "*7", "*14", "*21", "*28", "*57"],
-            0.4: ["*1", "*1", "*2", "*2", "*2", "*3", "*3", "*3", "*4", "*6", "*12", "*18", "*25", "*49"],
-            0.400001: ["89", "*1", "*1", "*2", "*2", "*2", "*3", "*3", "*4", "*5", "*11", "*16", "*21", "*43"],
-            0.5: ["77", "*1", "*1", "*2", "*2", "*2", "*2", "*3", "*3", "*5", "*9", "*14", "*19", "*37"],
-            0.6: ["67", "89", "*1", "*1", "*2", "*2", "*2", "*2", "*3", "*4", "*8", "*12", "*16", "*32"],
-            0.7: ["58", "78", "97", "*1", "*1", "*2", "*2", "*2", "*2", "*4", "*7", "*11", "*14", "*28"],
-            0.8: ["51", "67", "84", "*1", "*1", "*1", "*2", "*2", "*2", "*3", "*6", "*9", "*12", "*24"],
-            0.9: ["44", "58", "73", "88", "*1", "*1", "*1", "*1", "*2", "*3", "*5", "*8", "*11", "*21"],
-            1: ["38", "51", "64", "77", "89", "*1", "*1", "*1", "*2", "*2", "*5", "*7", "*9", "*19"],
-            1.000001: ["33", "44", "55", "66", "78", "89", "*1", "*1", "*1", "*2", "*4", "*6", "*8", "*16"],
-            1.000002: ["28", "38", "48", "58", "67", "77", "87", "97", "*1", "*2", "*3", "*5", "*7", "*14"],
-            1.000003: ["25", "33", "41", "50", "58", "67", "75", "84", "*1", "*2", "*3", "*5", "*6", "*12"],
-            2: ["21", "29", "36", "43", "51", "58", "65", "73", "88", "*1", "*2", "*3", "*5", "*11"],
-            2.000001: ["18", "25", "31", "38", "44", "50", "57", "63", "76", "*1", "*2", "*3", "*5", "*9"],
-            2.000002: ["16", "21", "27", "33", "38", "44", "49", "55", "66", "*1", "*2", "*3", "*4", "*8"],
-            3: ["14", "18", "23", "28", "33", "38", "43", "48", "57", "86", "*2", "*3", "*3", "*7"],
-            3.000001: ["12", "16", "20", "24", "29", "33", "37", "41", "50", "75", "*2", "*2", "*3", "*6"],
-            4: ["10", "14", "17", "21", "25", "28", "32", "36", "43", "65", "*1", "*2", "*3", "*5"],
-            4.000001: ["9", "12", "15", "18", "21", "25", "28", "31", "37", "56", "*1", "*2", "*2", "*5"],
-            5: ["7", "10", "13", "16", "18", "21", "24", "27", "32", "49", "98", "*1", "*2", "*4"],
-            5.000001: ["6", "9", "11", "13", "16", "18", "21", "23", "28", "42", "85", "*1", "*2", "*3"],
-            6: ["5", "7", "10", "12", "14", "16", "18", "20", "24", "37", "74", "*1", "*2", "*3"],
-            7: ["5", "6", "8", "10", "12", "14", "15", "17", "21", "32", "64", "97", "*1", "*3"],
-            8: ["4", "5", "7", "9", "10", "12", "13", "15", "18", "28", "56", "84", "*1", "*2"],
-            10: ["3", "5", "6", "7", "9", "10", "11", "13", "16", "24", "48", "73", "98", "*2"],
-            11: ["3", "4", "5", "6", "7", "9", "10", "11", "13", "21", "42", "64", "85", "*2"],
-            13: ["2", "3", "4", "5", "6", "7", "8", "9", "12", "18", "36", "55", "74", "*1"],
-            15: ["2", "3", "4", "4", "5", "6", "7", "8", "10", "15", "32", "48", "64", "*1"],
-            17: ["1", "2", "3", "4", "5", "5", "6", "7", "8", "13", "27", "41", "56", "*1"],
-            20: ["1", "2", "2", "3", "4", "5", "5", "6", "7", "11", "24", "36", "48", "97"],
-            23: ["1", "1", "2", "3", "3", "4", "4", "5", "6", "10", "20", "31", "42", "85"],
-            26: ["1", "1", "2", "2", "3", "3", "4", "4", "5", "8", "18", "27", "36", "73"],
-            30: ["0", "1", "1", "2", "2", "3", "3", "3", "4", "7", "15", "23", "31", "64"],
-            35: ["0", "1", "1", "1", "2", "2", "3", "3", "4", "6", "13", "20", "27", "55"],
-            40: ["0", "0", "1", "1", "1", "2", "2", "2", "3", "5", "11", "17", "23", "48"],
-            46: ["0", "0", "0", "1", "1", "1", "2", "2", "3", "4", "10", "15", "20", "42"],
-            53: ["0", "0", "0", "1", "1", "1", "1", "2", "2", "4", "8", "13", "17", "37"],
-            61: ["0", "0", "0", "0", "1", "1", "1", "1", "2", "3", "7", "11", "15", "31"],
-            70: ["0", "0", "0", "0", "0", "1", "1", "1", "1", "2", "6", "9", "13", "27"],
-            81: ["0", "0", "0", "0", "0", "0", "1", "1", "1", "2", "5", "8", "11", "23"],
-            93: ["0", "0", "0", "0", "0", "0", "0", "0", "1", "2", "4", "7", "10", "20"],
-            107: ["0", "0", "0", "0", "0", "0", "0", "0", "1", "1", "4", "6", "8", "17"],
-            123: ["0", "0", "0", "0", "0", "0", "0", "0", "0", "1", "3", "5", "7", "15"],
-            142: ["0", "0", "0", "0", "0", "0", "0", "0", "0", "1", "2", "4", "6", "13"],
-            163: ["0", "0", "0", "0", "0", "0", "0", "0", "0", "1", "2", "4", "5", "11"],
-            188: ["0", "0", "0", "0", "0", "0", "0", "0", "0", "0", "2", "3", "4", "10"],
-        }
-
-        FIRE_COLUMNS = [3, 4, 5, 6, 7, 8, 9, 10, 12, 18, 36, 54, 72, 144]
-        arc_keys = list(FIRE_TABLE.keys())
-        arc_keys.sort()
-
-        if arc_of_fire > arc_keys[-1]:
+        if arc_of_fire > cls.ARC_KEYS_5A[-1]:
             return (0, 0)
+        return cls._fire_cell_5a(arc_of_fire, min(rate_of_fire, 144), size_modifier)
 
-        arc_key = cls.ceil_key(arc_of_fire, arc_keys)
-
-        row_index = arc_keys.index(arc_key)
-        shifted_index = row_index - size_modifier
-        shifted_index = max(0, min(len(arc_keys) - 1, shifted_index))
-        row_key = arc_keys[shifted_index]
+    @classmethod
+    def get_fire_table_probability_5a_batch(
+            cls,
+            arcs_of_fire: Iterable[float],
+            rates_of_fire: Iterable[float],
+            size_modifiers: Iterable[int],
+    ) -> List[Tuple[int, int]]:
+        """Vectorised form of get_fire_table_probability_5a over parallel iterables."""
+        max_arc = cls.ARC_KEYS_5A[-1]
+        return [
+            (0, 0) if arc_of_fire > max_arc else cls._fire_cell_5a(arc_of_fire, min(rate_of_fire, 144), size_modifier)
+            for arc_of_fire, rate_of_fire, size_modifier in zip(arcs_of_fire, rates_of_fire, size_modifiers,
+                                                                strict=True)
+        ]
 
-        row = FIRE_TABLE[row_key]
-        if rate_of_fire > 144:
-            rate_of_fire = 144
+    @classmethod
+    def _pellet_value_index_5a(cls, base_shrapnel_pellet_hit_chance: float, is_guaranteed: bool,
+                               size_modifier: int) -> int:
+        """Index into PELLET_VALUES_5A after locating the base value and applying the size modifier."""
+        values = cls.PELLET_VALUES_5A
+        num_guaranteed = cls.PELLET_GUARANTEED_COUNT_5A
+        base = max(0.0, min(100.0, base_shrapnel_pellet_hit_chance))  # Clamp to 0-100
 
-        col_key = cls.ceil_key(rate_of_fire, FIRE_COLUMNS)
-        col_index = FIRE_COLUMNS.index(col_key)
-        cell = row[col_index]
+        if is_guaranteed:
+            start, negated, max_val = 0, cls._NEG_GUARANTEED_5A, 58
+        else:
+            start, negated, max_val = num_guaranteed, cls._NEG_PROBABILITY_5A, 87
 
-        if cell.startswith("*"):
-            return (int(cell[1:]), 0)
+        if base > max_val:
+            base_index = start
+        elif base <= values[-1]:
+            base_index = len(values) - 1
         else:
-            return (0, int(cell))
+            # Last entry of the (descending) segment that is still >= base
+            base_index = start + max(0, bisect.bisect_right(negated, -base) - 1)
+
+        # Apply size modifier: subtract to move left (higher values), add to move right (lower values)
+        adjusted_index = base_index - size_modifier
+        return max(0, min(len(values) - 1, adjusted_index))
 
     @classmethod
     def get_shrapnel_pellet_hits_5a(cls, base_shrapnel_pellet_hit_chance: float, is_guaranteed: bool,
-                                 size_modifier: int) -> int:
+                                 size_modifier: int, rng: Optional[random.Random] = None) -> int:
         """
         Calculates the number of shrapnel/pellet hits based on base chance, guaranteed flag, and size modifier.
 
@@ -212,46 +230,18 @@ class Table5AutoPelletShrapnel:
             base_shrapnel_pellet_hit_chance: Base hit chance or guaranteed hits value (0-100).
             is_guaranteed: If True, search in guaranteed (*) values; else, in probability values.
             size_modifier: Adjustment for target size (positive: larger target, move left/higher; negative: smaller, move right/lower).
+            rng: Random source; defaults to the module-level random functions.
 
         Returns:
             Number of hits (0-58), either guaranteed or probabilistic (0/1).
         """
-        full_values = [58, 44, 33, 25, 19, 14, 11, 8, 6, 5, 4, 3, 2, 2, 1, 87, 65, 49, 37, 28, 21, 15, 11, 8, 6, 4, 3,
-                       2, 1, 1, 0]
-        num_guaranteed = 15
-
-        base = max(0.0, min(100.0, base_shrapnel_pellet_hit_chance))  # Clamp to 0-100
-
-        if is_guaranteed:
-            candidates = range(num_guaranteed)
-            max_val = 58
-        else:
-            candidates = range(num_guaranteed, len(full_values))
-            max_val = 87
-
-        if base > max_val:
-            base_index = 0 if is_guaranteed else num_guaranteed
-        elif base <= full_values[-1]:
-            base_index = len(full_values) - 1
-        else:
-            base_index = None
-            for i in reversed(list(candidates)):
-                if full_values[i] >= base:
-                    base_index = i
-                    break
-            if base_index is None:
-                base_index = list(candidates)[0]
-
-        adjusted_index = base_index - size_modifier
-        adjusted_index = max(0, min(len(full_values) - 1, adjusted_index))
-
-        final_value = full_values[adjusted_index]
-        final_is_guaranteed = adjusted_index < num_guaranteed
+        index = cls._pellet_value_index_5a(base_shrapnel_pellet_hit_chance, is_guaranteed, size_modifier)
+        final_value = cls.PELLET_VALUES_5A[index]
 
-        if final_is_guaranteed:
+        if index < cls.PELLET_GUARANTEED_COUNT_5A:
             return min(58, final_value)
         else:
-            rand = random.randint(0, 99)
+            rand = (rng or random).randint(0, 99)
             return 1 if rand < final_value else 0
 
     @classmethod
@@ -270,41 +260,10 @@ class Table5AutoPelletShrapnel:
             - guaranteed_hits: Number of guaranteed hits (0 if not guaranteed)
             - probability_percent: Probability of 1 additional hit (0-100)
         """
-        # Values: guaranteed (0-14), then probabilistic (15-30)
-        full_values = [58, 44, 33, 25, 19, 14, 11, 8, 6, 5, 4, 3, 2, 2, 1, 87, 65, 49, 37, 28, 21, 15, 11, 8, 6, 4, 3,
-                       2, 1, 1, 0]
-        num_guaranteed = 15
-
-        base = max(0.0, min(100.0, base_shrapnel_pellet_hit_chance))
-
-        if is_guaranteed:
-            candidates = range(num_guaranteed)
-            max_val = 58
-        else:
-            candidates = range(num_guaranteed, len(full_values))
-            max_val = 87
-
-        if base > max_val:
-            base_index = 0 if is_guaranteed else num_guaranteed
-        elif base <= full_values[-1]:
-            base_index = len(full_values) - 1
-        else:
-            base_index = None
-            for i in reversed(list(candidates)):
-                if full_values[i] >= base:
-                    base_index = i
-                    break
-            if base_index is None:
-                base_index = list(candidates)[0]
-
-        # Apply size modifier: subtract to move left (higher values), add to move right (lower values)
-        adjusted_index = base_index - size_modifier
-        adjusted_index = max(0, min(len(full_values) - 1, adjusted_index))
-
-        final_value = full_values[adjusted_index]
-        final_is_guaranteed = adjusted_index < num_guaranteed
+        index = cls._pellet_value_index_5a(base_shrapnel_pellet_hit_chance, is_guaranteed, size_modifier)
+        final_value = cls.PELLET_VALUES_5A[index]
 
-        if final_is_guaranteed:
+        if index < cls.PELLET_GUARANTEED_COUNT_5A:
             return (min(58, final_value), 0)
         else:
             return (0, min(100, final_value))
@@ -1,114 +1,169 @@
+import bisect
 import random
 
-from typing import Optional
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 from phoenix_command.models.enums import MedicalAid, IncapacitationEffect
 from phoenix_command.models.recovery import Recovery
+from phoenix_command.simulations.rng import randints
+
+# Table 8A time units expressed in pulses
+_HOUR = 1800
+_DAY = 43200
+_MINUTE = 30
+_PULSE = 1
 
 
 class Table8HealingAndRecovery:
 
+    # Incapacitation time in phases, keyed by physical damage total, one column per roll band
+    INC_TABLE_8B = {
+        50: (4, 15, 29, 47, 73, 120),
+        100: (25, 90, 150, 270, 420, 750),
+        200: (90, 330, 630, 690, 1590, 2880),
+        300: (600, 1980, 3780, 7200, 10800, 18000),
+        450: (750, 2550, 10800, 14400, 25200, 43200),
+        600: (1500, 10800, 18000, 32400, 50400, 90000),
+        750: (7200, 21600, 39600, 68400, 104400, 190800),
+        1000: (18000, 61200, 115200, 190800, 295200, 259200),
+    }
+    # Column of INC_TABLE_8B for a modified roll of 0..9 (rolls above 9 use the last column)
+    ROLL_COLUMNS_8B = (0, 1, 1, 2, 2, 2, 3, 3, 4, 5)
+
+    # Critical time periods are already in pulses
+    # (damage, healing days, then (CTP, RR) for each MedicalAid in AID_COLUMNS_8A order)
+    TABLE_8A = (
+        (5, 17, 79 * _HOUR, 94, 25 * _DAY, 96, 99 * _DAY, 99, 99 * _DAY, 99, 25 * _DAY, 99),
+        (10, 25, 75 * _HOUR, 89, 25 * _DAY, 92, 99 * _DAY, 99, 99 * _DAY, 99, 25 * _DAY, 99),
+        (15, 30, 72 * _HOUR, 85, 25 * _DAY, 89, 99 * _DAY, 99, 99 * _DAY, 99, 25 * _DAY, 99),
+        (20, 35, 68 * _HOUR, 81, 25 * _DAY, 86, 25 * _DAY, 96, 99 * _DAY, 99, 25 * _DAY, 99),
+        (25, 38, 65 * _HOUR, 77, 25 * _DAY, 82, 25 * _DAY, 95, 99 * _DAY, 99, 25 * _DAY, 99),
+        (30, 41, 62 * _HOUR, 73, 25 * _DAY, 79, 25 * _DAY, 94, 99 * _DAY, 99, 25 * _DAY, 99),
+        (35, 43, 59 * _HOUR, 69, 25 * _DAY, 76, 25 * _DAY, 93, 25 * _DAY, 97, 25 * _DAY, 99),
+        (40, 44, 56 * _HOUR, 66, 25 * _DAY, 73, 25 * _DAY, 92, 25 * _DAY, 96, 25 * _DAY, 99),
+        (45, 46, 53 * _HOUR, 63, 25 * _DAY, 70, 25 * _DAY, 91, 25 * _DAY, 96, 25 * _DAY, 99),
+        (50, 47, 51 * _HOUR, 60, 25 * _DAY, 68, 25 * _DAY, 90, 25 * _DAY, 95, 25 * _DAY, 99),
+        (60, 48, 46 * _HOUR, 54, 25 * _DAY, 63, 25 * _DAY, 89, 25 * _DAY, 94, 25 * _DAY, 99),
+        (70, 50, 41 * _HOUR, 49, 25 * _DAY, 58, 25 * _DAY, 87, 25 * _DAY, 94, 25 * _DAY, 99),
+        (80, 51, 37 * _HOUR, 44, 25 * _DAY, 54, 25 * _DAY, 85, 25 * _DAY, 92, 25 * _DAY, 97),
+        (90, 52, 34 * _HOUR, 40, 25 * _DAY, 50, 25 * _DAY, 83, 25 * _DAY, 91, 25 * _DAY, 96),
+        (100, 53, 31 * _HOUR, 36, 25 * _DAY, 46, 25 * _DAY, 82, 25 * _DAY, 90, 25 * _DAY, 96),
+        (200, 61, 11 * _HOUR, 12, 23 * _DAY, 21, 25 * _DAY, 67, 25 * _DAY, 82, 25 * _DAY, 92),
+        (300, 65, 4 * _HOUR, 4, 19 * _DAY, 10, 25 * _DAY, 55, 25 * _DAY, 74, 25 * _DAY, 89),
+        (400, 68, 93 * _MINUTE, 1, 16 * _DAY, 4, 25 * _DAY, 45, 25 * _DAY, 67, 25 * _DAY, 85),
+        (500, 70, 35 * _MINUTE, 0, 13 * _DAY, 2, 25 * _DAY, 37, 25 * _DAY, 61, 25 * _DAY, 82),
+        (600, 72, 13 * _MINUTE, 0, 10 * _DAY, 1, 25 * _DAY, 30, 25 * _DAY, 55, 25 * _DAY, 79),
+        (700, 73, 6 * _MINUTE, 0, 8 * _DAY, 0, 25 * _DAY, 25, 25 * _DAY, 50, 25 * _DAY, 76),
+        (800, 75, 5 * _MINUTE, 0, 7 * _DAY, 0, 25 * _DAY, 20, 25 * _DAY, 45, 25 * _DAY, 73),
+        (900, 76, 4 * _MINUTE, 0, 6 * _DAY, 0, 25 * _DAY, 16, 25 * _DAY, 41, 25 * _DAY, 70),
+        (1000, 77, 90 * _PULSE, 0, 5 * _DAY, 0, 25 * _DAY, 13, 25 * _DAY, 37, 25 * _DAY, 67),
+        (2000, 84, 85 * _PULSE, 0, 15 * _HOUR, 0, 6 * _DAY, 2, 25 * _DAY, 13, 25 * _DAY, 45),
+        (3000, 88, 81 * _PULSE, 0, 2 * _HOUR, 0, 21 * _HOUR, 0, 5 * _DAY, 5, 18 * _HOUR, 30),
+        (4000, 91, 76 * _PULSE, 0, 22 * _MINUTE, 0, 4 * _HOUR, 0, 18 * _HOUR, 2, 72 * _HOUR, 20),
+        (5000, 93, 71 * _PULSE, 0, 6 * _MINUTE, 0, 63 * _MINUTE, 0, 5 * _HOUR, 1, 21 * _HOUR, 13),
+        (6000, 95, 67 * _PULSE, 0, 4 * _MINUTE, 0, 36 * _MINUTE, 0, 3 * _HOUR, 0, 12 * _HOUR, 9),
+        (7000, 96, 62 * _PULSE, 0, 87 * _PULSE, 0, 29 * _MINUTE, 0, 2 * _HOUR, 0, 10 * _HOUR, 6),
+        (8000, 98, 57 * _PULSE, 0, 75 * _PULSE, 0, 25 * _MINUTE, 0, 2 * _HOUR, 0, 8 * _HOUR, 4),
+        (9000, 99, 52 * _PULSE, 0, 67 * _PULSE, 0, 22 * _MINUTE, 0, 2 * _HOUR, 0, 7 * _HOUR, 3),
+        (12000, 102, 38 * _PULSE, 0, 57 * _PULSE, 0, 19 * _MINUTE, 0, 95 * _MINUTE, 0, 6 * _HOUR, 1),
+        (16000, 105, 25 * _PULSE, 0, 44 * _PULSE, 0, 15 * _MINUTE, 0, 75 * _MINUTE, 0, 5 * _HOUR, 0),
+        (16001, 999, 1 * _PULSE, 0, 1 * _PULSE, 0, 1 * _MINUTE, 0, 1 * _MINUTE, 0, 1 * _HOUR, 0),
+    )
+    AID_COLUMNS_8A = (
+        MedicalAid.NO_AID,
+        MedicalAid.FIRST_AID,
+        MedicalAid.AID_STATION,
+        MedicalAid.FIELD_HOSPITAL,
+        MedicalAid.TRAUMA_CENTER,
+    )
+
+    # Incapacitation effect roll thresholds per damage band (PD+shock below KO, 2xKO, 3xKO, above)
+    EFFECT_THRESHOLDS = (
+        (0, 2, 5),
+        (2, 8, 16),
+        (13, 31, 52),
+        (26, 53, 82),
+    )
+    EFFECTS = (
+        IncapacitationEffect.KNOCKED_OUT,
+        IncapacitationEffect.STUNNED,
+        IncapacitationEffect.DAZED,
+        IncapacitationEffect.DISORIENTED,
+    )
+
+    INC_KEYS_8B = tuple(sorted(INC_TABLE_8B))
+    INC_ROWS_8B = tuple(row for _, row in sorted(INC_TABLE_8B.items()))
+    _DAMAGE_KEYS_8A = tuple(row[0] for row in TABLE_8A)
+
     @classmethod
-    def get_incapacitation_time_8b(cls, physical_damage_total: int, modifier: int = 0) -> int:
-        """Return incapacitation time in phases with optional modifier to roll."""
+    def _incapacitation_row_8b(cls, physical_damage_total: int) -> Tuple[int, ...]:
+        """Return the INC_TABLE_8B row for the largest key not above the damage (minimum 50)."""
+        return cls.INC_ROWS_8B[bisect.bisect_right(cls.INC_KEYS_8B, max(50, physical_damage_total)) - 1]
 
-        INC_TABLE = {
-            50: [4, 15, 29, 47, 73, 120],
-            100: [25, 90, 150, 270, 420, 750],
-            200: [90, 330, 630, 690, 1590, 2880],
-            300: [600, 1980, 3780, 7200, 10800, 18000],
-            450: [750, 2550, 10800, 14400, 25200, 43200],
-            600: [1500, 10800, 18000, 32400, 50400, 90000],
-            750: [7200, 21600, 39600, 68400, 104400, 190800],
-            1000: [18000, 61200, 115200, 190800, 295200, 259200],
-        }
-
-        row_key = max(k for k in INC_TABLE.keys() if k <= max(50, physical_damage_total))
-
-        r = max(0, random.randint(0, 9) + modifier)
-        if r == 0:
-            col = 0
-        elif 1 <= r <= 2:
-            col = 1
-        elif 3 <= r <= 5:
-            col = 2
-        elif 6 <= r <= 7:
-            col = 3
-        elif r == 8:
-            col = 4
-        else:  # r == 9
-            col = 5
-
-        return INC_TABLE[row_key][col]
+    @classmethod
+    def get_incapacitation_time_8b(cls, physical_damage_total: int, modifier: int = 0,
+                                   rng: Optional[random.Random] = None) -> int:
+        """Return incapacitation time in phases with optional modifier to roll."""
+        row = cls._incapacitation_row_8b(physical_damage_total)
+        r = max(0, (rng or random).randint(0, 9) + modifier)
+        return row[cls.ROLL_COLUMNS_8B[min(r, 9)]]
 
     @classmethod
-    def get_critical_time_period_and_recovery_chance_8a(cls, physical_damage: float, target_health: float) -> Recovery:
-        # Конвертеры
-        H = 1800  # 1 hour in pulses
-        D = 43200  # 1 day in pulses
-        M = 30  # 1 minute in pulses
-        P = 1  # pulse stays pulse
-
-        # Таблица уже в pulses
-        TABLE = [
-            (5, 17, 79 * H, 94, 25 * D, 96, 99 * D, 99, 99 * D, 99, 25 * D, 99),
-            (10, 25, 75 * H, 89, 25 * D, 92, 99 * D, 99, 99 * D, 99, 25 * D, 99),
-            (15, 30, 72 * H, 85, 25 * D, 89, 99 * D, 99, 99 * D, 99, 25 * D, 99),
-            (20, 35, 68 * H, 81, 25 * D, 86, 25 * D, 96, 99 * D, 99, 25 * D, 99),
-            (25, 38, 65 * H, 77, 25 * D, 82, 25 * D, 95, 99 * D, 99, 25 * D, 99),
-            (30, 41, 62 * H, 73, 25 * D, 79, 25 * D, 94, 99 * D, 99, 25 * D, 99),
-            (35, 43, 59 * H, 69, 25 * D, 76, 25 * D, 93, 25 * D, 97, 25 * D, 99),
-            (40, 44, 56 * H, 66, 25 * D, 73, 25 * D, 92, 25 * D, 96, 25 * D, 99),
-            (45, 46, 53 * H, 63, 25 * D, 70, 25 * D, 91, 25 * D, 96, 25 * D, 99),
-            (50, 47, 51 * H, 60, 25 * D, 68, 25 * D, 90, 25 * D, 95, 25 * D, 99),
-            (60, 48, 46 * H, 54, 25 * D, 63, 25 * D, 89, 25 * D, 94, 25 * D, 99),
-            (70, 50, 41 * H, 49, 25 * D, 58, 25 * D, 87, 25 * D, 94, 25 * D, 99),
-            (80, 51, 37 * H, 44, 25 * D, 54, 25 * D, 85, 25 * D, 92, 25 * D, 97),
-            (90, 52, 34 * H, 40, 25 * D, 50, 25 * D, 83, 25 * D, 91, 25 * D, 96),
-            (100, 53, 31 * H, 36, 25 * D, 46, 25 * D, 82, 25 * D, 90, 25 * D, 96),
-            (200, 61, 11 * H, 12, 23 * D, 21, 25 * D, 67, 25 * D, 82, 25 * D, 92),
-            (300, 65, 4 * H, 4, 19 * D, 10, 25 * D, 55, 25 * D, 74, 25 * D, 89),
-            (400, 68, 93 * M, 1, 16 * D, 4, 25 * D, 45, 25 * D, 67, 25 * D, 85),
-            (500, 70, 35 * M, 0, 13 * D, 2, 25 * D, 37, 25 * D, 61, 25 * D, 82),
-            (600, 72, 13 * M, 0, 10 * D, 1, 25 * D, 30, 25 * D, 55, 25 * D, 79),
-            (700, 73, 6 * M, 0, 8 * D, 0, 25 * D, 25, 25 * D, 50, 25 * D, 76),
-            (800, 75, 5 * M, 0, 7 * D, 0, 25 * D, 20, 25 * D, 45, 25 * D, 73),
-            (900, 76, 4 * M, 0, 6 * D, 0, 25 * D, 16, 25 * D, 41, 25 * D, 70),
-            (1000, 77, 90 * P, 0, 5 * D, 0, 25 * D, 13, 25 * D, 37, 25 * D, 67),
-            (2000, 84, 85 * P, 0, 15 * H, 0, 6 * D, 2, 25 * D, 13, 25 * D, 45),
-            (3000, 88, 81 * P, 0, 2 * H, 0, 21 * H, 0, 5 * D, 5, 18 * H, 30),
-            (4000, 91, 76 * P, 0, 22 * M, 0, 4 * H, 0, 18 * H, 2, 72 * H, 20),
-            (5000, 93, 71 * P, 0, 6 * M, 0, 63 * M, 0, 5 * H, 1, 21 * H, 13),
-            (6000, 95, 67 * P, 0, 4 * M, 0, 36 * M, 0, 3 * H, 0, 12 * H, 9),
-            (7000, 96, 62 * P, 0, 87 * P, 0, 29 * M, 0, 2 * H, 0, 10 * H, 6),
-            (8000, 98, 57 * P, 0, 75 * P, 0, 25 * M, 0, 2 * H, 0, 8 * H, 4),
-            (9000, 99, 52 * P, 0, 67 * P, 0, 22 * M, 0, 2 * H, 0, 7 * H, 3),
-            (12000, 102, 38 * P, 0, 57 * P, 0, 19 * M, 0, 95 * M, 0, 6 * H, 1),
-            (16000, 105, 25 * P, 0, 44 * P, 0, 15 * M, 0, 75 * M, 0, 5 * H, 0),
-            (16001, 999, 1 * P, 0, 1 * P, 0, 1 * M, 0, 1 * M, 0, 1 * H, 0),
+    def get_incapacitation_time_8b_batch(
+        cls,
+        physical_damage_totals: Iterable[int],
+        modifiers: Union[int, Iterable[int]] = 0,
+        rolls: Optional[Iterable[int]] = None,
+        rng: Optional[random.Random] = None,
+    ) -> List[int]:
+        """Return incapacitation times for many characters at once.
+
+        Args:
+            physical_damage_totals: Physical damage total of each character.
+            modifiers: One roll modifier for all characters, or one per character.
+            rolls: Optional unmodified 0-9 rolls, one per character. Drawn from rng when omitted,
+                in the same order as repeated get_incapacitation_time_8b calls.
+            rng: Random source; defaults to the module-level random functions.
+
+        Returns:
+            Incapacitation time in phases for each character.
+        """
+        totals = list(physical_damage_totals)
+        modifiers = [modifiers] * len(totals) if isinstance(modifiers, int) else list(modifiers)
+        rolls = randints(rng, 0, 9, len(totals)) if rolls is None else list(rolls)
+        columns = cls.ROLL_COLUMNS_8B
+        return [
+            cls._incapacitation_row_8b(total)[columns[min(max(0, roll + modifier), 9)]]
+            for total, modifier, roll in zip(totals, modifiers, rolls, strict=True)
         ]
 
+    @classmethod
+    def _recovery_row_8a(cls, physical_damage: float, target_health: float) -> Tuple[int, ...]:
+        """Return the TABLE_8A row whose damage is closest to the health-scaled damage (lower row on ties)."""
         lookup = physical_damage * 10.0 / target_health
+        keys = cls._DAMAGE_KEYS_8A
+        i = bisect.bisect_left(keys, lookup)
+        if i == len(keys) or (i > 0 and abs(keys[i - 1] - lookup) <= abs(keys[i] - lookup)):
+            i -= 1
+        return cls.TABLE_8A[i]
 
-        closest_row = min(TABLE, key=lambda r: abs(r[0] - lookup))
-
-        (
-            dmg, healing_days,
-            no_ctp, no_rr,
-            fa_ctp, fa_rr,
-            as_ctp, as_rr,
-            fh_ctp, fh_rr,
-            tc_ctp, tc_rr
-        ) = closest_row
+    @classmethod
+    def _recovery_from_row_8a(cls, row: Sequence[int]) -> Recovery:
+        aid_map = {aid: (row[2 + 2 * i], row[3 + 2 * i]) for i, aid in enumerate(cls.AID_COLUMNS_8A)}
+        return Recovery(float(row[1]), aid_map)
 
-        aid_map = {
-            MedicalAid.NO_AID: (no_ctp, no_rr),
-            MedicalAid.FIRST_AID: (fa_ctp, fa_rr),
-            MedicalAid.AID_STATION: (as_ctp, as_rr),
-            MedicalAid.FIELD_HOSPITAL: (fh_ctp, fh_rr),
-            MedicalAid.TRAUMA_CENTER: (tc_ctp, tc_rr),
-        }
+    @classmethod
+    def get_critical_time_period_and_recovery_chance_8a(cls, physical_damage: float, target_health: float) -> Recovery:
+        return cls._recovery_from_row_8a(cls._recovery_row_8a(physical_damage, target_health))
 
-        return Recovery(float(healing_days), aid_map)
+    @classmethod
+    def get_critical_time_period_and_recovery_chance_8a_batch(
+        cls, physical_damages: Iterable[float], target_healths: Iterable[float]
+    ) -> List[Recovery]:
+        """Return Table 8A recovery data for parallel sequences of damage and health."""
+        return [
+            cls._recovery_from_row_8a(cls._recovery_row_8a(damage, health))
+            for damage, health in zip(physical_damages, target_healths, strict=True)
+        ]
 
     @classmethod
     def get_incapacitation_chance(cls, pd_with_shock: int, knockout_value: int) -> int:
@@ -125,41 +180,42 @@ class Table8HealingAndRecovery:
             return 98
 
     @classmethod
-    def get_incapacitation_effect(cls, pd_with_shock: int, knockout_value: int, effect_roll: int) -> Optional[IncapacitationEffect]:
-        """Return incapacitation effect based on damage level and roll."""
+    def get_incapacitation_chance_batch(
+        cls, pd_with_shocks: Iterable[int], knockout_values: Iterable[int]
+    ) -> List[int]:
+        """Return incapacitation chance percentages for parallel sequences of damage and KO values."""
+        return [
+            cls.get_incapacitation_chance(pd, ko)
+            for pd, ko in zip(pd_with_shocks, knockout_values, strict=True)
+        ]
+
+    @staticmethod
+    def _damage_band(pd_with_shock: int, knockout_value: int) -> int:
+        """Return the EFFECT_THRESHOLDS band for damage relative to the knockout value."""
         if pd_with_shock < knockout_value:
-            if effect_roll <= 0:
-                return IncapacitationEffect.KNOCKED_OUT
-            elif effect_roll <= 2:
-                return IncapacitationEffect.STUNNED
-            elif effect_roll <= 5:
-                return IncapacitationEffect.DAZED
-            else:
-                return IncapacitationEffect.DISORIENTED
+            return 0
         elif pd_with_shock < knockout_value * 2:
-            if effect_roll <= 2:
-                return IncapacitationEffect.KNOCKED_OUT
-            elif effect_roll <= 8:
-                return IncapacitationEffect.STUNNED
-            elif effect_roll <= 16:
-                return IncapacitationEffect.DAZED
-            else:
-                return IncapacitationEffect.DISORIENTED
+            return 1
         elif pd_with_shock < knockout_value * 3:
-            if effect_roll <= 13:
-                return IncapacitationEffect.KNOCKED_OUT
-            elif effect_roll <= 31:
-                return IncapacitationEffect.STUNNED
-            elif effect_roll <= 52:
-                return IncapacitationEffect.DAZED
-            else:
-                return IncapacitationEffect.DISORIENTED
-        else:
-            if effect_roll <= 26:
-                return IncapacitationEffect.KNOCKED_OUT
-            elif effect_roll <= 53:
-                return IncapacitationEffect.STUNNED
-            elif effect_roll <= 82:
-                return IncapacitationEffect.DAZED
-            else:
-                return IncapacitationEffect.DISORIENTED
+            return 2
+        return 3
+
+    @classmethod
+    def get_incapacitation_effect(cls, pd_with_shock: int, knockout_value: int, effect_roll: int) -> Optional[IncapacitationEffect]:
+        """Return incapacitation effect based on damage level and roll."""
+        thresholds = cls.EFFECT_THRESHOLDS[cls._damage_band(pd_with_shock, knockout_value)]
+        return cls.EFFECTS[bisect.bisect_left(thresholds, effect_roll)]
+
+    @classmethod
+    def get_incapacitation_effect_batch(
+        cls,
+        pd_with_shocks: Iterable[int],
+        knockout_values: Iterable[int],
+        effect_rolls: Iterable[int],
+    ) -> List[IncapacitationEffect]:
+        """Return incapacitation effects for parallel sequences of damage, KO values and effect rolls."""
+        thresholds, effects, band = cls.EFFECT_THRESHOLDS, cls.EFFECTS, cls._damage_band
+        return [
+            effects[bisect.bisect_left(thresholds[band(pd, ko)], roll)]
+            for pd, ko, roll in zip(pd_with_shocks, knockout_values, effect_rolls, strict=True)
+        ]
@@ -0,0 +1,29 @@
+"""Shared fixtures for the combat model and simulator tests."""
+
+import pytest
+
+from phoenix_command.item_database.weapons import WEAPONS_LIST
+from phoenix_command.models.character import Character
+from phoenix_command.models.hit_result_advanced import ShotParameters
+
+
+@pytest.fixture
+def make_character():
+    """Factory for an average character: every attribute 12, gun combat skill 8."""
+
+    def make(name: str = "Test", skill: int = 8, **attributes) -> Character:
+        values = dict(strength=12, intelligence=12, will=12, health=12, agility=12)
+        values.update(attributes)
+        return Character(name=name, gun_combat_skill_level=skill, **values)
+
+    return make
+
+
+@pytest.fixture
+def rifle_shot():
+    """(weapon, ammunition, fully aimed ShotParameters) for the first rifle with ballistic data."""
+    weapon = next(w for w in WEAPONS_LIST if w.ammunition_types and w.aim_time_modifiers and w.ballistic_data)
+    params = ShotParameters(
+        aim_time_ac=max(weapon.aim_time_modifiers), situation_stance_modifiers=[], visibility_modifiers=[]
+    )
+    return weapon, weapon.ammunition_types[0], params
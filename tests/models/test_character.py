@@ -0,0 +1,176 @@
+"""Tests for the Character model: cached stats, armor index and shared gear."""
+
+import copy
+import pickle
+
+from phoenix_command.item_database.character_templates import character_templates
+from phoenix_command.models.character import Character
+from phoenix_command.models.enums import AdvancedHitLocation, ArmorMaterial
+from phoenix_command.models.gear import Armor, Gear
+from phoenix_command.tables.core.table1_character_generation import Table1CharacterGeneration
+
+
+def _vest() -> Armor:
+    armor = Armor(name="Vest", weight=10.0)
+    armor.add_protection(AdvancedHitLocation.HEART, True, ArmorMaterial.KEVLAR, 10, 4)
+    return armor
+
+
+def _count_chain_runs(monkeypatch) -> list:
+    calls = []
+    original = Table1CharacterGeneration.get_combat_actions_1d
+
+    def counting(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(Table1CharacterGeneration, "get_combat_actions_1d", counting)
+    return calls
+
+
+class TestDerivedStatCache:
+    """Tests for computing derived stats once and invalidating on change."""
+
+    def test_stats_match_tables(self, make_character):
+        """Cached values equal a direct run of the Table 1 chain."""
+        character = make_character()
+        character.add_gear(Gear(name="Pack", weight=30.0))
+        base_speed = Table1CharacterGeneration.get_base_speed_1a(12, 30.0)
+        max_speed = int(Table1CharacterGeneration.get_max_speed_1b(12, base_speed))
+        isf = 12 + Table1CharacterGeneration.get_skill_accuracy_level_1c(8)
+        combat_actions = Table1CharacterGeneration.get_combat_actions_1d(max_speed, isf)
+        assert character.encumbrance == 30.0
+        assert character.base_speed == base_speed
+        assert character.max_speed == max_speed
+        assert character.combat_actions == combat_actions
+        assert character.impulses == Table1CharacterGeneration.get_impulses_1e(combat_actions)
+        assert character.defensive_alm == Table1CharacterGeneration.get_defensive_alm(isf)
+        assert character.knockout_value == 48
+
+    def test_chain_runs_once(self, monkeypatch, make_character):
+        """Repeated access does not recompute the chain."""
+        calls = _count_chain_runs(monkeypatch)
+        character = make_character()
+        for _ in range(5):
+            character.impulses, character.combat_actions, character.defensive_alm
+        assert len(calls) == 1
+
+    def test_attribute_and_gear_changes_invalidate(self, monkeypatch, make_character):
+        """Setting an input attribute or changing gear recomputes; damage does not."""
+        calls = _count_chain_runs(monkeypatch)
+        character = make_character()
+        speed = character.max_speed
+        character.apply_damage(5)
+        character.combat_actions
+        assert len(calls) == 1
+
+        character.strength = 6
+        character.combat_actions
+        assert len(calls) == 2
+
+        character.add_gear(Gear(name="Anvil", weight=200.0))
+        assert character.max_speed < speed
+        character.remove_gear(character.equipment[0])
+        assert character.max_speed == int(Table1CharacterGeneration.get_max_speed_1b(
+            12, Table1CharacterGeneration.get_base_speed_1a(6, 0.0)
+        ))
+
+    def test_armor_protection_follows_degradation(self, make_character):
+        """Armor protection reflects layer degradation without a rebuild."""
+        character = make_character()
+        character.add_gear(_vest())
+        assert character.armor_protection[(AdvancedHitLocation.HEART, True)] == (10, 4)
+        index = character.armor_index
+
+        layer = character.equipment[0].get_protection(AdvancedHitLocation.HEART, True).layers[0]
+        layer.apply_penetration_damage()
+        assert character.armor_index is index
+        assert character.armor_protection[(AdvancedHitLocation.HEART, True)] == (
+            layer.effective_protection, layer.effective_blunt_protection
+        )
+
+    def test_gear_changes_rebuild_armor_index(self, make_character):
+        """Adding or removing armor rebuilds the index and detaches the old one."""
+        character = make_character()
+        character.add_gear(_vest())
+        old_index = character.armor_index
+        character.add_gear(_vest())
+        stack = character.armor_index[(AdvancedHitLocation.HEART, True)]
+        assert len(stack.pieces) == 2
+        assert stack.total_protection == 20
+        assert all(
+            entry[0] is not old_index[(AdvancedHitLocation.HEART, True)]
+            for _, data in stack.pieces for layer in data.layers for entry in layer._stacks
+        )
+        character.remove_gear(character.equipment[0])
+        assert character.armor_protection[(AdvancedHitLocation.HEART, True)] == (10, 4)
+
+    def test_copies_keep_working(self, make_character):
+        """Deep copies and pickles carry independent caches."""
+        character = make_character()
+        character.impulses
+        clone = copy.deepcopy(character)
+        clone.add_gear(Gear(name="Anvil", weight=200.0))
+        assert clone.encumbrance == 200.0
+        assert character.encumbrance == 0
+        assert pickle.loads(pickle.dumps(character)).impulses == character.impulses
+
+
+class TestRosterStats:
+    """Tests for Character.recompute_roster_stats."""
+
+    def test_identical_characters_share_one_run(self, monkeypatch, make_character):
+        """One chain run per distinct stat profile."""
+        roster = [make_character(f"NPC {i}") for i in range(10)] + [make_character("Strong", strength=18)]
+        calls = _count_chain_runs(monkeypatch)
+        Character.recompute_roster_stats(roster)
+        assert len(calls) == 2
+        assert roster[0].impulses == roster[9].impulses
+        assert roster[-1].max_speed == make_character(strength=18).max_speed
+        assert len(calls) == 3
+
+    def test_roster_member_can_change_independently(self, make_character):
+        """Changing one member after a bulk refresh does not affect the others."""
+        roster = [make_character("A"), make_character("B")]
+        Character.recompute_roster_stats(roster)
+        roster[0].add_gear(Gear(name="Anvil", weight=200.0))
+        assert roster[0].encumbrance == 200.0
+        assert roster[1].encumbrance == 0
+
+    def test_roster_members_do_not_share_mutable_stats(self, make_character):
+        """Each member gets its own stats dict and impulse list."""
+        roster = [make_character("A"), make_character("B")]
+        Character.recompute_roster_stats(roster)
+        assert roster[0]._stats is not roster[1]._stats
+        roster[0].impulses[0] += 1
+        assert roster[1].impulses[0] == roster[0].impulses[0] - 1
+
+
+class TestSharedGear:
+    """Tests for carrying shared gear templates."""
+
+    def test_add_gear_shares_templates(self, make_character):
+        """Weapons are shared with their template; armor gets its own layers."""
+        weapon = next(item for item in character_templates[0].equipment if not isinstance(item, Armor))
+        character = make_character()
+        character.add_gear(weapon)
+        character.add_gear(_vest())
+        assert character.equipment[0] is weapon
+        assert isinstance(character.equipment[1], Armor)
+
+    def test_clone_roster_from_template(self, make_character):
+        """Clones share gear templates but degrade and take damage independently."""
+        template = make_character("Template")
+        template.add_gear(Gear(name="Rifle", weight=8.0))
+        template.add_gear(_vest())
+        roster = [template.clone() for _ in range(3)]
+
+        assert all(member.equipment[0] is template.equipment[0] for member in roster)
+        assert roster[0].equipment[1] is not roster[1].equipment[1]
+
+        roster[0].equipment[1].process_hit(AdvancedHitLocation.HEART, True, 50.0)
+        roster[0].apply_damage(12)
+        assert roster[1].armor_protection == template.armor_protection == {(AdvancedHitLocation.HEART, True): (10, 4)}
+        assert roster[0].armor_protection != roster[1].armor_protection
+        assert (roster[1].physical_damage_total, len(roster[1].hit_history)) == (0, 0)
+        assert roster[1].impulses == template.impulses
@@ -0,0 +1,127 @@
+"""Tests for structured combat traces and their use in the combat simulator."""
+
+import random
+
+import pytest
+
+from phoenix_command.models.combat_trace import NULL_TRACE, CombatTrace, TraceEvent
+from phoenix_command.models.enums import TargetExposure
+from phoenix_command.simulations.combat_simulator import CombatSimulator
+from phoenix_command.simulations.combat_simulator_utils import CombatSimulatorUtils
+
+
+class _Exploding:
+    def __str__(self):
+        raise AssertionError("formatted eagerly")
+
+
+class TestCombatTrace:
+    """Tests for CombatTrace recording and rendering."""
+
+    def test_render_formats_templates(self):
+        """Events render with %-formatting, including literal percent signs."""
+        trace = CombatTrace()
+        trace.add("roll", "Odds: %s%%, Roll: %s", 45, 12)
+        trace.add("eal", "  Custom EAL '%s': %+d", "cover", 3)
+        assert trace.lines() == ["Odds: 45%, Roll: 12", "  Custom EAL 'cover': +3"]
+        assert trace.render() == "Odds: 45%, Roll: 12\n  Custom EAL 'cover': +3"
+        assert trace.render(None, "tail") == "Odds: 45%, Roll: 12\n  Custom EAL 'cover': +3\n\ntail"
+
+    def test_formatting_is_deferred(self):
+        """Arguments are only formatted when the trace is rendered."""
+        trace = CombatTrace()
+        trace.add("damage", "Damage: %s", _Exploding())
+        assert len(trace) == 1
+        assert isinstance(trace.events[0], TraceEvent)
+        assert trace.events[0].kind == "damage"
+
+    def test_branch_and_extend(self):
+        """Branches start empty and merge back in order."""
+        trace = CombatTrace()
+        trace.add("header", "start")
+        branch = trace.branch()
+        branch.add("armor", "layer %s", 1)
+        trace.extend(branch)
+        assert list(trace) == ["start", "layer 1"]
+        assert [e.kind for e in trace.of_kind("armor")] == ["armor"]
+
+    def test_null_trace_records_nothing(self):
+        """NULL_TRACE ignores events, branches to itself and renders None."""
+        NULL_TRACE.add("damage", "Damage: %s", _Exploding())
+        NULL_TRACE.extend(CombatTrace())
+        assert NULL_TRACE.branch() is NULL_TRACE
+        assert len(NULL_TRACE) == 0
+        assert NULL_TRACE.render("tail") is None
+        assert NULL_TRACE.snapshot(CombatTrace()) is NULL_TRACE
+
+    def test_snapshot_renders_like_joined_text(self):
+        """A snapshot is detached from later events and renders like render() with tail text."""
+        trace = CombatTrace()
+        trace.add("header", "head %s", 1)
+        tail = CombatTrace()
+        tail.add("damage", "tail %s", 2)
+        snapshot = trace.snapshot(tail, None, CombatTrace())
+        trace.add("header", "later")
+        assert snapshot.render() == "head 1\ntail 2\n\n"
+
+
+class TestSimulatorTracing:
+    """Tests for traces passed to simulator entry points."""
+
+    def test_null_trace_matches_recorded_run(self, make_character, rifle_shot):
+        """A headless run produces the same outcomes as a traced run, without log text."""
+        weapon, ammo, params = rifle_shot
+        traced = [
+            CombatSimulator.single_shot(
+                make_character("S"), make_character("T"), weapon, ammo, 10, TargetExposure.STANDING_EXPOSED, params, True,
+                random.Random(seed)
+            )
+            for seed in range(30)
+        ]
+        headless = [
+            CombatSimulator.single_shot(
+                make_character("S"), make_character("T"), weapon, ammo, 10, TargetExposure.STANDING_EXPOSED, params, True,
+                random.Random(seed), NULL_TRACE
+            )
+            for seed in range(30)
+        ]
+        assert [(r.hit, r.roll, r.damage_result) for r in traced] == [(r.hit, r.roll, r.damage_result) for r in headless]
+        assert all(r.log for r in traced)
+        assert all(r.log is None for r in headless)
+
+    def test_structured_events(self, make_character, rifle_shot):
+        """A caller-supplied trace exposes EAL components and rolls as events."""
+        weapon, ammo, params = rifle_shot
+        trace = CombatTrace()
+        result = CombatSimulator.single_shot(
+            make_character("S"), make_character("T"), weapon, ammo, 10, TargetExposure.STANDING_EXPOSED, params, True,
+            random.Random(3), trace
+        )
+        assert result.log == trace.render()
+        assert result.trace is not trace and result.trace.events == trace.events
+
+    def test_shot_result_renders_on_demand(self, make_character, rifle_shot):
+        """ShotResult keeps the structured trace and formats it only when log is read."""
+        weapon, ammo, params = rifle_shot
+        trace = CombatTrace()
+        trace.add("header", "%s", _Exploding())
+        result = CombatSimulator.single_shot(
+            make_character("S"), make_character("T"), weapon, ammo, 10, TargetExposure.STANDING_EXPOSED, params, True,
+            random.Random(3), trace
+        )
+        assert result.trace.of_kind("roll")
+        with pytest.raises(AssertionError, match="formatted eagerly"):
+            result.log
+        assert any(e.template.startswith("  Final EAL") and e.args[-1] == result.eal for e in trace.of_kind("eal"))
+        assert any(result.roll in e.args for e in trace.of_kind("roll"))
+
+    def test_calculate_eal_without_log(self, make_character, rifle_shot):
+        """calculate_eal defaults to the null trace."""
+        weapon, _, params = rifle_shot
+        shooter, target = make_character("S"), make_character("T")
+        trace = CombatTrace()
+        eal = CombatSimulatorUtils.calculate_eal(shooter, target, weapon, 10, TargetExposure.STANDING_EXPOSED, params)
+        assert eal == CombatSimulatorUtils.calculate_eal(
+            shooter, target, weapon, 10, TargetExposure.STANDING_EXPOSED, params, trace=trace
+        )
+        assert len(trace) > 0
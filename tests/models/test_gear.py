@@ -3,6 +3,8 @@ Pytest tests for gear.py models.
 Tests all dataclasses and their methods including ballistic calculations,
 armor protection, and weapon characteristics.
 """
+import dataclasses
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -10,12 +12,15 @@ from phoenix_command.models.gear import (
     BallisticData,
     ExplosiveData,
     RangeData,
+    RangeIndex,
     WeaponBallisticData,
     Gear,
     AmmoType,
     ArmorLayer,
     ArmorProtectionData,
     Armor,
+    ArmorStack,
+    build_armor_index,
     Weapon,
     Grenade,
 )
@@ -66,6 +71,24 @@ class TestBallisticData:
 
 # ===== ExplosiveData Tests =====
 
+class TestSlottedRecords:
+    """Tests for slotted and frozen hot-path records."""
+
+    def test_ballistic_records_are_frozen_and_slotted(self):
+        """BallisticData and RangeData have no instance dict and reject writes."""
+        for record in (BallisticData(range_hexes=10, penetration=5.5, damage_class=3), RangeData(10, 2.0)):
+            assert not hasattr(record, "__dict__")
+            with pytest.raises(AttributeError):
+                record.range_hexes = 20
+
+    def test_armor_layer_is_slotted(self):
+        """ArmorLayer keeps mutable condition without an instance dict."""
+        layer = ArmorLayer(ArmorMaterial.KEVLAR, 10, 4)
+        layer.apply_hit_damage()
+        assert layer.current_condition < 1.0
+        assert not hasattr(layer, "__dict__")
+
+
 class TestExplosiveData:
     """Tests for ExplosiveData dataclass."""
 
@@ -184,6 +207,69 @@ class TestWeaponBallisticData:
         assert data.get_minimum_arc(10) is None
 
 
+class TestRangeIndex:
+    """Tests for the compiled per-range lookup index."""
+
+    def test_matches_table_walk_for_unsorted_tables(self):
+        """Lookups reproduce the in-order table walk, including out-of-order entries."""
+        table = [RangeData(10, 1.0), RangeData(20, 2.0), RangeData(40, 3.0), RangeData(9, 4.0)]
+        index = RangeIndex.build(table)
+        ranges = [0, 9, 9.5, 10, 15, 20, 39, 40, 41, 100]
+        expected = [1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 3.0, 4.0, 4.0]
+        assert [index.lookup(r).value for r in ranges] == expected
+        assert [data.value for data in index.lookup_batch(ranges)] == expected
+
+    def test_rebuilt_when_table_changes(self):
+        """Appending to or replacing a table invalidates its cached index."""
+        data = WeaponBallisticData(ballistic_accuracy=[RangeData(10, 20.0)])
+        assert data.get_ballistic_accuracy(50) == 20
+        data.ballistic_accuracy.append(RangeData(40, 12.0))
+        assert data.get_ballistic_accuracy(50) == 12
+        data.ballistic_accuracy = [RangeData(10, 30.0)]
+        assert data.get_ballistic_accuracy(50) == 30
+
+    def test_rebuilt_when_entries_change_in_place(self):
+        """Replacing an entry or re-sorting the table in place invalidates its cached index."""
+        ammo = AmmoType(name="Ball", weight=0.1, ballistic_data=[BallisticData(40, 6.0, 3), BallisticData(10, 12.0, 5)])
+        assert ammo.get_pen(10) == 6.0
+        ammo.ballistic_data.sort(key=lambda data: data.range_hexes)
+        assert ammo.get_pen(10) == 12.0
+        ammo.ballistic_data[0] = BallisticData(10, 14.0, 5)
+        assert (ammo.get_pen(10), ammo.get_pen_batch([10, 40])) == (14.0, [14.0, 6.0])
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ammo.ballistic_data[0].range_hexes = 20
+
+    def test_batch_getters(self):
+        """Batch getters agree with the per-range getters."""
+        ranges = [1, 5, 10, 14, 20, 80]
+        data = WeaponBallisticData(
+            ballistic_accuracy=[RangeData(5, 10.0), RangeData(20, 5.0)],
+            time_of_flight=[RangeData(5, 0.1), RangeData(20, 0.7)],
+        )
+        ammo = AmmoType(
+            name="Ball",
+            weight=0.1,
+            ballistic_data=[BallisticData(10, 12.0, 5), BallisticData(40, 6.0, 3)],
+        )
+        assert data.get_ballistic_accuracy_batch(ranges) == [data.get_ballistic_accuracy(r) for r in ranges]
+        assert data.get_time_of_flight_batch(ranges) == [data.get_time_of_flight(r) for r in ranges]
+        assert ammo.get_pen_batch(ranges) == [ammo.get_pen(r) for r in ranges]
+        assert ammo.get_dc_batch(ranges) == [ammo.get_dc(r) for r in ranges]
+        assert WeaponBallisticData().get_ballistic_accuracy_batch([5, 10]) == [0, 0]
+        assert AmmoType(name="Empty", weight=0.1).get_pen_batch([5]) == [0.0]
+
+    def test_explosive_contact_entry(self):
+        """A None burst range selects the contact entry; ranged lookups skip it."""
+        grenade = Grenade(
+            name="Frag", weight=1.0, country=Country.USA, grenade_type=GrenadeType.FRAG, length=4.0,
+            arm_time=2, fuse_length=4, range=range(0, 40),
+            explosive_data=[ExplosiveData(None, 20.0, 6, "4D6", 30), ExplosiveData(1, 15.0, 5, "3D6", 20),
+                            ExplosiveData(3, 8.0, 3, "2D6", 10)],
+        )
+        assert [grenade.get_explosion_pen(r) for r in (None, 0, 1, 2, 3, 9)] == [20.0, 15.0, 15.0, 15.0, 8.0, 8.0]
+        assert grenade == dataclasses.replace(grenade)
+
+
 # ===== Gear Tests =====
 
 class TestGear:
@@ -593,7 +679,7 @@ class TestArmor:
         
         assert penetrated is False
         assert remaining == 0
-        mock_process_hit.assert_called_once_with(15.0)
+        mock_process_hit.assert_called_once_with(15.0, None)
 
     def test_process_hit_without_protection(self):
         """Test processing a hit on unprotected location."""
@@ -644,6 +730,111 @@ class TestArmor:
         assert rear.get_total_protection() == 10
 
 
+# ===== Gear Instance Tests =====
+
+class TestGearInstantiate:
+    """Tests for sharing gear templates between carried instances."""
+
+    def test_stateless_gear_is_shared(self):
+        """Plain gear, ammo and weapons are carried as the template itself."""
+        gear = Gear(name="Canteen", weight=1.0)
+        assert gear.instantiate() is gear
+
+    def test_armor_copies_only_layer_state(self):
+        """Armor instances get their own layers and keep the template's values."""
+        template = Armor(name="Vest", weight=4.0, description="Soft vest")
+        template.add_protection(AdvancedHitLocation.HEART, True, ArmorMaterial.KEVLAR, 10, 4)
+        template.protection[(AdvancedHitLocation.HEART, True)].layers[0].current_condition = 0.8
+
+        instance = template.instantiate()
+        assert instance is not template
+        assert instance == template
+        assert (instance.name, instance.weight, instance.description) == ("Vest", 4.0, "Soft vest")
+
+        data = instance.get_protection(AdvancedHitLocation.HEART, True)
+        data.process_hit(50.0)
+        assert data.layers[0].current_condition < 0.8
+        assert template.get_protection(AdvancedHitLocation.HEART, True).layers[0].current_condition == 0.8
+
+
+# ===== ArmorStack Tests =====
+
+class TestArmorStack:
+    """Tests for ArmorStack and build_armor_index."""
+
+    @staticmethod
+    def _worn_armor():
+        vest = Armor(name="Vest", weight=4.0)
+        vest.add_protection(AdvancedHitLocation.HEART, True, ArmorMaterial.KEVLAR, 10, 4)
+        vest.add_protection(AdvancedHitLocation.HEART, True, ArmorMaterial.KEVLAR, 6, 2)
+        plate = Armor(name="Plate", weight=8.0)
+        plate.add_protection(AdvancedHitLocation.HEART, True, ArmorMaterial.STEEL, 20, 10)
+        plate.add_protection(AdvancedHitLocation.LUNG, False, ArmorMaterial.STEEL, 20, 10)
+        return [Gear(name="Canteen", weight=1.0), vest, plate]
+
+    def test_index_orders_pieces_by_equipment(self):
+        """Stacks list pieces in equipment order with summed totals."""
+        equipment = self._worn_armor()
+        index = build_armor_index(equipment)
+        assert set(index) == {(AdvancedHitLocation.HEART, True), (AdvancedHitLocation.LUNG, False)}
+        stack = index[(AdvancedHitLocation.HEART, True)]
+        assert [armor.name for armor, _ in stack.pieces] == ["Vest", "Plate"]
+        assert (stack.total_protection, stack.total_blunt_protection) == (36, 16)
+
+    def test_degradation_updates_totals(self):
+        """Layer degradation adjusts the stack by the change in effective protection."""
+        index = build_armor_index(self._worn_armor())
+        stack = index[(AdvancedHitLocation.HEART, True)]
+        _, vest_data = stack.pieces[0]
+        vest_data.layers[0].apply_penetration_damage()
+        vest_data.layers[1].apply_hit_damage()
+        assert stack.piece_protection[0] == vest_data.get_total_protection()
+        assert stack.piece_blunt_protection[0] == vest_data.get_total_blunt_protection()
+        assert stack.total_protection == vest_data.get_total_protection() + 20
+        assert stack.total_blunt_protection == vest_data.get_total_blunt_protection() + 10
+
+    def test_global_degradation_reaches_other_locations(self):
+        """Degrading one location's steel through global degradation updates every stack it is in."""
+        equipment = self._worn_armor()
+        index = build_armor_index(equipment)
+        plate = equipment[2]
+        plate.apply_global_degradation(ArmorMaterial.STEEL, True)
+        lung = index[(AdvancedHitLocation.LUNG, False)]
+        assert lung.total_protection == plate.get_protection(AdvancedHitLocation.LUNG, False).get_total_protection()
+
+    def test_active_pieces_skip_destroyed_armor(self):
+        """Pieces without protection left are not returned as active."""
+        stack = ArmorStack()
+        data = ArmorProtectionData()
+        data.add_layer(ArmorMaterial.KEVLAR, 1, 1)
+        stack.add(Armor(name="Thin", weight=1.0), data)
+        assert len(stack.active_pieces()) == 1
+        data.layers[0].current_condition = 0.5
+        assert stack.active_pieces() == []
+
+    def test_direct_assignment_updates_totals(self):
+        """Assigning a layer's condition or protection factor keeps stack totals current."""
+        index = build_armor_index(self._worn_armor())
+        stack = index[(AdvancedHitLocation.HEART, True)]
+        _, vest_data = stack.pieces[0]
+        vest_data.layers[0].current_condition = 0.5
+        vest_data.layers[1].protection_factor = 3
+        assert stack.piece_protection[0] == vest_data.get_total_protection() == 8
+        assert stack.piece_blunt_protection[0] == vest_data.get_total_blunt_protection() == 4
+        assert (stack.total_protection, stack.total_blunt_protection) == (28, 14)
+
+    def test_detach_stops_updates(self):
+        """A detached stack no longer follows its layers."""
+        stack = ArmorStack()
+        data = ArmorProtectionData()
+        data.add_layer(ArmorMaterial.STEEL, 20, 10)
+        stack.add(Armor(name="Plate", weight=1.0), data)
+        stack.detach()
+        data.layers[0].apply_penetration_damage()
+        assert stack.total_protection == 20
+        assert data.layers[0]._stacks == []
+
+
 # ===== Weapon Tests =====
 
 class TestWeapon:
@@ -1,22 +1,30 @@
 """Tests for map state serialization."""
 
 import base64
+import copy
+import pickle
 
 import pytest
 
 from phoenix_command.session.domains.map_state import (
     BackgroundImage,
     CustomBarrierMaterial,
+    HexCondition,
     HexGridConfig,
+    HexKeyedDict,
     LayerStair,
     MapLayer,
     MapState,
     Obstacle,
     Opening,
     TerrainTile,
+    WallKeyedDict,
     WallSegment,
+    cell_hex,
+    hex_cell,
     hex_wall_key,
     is_hex_wall_key,
+    key_hexes,
     layer_has_hex_wall,
     rules_hexes,
 )
@@ -263,3 +271,67 @@ def test_hex_wall_key_helpers():
     layer.walls[hex_wall_key(1, 1)] = WallSegment()
     assert layer_has_hex_wall(layer, 1, 1)
     assert not layer_has_hex_wall(layer, 0, 0)
+    assert key_hexes(["3,5", "-2,4:1", hex_wall_key(0, -3)]) == [(3, 5), (-2, 4), (0, -3)]
+
+
+@pytest.mark.parametrize("q,r", [(0, 0), (3, -7), (-250, 400), (-1, -1), (70000, -524288)])
+def test_hex_cell_round_trip(q, r):
+    assert cell_hex(hex_cell(q, r)) == (q, r)
+
+
+def test_keyed_dicts_index_follows_string_view():
+    layer = MapLayer()
+    layer.obstacles["2,-3"] = Obstacle(height=2.0)
+    assert layer.obstacles.at(2, -3).height == 2.0
+    assert layer.obstacles.at(-3, 2) is None
+
+    layer.obstacles["4,1"] = Obstacle(blocks_los=False)
+    layer.obstacles["2,-3"] = Obstacle(height=3.0)
+    assert layer.obstacles.at(2, -3).height == 3.0
+    assert not layer.obstacles.at(4, 1).blocks_los
+    layer.obstacles.pop("4,1")
+    del layer.obstacles["2,-3"]
+    assert layer.obstacles.at(4, 1) is None and layer.obstacles.at(2, -3) is None
+
+    layer.conditions.update({"1,1": HexCondition(visibility=["SMOKE_HEAVY"])})
+    layer.conditions.setdefault("0,5", HexCondition())
+    assert sorted((q, r) for q, r, _ in layer.conditions.cell_items()) == [(0, 5), (1, 1)]
+    layer.conditions.clear()
+    assert list(layer.conditions.cell_items()) == []
+
+    layer.walls["1,2:4"] = WallSegment()
+    layer.walls[hex_wall_key(-1, 3)] = WallSegment(height=3.0)
+    assert layer.walls.at(1, 2, 4) is layer.walls["1,2:4"]
+    assert layer.walls.at(1, 2, 3) is None
+    assert layer.walls.hex_wall_at(-1, 3).height == 3.0
+    assert layer.walls.hex_wall_at(1, 2) is None
+    assert sorted((q, r, str(edge)) for q, r, edge, _ in layer.walls.cell_items()) == [
+        (-1, 3, "hex"), (1, 2, "4")
+    ]
+
+
+def test_keyed_fields_are_converted_and_survive_copies():
+    layer = MapLayer(terrain={"0,0": TerrainTile("rough", 2)}, walls={"0,0:1": WallSegment()})
+    layer.stairs = {"3,3": LayerStair(target_layer_id="up")}
+    assert type(layer.terrain) is HexKeyedDict and type(layer.walls) is WallKeyedDict
+    assert layer.stairs.at(3, 3).target_layer_id == "up"
+
+    restored = MapLayer.from_dict(layer.to_dict())
+    assert type(restored.walls) is WallKeyedDict
+    assert restored.terrain.at(0, 0).movement_cost == 2
+    assert restored.to_dict() == layer.to_dict()
+
+    for clone in (copy.deepcopy(layer), pickle.loads(pickle.dumps(layer)), copy.copy(layer.walls)):
+        walls = clone if isinstance(clone, WallKeyedDict) else clone.walls
+        assert type(walls) is WallKeyedDict
+        assert walls.at(0, 0, 1) is walls["0,0:1"]
+        walls["5,5:2"] = WallSegment()
+        assert walls.at(5, 5, 2) is not None
+    assert layer.walls.at(5, 5, 2) is None
+
+
+def test_unparseable_keys_are_kept_but_not_indexed():
+    layer = MapLayer(terrain={"legacy": TerrainTile(), "1,1": TerrainTile()}, walls={"0,0:9": WallSegment()})
+    assert [(q, r) for q, r, _ in layer.terrain.cell_items()] == [(1, 1)]
+    assert list(layer.walls.cell_items()) == []
+    assert set(layer.to_dict()["terrain"]) == {"legacy", "1,1"}
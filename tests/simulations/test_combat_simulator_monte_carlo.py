@@ -0,0 +1,143 @@
+"""Tests for Monte Carlo single-shot batches."""
+
+import copy
+import random
+
+import pytest
+
+from phoenix_command.item_database.weapons import WEAPONS_LIST
+from phoenix_command.models.character import Character
+from phoenix_command.models.enums import AdvancedHitLocation, ArmorMaterial, TargetExposure
+from phoenix_command.models.gear import Armor
+from phoenix_command.models.hit_result_advanced import MonteCarloShotSummary, ShotParameters, ShotResultBatch
+from phoenix_command.simulations.combat_simulator import CombatSimulator
+
+
+def _weapon_and_ammo():
+    weapon = next(w for w in WEAPONS_LIST if w.ammunition_types and w.aim_time_modifiers and w.ballistic_data)
+    return weapon, weapon.ammunition_types[0]
+
+
+def _run(
+    shooter: Character, target: Character, n: int, seed: int = 1, aim_time_ac: int = 4
+) -> MonteCarloShotSummary:
+    weapon, ammo = _weapon_and_ammo()
+    return CombatSimulator.monte_carlo_single_shot(
+        shooter, target, weapon, ammo, 10, TargetExposure.STANDING_EXPOSED,
+        ShotParameters(aim_time_ac=aim_time_ac, situation_stance_modifiers=[], visibility_modifiers=[]),
+        n, rng=random.Random(seed),
+    )
+
+
+class TestMonteCarloSingleShot:
+    """Tests for CombatSimulator.monte_carlo_single_shot."""
+
+    def test_target_is_not_mutated(self, make_character):
+        """Trials leave damage, hit history and armor condition untouched."""
+        target = make_character("Target")
+        armor = Armor(name="Vest", weight=5.0)
+        for location in AdvancedHitLocation:
+            armor.add_protection(location, True, ArmorMaterial.STEEL, 8, 4)
+        target.add_gear(armor)
+        before = copy.deepcopy(target.equipment[0].protection)
+        summary = _run(make_character("Shooter"), target, 500)
+        assert summary.hits > 0
+        assert target.physical_damage_total == 0
+        assert target.hit_history == []
+        assert target.equipment[0].protection == before
+
+    def test_counts_are_consistent(self, make_character):
+        """Histogram covers every trial and locations cover every hit."""
+        summary = _run(make_character("Shooter"), make_character("Target"), 400)
+        assert sum(summary.damage_histogram.values()) == 400
+        assert sum(summary.location_counts.values()) == summary.hits
+        assert summary.damage_histogram.get(0, 0) >= 400 - summary.hits
+        assert abs(sum(summary.location_frequencies.values()) - 1.0) < 1e-9
+        assert 0.0 <= summary.incapacitation_probability <= summary.hit_rate
+        assert 0.0 <= summary.death_probability <= summary.hit_rate
+
+    def test_hit_rate_tracks_odds(self, make_character):
+        """The observed hit rate is close to the Table 4G odds."""
+        summary = _run(make_character("Shooter"), make_character("Target"), 4000)
+        assert abs(summary.hit_rate - (summary.odds + 1) / 100) < 0.05
+
+    def test_seeded_runs_are_reproducible(self, make_character):
+        """The same seed gives the same summary."""
+        first = _run(make_character("Shooter"), make_character("Target"), 300, seed=7)
+        assert first == _run(make_character("Shooter"), make_character("Target"), 300, seed=7)
+
+    def test_negative_trials_raise(self, make_character):
+        """A negative trial count is rejected."""
+        with pytest.raises(ValueError):
+            _run(make_character("Shooter"), make_character("Target"), -1)
+
+
+class TestMonteCarloShotSummary:
+    """Tests for summary statistics."""
+
+    def test_percentiles_and_mean(self):
+        """Percentiles use nearest rank over all trials."""
+        summary = MonteCarloShotSummary(trials=10, eal=10, odds=50, hits=4, damage_histogram={0: 6, 5: 2, 100: 2})
+        assert summary.damage_percentile(50) == 0
+        assert summary.damage_percentile(70) == 5
+        assert summary.damage_percentile(100) == 100
+        assert summary.damage_percentiles((0, 80)) == {0: 0, 80: 5}
+        assert summary.mean_damage == 21.0
+        with pytest.raises(ValueError):
+            summary.damage_percentile(101)
+
+    def test_empty_summary(self):
+        """A zero-trial summary reports zeros."""
+        summary = MonteCarloShotSummary(trials=0, eal=0, odds=0)
+        assert summary.hit_rate == 0.0
+        assert summary.damage_percentile(50) == 0
+        assert summary.location_frequencies == {}
+
+
+class TestSingleShotBatch:
+    """Tests for CombatSimulator.single_shot_batch and ShotResultBatch."""
+
+    @staticmethod
+    def _batch(shooter: Character, target: Character, n: int, seed: int = 1) -> ShotResultBatch:
+        weapon, ammo = _weapon_and_ammo()
+        return CombatSimulator.single_shot_batch(
+            shooter, target, weapon, ammo, 10, TargetExposure.STANDING_EXPOSED,
+            ShotParameters(aim_time_ac=4, situation_stance_modifiers=[], visibility_modifiers=[]),
+            n, rng=random.Random(seed),
+        )
+
+    def test_columns_are_consistent(self, make_character):
+        """Every column has one entry per shot; only hits carry locations and damage."""
+        target = make_character("Target")
+        batch = self._batch(make_character("Shooter"), target, 400)
+        assert len(batch) == 400
+        assert {len(column) for column in (
+            batch.eals, batch.odds, batch.rolls, batch.damages, batch.shocks, batch.locations,
+            batch.incapacitation_effects,
+        )} == {400}
+        for i in range(len(batch)):
+            assert bool(batch.hits[i]) == (batch.rolls[i] <= batch.odds[i])
+            assert (batch.locations[i] is not None) == bool(batch.hits[i])
+        assert 0 < batch.hit_rate < 1
+        assert target.physical_damage_total == 0
+
+    def test_matches_monte_carlo_rates(self, make_character):
+        """Batch and summary runs agree on hit rate and mean damage."""
+        batch = self._batch(make_character("Shooter"), make_character("Target"), 4000, seed=3)
+        summary = _run(make_character("Shooter"), make_character("Target"), 4000, seed=4)
+        assert batch.hit_rate == pytest.approx(summary.hit_rate, abs=0.03)
+        assert batch.mean_damage == pytest.approx(summary.mean_damage, rel=0.25)
+
+    def test_rows_round_trip(self, make_character):
+        """Rows rebuild ShotResults that pack back into an equal batch."""
+        batch = self._batch(make_character("Shooter"), make_character("Target"), 50, seed=2)
+        rows = [batch.row(i) for i in range(len(batch))]
+        assert all(row.target is batch.target for row in rows)
+        assert ShotResultBatch.from_results(rows) == batch
+
+    def test_empty_batch(self, make_character):
+        """An empty batch reports zero rates."""
+        batch = ShotResultBatch()
+        assert (len(batch), batch.hit_rate, batch.mean_damage, batch.incapacitation_probability) == (0, 0.0, 0.0, 0.0)
+        with pytest.raises(ValueError):
+            self._batch(make_character("Shooter"), make_character("Target"), -1)
@@ -0,0 +1,136 @@
+"""Tests for CombatSimulatorProbabilities."""
+
+import itertools
+import random
+
+import pytest
+
+from phoenix_command.item_database.weapons import WEAPONS_LIST
+from phoenix_command.models.character import Character
+from phoenix_command.models.enums import AdvancedHitLocation, ArmorMaterial, ExplosiveTarget, \
+    SituationStanceModifier4B, TargetExposure
+from phoenix_command.models.gear import Armor
+from phoenix_command.models.hit_result_advanced import ShotParameters
+from phoenix_command.simulations.combat_simulator import CombatSimulator
+from phoenix_command.simulations.combat_simulator_probabilities import CombatSimulatorProbabilities
+from phoenix_command.simulations.combat_simulator_utils import CombatSimulatorUtils
+
+
+class TestExplosiveProbabilities:
+    """Tests for explosive, grenade and grenade launcher hit odds."""
+
+    def test_explosive_and_grenade_odds(self, make_character):
+        """EAL helpers run without a log and return odds within 0-99."""
+        weapon = next(
+            w for w in WEAPONS_LIST
+            if w.aim_time_modifiers and w.ballistic_data and w.full_auto and w.full_auto_rof
+            and w.ballistic_data.get_minimum_arc(30) is not None
+        )
+        params = ShotParameters(
+            aim_time_ac=max(weapon.aim_time_modifiers), situation_stance_modifiers=[], visibility_modifiers=[]
+        )
+        shooter = make_character("Shooter")
+
+        _, odds = CombatSimulatorProbabilities.calculate_explosive_weapon_probability(
+            shooter, weapon, 30, ExplosiveTarget.HEX, params
+        )
+        assert 0 <= odds <= 99
+        _, odds = CombatSimulatorProbabilities.calculate_thrown_grenade_probability(
+            shooter, 10, ExplosiveTarget.DOOR, 3, [SituationStanceModifier4B.STANDING], []
+        )
+        assert 0 <= odds <= 99
+        _, odds, arc, _ = CombatSimulatorProbabilities.calculate_auto_grenade_launcher_probability(
+            shooter, weapon, 30, ExplosiveTarget.HEX, params
+        )
+        assert 0 <= odds <= 99
+        assert arc > 0
+
+
+class _ScriptedRng:
+    """Returns fixed rolls in order."""
+
+    def __init__(self, rolls):
+        self._rolls = iter(rolls)
+
+    def randint(self, a, b):
+        return next(self._rolls)
+
+
+def _armored_target(target: Character) -> Character:
+    vest = Armor(name="Vest", weight=4.0)
+    plate = Armor(name="Plate", weight=8.0)
+    for location in (AdvancedHitLocation.HEART, AdvancedHitLocation.LUNG, AdvancedHitLocation.STOMACH):
+        vest.add_protection(location, True, ArmorMaterial.KEVLAR, 6, 3)
+        plate.add_protection(location, True, ArmorMaterial.STEEL, 10, 5)
+    target.add_gear(vest)
+    target.add_gear(plate)
+    return target
+
+
+class TestHitDamageDistribution:
+    """Tests for the exact per-hit damage distribution."""
+
+    def test_matches_every_armor_roll(self, make_character):
+        """Enumerating both armor rolls through resolve_hit_damage gives the same distribution."""
+        target = _armored_target(make_character("Target"))
+        location = AdvancedHitLocation.HEART
+        armor = CombatSimulatorUtils.get_armor_protection(target, location, True)
+        assert len(armor) == 2
+
+        for pen in (3.0, 9.0, 14.5, 30.0):
+            expected = {}
+            for rolls in itertools.product(range(10), repeat=2):
+                outcome = CombatSimulatorUtils.resolve_hit_damage(location, pen, 4, True, armor, _ScriptedRng(rolls))
+                expected[outcome] = expected.get(outcome, 0) + 1
+            exact = dict(CombatSimulatorProbabilities.hit_damage_distribution(location, pen, 4, True, armor))
+            assert exact.keys() == expected.keys()
+            for outcome, count in expected.items():
+                assert exact[outcome] == pytest.approx(count / 100)
+
+    def test_results_are_cached_by_armor_state(self, make_character):
+        """Identical armor on another target reuses the cached result; damaged armor does not."""
+        CombatSimulatorProbabilities.cache_clear()
+        location = AdvancedHitLocation.LUNG
+        first = CombatSimulatorUtils.get_armor_protection(_armored_target(make_character("Target")), location, True)
+        second_target = _armored_target(make_character("Target"))
+        second = CombatSimulatorUtils.get_armor_protection(second_target, location, True)
+
+        a = CombatSimulatorProbabilities.hit_damage_distribution(location, 12.0, 3, True, first)
+        assert CombatSimulatorProbabilities.hit_damage_distribution(location, 12.0, 3, True, second) is a
+
+        second[0].layers[0].current_condition = 0.5
+        assert CombatSimulatorProbabilities.hit_damage_distribution(location, 12.0, 3, True, second) is not a
+
+
+class TestSingleShotDistribution:
+    """Tests for calculate_single_shot_distribution."""
+
+    @pytest.mark.parametrize("armored", [False, True])
+    def test_probabilities_sum_to_one(self, armored, make_character, rifle_shot):
+        """Outcomes cover misses and hits and sum to one."""
+        weapon, ammo, params = rifle_shot
+        target = _armored_target(make_character("Target")) if armored else make_character("Target")
+        distribution = CombatSimulatorProbabilities.calculate_single_shot_distribution(
+            make_character("Shooter"), target, weapon, ammo, 10, TargetExposure.STANDING_EXPOSED, params
+        )
+        assert sum(distribution.outcomes.values()) == pytest.approx(1.0)
+        assert sum(distribution.damage_pmf.values()) == pytest.approx(1.0)
+        assert sum(distribution.location_probabilities.values()) == pytest.approx(1.0)
+        assert distribution.hit_probability == pytest.approx((distribution.odds + 1) / 100)
+        assert 0 <= distribution.incapacitation_probability <= distribution.hit_probability + 1e-9
+        assert distribution.damage_percentile(0) == 0
+
+    def test_matches_monte_carlo(self, make_character, rifle_shot):
+        """A large seeded Monte Carlo run agrees with the exact distribution."""
+        weapon, ammo, params = rifle_shot
+        target = _armored_target(make_character("Target"))
+        args = (make_character("Shooter"), target, weapon, ammo, 8, TargetExposure.STANDING_EXPOSED, params)
+        exact = CombatSimulatorProbabilities.calculate_single_shot_distribution(*args)
+        sampled = CombatSimulator.monte_carlo_single_shot(*args, 20000, rng=random.Random(5))
+
+        assert sampled.hit_rate == pytest.approx(exact.hit_probability, abs=0.015)
+        assert sampled.incapacitation_probability == pytest.approx(exact.incapacitation_probability, abs=0.015)
+        assert sampled.death_probability == pytest.approx(exact.death_probability, abs=0.015)
+        assert sampled.mean_damage == pytest.approx(exact.mean_damage, rel=0.1)
+        for effect, probability in exact.effect_probabilities.items():
+            assert sampled.incapacitation_counts.get(effect, 0) / sampled.trials == pytest.approx(probability, abs=0.015)
@@ -0,0 +1,222 @@
+"""Tests for CombatSimulatorUtils."""
+
+import itertools
+import random
+
+import pytest
+
+from phoenix_command.item_database.weapons import WEAPONS_LIST
+from phoenix_command.models.character import Character
+from phoenix_command.models.combat_trace import NULL_TRACE, CombatTrace
+from phoenix_command.models.enums import AdvancedHitLocation, ArmorMaterial, Country, GrenadeType, ShotType, \
+    SituationStanceModifier4B, TargetExposure, VisibilityModifier4C
+from phoenix_command.models.gear import Armor, ExplosiveData, Grenade
+from phoenix_command.models.hit_result_advanced import ShotParameters
+from phoenix_command.simulations.combat_simulator_utils import CombatSimulatorUtils
+from phoenix_command.tables.advanced_damage_tables.advanced_damage_calculator import AdvancedDamageCalculator
+from phoenix_command.tables.advanced_damage_tables.table_1_get_hit_location import Table1AdvancedDamageHitLocation
+from phoenix_command.tables.core.table4_advanced_odds_of_hitting import Table4AdvancedOddsOfHitting
+from phoenix_command.tables.core.table8_healing_and_recovery import Table8HealingAndRecovery
+
+
+def _armored(character: Character) -> Character:
+    vest = Armor(name="Vest", weight=4.0)
+    for location in AdvancedHitLocation:
+        vest.add_protection(location, True, ArmorMaterial.KEVLAR, 6, 3)
+    character.add_gear(vest)
+    return character
+
+
+def _grenade() -> Grenade:
+    return Grenade(
+        name="Frag", weight=1.0, country=Country.USA, grenade_type=GrenadeType.FRAG, length=4.0,
+        arm_time=2, fuse_length=4, range=range(0, 40),
+        explosive_data=[ExplosiveData(None, 20.0, 6, "*12", 30), ExplosiveData(3, 8.0, 3, "*5", 10)],
+    )
+
+
+_PARAMS = ShotParameters(aim_time_ac=4, situation_stance_modifiers=[], visibility_modifiers=[])
+
+
+def _shot_params_grid(aim_time_ac: int):
+    stances = [[], [SituationStanceModifier4B.STANDING], [SituationStanceModifier4B.PRONE]]
+    visibility = [[], [VisibilityModifier4C.NO_MOON]]
+    speeds = [0, 2.5, 9.0]
+    extras = [
+        {},
+        {"reflexive_duck_shooter": True, "custom_eal_modifiers": [("Scope", 3)]},
+        {"reflexive_duck_target": True, "custom_eal_modifiers": [{"label": "Fog", "alm": -2}, "ignored"]},
+    ]
+    for stance, vis, target_speed, shooter_speed, extra in itertools.product(stances, visibility, speeds, speeds, extras):
+        yield ShotParameters(
+            aim_time_ac=aim_time_ac,
+            situation_stance_modifiers=stance,
+            visibility_modifiers=vis,
+            target_speed_hex_per_impulse=target_speed,
+            shooter_speed_hex_per_impulse=shooter_speed,
+            **extra,
+        )
+
+
+class TestCalculateEalBatch:
+    """Tests for the vectorised EAL evaluator."""
+
+    @pytest.mark.parametrize("shot_type", [ShotType.SINGLE, ShotType.BURST])
+    def test_matches_calculate_eal(self, shot_type, make_character):
+        """Every shot matches calculate_eal and Table 4G."""
+        weapon = next(w for w in WEAPONS_LIST if w.aim_time_modifiers and w.ballistic_data)
+        shooter = make_character("Shooter")
+        targets = [make_character("Veteran", 15), make_character("Recruit", 2)]
+        aim_time_ac = max(weapon.aim_time_modifiers)
+
+        shots = [
+            (params, target, range_hexes, exposure)
+            for params, target, range_hexes, exposure in itertools.product(
+                _shot_params_grid(aim_time_ac), targets, [1, 7, 40, 300],
+                [TargetExposure.STANDING_EXPOSED, TargetExposure.HEAD],
+            )
+        ]
+        alms = [CombatSimulatorUtils.get_shot_parameter_alms(params) for params, *_ in shots]
+        eals, odds = CombatSimulatorUtils.calculate_eal_batch(
+            shooter, weapon, aim_time_ac,
+            ranges=[range_hexes for _, _, range_hexes, _ in shots],
+            exposures=[exposure for *_, exposure in shots],
+            defensive_alms=[target.defensive_alm for _, target, _, _ in shots],
+            situation_stance_alms=[alm[0] for alm in alms],
+            visibility_alms=[alm[1] for alm in alms],
+            target_speeds=[params.target_speed_hex_per_impulse for params, *_ in shots],
+            shooter_speeds=[params.shooter_speed_hex_per_impulse for params, *_ in shots],
+            extra_alms=[alm[2] for alm in alms],
+            shot_type=shot_type,
+        )
+
+        expected = [
+            CombatSimulatorUtils.calculate_eal(shooter, target, weapon, range_hexes, exposure, params)
+            for params, target, range_hexes, exposure in shots
+        ]
+        assert eals == expected
+        assert odds == [Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(eal, shot_type) for eal in expected]
+
+    def test_omitted_modifiers_default_to_zero(self, make_character):
+        """Only ranges, exposures and defensive ALMs are required."""
+        weapon = next(w for w in WEAPONS_LIST if w.aim_time_modifiers and w.ballistic_data)
+        shooter = make_character("Shooter")
+        target = make_character("Target")
+        params = ShotParameters(aim_time_ac=4, situation_stance_modifiers=[], visibility_modifiers=[])
+        eals, _ = CombatSimulatorUtils.calculate_eal_batch(
+            shooter, weapon, 4, [10], [TargetExposure.STANDING_EXPOSED], [target.defensive_alm]
+        )
+        assert eals == [
+            CombatSimulatorUtils.calculate_eal(shooter, target, weapon, 10, TargetExposure.STANDING_EXPOSED, params)
+        ]
+
+    def test_rejects_mismatched_lengths(self, make_character):
+        """Per-shot sequences must be parallel to ranges."""
+        weapon = next(w for w in WEAPONS_LIST if w.aim_time_modifiers)
+        with pytest.raises(ValueError):
+            CombatSimulatorUtils.calculate_eal_batch(
+                make_character("Shooter"), weapon, 4, [10, 20], [TargetExposure.STANDING_EXPOSED], [0, 0]
+            )
+
+
+class TestGroupedPatternHits:
+    """Tests for the grouped pellet and shrapnel fast path."""
+
+    def test_unarmored_groups_share_one_damage_lookup(self, make_character):
+        """Every hit at an unarmored location takes that location's damage, applied to the target."""
+        target = make_character("Target")
+        group = CombatSimulatorUtils.process_shrapnel_hits_grouped(
+            target, _grenade(), 3, TargetExposure.STANDING_EXPOSED, _PARAMS, True, "*12", NULL_TRACE, random.Random(1)
+        )
+        assert len(group) == sum(group.location_counts.values()) == len(target.hit_history) > 1
+        assert group.total_damage == target.physical_damage_total == sum(
+            count * AdvancedDamageCalculator.calculate_damage_cached(location, 3, 8.0, True).damage
+            for location, count in group.location_counts.items()
+        )
+        assert group.physical_damage_totals[-1] == target.physical_damage_total
+        assert len({id(damage_result) for damage_result in group.damage_results}) == len(group)
+
+    def test_hit_counts_match_per_hit_path(self, make_character):
+        """Grouped and per-hit paths draw the same hit count from the same seed."""
+        for seed in range(20):
+            slow = CombatSimulatorUtils.process_shrapnel_hits(
+                make_character("A"), _grenade(), 3, TargetExposure.STANDING_EXPOSED, _PARAMS, True, "20", CombatTrace(),
+                random.Random(seed)
+            )
+            fast = CombatSimulatorUtils.process_shrapnel_hits_grouped(
+                make_character("A"), _grenade(), 3, TargetExposure.STANDING_EXPOSED, _PARAMS, True, "20", NULL_TRACE,
+                random.Random(seed)
+            )
+            assert len(slow) == (len(fast) if fast is not None else 0)
+
+    @pytest.mark.parametrize("fragments", [False, True])
+    def test_armored_damage_matches_per_hit_path(self, fragments, make_character):
+        """Damage through degrading armor follows the per-hit path's distribution."""
+        rng = random.Random(3)
+        apply_at_location = (
+            CombatSimulatorUtils.apply_fragment_at_location if fragments else CombatSimulatorUtils.apply_hit_at_location
+        )
+        slow, fast = [], []
+        for _ in range(300):
+            target = _armored(make_character("Slow"))
+            for location in Table1AdvancedDamageHitLocation.sample_hit_locations(
+                    TargetExposure.STANDING_EXPOSED, _PARAMS.target_orientation, 8, rng
+            ):
+                apply_at_location(target, location, 8.0, 4, True, NULL_TRACE, rng)
+            slow.extend(damage_result.damage for damage_result in target.hit_history)
+            fast.extend(damage_result.damage for damage_result in CombatSimulatorUtils.resolve_pattern_hits(
+                _armored(make_character("Fast")), 8, TargetExposure.STANDING_EXPOSED, _PARAMS, True, 8.0, 4, NULL_TRACE,
+                fragments=fragments, rng=rng
+            ).damage_results)
+        # Per-hit damage is heavy tailed, so compare the share of blunt-only hits and the median
+        assert sum(d <= 3 for d in fast) / len(fast) == pytest.approx(sum(d <= 3 for d in slow) / len(slow), abs=0.03)
+        assert sorted(fast)[len(fast) // 2] == pytest.approx(sorted(slow)[len(slow) // 2], rel=0.15)
+
+    def test_results_materialize_on_request(self, make_character):
+        """to_shot_results rebuilds one ShotResult per hit with recovery for the running damage."""
+        target = _armored(make_character("Target"))
+        group = CombatSimulatorUtils.process_shrapnel_hits_grouped(
+            target, _grenade(), 3, TargetExposure.STANDING_EXPOSED, _PARAMS, True, "*5", NULL_TRACE, random.Random(4)
+        )
+        results = group.to_shot_results()
+        assert [result.damage_result for result in results] == group.damage_results
+        assert all(result.hit and result.odds == 100 and result.target is target for result in results)
+        assert results[-1].recovery == Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a(
+            target.physical_damage_total, target.health
+        )
+
+    def test_shotgun_pattern_groups_per_target(self, make_character):
+        """Each target hit by the pattern gets one group with its pellet hits."""
+        weapon = next(w for w in WEAPONS_LIST if any(a.pellet_count for a in w.ammunition_types))
+        ammo = next(a for a in weapon.ammunition_types if a.pellet_count)
+        targets = [make_character("A"), _armored(make_character("B"))]
+        groups = CombatSimulatorUtils.process_shotgun_pattern_grouped(
+            ammo, targets, [2, 2], [TargetExposure.STANDING_EXPOSED] * 2, [_PARAMS] * 2, [True, True], "*3",
+            NULL_TRACE, random.Random(5)
+        )
+        assert [group.target for group in groups] == targets
+        assert all(len(group) > 0 for group in groups)
+
+    def test_untraced_per_hit_paths_resolve_grouped(self, make_character):
+        """With a disabled trace the per-hit entry points return the grouped results."""
+        weapon = next(w for w in WEAPONS_LIST if any(a.pellet_count for a in w.ammunition_types))
+        ammo = next(a for a in weapon.ammunition_types if a.pellet_count)
+        pattern_args = ([2], [TargetExposure.STANDING_EXPOSED], [_PARAMS], [True], "*3")
+        shrapnel_args = (_grenade(), 3, TargetExposure.STANDING_EXPOSED, _PARAMS, True, "*5")
+
+        pellets = CombatSimulatorUtils.process_shotgun_pattern(
+            ammo, [make_character("A")], *pattern_args, NULL_TRACE, random.Random(6)
+        )
+        pellet_groups = CombatSimulatorUtils.process_shotgun_pattern_grouped(
+            ammo, [make_character("A")], *pattern_args, NULL_TRACE, random.Random(6)
+        )
+        assert [r.damage_result for r in pellets] == pellet_groups[0].damage_results
+
+        fragments = CombatSimulatorUtils.process_shrapnel_hits(
+            make_character("B"), *shrapnel_args, NULL_TRACE, random.Random(7)
+        )
+        fragment_group = CombatSimulatorUtils.process_shrapnel_hits_grouped(
+            make_character("B"), *shrapnel_args, NULL_TRACE, random.Random(7)
+        )
+        assert [r.damage_result for r in fragments] == fragment_group.damage_results
+        assert all(result.trace is None for result in pellets + fragments)
@@ -0,0 +1,124 @@
+"""Tests for LosCache: cached LOS across token moves and map edits."""
+
+from phoenix_command.session.domains.impulse_combat_state import TokenCombatRuntime
+from phoenix_command.session.domains.map_state import MapState, Obstacle, Opening, WallSegment, hex_wall_key
+from phoenix_command.session.domains.token_state import TokenPlacement
+from phoenix_command.simulations import map_los
+from phoenix_command.simulations.hex_tactical import line_hexes
+from phoenix_command.simulations.map_los import LosCache, check_los
+
+
+def _tokens(layer_id: str) -> list[TokenPlacement]:
+    return [
+        TokenPlacement(token_id="a", q=0, r=0, layer_id=layer_id),
+        TokenPlacement(token_id="b", q=4, r=0, layer_id=layer_id),
+        TokenPlacement(token_id="c", q=0, r=4, layer_id=layer_id),
+        TokenPlacement(token_id="d", q=-3, r=1, layer_id=layer_id),
+    ]
+
+
+def _count_checks(monkeypatch) -> list:
+    calls = []
+    original = map_los._check_los_along
+
+    def counting(*args):
+        calls.append(args[1:3])
+        return original(*args)
+
+    monkeypatch.setattr(map_los, "_check_los_along", counting)
+    return calls
+
+
+def _recomputed(calls: list) -> set[tuple[str, str]]:
+    return {(shooter.token_id, target.token_id) for shooter, target in calls}
+
+
+def _assert_matches_check_los(cache: LosCache, tokens: list[TokenPlacement], runtimes=None) -> None:
+    runtimes = runtimes or {}
+    results = cache.matrix(tokens, runtimes)
+    for (shooter_id, target_id), result in results.items():
+        shooter = next(t for t in tokens if t.token_id == shooter_id)
+        target = next(t for t in tokens if t.token_id == target_id)
+        assert result == check_los(cache.map_state, shooter, target, runtimes.get(target_id))
+
+
+def test_matrix_matches_check_los_and_is_reused(monkeypatch) -> None:
+    map_state = MapState()
+    layer = map_state.ensure_default_layer()
+    layer.obstacles["2,0"] = Obstacle()
+    layer.walls["0,2:1"] = WallSegment(openings=[Opening(kind="window", state="closed")])
+    tokens = _tokens(layer.id)
+    cache = LosCache(map_state)
+    runtimes = {"b": TokenCombatRuntime(stance="prone"), "c": TokenCombatRuntime(moved_this_impulse=True)}
+    _assert_matches_check_los(cache, tokens, runtimes)
+
+    calls = _count_checks(monkeypatch)
+    cache.matrix(tokens, runtimes)
+    assert calls == []
+    cache.get(tokens[0], tokens[1], TokenCombatRuntime(stance="kneeling"))
+    assert len(calls) == 1
+
+
+def test_moving_a_token_recomputes_its_row_and_column(monkeypatch) -> None:
+    map_state = MapState()
+    layer = map_state.ensure_default_layer()
+    tokens = _tokens(layer.id)
+    cache = LosCache(map_state)
+    cache.matrix(tokens)
+
+    calls = _count_checks(monkeypatch)
+    tokens[1].q, tokens[1].r = 3, -2
+    layer.obstacles["3,-1"] = Obstacle()
+    cache.invalidate_keys(layer.id, ["3,-1"])
+    cache.matrix(tokens)
+    assert _recomputed(calls) == {("a", "b"), ("b", "a"), ("c", "b"), ("b", "c"), ("d", "b"), ("b", "d")}
+    _assert_matches_check_los(cache, tokens)
+
+
+def test_map_edits_invalidate_only_rays_through_edited_hexes(monkeypatch) -> None:
+    map_state = MapState()
+    layer = map_state.ensure_default_layer()
+    tokens = _tokens(layer.id)
+    cache = LosCache(map_state)
+    cache.matrix(tokens)
+
+    calls = _count_checks(monkeypatch)
+    layer.walls[hex_wall_key(2, 0)] = WallSegment()
+    cache.invalidate_keys(layer.id, [hex_wall_key(2, 0)])
+    cache.matrix(tokens)
+    assert ("a", "b") in _recomputed(calls)
+    assert _recomputed(calls) == {
+        (shooter.token_id, target.token_id)
+        for shooter in tokens for target in tokens
+        if (2, 0) in line_hexes(shooter.q, shooter.r, target.q, target.r)[1:]
+    }
+    assert cache.get(tokens[0], tokens[1]).blocked
+    _assert_matches_check_los(cache, tokens)
+
+    calls.clear()
+    layer.walls.pop(hex_wall_key(2, 0))
+    layer.walls["4,0:3"] = WallSegment(openings=[Opening(kind="door", state="closed")])
+    cache.invalidate_hexes(layer.id, [(2, 0), (4, 0)])
+    assert cache.get(tokens[0], tokens[1]).blocked
+    layer.walls["4,0:3"].openings[0].state = "open"
+    cache.invalidate_keys(layer.id, ["4,0:3"])
+    assert cache.get(tokens[0], tokens[1]).through_opening
+    cache.matrix(tokens)
+    assert ("a", "c") not in _recomputed(calls)
+    _assert_matches_check_los(cache, tokens)
+
+
+def test_layer_changes_and_removed_tokens() -> None:
+    map_state = MapState()
+    layer = map_state.ensure_default_layer()
+    tokens = _tokens(layer.id)
+    cache = LosCache(map_state)
+    cache.matrix(tokens)
+
+    layer.elevation = 2
+    tokens[2].layer_id = "upstairs"
+    _assert_matches_check_los(cache, tokens)
+
+    cache.sync(tokens[:2])
+    assert set(cache.matrix(tokens[:2])) == {("a", "b"), ("b", "a")}
+    assert all(pair[0] in "ab" and pair[1] in "ab" for pair in cache._results)
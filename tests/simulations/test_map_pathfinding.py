@@ -0,0 +1,319 @@
+"""Tests for Table 7A A* token pathfinding."""
+
+import heapq
+import random
+
+import pytest
+
+from phoenix_command.gui.utils.hex_geometry import is_in_bounds, iter_rect_cells
+from phoenix_command.models.character import Character
+from phoenix_command.session.domains.impulse_combat_state import ImpulseCombatState, TokenCombatRuntime
+from phoenix_command.session.domains.map_state import LayerStair, MapLayer, MapState, Obstacle, TerrainTile, \
+    WallSegment, hex_wall_key
+from phoenix_command.session.domains.token_state import TokenPlacement, TokenState
+from phoenix_command.simulations.hex_tactical import AXIAL_NEIGHBORS, classify_movement_base
+from phoenix_command.simulations.impulse_combat_engine import METER_SCALE, ImpulseCombatEngine, \
+    STANCE_MODIFIER_MAP, movement_blocked_reason, terrain_modifiers
+from phoenix_command.simulations.map_pathfinding import ReachabilityCache, find_move_path, find_reachable_hexes
+from phoenix_command.tables.catalogs.movement_catalog import TERRAIN_PRESETS, compute_movement_cost
+
+
+def _random_map(seed: int, cols: int = 9, rows: int = 8) -> MapState:
+    rng = random.Random(seed)
+    map_state = MapState()
+    map_state.grid.cols = cols
+    map_state.grid.rows = rows
+    layer = map_state.ensure_default_layer()
+    presets = list(TERRAIN_PRESETS.values())
+    for q, r in iter_rect_cells(map_state.grid):
+        roll = rng.random()
+        if roll < 0.1:
+            layer.obstacles[f"{q},{r}"] = Obstacle(blocks_movement=rng.random() < 0.8)
+        elif roll < 0.15:
+            layer.walls[hex_wall_key(q, r)] = WallSegment()
+        elif roll < 0.5:
+            preset = rng.choice(presets)
+            layer.terrain[f"{q},{r}"] = TerrainTile(preset.id, preset.movement_cost, preset.color)
+    return map_state
+
+
+def _dijkstra_cost(map_state: MapState, token: TokenPlacement, goal: tuple[int, int], stance: str) -> float | None:
+    """Reference single-layer uniform-cost search straight off the engine's rules."""
+    layer = map_state.layers[0]
+    best = {(token.q, token.r): 0}
+    frontier = [(0, token.q, token.r)]
+    while frontier:
+        g, q, r = heapq.heappop(frontier)
+        if (q, r) == goal:
+            return g * METER_SCALE
+        if g > best[(q, r)]:
+            continue
+        for direction, (dq, dr) in enumerate(AXIAL_NEIGHBORS):
+            nq, nr = q + dq, r + dr
+            if not is_in_bounds(nq, nr, map_state.grid) or movement_blocked_reason(layer, nq, nr):
+                continue
+            terrain_cost, modifier_ids = terrain_modifiers(layer, nq, nr, stance)
+            cost = compute_movement_cost(classify_movement_base(token.facing, direction), modifier_ids, terrain_cost)
+            if cost >= 0 and g + cost < best.get((nq, nr), g + cost + 1):
+                best[(nq, nr)] = g + cost
+                heapq.heappush(frontier, (g + cost, nq, nr))
+    return None
+
+
+def _engine(map_state: MapState, token: TokenPlacement, stance: str) -> ImpulseCombatEngine:
+    tokens = TokenState()
+    tokens.placements[token.token_id] = token
+    impulse_combat = ImpulseCombatState(map_mode="combat", impulse=0)
+    impulse_combat.token_runtime[token.token_id] = TokenCombatRuntime(ac_remaining=1000.0, stance=stance)
+    return ImpulseCombatEngine(impulse_combat, tokens, map_state, {})
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_cost_is_optimal_and_replays_through_engine(seed) -> None:
+    map_state = _random_map(seed)
+    layer = map_state.layers[0]
+    cells = [cell for cell in iter_rect_cells(map_state.grid) if not movement_blocked_reason(layer, *cell)]
+    rng = random.Random(seed)
+    stance = rng.choice(list(STANCE_MODIFIER_MAP))
+    (sq, sr), goal = rng.sample(cells, 2)
+    token = TokenPlacement(token_id="t", q=sq, r=sr, layer_id=layer.id, facing=rng.randrange(12))
+    engine = _engine(map_state, token, stance)
+
+    path = engine.find_move_path("t", *goal)
+    expected = _dijkstra_cost(map_state, token, goal, stance)
+    if expected is None:
+        assert path is None
+        return
+    assert path.ac_cost == expected
+    assert path.steps[-1] == (layer.id, *goal)
+
+    spent = 0.0
+    for _, q, r in path.steps:
+        result = engine.apply_action("t", "move", {"target_q": q, "target_r": r})
+        assert result.success and (token.q, token.r) == (q, r)
+        spent += result.ac_spent
+    assert spent == path.ac_cost
+
+
+def test_facing_changes_the_route_cost() -> None:
+    map_state = MapState()
+    map_state.grid.cols = map_state.grid.rows = 12
+    layer = map_state.ensure_default_layer()
+    token = TokenPlacement(token_id="t", q=2, r=3, layer_id=layer.id, facing=0)
+    forward = find_move_path(map_state, token, 8, 3)
+    assert forward.ac_cost == 6 * METER_SCALE
+    token.facing = 6
+    assert find_move_path(map_state, token, 8, 3).ac_cost == 6 * 3 * METER_SCALE
+    assert find_move_path(map_state, token, 8, 3, stance="prone").ac_cost == 6 * (3 + 3) * METER_SCALE
+
+
+def test_blocked_goals_and_budget() -> None:
+    map_state = MapState()
+    map_state.grid.cols = map_state.grid.rows = 10
+    layer = map_state.ensure_default_layer()
+    for dq, dr in AXIAL_NEIGHBORS:
+        layer.walls[hex_wall_key(5 + dq, 2 + dr)] = WallSegment()
+    token = TokenPlacement(token_id="t", q=0, r=0, layer_id=layer.id)
+    assert find_move_path(map_state, token, 5, 2) is None
+    assert find_move_path(map_state, token, 6, 2) is None
+    assert find_move_path(map_state, token, 50, 50) is None
+    assert find_move_path(map_state, token, 0, 0).steps == []
+
+    layer.terrain["2,0"] = TerrainTile("impassable", -1)
+    path = find_move_path(map_state, token, 3, 0)
+    assert (layer.id, 2, 0) not in path.steps
+    assert find_move_path(map_state, token, 3, 0, max_ac=path.ac_cost - METER_SCALE) is None
+
+
+def test_stairs_link_layers() -> None:
+    map_state = MapState()
+    map_state.grid.cols = map_state.grid.rows = 10
+    ground = map_state.ensure_default_layer()
+    upstairs = MapLayer(name="Floor2", kind="floor", elevation=1)
+    map_state.layers.append(upstairs)
+    token = TokenPlacement(token_id="t", q=1, r=1, layer_id=ground.id)
+    assert find_move_path(map_state, token, 5, 1, upstairs.id) is None
+
+    ground.stairs["3,1"] = LayerStair(target_layer_id=upstairs.id)
+    path = find_move_path(map_state, token, 5, 1, upstairs.id)
+    assert path.steps == [(ground.id, 2, 1), (ground.id, 3, 1), (upstairs.id, 3, 1), (upstairs.id, 4, 1),
+                          (upstairs.id, 5, 1)]
+    assert path.step_costs[2] == compute_movement_cost("forward", ["stance_standing", "slope_across"]) * METER_SCALE
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_reachable_costs_match_cheapest_paths(seed) -> None:
+    map_state = _random_map(seed)
+    layer = map_state.layers[0]
+    rng = random.Random(seed)
+    stance = rng.choice(list(STANCE_MODIFIER_MAP))
+    start = rng.choice([cell for cell in iter_rect_cells(map_state.grid) if not movement_blocked_reason(layer, *cell)])
+    token = TokenPlacement(token_id="t", q=start[0], r=start[1], layer_id=layer.id, facing=rng.randrange(12))
+    budget = 6.0
+    area = find_reachable_hexes(map_state, token, [budget], stance)
+    assert area.impulse_count == len(area)
+    assert list(area.costs) == sorted(area.costs)
+
+    reached = dict(zip(area.hexes(layer.id), area.costs))
+    for q, r in iter_rect_cells(map_state.grid):
+        if (q, r) == start:
+            assert (q, r) not in reached
+            continue
+        cost = _dijkstra_cost(map_state, token, (q, r), stance)
+        if cost is not None and cost <= budget:
+            assert reached[(q, r)] == cost
+        else:
+            assert (q, r) not in reached
+
+
+def _replay_arrival(engine: ImpulseCombatEngine, token: TokenPlacement, steps: list, impulse_ac: list,
+                    impulse: int = 0, spent: float = 0.0) -> tuple[int, float] | None:
+    """(impulse, AC spent in it) once the engine's moves along steps reach the last one, refilling AC each impulse."""
+    rt = engine.get_runtime(token.token_id)
+    rt.ac_remaining = impulse_ac[impulse] - spent
+    for _, q, r in steps:
+        while (token.q, token.r) != (q, r):
+            if rt.ac_remaining <= 1e-9:
+                impulse += 1
+                if impulse == len(impulse_ac):
+                    return None
+                rt.ac_remaining = impulse_ac[impulse]
+            if not engine.apply_action(token.token_id, "move", {"target_q": q, "target_r": r}).success:
+                return None
+    return impulse, impulse_ac[impulse] - rt.ac_remaining
+
+
+def _engine_reachability(map_state: MapState, token: TokenPlacement, stance: str, impulse_ac: list) -> dict:
+    """Reference flood that enters every neighbour through _apply_move itself: (q, r) -> (impulse, spent)."""
+    start = (token.q, token.r)
+    mover = TokenPlacement(token_id=token.token_id, layer_id=token.layer_id, facing=token.facing)
+    engine = _engine(map_state, mover, stance)
+    best = {start: (0, 0.0)}
+    frontier = [(0, 0.0, start)]
+    while frontier:
+        impulse, spent, (q, r) = heapq.heappop(frontier)
+        if (impulse, spent) > best[(q, r)]:
+            continue
+        for dq, dr in AXIAL_NEIGHBORS:
+            if not is_in_bounds(q + dq, r + dr, map_state.grid):
+                continue
+            mover.q, mover.r = q, r
+            engine.impulse_combat.token_runtime[token.token_id] = TokenCombatRuntime(stance=stance)
+            label = _replay_arrival(engine, mover, [(token.layer_id, q + dq, r + dr)], impulse_ac, impulse, spent)
+            if label is not None and label < best.get((q + dq, r + dr), (len(impulse_ac), 0.0)):
+                best[(q + dq, r + dr)] = label
+                heapq.heappush(frontier, (*label, (q + dq, r + dr)))
+    del best[start]
+    return best
+
+
+def test_partial_moves_carry_into_the_next_impulse() -> None:
+    map_state = MapState()
+    map_state.grid.cols = map_state.grid.rows = 12
+    layer = map_state.ensure_default_layer()
+    token = TokenPlacement(token_id="t", q=2, r=3, layer_id=layer.id, facing=0)
+    step = find_move_path(map_state, token, 3, 3).ac_cost
+
+    area = find_reachable_hexes(map_state, token, [1.5 * step, 1.5 * step])
+    forward = dict(zip(area.hexes(layer.id), zip(area.impulses, area.costs)))
+    assert forward[(3, 3)] == (0, step)
+    assert forward[(4, 3)] == (1, step)
+    assert (5, 3) not in forward
+    assert (4, 3) not in area.hexes(layer.id, within_impulse=True)
+    assert list(area.impulses) == sorted(area.impulses)
+    assert area.hexes("elsewhere") == []
+    assert len(find_reachable_hexes(map_state, token, [])) == 0
+
+
+def test_prone_crawl_spans_impulses() -> None:
+    map_state = MapState()
+    map_state.grid.cols = map_state.grid.rows = 12
+    layer = map_state.ensure_default_layer()
+    token = TokenPlacement(token_id="t", q=5, r=5, layer_id=layer.id, facing=0)
+    impulse_ac = [2.0, 2.0, 2.0, 2.0]
+    area = find_reachable_hexes(map_state, token, impulse_ac, "prone")
+    reached = dict(zip(area.hexes(layer.id), area.impulses))
+    assert find_move_path(map_state, token, 5, 6, stance="prone").ac_cost > impulse_ac[0]
+    assert reached[(5, 6)] == 1
+
+    engine = _engine(map_state, token, "prone")
+    path = find_move_path(map_state, token, 5, 6, stance="prone")
+    assert _replay_arrival(engine, token, path.steps, impulse_ac)[0] == 1
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_reachable_impulses_replay_through_engine(seed) -> None:
+    map_state = _random_map(seed)
+    layer = map_state.layers[0]
+    rng = random.Random(seed)
+    stance = rng.choice(list(STANCE_MODIFIER_MAP))
+    start = rng.choice([cell for cell in iter_rect_cells(map_state.grid) if not movement_blocked_reason(layer, *cell)])
+    facing = rng.randrange(12)
+    impulse_ac = [1.0, 2.0, 3.0, 2.0]
+    token = TokenPlacement(token_id="t", q=start[0], r=start[1], layer_id=layer.id, facing=facing)
+    area = find_reachable_hexes(map_state, token, impulse_ac, stance)
+    assert len(area) > area.impulse_count
+
+    reference = _engine_reachability(map_state, token, stance, impulse_ac)
+    assert sorted(area.hexes(layer.id)) == sorted(reference)
+    for (q, r), impulse, cost in zip(area.hexes(layer.id), area.impulses, area.costs):
+        assert reference[(q, r)] == (impulse, pytest.approx(cost))
+
+
+def test_reachability_starts_from_a_move_in_progress() -> None:
+    map_state = MapState()
+    map_state.grid.cols = map_state.grid.rows = 12
+    layer = map_state.ensure_default_layer()
+    token = TokenPlacement(token_id="t", q=5, r=5, layer_id=layer.id, facing=0)
+    engine = _engine(map_state, token, "prone")
+    rt = engine.get_runtime("t")
+    rt.ac_remaining = 1.0
+    assert engine.apply_action("t", "move", {"target_q": 5, "target_r": 6}).success
+    assert (token.q, token.r) == (5, 5) and rt.move_progress > 0
+
+    impulse_ac = [0.0, 2.0, 2.0, 4.0]
+    area = find_reachable_hexes(map_state, token, impulse_ac, "prone", rt.move_progress, (5, 6))
+    reached = dict(zip(area.hexes(layer.id), zip(area.impulses, area.costs)))
+    assert area.hexes(layer.id)[0] == (5, 6)
+    impulse, cost = _replay_arrival(engine, token, [(layer.id, 5, 6)], impulse_ac)
+    assert reached[(5, 6)] == (impulse, pytest.approx(cost))
+    others = [reached.get((5 + dq, 5 + dr)) for dq, dr in AXIAL_NEIGHBORS if (5 + dq, 5 + dr) != (5, 6)]
+    assert any(others) and all(label > reached[(5, 6)] for label in others if label)
+
+
+def test_reachability_cache_reuses_and_invalidates() -> None:
+    map_state = MapState()
+    map_state.grid.cols = map_state.grid.rows = 20
+    layer = map_state.ensure_default_layer()
+    token = TokenPlacement(token_id="t", q=3, r=3, layer_id=layer.id, character_name="Fighter")
+    tokens = TokenState()
+    tokens.placements["t"] = token
+    fighter = Character(
+        name="Fighter", strength=12, intelligence=10, will=11, health=12, agility=10, gun_combat_skill_level=5
+    )
+    impulse_combat = ImpulseCombatState(map_mode="combat", impulse=1)
+    impulse_combat.token_runtime["t"] = TokenCombatRuntime(ac_remaining=2.0)
+    engine = ImpulseCombatEngine(impulse_combat, tokens, map_state, {"Fighter": fighter})
+    assert engine.movement_budgets("t") == [2.0] + [float(ac) for ac in fighter.impulses[2:]]
+
+    cache = ReachabilityCache(map_state)
+    area = engine.reachable_hexes("t", cache)
+    assert area.impulse_count < len(area)
+    assert engine.reachable_hexes("t", cache) is area
+
+    layer.obstacles["19,19"] = Obstacle()
+    cache.invalidate_keys(layer.id, ["19,19"])
+    assert engine.reachable_hexes("t", cache) is area
+
+    layer.obstacles["4,3"] = Obstacle()
+    cache.invalidate_keys(layer.id, ["4,3"])
+    blocked = engine.reachable_hexes("t", cache)
+    assert blocked is not area
+    assert (4, 3) not in blocked.hexes(layer.id)
+    assert blocked.costs == engine.reachable_hexes("t").costs
+
+    engine.get_runtime("t").ac_remaining = 0.5
+    assert engine.reachable_hexes("t", cache).impulse_count < blocked.impulse_count
+    map_state.layers.append(MapLayer(name="Floor2", kind="floor", elevation=1))
+    assert engine.reachable_hexes("t", cache) is not blocked
+    assert engine.reachable_hexes("missing", cache) is None
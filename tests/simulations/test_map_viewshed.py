@@ -0,0 +1,141 @@
+"""Tests for per-token viewsheds and their incremental cache."""
+
+import time
+
+from phoenix_command.gui.utils.hex_geometry import axial_distance, iter_rect_cells
+from phoenix_command.session.domains.impulse_combat_state import TokenCombatRuntime
+from phoenix_command.session.domains.map_state import (
+    MapLayer,
+    MapState,
+    Obstacle,
+    Opening,
+    WallSegment,
+    cell_hex,
+    hex_wall_key,
+)
+from phoenix_command.session.domains.token_state import TokenPlacement
+from phoenix_command.simulations import map_viewshed
+from phoenix_command.simulations.map_los import check_los
+from phoenix_command.simulations.map_viewshed import DEFAULT_MAX_RANGE, ViewshedCache, compute_viewshed
+
+
+def _map() -> MapState:
+    map_state = MapState()
+    map_state.grid.cols = 12
+    map_state.grid.rows = 10
+    layer = map_state.ensure_default_layer()
+    layer.obstacles["5,2"] = Obstacle()
+    layer.obstacles["3,6"] = Obstacle(blocks_los=False)
+    layer.walls[hex_wall_key(8, 0)] = WallSegment()
+    layer.walls["7,4:3"] = WallSegment(openings=[Opening(kind="door", state="closed")])
+    layer.walls["4,1:5"] = WallSegment(openings=[Opening(kind="window", state="closed", sill_height=1.0)])
+    map_state.layers.append(MapLayer(name="Floor2", kind="floor", elevation=1))
+    return map_state
+
+
+def _visible_by_check_los(map_state: MapState, observer: TokenPlacement, layer_id: str, stance: str) -> set:
+    return {
+        (q, r) for q, r in iter_rect_cells(map_state.grid)
+        if not check_los(
+            map_state, observer, TokenPlacement(token_id="t", q=q, r=r, layer_id=layer_id),
+            TokenCombatRuntime(stance=stance),
+        ).blocked
+    }
+
+
+def _count_walks(monkeypatch) -> list:
+    calls = []
+    original = map_viewshed._walk_fan
+
+    def counting(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(map_viewshed, "_walk_fan", counting)
+    return calls
+
+
+def test_viewshed_matches_check_los() -> None:
+    map_state = _map()
+    ground, floor = map_state.layers
+    observer = TokenPlacement(token_id="o", q=2, r=3, layer_id=ground.id)
+    for layer_id in (ground.id, floor.id):
+        for stance in ("standing", "prone"):
+            viewshed = compute_viewshed(map_state, observer, layer_id, stance)
+            expected = _visible_by_check_los(map_state, observer, layer_id, stance)
+            assert set(viewshed.hexes()) == expected
+            assert len(viewshed) == len(expected)
+            assert all(viewshed.is_visible(q, r) == ((q, r) in expected) for q, r in iter_rect_cells(map_state.grid))
+    assert not compute_viewshed(map_state, observer).is_visible(-50, 50)
+
+
+def test_max_range_limits_the_fan() -> None:
+    map_state = _map()
+    observer = TokenPlacement(token_id="o", q=2, r=3, layer_id=map_state.layers[0].id)
+    viewshed = compute_viewshed(map_state, observer, max_range=3)
+    assert viewshed.hexes()
+    assert all(axial_distance(2, 3, q, r) <= 3 for q, r in viewshed.hexes())
+
+
+def test_default_range_bounds_large_maps() -> None:
+    map_state = MapState()
+    map_state.grid.cols = map_state.grid.rows = 200
+    observer = TokenPlacement(token_id="o", q=50, r=100, layer_id=map_state.ensure_default_layer().id)
+
+    started = time.perf_counter()
+    viewshed = compute_viewshed(map_state, observer)
+    assert time.perf_counter() - started < 5.0
+    assert all(axial_distance(50, 100, q, r) <= DEFAULT_MAX_RANGE for q, r in viewshed.hexes())
+    assert viewshed.is_visible(50 + DEFAULT_MAX_RANGE, 100)
+
+    fan = map_viewshed._ray_fan(50, 100, map_state.grid, DEFAULT_MAX_RANGE)
+    assert len(fan) < 100_000
+    assert fan.nbytes < 2_000_000
+
+
+def test_cache_updates_rays_through_edited_hexes(monkeypatch) -> None:
+    map_state = _map()
+    layer = map_state.layers[0]
+    observer = TokenPlacement(token_id="o", q=2, r=3, layer_id=layer.id)
+    cache = ViewshedCache(map_state)
+    before = set(cache.get(observer).hexes())
+
+    calls = _count_walks(monkeypatch)
+    assert set(cache.get(observer).hexes()) == before
+    assert calls == []
+
+    layer.walls["7,4:3"].openings[0].state = "open"
+    cache.invalidate_keys(layer.id, ["7,4:3"])
+    (*_, fan, _, _, nodes), = calls
+    assert 0 < len(nodes) < len(fan)
+    on_edit = {node for node in nodes if cell_hex(fan.cells[node]) == (7, 4)}
+    assert on_edit and all(node in on_edit or fan.parents[node] in nodes for node in nodes)
+    after = set(cache.get(observer).hexes())
+    assert after == set(compute_viewshed(map_state, observer).hexes())
+    assert after > before
+
+    layer.obstacles["3,3"] = Obstacle()
+    cache.invalidate_hexes(layer.id, [(3, 3)])
+    assert set(cache.get(observer).hexes()) == set(compute_viewshed(map_state, observer).hexes())
+
+
+def test_cache_recomputes_moved_tokens_and_layer_changes(monkeypatch) -> None:
+    map_state = _map()
+    observer = TokenPlacement(token_id="o", q=2, r=3, layer_id=map_state.layers[0].id)
+    cache = ViewshedCache(map_state, stance="kneeling")
+    fans = []
+    original = map_viewshed._ray_fan
+    monkeypatch.setattr(map_viewshed, "_ray_fan", lambda *args: fans.append(args) or original(*args))
+    first = cache.get(observer)
+    cache.get(observer, map_state.layers[1].id)
+    assert len(fans) == 1
+
+    observer.q, observer.r = 9, 5
+    moved = cache.get(observer)
+    assert moved is not first
+    assert moved.bits == compute_viewshed(map_state, observer, stance="kneeling").bits
+
+    map_state.layers[1].elevation = 3
+    assert cache.get(observer) is not moved
+    cache.remove_token("o")
+    assert cache.get(observer).bits == moved.bits
@@ -0,0 +1,119 @@
+"""Tests for seedable RNG streams and their use in the combat simulator."""
+
+import pickle
+import random
+from collections import Counter
+
+import pytest
+
+from phoenix_command.models.enums import TargetExposure
+from phoenix_command.simulations.combat_simulator import CombatSimulator
+from phoenix_command.simulations.rng import RngStream, randints
+
+
+class TestRngStream:
+    """Tests for RngStream seeding, splitting and bulk draws."""
+
+    def test_same_seed_reproduces_draws(self):
+        """Two streams with the same seed produce identical rolls."""
+        assert RngStream(42).randints(0, 99, 50) == RngStream(42).randints(0, 99, 50)
+
+    def test_randints_matches_randint(self):
+        """Bulk draws consume the stream exactly like repeated randint calls."""
+        bulk, single = RngStream(7), RngStream(7)
+        assert bulk.randints(0, 9, 200) == [single.randint(0, 9) for _ in range(200)]
+        assert bulk.randint(1, 6) == single.randint(1, 6)
+        assert [single.randint(0, 99) for _ in range(10)] + single.randints(0, 99, 9000) == bulk.randints(0, 99, 9010)
+        assert bulk.randints(0, 999, 5) == [single.randint(0, 999) for _ in range(5)]
+
+    def test_buffered_rolls_are_uniform(self):
+        """Rejecting the biased tail of each byte keeps every face equally likely."""
+        counts = Counter(RngStream(3).randints(1, 100, 200_000))
+        assert set(counts) == set(range(1, 101))
+        assert max(counts.values()) / min(counts.values()) < 1.2
+
+    def test_state_includes_buffered_rolls(self):
+        """getstate/setstate and reseeding cover values already drawn into the buffers."""
+        stream = RngStream(8)
+        stream.randint(0, 9)
+        state = stream.getstate()
+        first = stream.randints(0, 9, 50)
+        stream.setstate(state)
+        assert stream.randints(0, 9, 50) == first
+        stream.seed(8)
+        assert stream.randint(0, 9) == RngStream(8).randint(0, 9)
+
+    def test_module_randints_falls_back_to_randint(self):
+        """Plain Random sources are rolled one randint at a time."""
+        single = random.Random(4)
+        assert randints(random.Random(4), 0, 9, 20) == [single.randint(0, 9) for _ in range(20)]
+        assert randints(RngStream(4), 0, 9, 20) == RngStream(4).randints(0, 9, 20)
+
+    def test_randints_empty_range_raises(self):
+        """A range with b < a is rejected."""
+        with pytest.raises(ValueError):
+            RngStream(1).randints(5, 4, 3)
+
+    def test_children_are_deterministic_and_independent(self):
+        """Children depend only on the root seed and key, not on parent usage."""
+        parent = RngStream(123)
+        untouched = RngStream(123)
+        parent.randints(0, 99, 10)
+        assert parent.child("worker").randints(0, 99, 20) == untouched.child("worker").randints(0, 99, 20)
+        assert parent.child("a").randints(0, 99, 20) != parent.child("b").randints(0, 99, 20)
+
+    def test_spawn_continues_numbering(self):
+        """Repeated spawn calls hand out distinct streams."""
+        stream = RngStream(5)
+        first, second = stream.spawn(2), stream.spawn(1)
+        assert [s.key for s in first + second] == ["/0", "/1", "/2"]
+        with pytest.raises(ValueError):
+            stream.spawn(-1)
+
+    def test_pickle_round_trip_preserves_state(self):
+        """Unpickled streams continue exactly where the original left off."""
+        stream = RngStream(99).child("pool")
+        stream.randints(0, 99, 13)
+        stream.spawn(3)
+        clone = pickle.loads(pickle.dumps(stream))
+        assert (clone.root_seed, clone.key) == (stream.root_seed, stream.key)
+        assert clone.randints(0, 99, 30) == stream.randints(0, 99, 30)
+        assert clone.spawn(1)[0].key == stream.spawn(1)[0].key == "/pool/3"
+
+    def test_replay_restarts_stream(self):
+        """replay returns a stream positioned at the first draw."""
+        stream = RngStream(11, "shot")
+        first = stream.randints(0, 99, 5)
+        assert stream.replay().randints(0, 99, 5) == first
+
+    def test_replay_rederives_one_child_by_key(self):
+        """A single shot's child stream is reproduced from its recorded key alone."""
+        root = RngStream(11)
+        shots = root.spawn(4)
+        rolls = [shot.randints(0, 99, 3) for shot in shots]
+        recorded_key = shots[2].key
+        assert RngStream(11).replay(recorded_key).randints(0, 99, 3) == rolls[2]
+        assert root.replay(recorded_key).key == recorded_key
+
+
+class TestSimulatorReplay:
+    """Tests for deterministic simulator runs driven by an RngStream."""
+
+    def test_seeded_single_shot_replays(self, make_character, rifle_shot):
+        """The same stream position reproduces the same shot and log."""
+        weapon, ammo, params = rifle_shot
+
+        results = []
+        for _ in range(2):
+            stream = RngStream(2024)
+            results.append([
+                CombatSimulator.single_shot(
+                    make_character("Shooter"), make_character("Target"), weapon, ammo, 10,
+                    TargetExposure.STANDING_EXPOSED, params, True, stream
+                )
+                for _ in range(20)
+            ])
+
+        first, second = results
+        assert [(r.hit, r.roll, r.log) for r in first] == [(r.hit, r.roll, r.log) for r in second]
+        assert any(r.hit for r in first)
@@ -0,0 +1,166 @@
+"""Tests for the burst scenario grid and process-pool runner."""
+
+import dataclasses
+
+import pytest
+
+from phoenix_command.item_database.weapons import WEAPONS_LIST
+from phoenix_command.models.enums import TargetExposure
+from phoenix_command.models.hit_result_advanced import BurstScenarioSummary, ShotParameters, TargetGroup
+from phoenix_command.simulations.scenario_runner import build_scenario_grid, run_scenarios
+
+
+def _auto_weapons(pellets: bool):
+    return [
+        w for w in WEAPONS_LIST
+        if w.full_auto and w.full_auto_rof and w.aim_time_modifiers and w.ballistic_data
+        and w.ballistic_data.get_minimum_arc(10) is not None
+        and any(bool(a.pellet_count) == pellets for a in w.ammunition_types)
+    ]
+
+
+def _layout(make_character, names, weapon, range_hexes=10):
+    params = ShotParameters(
+        aim_time_ac=max(weapon.aim_time_modifiers), situation_stance_modifiers=[], visibility_modifiers=[]
+    )
+    return TargetGroup(
+        targets=[make_character(name) for name in names],
+        ranges=[range_hexes] * len(names),
+        exposures=[TargetExposure.STANDING_EXPOSED] * len(names),
+        shot_params_list=[params] * len(names),
+        is_front_shots=[True] * len(names),
+    )
+
+
+def _burst_grid(make_character):
+    weapon = _auto_weapons(pellets=False)[0]
+    ammo = next(a for a in weapon.ammunition_types if not a.pellet_count)
+    return build_scenario_grid(
+        make_character("Shooter"), [(weapon, ammo)], [None, 12.0], [None, weapon.full_auto_rof + 2],
+        [_layout(make_character, ["A", "B"], weapon)], ranges=[None, 20],
+    )
+
+
+class TestScenarioGrid:
+    """Tests for build_scenario_grid."""
+
+    def test_cross_product_and_overrides(self, make_character):
+        """Every combination is produced and ROF/range overrides are applied to copies."""
+        scenarios = _burst_grid(make_character)
+        assert len(scenarios) == 8
+        base_rof = scenarios[0].weapon.full_auto_rof
+        assert {s.weapon.full_auto_rof for s in scenarios} == {base_rof, base_rof + 2}
+        assert {tuple(s.target_group.ranges) for s in scenarios} == {(10, 10), (20, 20)}
+        assert len({s.label for s in scenarios}) == 8
+
+    def test_range_override_applies_to_pattern_layouts(self, make_character):
+        """A range override replaces pattern layout ranges too; None keeps them."""
+        weapon = _auto_weapons(pellets=False)[0]
+        ammo = weapon.ammunition_types[0]
+        patterns = [_layout(make_character, ["Q", "R"], weapon, 6)]
+        kept, overridden = build_scenario_grid(
+            make_character("Shooter"), [(weapon, ammo)], [None], [None], [_layout(make_character, ["P"], weapon, 5)],
+            ranges=[None, 20], pattern_layouts=patterns,
+        )
+        assert kept.pattern_target_groups[0].ranges == [6, 6]
+        assert overridden.target_group.ranges == [20]
+        assert overridden.pattern_target_groups[0].ranges == [20, 20]
+        assert patterns[0].ranges == [6, 6]
+
+
+    def test_pattern_layouts_must_match_primary_targets(self, make_character):
+        """Each primary target needs exactly one pattern layout."""
+        weapon = _auto_weapons(pellets=False)[0]
+        with pytest.raises(ValueError):
+            build_scenario_grid(
+                make_character("Shooter"), [(weapon, weapon.ammunition_types[0])], [None], [None],
+                [_layout(make_character, ["P", "Q"], weapon)], pattern_layouts=[_layout(make_character, ["R"], weapon)],
+            )
+
+
+class TestRunScenarios:
+    """Tests for run_scenarios."""
+
+    def test_serial_run_is_deterministic(self, make_character):
+        """The same seed gives the same summaries, independent of chunk size."""
+        scenarios = _burst_grid(make_character)[:2]
+        first = run_scenarios(scenarios, 60, seed=7, max_workers=1, chunk_trials=25)
+        second = run_scenarios(scenarios, 60, seed=7, max_workers=1, chunk_trials=25)
+        assert first == second
+        assert [s.trials for s in first] == [60, 60]
+        assert first[0].target_names == ["A", "B"]
+        assert sum(first[0].hits) >= first[0].volleys_hit > 0
+
+    def test_process_pool_matches_serial(self, make_character):
+        """Worker count does not change results."""
+        scenarios = _burst_grid(make_character)[:2]
+        serial = run_scenarios(scenarios, 40, seed=3, max_workers=1, chunk_trials=10)
+        pooled = run_scenarios(scenarios, 40, seed=3, max_workers=2, chunk_trials=10)
+        assert pooled == serial
+
+    def test_targets_are_not_mutated(self, make_character):
+        """Trials run on unpickled copies of the scenario's targets."""
+        scenarios = _burst_grid(make_character)[:1]
+        run_scenarios(scenarios, 30, seed=1, max_workers=1)
+        assert all(t.physical_damage_total == 0 for t in scenarios[0].all_targets)
+
+    def test_shotgun_burst_scenarios(self, make_character):
+        """Scenarios with pattern groups aggregate primary and pattern targets."""
+        weapons = _auto_weapons(pellets=True)
+        if not weapons:
+            pytest.skip("No full auto shotgun in the weapon database")
+        weapon = weapons[0]
+        ammo = next(a for a in weapon.ammunition_types if a.pellet_count)
+        scenarios = build_scenario_grid(
+            make_character("Shooter"), [(weapon, ammo)], [None], [None], [_layout(make_character, ["P"], weapon, 5)],
+            pattern_layouts=[_layout(make_character, ["Q", "R"], weapon, 6)],
+        )
+        summary = run_scenarios(scenarios, 20, seed=11, max_workers=1)[0]
+        assert summary.target_names == ["P", "Q", "R"]
+        assert summary.trials == 20
+        assert len(summary.mean_damage) == 3
+
+    def test_shared_targets_aggregate_once(self, make_character):
+        """A character in several slots is summarised once, with every hit it takes."""
+        weapons = _auto_weapons(pellets=True)
+        if not weapons:
+            pytest.skip("No full auto shotgun in the weapon database")
+        weapon = weapons[0]
+        ammo = next(a for a in weapon.ammunition_types if a.pellet_count)
+        layout = _layout(make_character, ["P", "Q"], weapon, 5)
+        p, q = layout.targets
+        patterns = [
+            dataclasses.replace(_layout(make_character, [target.name], weapon, 5), targets=[target]) for target in (q, p)
+        ]
+        scenarios = build_scenario_grid(
+            make_character("Shooter"), [(weapon, ammo)], [None], [None], [layout], pattern_layouts=patterns
+        )
+        assert scenarios[0].all_targets == [p, q]
+        summary = run_scenarios(scenarios, 20, seed=5, max_workers=1)[0]
+        assert summary.target_names == ["P", "Q"]
+        assert sum(summary.hits) > 0 and all(summary.hits)
+
+    def test_invalid_arguments(self):
+        """Negative trials and empty chunks are rejected."""
+        with pytest.raises(ValueError):
+            run_scenarios([], -1)
+        with pytest.raises(ValueError):
+            run_scenarios([], 10, chunk_trials=0)
+
+
+class TestBurstScenarioSummary:
+    """Tests for merging summaries."""
+
+    def test_merge_adds_counts(self):
+        """Merging sums trials and per-target counts."""
+        a = BurstScenarioSummary("s", ["A", "B"], trials=2, volleys_hit=1, hits=[3, 0], damage=[10, 0], incapacitated=[1, 0])
+        b = BurstScenarioSummary("s", ["A", "B"], trials=2, volleys_hit=2, hits=[1, 2], damage=[5, 7], incapacitated=[0, 1])
+        a.merge(b)
+        assert (a.trials, a.volleys_hit, a.hits, a.damage, a.incapacitated) == (4, 3, [4, 2], [15, 7], [1, 1])
+        assert a.hit_rate == 0.75
+        assert a.mean_hits == [1.0, 0.5]
+
+    def test_merge_rejects_other_layouts(self):
+        """Summaries of different target layouts cannot be merged."""
+        with pytest.raises(ValueError):
+            BurstScenarioSummary("s", ["A"]).merge(BurstScenarioSummary("s", ["B"]))
@@ -1,6 +1,10 @@
 """
 Tests for AdvancedDamageCalculator.
 """
+import dataclasses
+
+import pytest
+
 from phoenix_command.models.enums import AdvancedHitLocation
 from phoenix_command.tables.advanced_damage_tables.advanced_damage_calculator import AdvancedDamageCalculator
 from phoenix_command.tables.advanced_damage_tables.tables_data import TablesData
@@ -597,3 +601,50 @@ class TestAdvancedDamageCalculator:
         print(f"\n{'='*80}")
         print(f"Total locations tested: {len(two_table_locations)}")
         print(f"{'='*80}\n")
+
+
+class TestAdvancedDamageCalculatorCache:
+    """Test the memoized damage kernel."""
+
+    def setup_method(self):
+        AdvancedDamageCalculator.cache_clear()
+
+    def test_cached_record_matches_calculate_damage(self):
+        """Cached records carry the same values as a fresh calculation."""
+        for is_front in (True, False):
+            fresh = AdvancedDamageCalculator.calculate_damage(AdvancedHitLocation.FOREHEAD, 10, 2.3, is_front)
+            record = AdvancedDamageCalculator.calculate_damage_cached(AdvancedHitLocation.FOREHEAD, 10, 2.3, is_front)
+            assert record.to_damage_result() == fresh
+
+    def test_record_is_frozen_and_copies_are_independent(self):
+        """Records are immutable; mutable copies do not leak back into the cache."""
+        record = AdvancedDamageCalculator.calculate_damage_cached(AdvancedHitLocation.FOREHEAD, 10, 3.0, True)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.damage = 0
+
+        copy = record.to_damage_result()
+        copy.damage = -1
+        copy.pierced_organs.append("Test")
+        again = AdvancedDamageCalculator.calculate_damage_cached(AdvancedHitLocation.FOREHEAD, 10, 3.0, True)
+        assert again is record
+        assert "Test" not in again.pierced_organs
+
+    def test_epen_noise_shares_cache_entry(self):
+        """EPEN values that differ only by float noise hit the same cache entry."""
+        AdvancedDamageCalculator.calculate_damage_cached(AdvancedHitLocation.FOREHEAD, 10, 2.3, True)
+        AdvancedDamageCalculator.calculate_damage_cached(AdvancedHitLocation.FOREHEAD, 10, 12.3 - 10.0, True)
+        info = AdvancedDamageCalculator.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_set_cache_size_bounds_entries(self):
+        """The cache can be resized and never grows past its bound."""
+        AdvancedDamageCalculator.set_cache_size(2)
+        try:
+            for epen in (1.0, 2.0, 3.0, 4.0):
+                AdvancedDamageCalculator.calculate_damage_cached(AdvancedHitLocation.FOREHEAD, 10, epen, True)
+            info = AdvancedDamageCalculator.cache_info()
+            assert info.maxsize == 2
+            assert info.currsize == 2
+        finally:
+            AdvancedDamageCalculator.set_cache_size(AdvancedDamageCalculator.DEFAULT_CACHE_SIZE)
@@ -0,0 +1,44 @@
+"""
+Tests for the compiled numeric form of TABLES_DATA.
+"""
+from phoenix_command.models.enums import AdvancedHitLocation
+from phoenix_command.tables.advanced_damage_tables.compiled_tables_data import CompiledTablesData, parse_table_value
+from phoenix_command.tables.advanced_damage_tables.tables_data import TablesData
+
+
+class TestCompiledTablesData:
+    """Test that compiled tables mirror the string tables."""
+
+    def test_every_table_is_compiled(self):
+        """Every TABLES_DATA entry has a compiled counterpart."""
+        assert set(CompiledTablesData.TABLES) == set(TablesData.TABLES_DATA)
+
+    def test_damage_matrices_are_parsed(self):
+        """Damage matrices hold parsed integers for every DC."""
+        for table_id, data in TablesData.TABLES_DATA.items():
+            compiled = CompiledTablesData.TABLES[table_id]
+            assert compiled.thresholds == tuple(data["epen"])
+            for dc, values in data["dc"].items():
+                assert compiled.damage[dc] == tuple(parse_table_value(v) for v in values)
+
+    def test_shock_prefix_max_is_monotonic(self):
+        """Running shock maxima never decrease and end at the table maximum."""
+        for compiled in CompiledTablesData.TABLES.values():
+            prefix = compiled.shock_prefix_max
+            assert list(prefix) == sorted(prefix)
+            assert prefix[-1] == compiled.max_shock
+
+    def test_table_1_organs(self):
+        """Front and rear organ paths follow the organ boundaries of Table 1."""
+        compiled = CompiledTablesData.TABLES[1]
+        assert [name for name, _ in compiled.front_organs[0]] == ["Scalp"]
+        assert [name for name, _ in compiled.front_organs[-1]] == ["Scalp", "Skull Bone", "Scalp"]
+        assert [name for name, _ in compiled.rear_organs[-1]] == ["Scalp"]
+        assert [name for name, _ in compiled.rear_organs[0]] == ["Scalp", "Skull Bone", "Scalp"]
+
+    def test_location_references(self):
+        """Location labels are resolved to table references once."""
+        assert CompiledTablesData.FRONT_REFERENCES[AdvancedHitLocation.HEAD_GLANCE] == (1,)
+        assert CompiledTablesData.FRONT_REFERENCES[AdvancedHitLocation.MISS] == ()
+        for location, refs in CompiledTablesData.FRONT_REFERENCES.items():
+            assert CompiledTablesData.REAR_REFERENCES[location] == refs[::-1]
@@ -527,3 +527,61 @@ class TestStatisticalDistribution:
         assert AdvancedHitLocation.PELVIS in counter  # 417-533
         assert AdvancedHitLocation.FOOT_RIGHT in counter  # 968-999
 
+
+
+class TestCompiledHitLocationTable:
+    """Tests for the cumulative-distribution hit location sampler."""
+
+    def test_resolve_matches_original_chain(self):
+        """Every roll in the window resolves to the same location as the if-chain."""
+        for orientation in TargetOrientation:
+            for exposure in TargetExposure:
+                table = Table1AdvancedDamageHitLocation.get_compiled_table(exposure, orientation)
+                resolve = {
+                    TargetOrientation.FRONT_REAR: Table1AdvancedDamageHitLocation._resolve_front_rear,
+                    TargetOrientation.OBLIQUE: Table1AdvancedDamageHitLocation._resolve_oblique,
+                    TargetOrientation.RIGHT_SIDE: Table1AdvancedDamageHitLocation._resolve_right_side,
+                    TargetOrientation.LEFT_SIDE: Table1AdvancedDamageHitLocation._resolve_left_side,
+                }[orientation]
+                for roll in range(table.roll_min, table.roll_max + 1):
+                    assert table.resolve(roll) == resolve(exposure, roll)
+
+    def test_roll_windows(self):
+        """Cover exposures roll d100, partial open exposures use their restricted window."""
+        assert Table1AdvancedDamageHitLocation.get_roll_range(
+            TargetExposure.FIRING_OVER_COVER, TargetOrientation.OBLIQUE
+        ) == (0, 99)
+        assert Table1AdvancedDamageHitLocation.get_roll_range(
+            TargetExposure.HEAD, TargetOrientation.FRONT_REAR
+        ) == (0, 59)
+        assert Table1AdvancedDamageHitLocation.get_roll_range(
+            TargetExposure.STANDING_EXPOSED, TargetOrientation.LEFT_SIDE
+        ) == (0, 999)
+
+    def test_cumulative_weights_cover_window(self):
+        """The last cumulative weight equals the number of rolls in the window."""
+        table = Table1AdvancedDamageHitLocation.get_compiled_table(
+            TargetExposure.BODY, TargetOrientation.FRONT_REAR
+        )
+        assert table.cum_weights[-1] == table.roll_max - table.roll_min + 1
+        assert abs(sum(table.probabilities().values()) - 1.0) < 1e-9
+
+    def test_sample_many_uses_supplied_rng(self):
+        """The same seeded RNG produces the same batch of locations."""
+        first = Table1AdvancedDamageHitLocation.sample_hit_locations(
+            TargetExposure.STANDING_EXPOSED, TargetOrientation.FRONT_REAR, 500, random.Random(7)
+        )
+        second = Table1AdvancedDamageHitLocation.sample_hit_locations(
+            TargetExposure.STANDING_EXPOSED, TargetOrientation.FRONT_REAR, 500, random.Random(7)
+        )
+        assert first == second
+        assert len(first) == 500
+
+    def test_sample_many_stays_within_exposure(self):
+        """Batch draws for a head exposure only return head/neck locations."""
+        table = Table1AdvancedDamageHitLocation.get_compiled_table(
+            TargetExposure.HEAD, TargetOrientation.FRONT_REAR
+        )
+        locations = table.sample_many(1000, random.Random(3))
+        assert set(locations) <= set(table.locations)
+        assert AdvancedHitLocation.MISS not in locations
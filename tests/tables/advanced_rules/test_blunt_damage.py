@@ -476,3 +476,32 @@ class TestRealWorldScenarios:
 
         # Should cause moderate damage
         assert damage > 0
+
+
+class TestCompiledBluntDamage:
+    """Tests for the compiled Table 9A location groups and batch lookup."""
+
+    def test_location_groups(self):
+        """Every location maps to the head, torso or limb group."""
+        assert Table9ABluntDamage.get_location_group(AdvancedHitLocation.HEART) == 0
+        assert Table9ABluntDamage.get_location_group(AdvancedHitLocation.PELVIS_SIDE) == 1
+        assert Table9ABluntDamage.get_location_group(AdvancedHitLocation.ARM_FLESH_LEFT) == 2
+        assert Table9ABluntDamage.get_location_group(AdvancedHitLocation.WEAPON_CRITICAL) == 2
+        assert set(Table9ABluntDamage._LOCATION_GROUPS) == set(AdvancedHitLocation)
+
+    def test_batch_matches_scalar(self):
+        """Batch lookup returns the same values as repeated scalar calls."""
+        cases = [
+            (location, bpf, pen)
+            for location in (AdvancedHitLocation.FOREHEAD, AdvancedHitLocation.LUNG, AdvancedHitLocation.ARM_FLESH_LEFT)
+            for bpf in (-1, 1, 3, 7, 10, 11)
+            for pen in (0.5, 1.0, 6.3, 9.0, 10.0, 45.5, 120.0)
+        ]
+        expected = [Table9ABluntDamage.get_blunt_damage(*case) for case in cases]
+        locations, bpfs, pens = zip(*cases)
+        assert Table9ABluntDamage.get_blunt_damage_batch(locations, bpfs, pens) == expected
+
+    def test_batch_length_mismatch_raises(self):
+        """Locations, BPF and PEN values must be parallel sequences."""
+        with pytest.raises(ValueError):
+            Table9ABluntDamage.get_blunt_damage_batch([AdvancedHitLocation.LUNG], [5, 6], [10.0])
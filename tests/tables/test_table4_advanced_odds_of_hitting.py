@@ -0,0 +1,75 @@
+"""Tests for the compiled Table 4 lookups and their batch entry points."""
+
+import pytest
+
+from phoenix_command.models.enums import ShotType
+from phoenix_command.tables.core.table4_advanced_odds_of_hitting import Table4AdvancedOddsOfHitting
+
+
+class TestRangeModifier4A:
+    """Tests for Table 4A range ALM lookups."""
+
+    def test_exact_and_between_ranges(self):
+        """Ranges use the first row whose limit is >= distance."""
+        assert Table4AdvancedOddsOfHitting.get_accuracy_level_modifier_by_range_4a(1) == 33
+        assert Table4AdvancedOddsOfHitting.get_accuracy_level_modifier_by_range_4a(10) == 16
+        assert Table4AdvancedOddsOfHitting.get_accuracy_level_modifier_by_range_4a(100) == 0
+        assert Table4AdvancedOddsOfHitting.get_accuracy_level_modifier_by_range_4a(4350) == -27
+
+    def test_out_of_range_raises(self):
+        """Distances beyond the table raise ValueError."""
+        with pytest.raises(ValueError):
+            Table4AdvancedOddsOfHitting.get_accuracy_level_modifier_by_range_4a(4351)
+        with pytest.raises(ValueError):
+            Table4AdvancedOddsOfHitting.get_accuracy_level_modifier_by_range_4a_batch([10, 5000])
+
+    def test_batch_matches_scalar(self):
+        """Batch lookup returns the same values as repeated scalar calls."""
+        distances = [0, 1, 2.5, 10, 99, 100, 101, 1000, 4350]
+        expected = [Table4AdvancedOddsOfHitting.get_accuracy_level_modifier_by_range_4a(d) for d in distances]
+        assert Table4AdvancedOddsOfHitting.get_accuracy_level_modifier_by_range_4a_batch(distances) == expected
+
+
+class TestOddsOfHitting4G:
+    """Tests for Table 4G odds lookups."""
+
+    def test_clamped_extremes(self):
+        """EAL above 28 is 99%, below -22 is 0%."""
+        assert Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(40, ShotType.SINGLE) == 99
+        assert Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(-30, ShotType.BURST) == 0
+
+    @pytest.mark.parametrize("shot_type", list(ShotType))
+    def test_batch_matches_scalar(self, shot_type):
+        """Batch lookup returns the same values as repeated scalar calls."""
+        eals = [x / 2 for x in range(-60, 70)]
+        expected = [Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g(e, shot_type) for e in eals]
+        assert Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g_batch(eals, shot_type) == expected
+
+    def test_odds_are_monotonic_in_eal(self):
+        """Higher EAL never gives lower odds."""
+        for shot_type in ShotType:
+            odds = Table4AdvancedOddsOfHitting.get_odds_of_hitting_4g_batch(range(-25, 31), shot_type)
+            assert odds == sorted(odds)
+
+
+class TestMovement4D:
+    """Tests for Table 4D movement ALM lookups."""
+
+    def test_floor_lookup(self):
+        """Non-exact speeds and HPIs floor to the nearest lower table entry."""
+        assert Table4AdvancedOddsOfHitting.get_movement_alm_and_max_aim_time_4d(2.0, 10) == (-10, 2)
+        assert Table4AdvancedOddsOfHitting.get_movement_alm_and_max_aim_time_4d(2.5, 25) == (-8, 4)
+        assert Table4AdvancedOddsOfHitting.get_movement_alm_and_max_aim_time_4d(0.5, 1500) == (-5, float('inf'))
+
+    def test_batch_matches_scalar(self):
+        """Batch lookup returns parallel modifier and max aim lists."""
+        speeds = [0.1, 0.5, 3.0, 10.0, 55.0, 200.0]
+        hpis = [5, 20, 70, 300, 1000, 2000]
+        modifiers, max_aims = Table4AdvancedOddsOfHitting.get_movement_alm_and_max_aim_time_4d_batch(speeds, hpis)
+        expected = [Table4AdvancedOddsOfHitting.get_movement_alm_and_max_aim_time_4d(s, h) for s, h in zip(speeds, hpis)]
+        assert list(zip(modifiers, max_aims)) == expected
+
+    def test_batch_length_mismatch_raises(self):
+        """Speeds and HPIs must be parallel sequences."""
+        with pytest.raises(ValueError):
+            Table4AdvancedOddsOfHitting.get_movement_alm_and_max_aim_time_4d_batch([1.0, 2.0], [10])
@@ -0,0 +1,68 @@
+"""Tests for the compiled Table 5A fire table and its batch API."""
+
+import random
+
+import pytest
+
+from phoenix_command.tables.core.table5_auto_pellet_shrapnel import Table5AutoPelletShrapnel
+
+
+class TestFireTableProbability:
+    """Test compiled Table 5A cell lookups."""
+
+    def test_guaranteed_cell(self):
+        """Tight arc at high ROF gives guaranteed hits."""
+        assert Table5AutoPelletShrapnel.get_fire_table_probability_5a(0.000001, 144, 0) == (144, 0)
+
+    def test_probability_cell(self):
+        """Wide arc at low ROF gives a percentage chance of one hit."""
+        assert Table5AutoPelletShrapnel.get_fire_table_probability_5a(1, 3, 0) == (0, 38)
+
+    def test_arc_rounds_up_to_next_row(self):
+        """Arcs between rows use the next larger arc key."""
+        assert Table5AutoPelletShrapnel.get_fire_table_probability_5a(0.95, 3, 0) == (0, 38)
+
+    def test_size_modifier_shifts_rows(self):
+        """A positive size modifier moves towards tighter arcs, clamped to the table."""
+        assert Table5AutoPelletShrapnel.get_fire_table_probability_5a(1, 3, 1) == (0, 44)
+        assert Table5AutoPelletShrapnel.get_fire_table_probability_5a(1, 3, 100) == (3, 0)
+        assert Table5AutoPelletShrapnel.get_fire_table_probability_5a(1, 3, -100) == (0, 0)
+
+    def test_out_of_range_inputs(self):
+        """Arc beyond the table gives no hits; ROF above 144 is clamped."""
+        assert Table5AutoPelletShrapnel.get_fire_table_probability_5a(500, 10, 0) == (0, 0)
+        assert Table5AutoPelletShrapnel.get_fire_table_probability_5a(1, 500, 0) == \
+            Table5AutoPelletShrapnel.get_fire_table_probability_5a(1, 144, 0)
+
+
+class TestFireTableBatch:
+    """Test the batch Table 5A entry points."""
+
+    def test_probability_batch_matches_scalar(self):
+        """Batch probabilities equal scalar lookups."""
+        triples = [(a, r, m) for a in (0.1, 0.5, 2, 40, 200) for r in (3, 10, 144, 150) for m in (-3, 0, 3)]
+        expected = [Table5AutoPelletShrapnel.get_fire_table_probability_5a(*t) for t in triples]
+        arcs, rofs, mods = zip(*triples)
+        assert Table5AutoPelletShrapnel.get_fire_table_probability_5a_batch(arcs, rofs, mods) == expected
+
+    def test_value_batch_uses_supplied_rolls(self):
+        """Supplied rolls decide probability cells; guaranteed cells ignore them."""
+        hits = Table5AutoPelletShrapnel.get_fire_table_value5a_batch(
+            [1, 1, 0.000001], [3, 3, 144], [0, 0, 0], rolls=[37, 38, 99]
+        )
+        assert hits == [1, 0, 144]
+
+    def test_value_batch_matches_scalar_with_same_seed(self):
+        """Without rolls, the batch draws from random like repeated scalar calls."""
+        arcs, rofs, mods = [1, 2, 0.3, 10], [3, 12, 10, 36], [0, 1, 0, -2]
+        random.seed(11)
+        expected = [Table5AutoPelletShrapnel.get_fire_table_value5a(a, r, m) for a, r, m in zip(arcs, rofs, mods)]
+        random.seed(11)
+        assert Table5AutoPelletShrapnel.get_fire_table_value5a_batch(arcs, rofs, mods) == expected
+
+    def test_value_batch_rejects_out_of_range(self):
+        """Batch resolution raises like the scalar form."""
+        with pytest.raises(ValueError):
+            Table5AutoPelletShrapnel.get_fire_table_value5a_batch([500], [10], [0])
+        with pytest.raises(ValueError):
+            Table5AutoPelletShrapnel.get_fire_table_value5a_batch([1], [145], [0])
@@ -0,0 +1,84 @@
+"""Tests for the compiled Table 8 lookups and their batch entry points."""
+
+import random
+
+import pytest
+
+from phoenix_command.models.enums import IncapacitationEffect, MedicalAid
+from phoenix_command.tables.core.table8_healing_and_recovery import Table8HealingAndRecovery
+
+
+class TestIncapacitationTime8B:
+    """Tests for Table 8B incapacitation time."""
+
+    def test_row_floors_to_table_key(self):
+        """Damage uses the largest key not above it, with a minimum row of 50."""
+        assert Table8HealingAndRecovery.get_incapacitation_time_8b_batch([0, 49, 99, 100, 449, 5000], rolls=[0] * 6) == \
+            [4, 4, 4, 25, 600, 18000]
+
+    def test_modifier_clamps_roll(self):
+        """Modified rolls below 0 use the first column and above 9 the last."""
+        assert Table8HealingAndRecovery.get_incapacitation_time_8b_batch([100, 100], modifiers=[-5, 5], rolls=[2, 7]) == \
+            [25, 750]
+
+    def test_batch_matches_scalar_with_same_seed(self):
+        """Without rolls, the batch draws from random like repeated scalar calls."""
+        totals = [10, 120, 300, 760, 2000]
+        random.seed(3)
+        expected = [Table8HealingAndRecovery.get_incapacitation_time_8b(t, -1) for t in totals]
+        random.seed(3)
+        assert Table8HealingAndRecovery.get_incapacitation_time_8b_batch(totals, -1) == expected
+
+
+class TestRecovery8A:
+    """Tests for Table 8A critical time period and recovery chance."""
+
+    def test_closest_row(self):
+        """Health-scaled damage picks the closest row, preferring the lower row on ties."""
+        recovery = Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a(10, 10)
+        assert recovery.healing_time_in_days == 25.0
+        assert recovery.aid_data[MedicalAid.NO_AID] == (75 * 1800, 89)
+        tie = Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a(150, 10)
+        assert tie.healing_time_in_days == 53.0
+
+    def test_extremes(self):
+        """Damage outside the table uses the first or last row."""
+        assert Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a(0, 10).healing_time_in_days == 17.0
+        assert Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a(1e9, 10).healing_time_in_days == 999.0
+
+    def test_batch_matches_scalar(self):
+        """Batch lookup returns the same Recovery values as repeated scalar calls."""
+        damages = [0, 3.3, 17, 250, 1200, 9999]
+        healths = [10, 12, 8, 10, 15, 9]
+        expected = [
+            Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a(d, h)
+            for d, h in zip(damages, healths)
+        ]
+        assert Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a_batch(damages, healths) == expected
+
+    def test_batch_length_mismatch_raises(self):
+        """Damage and health must be parallel sequences."""
+        with pytest.raises(ValueError):
+            Table8HealingAndRecovery.get_critical_time_period_and_recovery_chance_8a_batch([1, 2], [10])
+
+
+class TestIncapacitationEffect:
+    """Tests for incapacitation chance and effect lookups."""
+
+    def test_effect_bands(self):
+        """Effect roll thresholds depend on damage relative to the knockout value."""
+        assert Table8HealingAndRecovery.get_incapacitation_effect(5, 10, 0) == IncapacitationEffect.KNOCKED_OUT
+        assert Table8HealingAndRecovery.get_incapacitation_effect(5, 10, 6) == IncapacitationEffect.DISORIENTED
+        assert Table8HealingAndRecovery.get_incapacitation_effect(15, 10, 8) == IncapacitationEffect.STUNNED
+        assert Table8HealingAndRecovery.get_incapacitation_effect(25, 10, 52) == IncapacitationEffect.DAZED
+        assert Table8HealingAndRecovery.get_incapacitation_effect(35, 10, 83) == IncapacitationEffect.DISORIENTED
+
+    def test_batches_match_scalar(self):
+        """Batch chance and effect lookups equal scalar calls."""
+        pds = [0, 1, 9, 10, 19, 20, 29, 30, 100]
+        kos = [10] * len(pds)
+        rolls = [0, 2, 5, 13, 26, 53, 82, 83, 99]
+        assert Table8HealingAndRecovery.get_incapacitation_chance_batch(pds, kos) == \
+            [Table8HealingAndRecovery.get_incapacitation_chance(p, k) for p, k in zip(pds, kos)]
+        assert Table8HealingAndRecovery.get_incapacitation_effect_batch(pds, kos, rolls) == \
+            [Table8HealingAndRecovery.get_incapacitation_effect(p, k, r) for p, k, r in zip(pds, kos, rolls)]